@@ -8,14 +8,16 @@ Description:                动画类
 
 Changed history:            
                             2025/05/14: 初始创建;
+                            2026/10/16: 添加按帧缓存的QPixmap，显示时不再每次转换QImage;
+                            2026/10/16: 添加距下一帧的时间，供帧调度器安排唤醒;
 ----
 """
 
 import logging
 import time
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Union, Tuple
 
-from PySide6.QtGui import QImage
+from PySide6.QtGui import QImage, QPixmap
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +41,8 @@ class Animation:
         self.is_looping = True  # 是否循环播放
         self.is_reversed = False  # 是否反向播放
         self.last_frame_time = 0.0  # 最后一帧的时间
+        # 帧索引 -> (源QImage, 转换后的QPixmap)，源帧被替换时重新转换
+        self._pixmap_cache: Dict[int, Tuple[QImage, QPixmap]] = {}
     
     def next_frame(self) -> QImage:
         """获取下一帧图像
@@ -76,6 +80,37 @@ class Animation:
             return QImage()
         return self.frames[self.current_frame_index]
     
+    def get_pixmap_at_index(self, index: int) -> Optional[QPixmap]:
+        """获取指定索引的帧对应的QPixmap（首次访问时转换并缓存）
+        
+        Args:
+            index: 帧索引
+            
+        Returns:
+            Optional[QPixmap]: 帧的QPixmap，如果索引无效则返回None
+        """
+        if not 0 <= index < len(self.frames):
+            return None
+        frame = self.frames[index]
+        cached = self._pixmap_cache.get(index)
+        if cached is not None and cached[0] is frame:
+            return cached[1]
+        pixmap = QPixmap.fromImage(frame)
+        self._pixmap_cache[index] = (frame, pixmap)
+        return pixmap
+    
+    def current_pixmap(self) -> Optional[QPixmap]:
+        """获取当前帧的QPixmap
+        
+        Returns:
+            Optional[QPixmap]: 当前帧的QPixmap，如果没有帧则返回None
+        """
+        return self.get_pixmap_at_index(self.current_frame_index)
+    
+    def clear_pixmap_cache(self) -> None:
+        """释放已转换的QPixmap（例如动画长时间不再显示时）"""
+        self._pixmap_cache.clear()
+    
     def reset(self) -> None:
         """重置动画到第一帧"""
         self.current_frame_index = 0 if not self.is_reversed else len(self.frames) - 1
@@ -139,6 +174,17 @@ class Animation:
             return self.frames[index]
         return None
     
+    def time_to_next_frame(self) -> Optional[float]:
+        """获取距下一次换帧的时间
+        
+        Returns:
+            Optional[float]: 剩余时间（秒，已到期为0），未在播放或没有帧时返回None
+        """
+        if not self.is_playing or not self.frames or self.fps <= 0:
+            return None
+        elapsed = time.perf_counter() - self.last_frame_time
+        return max(0.0, 1.0 / self.fps - elapsed)
+    
     def update(self, dt: float) -> bool:
         """更新动画状态
         
@@ -0,0 +1,114 @@
+"""
+---------------------------------------------------------------
+File name:                  frame_scheduler.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                自适应帧调度器，根据动画帧率和窗口可见性安排下一次更新
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+                            2026/10/16: 添加 request_frame，在一帧内安排更新，用于投递按帧合并的事件;
+----
+"""
+
+import math
+import logging
+from typing import Optional
+
+from PySide6.QtCore import QTimer, Qt
+
+from status.animation.animation import Animation
+
+logger = logging.getLogger(__name__)
+
+
+class FrameScheduler:
+    """自适应帧调度器
+
+    使用单次触发的QTimer：每次更新结束后根据当前动画距下一帧的时间安排下一次唤醒，
+    没有动画播放或窗口不可见时降到低频，交互事件到来时立即唤醒。
+    """
+
+    def __init__(self, timer: QTimer, min_interval_ms: int = 8, max_interval_ms: int = 1000,
+                 idle_interval_ms: int = 1000, hidden_interval_ms: int = 5000, frame_interval_ms: int = 16):
+        """初始化帧调度器
+
+        Args:
+            timer: 驱动更新的定时器（会被设为单次触发）
+            min_interval_ms: 最短唤醒间隔（毫秒）
+            max_interval_ms: 播放动画时的最长唤醒间隔（毫秒）
+            idle_interval_ms: 窗口可见但没有动画播放时的唤醒间隔（毫秒）
+            hidden_interval_ms: 窗口隐藏或被遮挡时的唤醒间隔（毫秒）
+            frame_interval_ms: request_frame 使用的帧间隔（毫秒）
+        """
+        self._timer = timer
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.min_interval_ms = min_interval_ms
+        self.max_interval_ms = max_interval_ms
+        self.idle_interval_ms = idle_interval_ms
+        self.hidden_interval_ms = hidden_interval_ms
+        self.frame_interval_ms = frame_interval_ms
+
+    def compute_interval(self, animation: Optional[Animation], visible: bool,
+                         deadline_ms: Optional[int] = None) -> int:
+        """计算下一次唤醒的间隔
+
+        Args:
+            animation: 当前动画
+            visible: 窗口是否可见（未隐藏、未最小化且未被遮挡）
+            deadline_ms: 其他需要定时刷新的内容（如统计面板）要求的最长间隔
+
+        Returns:
+            int: 间隔（毫秒）
+        """
+        wait = animation.time_to_next_frame() if animation is not None else None
+        if not visible:
+            interval = self.hidden_interval_ms
+        elif wait is None:
+            interval = self.idle_interval_ms
+        else:
+            interval = min(math.ceil(wait * 1000), self.max_interval_ms)
+
+        if deadline_ms is not None:
+            interval = min(interval, deadline_ms)
+        return max(self.min_interval_ms, interval)
+
+    def schedule(self, animation: Optional[Animation], visible: bool,
+                 deadline_ms: Optional[int] = None) -> int:
+        """按计算出的间隔安排下一次更新
+
+        Args:
+            animation: 当前动画
+            visible: 窗口是否可见
+            deadline_ms: 其他内容要求的最长间隔
+
+        Returns:
+            int: 安排的间隔（毫秒）
+        """
+        interval = self.compute_interval(animation, visible, deadline_ms)
+        self._timer.start(interval)
+        return interval
+
+    def wake(self) -> None:
+        """立即安排一次更新（交互事件、动画切换时调用），已安排立即更新时不重复"""
+        if self._timer.isActive() and self._timer.remainingTime() == 0:
+            return
+        self._timer.start(0)
+
+    def request_frame(self) -> None:
+        """在一帧间隔内安排一次更新，已安排的更新更早时不改变
+
+        与 wake 不同，连续请求不会让更新频率超过帧率，用于投递按帧合并的事件
+        """
+        if self._timer.isActive() and self._timer.remainingTime() <= self.frame_interval_ms:
+            return
+        self._timer.start(self.frame_interval_ms)
+
+    def stop(self) -> None:
+        """停止调度"""
+        self._timer.stop()
+
+
+__all__ = ['FrameScheduler']
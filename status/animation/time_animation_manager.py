@@ -8,6 +8,8 @@ Description:                时间动画管理器
 
 Changed history:            
                             2025/05/14: 初始创建;
+                            2026/10/16: 目录动画帧持久化到磁盘帧缓存，未变化时直接映射而不重新解码;
+                            2026/10/16: 默认不启用磁盘帧缓存，由调用方传入;
 ----
 """
 
@@ -19,6 +21,7 @@ from PySide6.QtGui import QImage, QColor
 
 from status.animation.animation import Animation
 from status.behavior.time_based_behavior import TimePeriod
+from status.resources.frame_cache import FrameDiskCache
 
 
 class TimeAnimationManager(QObject):
@@ -27,17 +30,21 @@ class TimeAnimationManager(QObject):
     # 信号：动画加载完成
     animation_loaded = Signal(str, Animation)
     
-    def __init__(self, base_path: str = ""):
+    def __init__(self, base_path: str = "", frame_cache: Optional[FrameDiskCache] = None):
         """初始化时间动画管理器
         
         Args:
             base_path: 动画资源的基础路径
+            frame_cache: 磁盘帧缓存，为None时每次都重新解码图像
         """
         super().__init__()
         
         # 资源基础路径
         self.base_path = base_path
         
+        # 解码后的帧缓存
+        self.frame_cache = frame_cache
+        
         # 时间段动画字典
         self.time_period_animations: Dict[TimePeriod, Animation] = {}
         
@@ -284,20 +291,22 @@ class TimeAnimationManager(QObject):
             return None
         
         # 收集所有图片文件
-        frames = []
         files = sorted([f for f in os.listdir(directory) if f.endswith(('.png', '.jpg', '.jpeg', '.gif'))])
         
         if not files:
             self.logger.warning(f"目录中没有图片文件: {directory}")
             return None
         
-        for file in files:
-            file_path = os.path.join(directory, file)
-            image = QImage(file_path)
-            if image.isNull():
-                self.logger.warning(f"无法加载图像: {file_path}")
-                continue
-            frames.append(image)
+        # 目录内容未变化时直接映射缓存的帧，不再解码
+        cache_key = self._get_frame_cache_key(directory, files)
+        cached = self.frame_cache.load_frames(cache_key) if cache_key is not None else None
+        if cached is not None:
+            frames = cached[0]
+        else:
+            frames = self._decode_frames(directory, files)
+            # 只缓存完整解码的目录，部分失败时下次仍重新尝试
+            if cache_key is not None and frames and len(frames) == len(files):
+                self.frame_cache.store_frames(cache_key, frames)
         
         if not frames:
             self.logger.warning(f"没有成功加载任何帧: {directory}")
@@ -312,6 +321,27 @@ class TimeAnimationManager(QObject):
         
         return animation
     
+    def _get_frame_cache_key(self, directory: str, files: List[str]) -> Optional[str]:
+        """由目录中图像文件的签名计算帧缓存键，未启用帧缓存或文件不可访问时返回None"""
+        if self.frame_cache is None:
+            return None
+        signature = self.frame_cache.directory_signature(directory, files)
+        if signature is None:
+            return None
+        return self.frame_cache.make_key("directory", signature)
+    
+    def _decode_frames(self, directory: str, files: List[str]) -> List[QImage]:
+        """按顺序解码目录中的图像文件，跳过无法加载的文件"""
+        frames = []
+        for file in files:
+            file_path = os.path.join(directory, file)
+            image = QImage(file_path)
+            if image.isNull():
+                self.logger.warning(f"无法加载图像: {file_path}")
+                continue
+            frames.append(image)
+        return frames
+    
     def _create_placeholder_animation(self, name: str) -> Animation:
         """创建占位符动画
         
@@ -10,9 +10,11 @@ Changed history:
                             2025/04/04: 初始创建;
                             2025/04/04: 添加系统监控相关事件类型;
                             2025/05/13: 添加 STATE_CHANGED 事件类型;
+                            2026/10/16: Event 添加 copy，可以直接作为新事件管理器的事件数据;
 ----
 """
 
+import copy
 import logging
 from typing import Dict, List, Any, Callable, Optional
 from enum import Enum, auto
@@ -58,6 +60,10 @@ class Event:
     def __str__(self) -> str:
         """字符串表示"""
         return f"Event(type={self.type.name}, sender={self.sender}, data={self.data})"
+    
+    def copy(self) -> 'Event':
+        """浅复制事件（新事件管理器排队异步或节流事件时会复制事件数据）"""
+        return copy.copy(self)
 
 # 事件处理器类型: 接收事件对象，无返回值
 EventHandler = Callable[[Event], None]
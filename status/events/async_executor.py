@@ -0,0 +1,310 @@
+"""
+---------------------------------------------------------------
+File name:                  async_executor.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                有界、带优先级的异步事件执行器
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+----
+"""
+
+import heapq
+import logging
+import itertools
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Tuple
+
+from status.events.event_types import OverflowPolicy
+
+
+class _Task:
+    """排队中的任务"""
+
+    __slots__ = ("seq", "fn", "args", "coalesce_key", "enqueued")
+
+    def __init__(self, seq: int, fn: Callable[..., Any], args: Tuple[Any, ...],
+                 coalesce_key: Optional[Hashable]):
+        self.seq = seq
+        self.fn = fn
+        self.args = args
+        self.coalesce_key = coalesce_key
+        self.enqueued = time.perf_counter()
+
+
+class _Lane:
+    """串行通道：同一通道的任务按提交顺序逐个执行"""
+
+    __slots__ = ("key", "priority", "tasks", "index", "running")
+
+    def __init__(self, key: Hashable, priority: int):
+        self.key = key
+        self.priority = priority
+        self.tasks: Deque[_Task] = deque()
+        self.index: Dict[Hashable, _Task] = {}
+        self.running = False
+
+
+class AsyncEventExecutor:
+    """有界、带优先级的异步事件执行器
+
+    任务按通道（通常每个订阅一个通道）排队：同一通道的任务按提交顺序串行执行，
+    不同通道之间按优先级（数值越小越先执行）和提交顺序调度到工作线程上。
+    排队任务总数不超过 max_pending，已满时按溢出策略处理。工作线程在提交任务时按需创建。
+    """
+
+    def __init__(self, max_workers: int = 4, max_pending: int = 1024,
+                 overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+                 block_timeout: Optional[float] = 1.0, name: str = "AsyncEventExecutor"):
+        """初始化执行器
+
+        Args:
+            max_workers: 最大工作线程数
+            max_pending: 最多排队的任务数
+            overflow: 队列已满时的溢出策略
+            block_timeout: BLOCK 策略下最长等待时间（秒），None表示一直等待
+            name: 工作线程名前缀
+        """
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(1, max_pending)
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self.name = name
+        self.logger = logging.getLogger("Status.Events.AsyncEventExecutor")
+
+        self._cond = threading.Condition()
+        self._lanes: Dict[Hashable, _Lane] = {}
+        # 可执行通道的堆：(优先级, 通道首个任务的序号, 通道键)，过期条目在出堆时跳过
+        self._ready: List[Tuple[int, int, Hashable]] = []
+        self._seq = itertools.count()
+        self._workers: List[threading.Thread] = []
+        self._idle_workers = 0
+        self._local = threading.local()
+        self._stopping = False
+
+        # 统计
+        self._pending = 0
+        self._peak_pending = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._dropped = 0
+        self._coalesced = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+
+    def submit(self, fn: Callable[..., Any], *args: Any, priority: int = 50,
+               lane: Optional[Hashable] = None, coalesce_key: Optional[Hashable] = None) -> bool:
+        """提交任务
+
+        Args:
+            fn: 要执行的函数
+            *args: 位置参数
+            priority: 优先级，数值越小越先执行
+            lane: 串行通道键，None表示独立执行
+            coalesce_key: 合并键，通道中已有相同合并键的排队任务时用本次参数替换该任务
+
+        Returns:
+            bool: 是否作为新任务排队（被合并时返回False）
+        """
+        with self._cond:
+            self._stopping = False
+            self._submitted += 1
+            lane_key = lane if lane is not None else ("task", next(self._seq))
+            existing = self._lanes.get(lane_key)
+
+            # 合并到排队中的同键任务（保持原来的排队位置）
+            if coalesce_key is not None and existing is not None:
+                queued = existing.index.get(coalesce_key)
+                if queued is not None:
+                    queued.fn = fn
+                    queued.args = args
+                    self._coalesced += 1
+                    return False
+
+            if self._pending >= self.max_pending:
+                self._make_room()
+
+            target = self._lanes.get(lane_key)
+            if target is None:
+                target = self._lanes[lane_key] = _Lane(lane_key, priority)
+            task = _Task(next(self._seq), fn, args, coalesce_key)
+            target.tasks.append(task)
+            if coalesce_key is not None:
+                target.index[coalesce_key] = task
+            if len(target.tasks) == 1 and not target.running:
+                heapq.heappush(self._ready, (target.priority, task.seq, lane_key))
+
+            self._pending += 1
+            self._peak_pending = max(self._peak_pending, self._pending)
+            self._ensure_worker()
+            self._cond.notify()
+            return True
+
+    def _make_room(self) -> None:
+        """队列已满时按溢出策略腾出空位（调用方需持有锁）"""
+        if self.overflow == OverflowPolicy.BLOCK and not getattr(self._local, "is_worker", False):
+            # 工作线程自己提交时不能阻塞，否则可能所有工作线程互相等待
+            deadline = None if self.block_timeout is None else time.monotonic() + self.block_timeout
+            while self._pending >= self.max_pending:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            if self._pending < self.max_pending:
+                return
+        self._drop_oldest()
+
+    def _drop_oldest(self) -> None:
+        """丢弃优先级最低的通道中最早排队的任务（调用方需持有锁）"""
+        victim: Optional[_Lane] = None
+        for lane in self._lanes.values():
+            if not lane.tasks:
+                continue
+            if (victim is None or lane.priority > victim.priority or
+                    (lane.priority == victim.priority and lane.tasks[0].seq < victim.tasks[0].seq)):
+                victim = lane
+        if victim is None:
+            return
+
+        task = victim.tasks.popleft()
+        if task.coalesce_key is not None and victim.index.get(task.coalesce_key) is task:
+            del victim.index[task.coalesce_key]
+        self._pending -= 1
+        self._dropped += 1
+        if victim.tasks:
+            if not victim.running:
+                heapq.heappush(self._ready, (victim.priority, victim.tasks[0].seq, victim.key))
+        elif not victim.running:
+            del self._lanes[victim.key]
+
+    def _ensure_worker(self) -> None:
+        """可执行通道多于空闲线程且未达上限时创建新的工作线程（调用方需持有锁）"""
+        if len(self._workers) >= self.max_workers or len(self._ready) <= self._idle_workers:
+            return
+        worker = threading.Thread(
+            target=self._worker_loop,
+            name=f"{self.name}-{len(self._workers)}",
+            daemon=True
+        )
+        self._workers.append(worker)
+        worker.start()
+
+    def _next_task(self) -> Optional[Tuple[_Lane, _Task]]:
+        """取出下一个可执行的任务（调用方需持有锁）"""
+        while self._ready:
+            _, seq, lane_key = heapq.heappop(self._ready)
+            lane = self._lanes.get(lane_key)
+            if lane is None or lane.running or not lane.tasks or lane.tasks[0].seq != seq:
+                # 过期条目
+                continue
+            task = lane.tasks.popleft()
+            if task.coalesce_key is not None and lane.index.get(task.coalesce_key) is task:
+                del lane.index[task.coalesce_key]
+            lane.running = True
+            self._pending -= 1
+            latency = time.perf_counter() - task.enqueued
+            self._latency_total += latency
+            self._latency_max = max(self._latency_max, latency)
+            return lane, task
+        return None
+
+    def _worker_loop(self) -> None:
+        self._local.is_worker = True
+        while True:
+            with self._cond:
+                self._idle_workers += 1
+                item = self._next_task()
+                while item is None:
+                    if self._stopping:
+                        self._idle_workers -= 1
+                        self._workers.remove(threading.current_thread())
+                        self._cond.notify_all()
+                        return
+                    self._cond.wait()
+                    item = self._next_task()
+                self._idle_workers -= 1
+                # 腾出了空位，唤醒阻塞的提交者
+                self._cond.notify_all()
+
+            lane, task = item
+            try:
+                task.fn(*task.args)
+                failed = False
+            except Exception as e:
+                failed = True
+                self.logger.error(f"异步事件处理器出错: {str(e)}", exc_info=True)
+
+            with self._cond:
+                if failed:
+                    self._failed += 1
+                else:
+                    self._completed += 1
+                lane.running = False
+                if lane.tasks:
+                    heapq.heappush(self._ready, (lane.priority, lane.tasks[0].seq, lane.key))
+                    self._cond.notify()
+                elif self._lanes.get(lane.key) is lane:
+                    del self._lanes[lane.key]
+
+    def is_worker_thread(self) -> bool:
+        """当前线程是否为本执行器的工作线程"""
+        return getattr(self._local, "is_worker", False)
+
+    def shutdown(self, wait: bool = True, timeout: Optional[float] = None, cancel_pending: bool = False) -> None:
+        """停止工作线程。之后再提交任务会重新创建工作线程
+
+        Args:
+            wait: 是否等待工作线程退出
+            timeout: 最长等待时间（秒）
+            cancel_pending: 是否丢弃尚未开始的任务（否则工作线程执行完排队任务后退出）
+        """
+        with self._cond:
+            self._stopping = True
+            if cancel_pending:
+                self._dropped += self._pending
+                self._pending = 0
+                self._lanes = {key: lane for key, lane in self._lanes.items() if lane.running}
+                for lane in self._lanes.values():
+                    lane.tasks.clear()
+                    lane.index.clear()
+                self._ready.clear()
+            self._cond.notify_all()
+            if not wait or self.is_worker_thread():
+                return
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while self._workers:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取统计信息（队列深度、排队延迟、丢弃和合并数量等）
+
+        Returns:
+            Dict[str, Any]: 统计信息
+        """
+        with self._cond:
+            started = self._completed + self._failed + sum(1 for lane in self._lanes.values() if lane.running)
+            return {
+                "max_workers": self.max_workers,
+                "workers": len(self._workers),
+                "pending": self._pending,
+                "peak_pending": self._peak_pending,
+                "max_pending": self.max_pending,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "dropped": self._dropped,
+                "coalesced": self._coalesced,
+                "avg_latency_ms": self._latency_total / started * 1000 if started else 0.0,
+                "max_latency_ms": self._latency_max * 1000
+            }
+
+
+__all__ = ['AsyncEventExecutor']
@@ -8,22 +8,29 @@ Description:                事件管理器
 
 Changed history:            
                             2025/05/14: 初始创建;
+                            2026/10/16: 按事件类型预先合并通配符订阅生成分发表，emit 不再复制和排序订阅列表;
+                            2026/10/16: 异步订阅改由有界、按优先级调度的 AsyncEventExecutor 执行，去掉中转线程;
+                            2026/10/16: 节流的尾随事件由定时调度器在截止时间投递，不再依赖定期调用 process_throttled_events;
+                            2026/10/16: 添加按帧合并：声明的事件类型在一帧内同键只保留最新一个，由界面帧循环统一投递;
+                            2026/10/16: 按帧合并改为可单独取消的声明，帧更新请求回调随声明注册;
+                            2026/10/16: 节流的尾随事件可通过线程投递器交回发出事件的线程（如界面线程）处理;
 ----
 """
 
 import time
+import heapq
 import logging
 import asyncio
 import threading
-from typing import Dict, List, Set, Optional, Callable, Any, Tuple, Union
-from queue import Queue, Empty
-from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Set, Optional, Callable, Any, Tuple, Union, Hashable
 
 from status.core.types import SingletonType
 from status.events.event_types import (
     EventType, EventData, EventHandler, AsyncEventHandler, EventFilter,
-    EventPriority, ThrottleMode
+    EventPriority, ThrottleMode, OverflowPolicy
 )
+from status.events.async_executor import AsyncEventExecutor
+from status.events.throttle_scheduler import ThrottleScheduler
 
 
 class EventSubscription:
@@ -61,6 +68,8 @@ class EventSubscription:
         # 用于节流的状态跟踪
         self.last_fired_time: float = 0
         self.queued_event: Optional[Tuple[EventType, EventData]] = None
+        # 排队事件的发出线程，尾随事件交回该线程投递（若注册了线程投递器）
+        self.queued_thread: Optional[int] = None
         self.is_throttled: bool = False
         
         # 生成唯一ID，用于标识和移除订阅
@@ -109,6 +118,27 @@ class EventSubscription:
         return False
 
 
+class FrameCoalescing:
+    """按帧合并声明，由 EventManager.coalesce_per_frame 返回，通过 stop_coalescing 取消"""
+    
+    def __init__(
+            self,
+            event_type: EventType,
+            key: Optional[Callable[[EventData], Hashable]] = None,
+            requester: Optional[Callable[[], None]] = None
+    ):
+        """初始化按帧合并声明
+        
+        Args:
+            event_type: 事件类型
+            key: 从事件数据计算合并键的函数
+            requester: 请求界面帧更新的回调
+        """
+        self.event_type = event_type
+        self.key = key
+        self.requester = requester
+
+
 class EventManager(metaclass=SingletonType):
     """事件管理器，负责事件的分发和处理
     
@@ -119,39 +149,91 @@ class EventManager(metaclass=SingletonType):
         """初始化事件管理器"""
         self.logger = logging.getLogger("Status.Events.EventManager")
         
-        # 事件订阅，按事件类型分组
+        # 事件订阅，按事件类型分组（只能通过 subscribe/unsubscribe 修改，以保持分发表同步）
         self.subscriptions: Dict[EventType, List[EventSubscription]] = {}
         # 通配符订阅，接收所有事件
         self.wildcard_subscriptions: List[EventSubscription] = []
         
-        # 用于异步事件处理的队列
-        self.async_event_queue: Queue = Queue()
-        # 异步事件处理线程
-        self.async_thread: Optional[threading.Thread] = None
-        # 线程运行标志
+        # 分发表：每个事件类型按优先级合并了通配符订阅的不可变元组，订阅变化时重建
+        self._dispatch_tables: Dict[EventType, Tuple[EventSubscription, ...]] = {}
+        # 没有特定订阅的事件类型使用的分发表（只有通配符订阅）
+        self._wildcard_table: Tuple[EventSubscription, ...] = ()
+        
+        # 异步订阅的执行器：排队数量有上限，按订阅优先级调度，同一订阅的事件按顺序执行
+        self.async_executor = AsyncEventExecutor(name="EventManagerAsync")
+        # 异步处理运行标志
         self.running: bool = False
-        # 线程池，用于并行处理事件
-        self.thread_pool = ThreadPoolExecutor(max_workers=4)
+        # 排队时只保留最新一个的事件类型（同一订阅尚未处理的旧事件会被新事件替换）
+        self.coalesced_event_types: Set[EventType] = {"SYSTEM_STATS_UPDATED"}
+        
+        # 节流调度器：每个有排队事件的节流订阅一个定时器，在 last_fired_time + 间隔时投递排队事件
+        self.throttle_scheduler = ThrottleScheduler(name="EventManagerThrottle")
+        # 保护节流状态（emit 线程和调度线程都会修改）
+        self._throttle_lock = threading.Lock()
+        # 线程ID -> 在该线程执行回调的投递器（如界面线程的Qt排队调用），用于交回节流的尾随事件
+        self._thread_dispatchers: Dict[int, Callable[[Callable[[], None]], None]] = {}
+        
+        # 按帧合并的事件类型 -> 仍有效的合并声明（全部取消后恢复立即分发）
+        self._frame_coalesced: Dict[EventType, List[FrameCoalescing]] = {}
+        # 等待下一帧投递的事件：(事件类型, 合并键) -> 最新的事件数据
+        self._frame_pending: Dict[Tuple[EventType, Hashable], EventData] = {}
+        # 有事件等待投递的事件类型，用于在每帧第一个事件到达时请求帧更新
+        self._frame_pending_types: Set[EventType] = set()
+        self._frame_lock = threading.Lock()
         
         # 已注册事件类型合集
         self.registered_event_types: Set[EventType] = set()
     
     def start(self) -> None:
-        """启动异步事件处理线程"""
-        if self.async_thread is not None and self.async_thread.is_alive():
+        """启动异步事件处理
+        
+        执行器的工作线程在有异步事件时按需创建，这里只设置运行标志
+        """
+        if self.running:
             return
         
         self.running = True
-        self.async_thread = threading.Thread(target=self._process_async_events, daemon=True)
-        self.async_thread.start()
-        self.logger.info("事件管理器异步处理线程已启动")
+        self.logger.info("事件管理器异步处理已启动")
     
     def stop(self) -> None:
-        """停止异步事件处理线程"""
+        """停止异步事件处理，等待已排队的异步事件处理完毕（最多1秒）"""
         self.running = False
-        if self.async_thread and self.async_thread.is_alive():
-            self.async_thread.join(timeout=1.0)
-            self.logger.info("事件管理器异步处理线程已停止")
+        self.throttle_scheduler.shutdown(wait=True, timeout=1.0)
+        self.async_executor.shutdown(wait=True, timeout=1.0)
+        self.logger.info("事件管理器异步处理已停止")
+    
+    def configure_async_executor(
+            self,
+            max_workers: Optional[int] = None,
+            max_pending: Optional[int] = None,
+            overflow: Optional[OverflowPolicy] = None,
+            block_timeout: Optional[float] = None
+    ) -> None:
+        """配置异步事件执行器，未提供的参数保持不变
+        
+        Args:
+            max_workers: 最大工作线程数
+            max_pending: 最多排队的异步事件数
+            overflow: 队列已满时的溢出策略
+            block_timeout: BLOCK 策略下发出事件的线程最长等待时间（秒）
+        """
+        executor = self.async_executor
+        if max_workers is not None:
+            executor.max_workers = max(1, max_workers)
+        if max_pending is not None:
+            executor.max_pending = max(1, max_pending)
+        if overflow is not None:
+            executor.overflow = overflow
+        if block_timeout is not None:
+            executor.block_timeout = block_timeout
+    
+    def get_async_stats(self) -> Dict[str, Any]:
+        """获取异步事件执行器的统计信息（队列深度、排队延迟、丢弃和合并数量等）
+        
+        Returns:
+            Dict[str, Any]: 统计信息
+        """
+        return self.async_executor.get_stats()
     
     def register_event_type(self, event_type: EventType) -> None:
         """注册事件类型
@@ -181,6 +263,33 @@ class EventManager(metaclass=SingletonType):
         """
         return event_type in self.registered_event_types
     
+    def _merge_dispatch_table(self, specific: List[EventSubscription]) -> Tuple[EventSubscription, ...]:
+        """按优先级合并特定订阅和通配符订阅
+        
+        两个列表都已按优先级排序；优先级相同时特定订阅排在通配符订阅之前。
+        """
+        return tuple(heapq.merge(specific, self.wildcard_subscriptions, key=lambda s: s.priority.value))
+    
+    def _rebuild_dispatch_table(self, event_type: EventType) -> None:
+        """重建单个事件类型的分发表
+        
+        Args:
+            event_type: 事件类型
+        """
+        specific = self.subscriptions.get(event_type)
+        if specific:
+            self._dispatch_tables[event_type] = self._merge_dispatch_table(specific)
+        else:
+            self._dispatch_tables.pop(event_type, None)
+    
+    def _rebuild_all_dispatch_tables(self) -> None:
+        """通配符订阅变化后重建所有分发表（整体替换，正在进行的 emit 不受影响）"""
+        self._dispatch_tables = {
+            event_type: self._merge_dispatch_table(specific)
+            for event_type, specific in self.subscriptions.items() if specific
+        }
+        self._wildcard_table = tuple(self.wildcard_subscriptions)
+    
     def subscribe(
             self,
             event_type: EventType,
@@ -199,7 +308,9 @@ class EventManager(metaclass=SingletonType):
             priority: 事件优先级
             filters: 事件过滤器列表
             is_async: 是否为异步处理器
-            throttle: 事件节流设置，格式为(模式, 间隔秒数)
+            throttle: 事件节流设置，格式为(模式, 间隔秒数)。LAST 和 RATE 模式下被节流的尾随事件
+                由节流调度线程在截止时间投递：如果发出事件的线程通过 set_thread_dispatcher 注册了
+                投递器（如界面线程），同步处理器在该线程中执行，否则在节流调度线程中执行
             once: 是否只触发一次
             
         Returns:
@@ -219,6 +330,7 @@ class EventManager(metaclass=SingletonType):
             # 通配符订阅
             self.wildcard_subscriptions.append(subscription)
             self.wildcard_subscriptions.sort(key=lambda s: s.priority.value)
+            self._rebuild_all_dispatch_tables()
         else:
             # 特定事件类型订阅
             if event_type not in self.subscriptions:
@@ -226,8 +338,9 @@ class EventManager(metaclass=SingletonType):
             
             self.subscriptions[event_type].append(subscription)
             self.subscriptions[event_type].sort(key=lambda s: s.priority.value)
+            self._rebuild_dispatch_table(event_type)
         
-        self.logger.debug(f"已订阅事件: {event_type}")
+        self.logger.debug("已订阅事件: %s", event_type)
         return subscription
     
     def unsubscribe(self, subscription: EventSubscription) -> bool:
@@ -245,18 +358,22 @@ class EventManager(metaclass=SingletonType):
             # 通配符订阅
             if subscription in self.wildcard_subscriptions:
                 self.wildcard_subscriptions.remove(subscription)
+                self.throttle_scheduler.cancel(subscription.id)
+                self._rebuild_all_dispatch_tables()
                 self.logger.debug("已取消通配符事件订阅")
                 return True
         elif event_type in self.subscriptions:
             # 特定事件类型订阅
             if subscription in self.subscriptions[event_type]:
                 self.subscriptions[event_type].remove(subscription)
+                self.throttle_scheduler.cancel(subscription.id)
                 if not self.subscriptions[event_type]:
                     del self.subscriptions[event_type]
-                self.logger.debug(f"已取消事件订阅: {event_type}")
+                self._rebuild_dispatch_table(event_type)
+                self.logger.debug("已取消事件订阅: %s", event_type)
                 return True
         
-        self.logger.warning(f"尝试取消不存在的事件订阅: {event_type}")
+        self.logger.warning("尝试取消不存在的事件订阅: %s", event_type)
         return False
     
     def unsubscribe_all(self, event_type: Optional[EventType] = None) -> None:
@@ -267,21 +384,150 @@ class EventManager(metaclass=SingletonType):
         """
         if event_type is None:
             # 取消所有订阅
+            self.throttle_scheduler.clear()
             self.subscriptions.clear()
             self.wildcard_subscriptions.clear()
+            self._rebuild_all_dispatch_tables()
             self.logger.debug("已取消所有事件订阅")
         elif event_type == "*":
             # 取消所有通配符订阅
+            self._cancel_throttle_timers(self.wildcard_subscriptions)
             self.wildcard_subscriptions.clear()
+            self._rebuild_all_dispatch_tables()
             self.logger.debug("已取消所有通配符事件订阅")
         elif event_type in self.subscriptions:
             # 取消特定事件类型的订阅
+            self._cancel_throttle_timers(self.subscriptions[event_type])
             del self.subscriptions[event_type]
-            self.logger.debug(f"已取消所有 {event_type} 事件订阅")
+            self._rebuild_dispatch_table(event_type)
+            self.logger.debug("已取消所有 %s 事件订阅", event_type)
+    
+    def set_thread_dispatcher(
+            self,
+            thread_id: int,
+            dispatcher: Optional[Callable[[Callable[[], None]], None]]
+    ) -> None:
+        """注册在指定线程中执行回调的投递器
+        
+        该线程发出的节流事件，其尾随事件会通过投递器交回该线程处理，而不是在节流调度线程中处理。
+        界面线程应注册一个排队调用的投递器，使同步处理器可以安全地访问界面控件
+        
+        Args:
+            thread_id: 线程ID（threading.get_ident()）
+            dispatcher: 接收一个无参回调并安排在该线程中执行的函数，None表示取消注册
+        """
+        if dispatcher is None:
+            self._thread_dispatchers.pop(thread_id, None)
+        else:
+            self._thread_dispatchers[thread_id] = dispatcher
+    
+    def coalesce_per_frame(
+            self,
+            event_type: EventType,
+            key: Optional[Callable[[EventData], Hashable]] = None,
+            requester: Optional[Callable[[], None]] = None
+    ) -> FrameCoalescing:
+        """声明按帧合并的事件类型
+        
+        在返回的声明被 stop_coalescing 取消之前，该类型的事件不再立即分发，而是在下一次 flush_coalesced 时投递；
+        期间合并键相同的事件只保留最新一个。同一事件类型可以有多个声明，使用最近一个声明的合并键
+        
+        Args:
+            event_type: 事件类型
+            key: 从事件数据计算合并键的函数，None表示同类型事件全部合并
+            requester: 每帧第一个该类型事件等待投递时调用，用于请求一次界面帧更新（帧更新中应调用 flush_coalesced）
+            
+        Returns:
+            FrameCoalescing: 合并声明，用于取消
+        """
+        coalescing = FrameCoalescing(event_type, key, requester)
+        with self._frame_lock:
+            self._frame_coalesced.setdefault(event_type, []).append(coalescing)
+        return coalescing
+    
+    def stop_coalescing(self, coalescing: FrameCoalescing) -> bool:
+        """取消按帧合并声明
+        
+        事件类型的最后一个声明被取消时，该类型等待中的事件立即投递，之后的事件恢复立即分发
+        
+        Args:
+            coalescing: coalesce_per_frame 返回的合并声明
+            
+        Returns:
+            bool: 是否成功取消
+        """
+        event_type = coalescing.event_type
+        with self._frame_lock:
+            declarations = self._frame_coalesced.get(event_type)
+            if not declarations or coalescing not in declarations:
+                return False
+            declarations.remove(coalescing)
+            if declarations:
+                return True
+            del self._frame_coalesced[event_type]
+            
+            # 取出该类型等待中的事件，避免没有帧循环时一直滞留
+            pending = [(pending_key, event_data) for pending_key, event_data in self._frame_pending.items()
+                       if pending_key[0] == event_type]
+            for pending_key, _ in pending:
+                del self._frame_pending[pending_key]
+            self._frame_pending_types.discard(event_type)
+        
+        for _, event_data in pending:
+            self._dispatch(event_type, event_data)
+        return True
+    
+    def flush_coalesced(self) -> int:
+        """投递所有等待中的按帧合并事件，应在每个界面帧中调用一次
+        
+        Returns:
+            int: 投递的事件数量
+        """
+        with self._frame_lock:
+            if not self._frame_pending:
+                return 0
+            pending, self._frame_pending = self._frame_pending, {}
+            self._frame_pending_types.clear()
+        
+        for (event_type, _), event_data in pending.items():
+            self._dispatch(event_type, event_data)
+        return len(pending)
+    
+    def _defer_to_frame(self, event_type: EventType, event_data: EventData) -> bool:
+        """将按帧合并的事件放入等待队列，替换同键的旧事件
+        
+        Args:
+            event_type: 事件类型
+            event_data: 事件数据
+            
+        Returns:
+            bool: 是否已放入等待队列（声明刚被取消时返回False，应立即分发）
+        """
+        with self._frame_lock:
+            declarations = self._frame_coalesced.get(event_type)
+            if not declarations:
+                return False
+            key_func = declarations[-1].key
+            pending_key = (event_type, key_func(event_data) if key_func is not None else None)
+            request_frame = event_type not in self._frame_pending_types
+            # 先移除旧事件，使投递顺序与最新事件的到达顺序一致
+            self._frame_pending.pop(pending_key, None)
+            self._frame_pending[pending_key] = event_data
+            self._frame_pending_types.add(event_type)
+            requesters = [d.requester for d in declarations if d.requester is not None] if request_frame else []
+        
+        for requester in requesters:
+            try:
+                requester()
+            except Exception as e:
+                self.logger.error(f"请求帧更新时出错: {str(e)}", exc_info=True)
+        return True
     
     def emit(self, event_type: EventType, event_data: Optional[EventData] = None) -> None:
         """发出事件
         
+        声明了按帧合并的事件类型会延迟到下一次 flush_coalesced 时分发
+        
         Args:
             event_type: 事件类型
             event_data: 事件数据
@@ -289,43 +535,33 @@ class EventManager(metaclass=SingletonType):
         if event_data is None:
             event_data = {}
         
-        # 记录日志
-        self.logger.debug(f"发出事件: {event_type} {event_data}")
+        # 记录日志（未启用DEBUG时不格式化事件数据）
+        self.logger.debug("发出事件: %s %s", event_type, event_data)
         
-        # 收集需要处理的订阅
-        to_process = []
-        
-        # 添加特定事件类型的订阅
-        if event_type in self.subscriptions:
-            to_process.extend(self.subscriptions[event_type])
+        if self._frame_coalesced and event_type in self._frame_coalesced and self._defer_to_frame(event_type, event_data):
+            return
         
-        # 添加通配符订阅
-        to_process.extend(self.wildcard_subscriptions)
+        self._dispatch(event_type, event_data)
+    
+    def _dispatch(self, event_type: EventType, event_data: EventData) -> None:
+        """将事件分发给匹配的订阅
         
-        # 按优先级排序
-        to_process.sort(key=lambda s: s.priority.value)
+        Args:
+            event_type: 事件类型
+            event_data: 事件数据
+        """
+        # 预先合并并排序的分发表，订阅变化时整体替换，可以直接迭代
+        to_process = self._dispatch_tables.get(event_type, self._wildcard_table)
         
         # 收集需要移除的订阅
         to_remove = []
         
-        # 处理每个订阅
+        # 处理每个订阅（分发表中的订阅类型都匹配，只需检查过滤器）
         for subscription in to_process:
-            if subscription.matches(event_type, event_data):
+            if not subscription.filters or subscription.matches(event_type, event_data):
                 # 检查是否需要节流
-                if subscription.should_throttle():
-                    # 根据节流模式处理
-                    mode, _ = subscription.throttle
-                    if mode == ThrottleMode.FIRST:
-                        # 保持第一个事件，忽略后续事件
-                        continue
-                    elif mode == ThrottleMode.LAST:
-                        # 替换为最新事件
-                        subscription.queued_event = (event_type, event_data.copy())
-                        continue
-                    elif mode == ThrottleMode.RATE:
-                        # 将事件放入队列，稍后处理
-                        subscription.queued_event = (event_type, event_data.copy())
-                        continue
+                if subscription.throttle and self._throttle_event(subscription, event_type, event_data):
+                    continue
                 
                 # 处理事件
                 self._process_subscription(subscription, event_type, event_data)
@@ -338,6 +574,89 @@ class EventManager(metaclass=SingletonType):
         for subscription in to_remove:
             self.unsubscribe(subscription)
     
+    def _throttle_event(
+            self,
+            subscription: EventSubscription,
+            event_type: EventType,
+            event_data: EventData
+    ) -> bool:
+        """对节流订阅应用节流规则
+        
+        LAST 和 RATE 模式下被节流的事件替换排队事件，并在 last_fired_time + 间隔时由调度器投递
+        
+        Args:
+            subscription: 带节流设置的事件订阅
+            event_type: 事件类型
+            event_data: 事件数据
+            
+        Returns:
+            bool: 事件是否被节流（不应立即处理）
+        """
+        with self._throttle_lock:
+            if not subscription.should_throttle():
+                if subscription.queued_event is not None:
+                    # 定时器尚未触发，排队的旧事件已被当前事件取代
+                    subscription.queued_event = None
+                    self.throttle_scheduler.cancel(subscription.id)
+                return False
+            
+            mode, interval = subscription.throttle
+            if mode in (ThrottleMode.LAST, ThrottleMode.RATE):
+                # 替换为最新事件，截止时间到达时投递
+                subscription.queued_event = (event_type, event_data.copy())
+                subscription.queued_thread = threading.get_ident()
+                self.throttle_scheduler.schedule(
+                    subscription.id, subscription.last_fired_time + interval,
+                    self._flush_throttled, subscription
+                )
+            # FIRST 模式保持第一个事件，忽略后续事件
+            return True
+    
+    def _flush_throttled(self, subscription: EventSubscription) -> None:
+        """投递订阅排队的节流事件（由节流调度器在截止时间调用）
+        
+        发出事件的线程注册了投递器时交回该线程投递，否则在当前线程投递
+        
+        Args:
+            subscription: 事件订阅
+        """
+        dispatcher = self._thread_dispatchers.get(subscription.queued_thread)
+        if dispatcher is None or subscription.queued_thread == threading.get_ident():
+            self._deliver_throttled(subscription)
+            return
+        try:
+            dispatcher(lambda: self._deliver_throttled(subscription))
+        except Exception as e:
+            self.logger.error(f"交回节流事件时出错: {str(e)}", exc_info=True)
+    
+    def _deliver_throttled(self, subscription: EventSubscription) -> None:
+        """处理订阅排队的节流事件，排队事件已被取代或取消时什么也不做
+        
+        Args:
+            subscription: 事件订阅
+        """
+        with self._throttle_lock:
+            queued = subscription.queued_event
+            if queued is None:
+                return
+            subscription.queued_event = None
+            subscription.queued_thread = None
+            subscription.last_fired_time = time.time()
+            subscription.is_throttled = False
+        
+        queued_type, queued_data = queued
+        self._process_subscription(subscription, queued_type, queued_data)
+    
+    def _cancel_throttle_timers(self, subscriptions: List[EventSubscription]) -> None:
+        """取消订阅的节流定时器
+        
+        Args:
+            subscriptions: 事件订阅列表
+        """
+        for subscription in subscriptions:
+            if subscription.throttle:
+                self.throttle_scheduler.cancel(subscription.id)
+    
     def _process_subscription(
             self,
             subscription: EventSubscription,
@@ -353,67 +672,28 @@ class EventManager(metaclass=SingletonType):
         """
         try:
             if subscription.is_async:
-                # 异步处理
-                self.async_event_queue.put((subscription, event_type, event_data.copy()))
+                # 异步处理：同一订阅的事件串行执行，可合并的事件类型只保留最新一个
+                coalesce = (self.async_executor.overflow == OverflowPolicy.COALESCE
+                            or event_type in self.coalesced_event_types)
+                self.async_executor.submit(
+                    subscription.handler, event_type, event_data.copy(),
+                    priority=subscription.priority.value,
+                    lane=subscription.id,
+                    coalesce_key=event_type if coalesce else None
+                )
             else:
                 # 同步处理
                 subscription.handler(event_type, event_data)
         except Exception as e:
             self.logger.error(f"处理事件 {event_type} 时出错: {str(e)}", exc_info=True)
     
-    def _process_async_events(self) -> None:
-        """处理异步事件队列中的事件"""
-        while self.running:
-            try:
-                # 从队列中获取事件，最多等待0.5秒
-                subscription, event_type, event_data = self.async_event_queue.get(timeout=0.5)
-                
-                try:
-                    # 提交到线程池执行
-                    self.thread_pool.submit(subscription.handler, event_type, event_data)
-                except Exception as e:
-                    self.logger.error(f"异步处理事件 {event_type} 时出错: {str(e)}", exc_info=True)
-                
-                # 标记任务完成
-                self.async_event_queue.task_done()
-            except Empty:
-                # 队列为空，继续等待
-                continue
-            except Exception as e:
-                self.logger.error(f"异步事件处理线程出错: {str(e)}", exc_info=True)
-    
     def process_throttled_events(self) -> None:
-        """处理节流队列中的事件
+        """立即投递已到截止时间的节流事件
         
-        此方法应定期调用，以处理使用RATE模式节流的事件
+        节流调度器会在截止时间自动投递排队的事件，此方法只用于在当前线程同步处理已到期的事件，
+        只检查有排队事件的订阅
         """
-        for event_type, subscriptions in self.subscriptions.items():
-            for subscription in subscriptions:
-                if subscription.throttle and subscription.queued_event:
-                    mode, interval = subscription.throttle
-                    current_time = time.time()
-                    
-                    if current_time - subscription.last_fired_time >= interval:
-                        # 可以处理下一个事件了
-                        queued_type, queued_data = subscription.queued_event
-                        self._process_subscription(subscription, queued_type, queued_data)
-                        subscription.last_fired_time = current_time
-                        subscription.queued_event = None
-                        subscription.is_throttled = False
-        
-        # 处理通配符订阅的节流事件
-        for subscription in self.wildcard_subscriptions:
-            if subscription.throttle and subscription.queued_event:
-                mode, interval = subscription.throttle
-                current_time = time.time()
-                
-                if current_time - subscription.last_fired_time >= interval:
-                    # 可以处理下一个事件了
-                    queued_type, queued_data = subscription.queued_event
-                    self._process_subscription(subscription, queued_type, queued_data)
-                    subscription.last_fired_time = current_time
-                    subscription.queued_event = None
-                    subscription.is_throttled = False
+        self.throttle_scheduler.run_due()
     
     def get_subscription_count(self, event_type: Optional[EventType] = None) -> int:
         """获取事件订阅数量
@@ -8,6 +8,7 @@ Description:                事件类型定义
 
 Changed history:            
                             2025/05/14: 初始创建;
+                            2026/10/16: 添加异步事件队列满时的溢出策略;
 ----
 """
 
@@ -113,6 +114,17 @@ class ThrottleMode(Enum):
     NONE = auto()
 
 
+# 异步事件队列溢出策略
+class OverflowPolicy(Enum):
+    """异步事件队列已满时的处理策略"""
+    # 丢弃优先级最低的最早排队的事件
+    DROP_OLDEST = auto()
+    # 同一订阅的同类事件只保留最新的一个（替换排队中的旧事件），仍然已满时丢弃最早的事件
+    COALESCE = auto()
+    # 阻塞发出事件的线程直到队列有空位（超时后丢弃最早的事件）
+    BLOCK = auto()
+
+
 # 资源加载相关事件
 # 将它们定义为普通类或 dataclass，而不是 Enum，以便实例化并携带数据
 
@@ -12,6 +12,7 @@ Changed history:
                             2025/05/16: 添加订阅映射和事件类型枚举的适配;
                             2025/05/16: 添加事件分发和注册处理器的适配;
                             2025/05/16: 添加取消订阅和清空处理器的适配;
+                            2026/10/16: 旧事件类型一次性映射到新事件类型，事件对象按引用直接传递，不再构造包装字典;
 ----
 """
 import logging
@@ -26,6 +27,37 @@ from status.events.event_manager import EventSubscription as AdvancedEventSubscr
 
 logger = logging.getLogger(__name__)
 
+# 旧事件类型到新事件类型的映射，只在导入时计算一次
+_EVENT_TYPE_MAP: Dict[OldEventType, str] = {event_type: event_type.name for event_type in OldEventType}
+
+# 事件数据的载荷类别：SystemStatsUpdatedEvent 取 stats_data；其他旧 Event 取其 data；其余对象原样传递
+_PAYLOAD_STATS, _PAYLOAD_EVENT, _PAYLOAD_PLAIN = range(3)
+# 按数据类型缓存的载荷类别（status.core.events 导入本模块，因此按类名识别新事件类，每个类型只判断一次）
+_payload_kinds: Dict[type, int] = {}
+
+
+def _payload_kind(data_type: type) -> int:
+    """获取数据类型的载荷类别"""
+    kind = _payload_kinds.get(data_type)
+    if kind is None:
+        if data_type.__name__ == "SystemStatsUpdatedEvent":
+            kind = _PAYLOAD_STATS
+        elif issubclass(data_type, OldEvent) and data_type.__name__ != "WindowPositionChangedEvent":
+            kind = _PAYLOAD_EVENT
+        else:
+            # WindowPositionChangedEvent 实例本身就是处理器需要的数据
+            kind = _PAYLOAD_PLAIN
+        _payload_kinds[data_type] = kind
+    return kind
+
+
+def _map_event_type(event_type: Any) -> str:
+    """获取旧事件类型对应的新事件类型"""
+    mapped = _EVENT_TYPE_MAP.get(event_type)
+    if mapped is None:
+        mapped = event_type.name if isinstance(event_type, Enum) else str(event_type)
+    return mapped
+
 # 定义 SingletonType 元类
 class SingletonType(type):
     _instances: Dict[type, Any] = {}
@@ -73,7 +105,7 @@ class LegacyEventManagerAdapter(metaclass=SingletonType):
         if cls._instance is None:
             # logger.debug("LegacyAdapter: 创建第一个实例。") # Already logged by __init__ effectively
             cls._instance = cls() # Calls __init__ via SingletonType
-        logger.info(f"[LegacyAdapter.get_instance] Returning adapter instance id: {id(cls._instance)}")
+        logger.debug("[LegacyAdapter.get_instance] Returning adapter instance id: %s", id(cls._instance))
         return cls._instance
 
     def _create_adapted_handler(
@@ -84,20 +116,16 @@ class LegacyEventManagerAdapter(metaclass=SingletonType):
         """创建一个包装处理器，将新事件系统的参数转换为旧的 Event 对象"""
         
         def adapted_handler(event_type_str: str, event_data: Any) -> None:
-            self.logger.debug(f"LegacyAdapter._adapted_handler: Received from AdvancedEM. Type_str: '{event_type_str}', Event_data_raw: '{event_data}', Type_of_event_data_raw: '{type(event_data)}'")
-            sender: Optional[Any] = None
-            actual_data: Optional[Any] = None
-            
-            if isinstance(event_data, dict):
-                sender = event_data.get("_sender_")
-                actual_data = event_data.get("_data_")
-                self.logger.debug(f"LegacyAdapter._adapted_handler: Extracted from dict. Sender: '{sender}', Actual_data: '{actual_data}', Type_actual_data: '{type(actual_data)}'")
+            if isinstance(event_data, OldEvent):
+                # 适配器发出的事件对象直接传给旧处理器
+                if event_data.type is original_event_type:
+                    legacy_event = event_data
+                else:
+                    legacy_event = OldEvent(original_event_type, event_data.sender, event_data.data)
+            elif isinstance(event_data, dict) and "_data_" in event_data:
+                legacy_event = OldEvent(original_event_type, event_data.get("_sender_"), event_data.get("_data_"))
             else:
-                actual_data = event_data
-                self.logger.debug(f"LegacyAdapter._adapted_handler: Event_data_raw was not dict. Actual_data: '{actual_data}', Type_actual_data: '{type(actual_data)}'")
-
-            legacy_event = OldEvent(original_event_type, sender, actual_data)
-            self.logger.debug(f"LegacyAdapter._adapted_handler: Created legacy_event. Type: {legacy_event.type.name}, Data: '{legacy_event.data}', Type_legacy_event.data: '{type(legacy_event.data)}'")
+                legacy_event = OldEvent(original_event_type, None, event_data)
             
             try:
                 original_handler(legacy_event)
@@ -122,7 +150,7 @@ class LegacyEventManagerAdapter(metaclass=SingletonType):
             return
 
         adapted_handler_func = self._create_adapted_handler(handler, event_type)
-        event_type_str: str = event_type.name
+        event_type_str: str = _map_event_type(event_type)
         
         subscription = self.advanced_em.subscribe(event_type_str, adapted_handler_func)
         
@@ -160,23 +188,13 @@ class LegacyEventManagerAdapter(metaclass=SingletonType):
             logger.error(f"Adapter: dispatch 期望 OldEvent，得到 {type(event)}")
             return
 
-        # logger.debug(f"Adapter: Dispatching legacy event: {event.type.name}")
-        event_type_str: str = event.type.name
+        # SystemStatsUpdatedEvent 作为数据时，处理器需要的是其中的统计字典
+        data = event.data
+        if _payload_kind(type(data)) == _PAYLOAD_STATS and data.stats_data is not None:
+            event = OldEvent(event.type, event.sender, data.stats_data)
         
-        data_for_payload = event.data
-        # Heuristic check for SystemStatsUpdatedEvent-like objects to avoid circular import
-        if hasattr(event.data, 'stats_data') and \
-           type(event.data).__name__ == 'SystemStatsUpdatedEvent' and \
-           getattr(event.data, 'stats_data') is not None:
-            data_for_payload = event.data.stats_data
-
-        adv_event_data: Dict[str, Any] = {
-            "_sender_": event.sender,
-            "_data_": data_for_payload, # Corrected data extraction
-            "_is_legacy_event_": True,
-            "_event_type_enum_val_": event.type.value 
-        }
-        self.advanced_em.emit(event_type_str, adv_event_data)
+        # 事件对象按引用传给所有处理器
+        self.advanced_em.emit(_map_event_type(event.type), event)
 
     def dispatch_event(self, event_type: OldEventType, sender: Any = None, data: Any = None) -> None:
         if not isinstance(event_type, OldEventType):
@@ -194,7 +212,8 @@ class LegacyEventManagerAdapter(metaclass=SingletonType):
         这里，我们将它简化为适配器上下文中的调度。
         如果 AdvancedEM.post_event 有特定的异步/队列逻辑，这个适配器会简化它。
         """
-        logger.debug(f"Adapter: post_event 调用用于事件类型 {event.type.name if hasattr(event, 'type') else 'UnknownEvent'}. 转发...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Adapter: post_event 调用用于事件类型 %s. 转发...", event.type.name if hasattr(event, 'type') else 'UnknownEvent')
         if not isinstance(event, OldEvent):
             logger.error(f"Adapter: post_event 期望 OldEvent 实例，得到 {type(event)}")
             # Potentially, if post_event in AdvancedEM can take type & data, we could adapt further.
@@ -230,83 +249,35 @@ class LegacyEventManagerAdapter(metaclass=SingletonType):
             self.unregister_handler(et_key, handler_key_fn)
 
     def emit(self, event_type: OldEventType, event_data: Any = None, sender: Optional[Any] = None):
-        self.logger.debug(f"LegacyAdapter: emit called with type: {event_type.name if isinstance(event_type, Enum) else event_type}, data type: {type(event_data)}")
+        """发出旧版事件
         
-        payload_data: Any = None
-        actual_sender: Optional[Any] = sender # Use the sender passed to emit first
-
-        # Directly inspect the type of event_data
-        event_data_type_name = type(event_data).__name__
-
-        if event_data_type_name == "SystemStatsUpdatedEvent":
-            # This is when a new SystemStatsUpdatedEvent instance is passed as event_data
-            if hasattr(event_data, 'stats_data'):
-                payload_data = getattr(event_data, 'stats_data')
-                self.logger.debug(f"LegacyAdapter.emit: event_data is SystemStatsUpdatedEvent, using its stats_data.")
-            else:
-                payload_data = event_data # Fallback, should ideally not happen
-                self.logger.warning(f"LegacyAdapter.emit: event_data is SystemStatsUpdatedEvent but no stats_data. Using event_data itself.")
-            if hasattr(event_data, 'sender') and actual_sender is None: # Prioritize explicitly passed sender
-                actual_sender = event_data.sender
-
-        elif event_data_type_name == "WindowPositionChangedEvent":
-            # This is when a new WindowPositionChangedEvent instance is passed as event_data
-            payload_data = event_data # The event instance itself is the data for adapted_handler
-            self.logger.debug(f"LegacyAdapter.emit: event_data is WindowPositionChangedEvent, using event_data itself as payload.")
-            if hasattr(event_data, 'sender') and actual_sender is None:
-                actual_sender = event_data.sender
+        事件类型通过映射表转换，载荷按引用放入一个旧 Event 对象直接发给 AdvancedEventManager，
+        所有适配的处理器共享该对象。
         
-        elif isinstance(event_data, OldEvent):
-            # This is when an old Event instance is passed
-            self.logger.debug(f"LegacyAdapter.emit: event_data is OldEvent. Unwrapping its .data and .sender.")
-            old_event_internal_data = event_data.data
-            if actual_sender is None: # Prioritize explicitly passed sender
-                actual_sender = event_data.sender
-            
-            # Further unwrap if the OldEvent.data itself is a new event type
-            old_event_internal_data_type_name = type(old_event_internal_data).__name__
-            if old_event_internal_data_type_name == "SystemStatsUpdatedEvent":
-                if hasattr(old_event_internal_data, 'stats_data'):
-                    payload_data = getattr(old_event_internal_data, 'stats_data')
-                    self.logger.debug(f"LegacyAdapter.emit: OldEvent.data was SystemStatsUpdatedEvent, using its stats_data.")
-                else:
-                    payload_data = old_event_internal_data # Fallback
-            elif old_event_internal_data_type_name == "WindowPositionChangedEvent":
-                payload_data = old_event_internal_data # Pass the new event instance
-                self.logger.debug(f"LegacyAdapter.emit: OldEvent.data was WindowPositionChangedEvent, using it as payload.")
-            else:
-                payload_data = old_event_internal_data # Generic data from OldEvent
-                self.logger.debug(f"LegacyAdapter.emit: OldEvent.data is generic, using it as payload. Type: {type(payload_data)}")
-
-        else: 
-            # event_data is likely raw data (e.g., a dict not wrapped in any event object)
-            # or an unknown/unhandled event type instance.
-            payload_data = event_data
-            self.logger.debug(f"LegacyAdapter.emit: event_data is raw data or unhandled event type. Using event_data as payload. Type: {type(payload_data)}")
-            # actual_sender remains what was passed to emit or None (already handled)
-
-        payload_for_new_em: Dict[str, Any] = {
-            "_sender_": actual_sender,
-            "_data_": payload_data,
-            "_is_legacy_event_": True, # Signifies this came via adapter for adapted_handler
-            "_event_type_enum_val_": event_type.value if isinstance(event_type, Enum) else None
-        }
-
-        if self.advanced_em:
-            # Log details before emitting to AdvancedEM
-            log_payload_data_repr = str(payload_for_new_em.get('_data_'))[:200] # Avoid overly long logs
-            
-            self.logger.debug(f"LegacyAdapter: Emitting to AdvancedEM. EventType: '{event_type.name if isinstance(event_type, Enum) else event_type}', "
-                              f"Payload's _data_ type: '{type(payload_for_new_em.get('_data_'))}', "
-                              f"Payload's _data_ (preview): '{log_payload_data_repr}', "
-                              f"Payload's _sender_ type: '{type(payload_for_new_em.get('_sender_'))}'")
-            
-            # self.logger.debug(f"LegacyAdapter: Raw payload for AdvancedEM.emit: type='{event_type.name if isinstance(event_type, Enum) else event_type}', "
-            #                   f"full_payload_dict='{payload_for_new_em}'") # This can be very verbose
-            
-            self.advanced_em.emit(event_type.name if isinstance(event_type, Enum) else str(event_type), payload_for_new_em)
+        Args:
+            event_type: 旧事件类型
+            event_data: 事件数据，可以是新事件对象（如 SystemStatsUpdatedEvent）、旧 Event 或原始数据
+            sender: 事件发送者，未提供时使用事件对象的发送者
+        """
+        kind = _payload_kind(type(event_data))
+        if kind == _PAYLOAD_STATS:
+            payload = event_data.stats_data
+        elif kind == _PAYLOAD_EVENT:
+            # 旧 Event：使用其数据，数据是 SystemStatsUpdatedEvent 时继续取出统计字典
+            payload = event_data.data
+            if _payload_kind(type(payload)) == _PAYLOAD_STATS:
+                payload = payload.stats_data
         else:
-            self.logger.warning("LegacyAdapter: Advanced EventManager (advanced_em) is not initialized!")
+            payload = event_data
+        if sender is None and isinstance(event_data, OldEvent):
+            sender = event_data.sender
+        
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("LegacyAdapter: emit %s, payload type: %s, payload (preview): %.200s",
+                              event_type.name if isinstance(event_type, Enum) else event_type,
+                              type(payload).__name__, payload)
+        
+        self.advanced_em.emit(_map_event_type(event_type), OldEvent(event_type, sender, payload))
 
     def unregister_all_handlers(self, target_handler: Optional[Callable] = None, event_type: Optional[OldEventType] = None):
         keys_to_remove: List[Tuple[OldEventType, Callable[[OldEvent], None]]] = []
@@ -0,0 +1,179 @@
+"""
+---------------------------------------------------------------
+File name:                  throttle_scheduler.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                节流事件的定时调度器，在截止时间准时投递被节流的尾随事件
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+----
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+class ThrottleScheduler:
+    """节流事件的定时调度器
+
+    每个键（通常是一个节流订阅）最多有一个待触发的定时器，所有定时器共用一个按截止时间排序的堆
+    和一个后台线程。没有定时器时线程一直等待，不做任何周期性扫描。截止时间使用 time.time()，
+    与 EventSubscription.last_fired_time 一致。回调在调度线程中执行。
+    """
+
+    def __init__(self, name: str = "ThrottleScheduler"):
+        """初始化调度器
+
+        Args:
+            name: 调度线程名
+        """
+        self.name = name
+        self.logger = logging.getLogger("Status.Events.ThrottleScheduler")
+
+        self._cond = threading.Condition()
+        # (截止时间, 序号, 键)，被取消或重新安排的条目在出堆时跳过
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        # 键 -> (序号, 截止时间, 回调, 参数)
+        self._armed: Dict[Hashable, Tuple[int, float, Callable[..., Any], Tuple[Any, ...]]] = {}
+        self._seq = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._fired = 0
+
+    def schedule(self, key: Hashable, deadline: float, callback: Callable[..., Any], *args: Any) -> bool:
+        """在截止时间调用回调。同一个键已有待触发的定时器时不重复安排
+
+        Args:
+            key: 定时器键
+            deadline: 截止时间（time.time() 时间戳）
+            callback: 回调函数
+            *args: 回调参数
+
+        Returns:
+            bool: 是否新安排了定时器
+        """
+        with self._cond:
+            if key in self._armed:
+                return False
+            seq = next(self._seq)
+            self._armed[key] = (seq, deadline, callback, args)
+            heapq.heappush(self._heap, (deadline, seq, key))
+            self._stopping = False
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+            elif self._heap[0][1] == seq:
+                # 新的定时器最早到期，唤醒线程重新计算等待时间
+                self._cond.notify()
+            return True
+
+    def cancel(self, key: Hashable) -> bool:
+        """取消键对应的定时器
+
+        Returns:
+            bool: 是否取消了待触发的定时器
+        """
+        with self._cond:
+            return self._armed.pop(key, None) is not None
+
+    def is_armed(self, key: Hashable) -> bool:
+        """键是否有待触发的定时器"""
+        with self._cond:
+            return key in self._armed
+
+    def clear(self) -> None:
+        """取消所有定时器"""
+        with self._cond:
+            self._armed.clear()
+            self._heap.clear()
+            self._cond.notify()
+
+    def _pop_due(self, now: float) -> Optional[Tuple[Callable[..., Any], Tuple[Any, ...]]]:
+        """取出一个已到期的定时器（调用方需持有锁）"""
+        while self._heap and self._heap[0][0] <= now:
+            _, seq, key = heapq.heappop(self._heap)
+            entry = self._armed.get(key)
+            if entry is None or entry[0] != seq:
+                # 已取消的条目
+                continue
+            del self._armed[key]
+            self._fired += 1
+            return entry[2], entry[3]
+        return None
+
+    def _invoke(self, callback: Callable[..., Any], args: Tuple[Any, ...]) -> None:
+        try:
+            callback(*args)
+        except Exception as e:
+            self.logger.error(f"节流定时器回调出错: {str(e)}", exc_info=True)
+
+    def run_due(self) -> int:
+        """在当前线程立即执行所有已到期的定时器
+
+        Returns:
+            int: 执行的回调数量
+        """
+        count = 0
+        while True:
+            with self._cond:
+                due = self._pop_due(time.time())
+            if due is None:
+                return count
+            self._invoke(*due)
+            count += 1
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    # 丢弃堆顶已取消的条目，避免为它们等待
+                    while self._heap and self._heap[0][2] not in self._armed:
+                        heapq.heappop(self._heap)
+                    if self._stopping and not self._armed:
+                        self._thread = None
+                        self._cond.notify_all()
+                        return
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    now = time.time()
+                    due = self._pop_due(now)
+                    if due is not None:
+                        break
+                    if self._heap:
+                        self._cond.wait(self._heap[0][0] - now)
+            self._invoke(*due)
+
+    def shutdown(self, wait: bool = True, timeout: Optional[float] = None) -> None:
+        """取消所有定时器并停止调度线程。之后再安排定时器会重新启动线程
+
+        Args:
+            wait: 是否等待调度线程退出
+            timeout: 最长等待时间（秒）
+        """
+        with self._cond:
+            self._stopping = True
+            self._armed.clear()
+            self._heap.clear()
+            self._cond.notify_all()
+            thread = self._thread
+        if wait and thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取统计信息（待触发数量、已触发数量、线程是否运行）"""
+        with self._cond:
+            return {
+                "armed": len(self._armed),
+                "fired": self._fired,
+                "running": self._thread is not None
+            }
+
+
+__all__ = ['ThrottleScheduler']
@@ -16,12 +16,23 @@ Changed history:
                             2025/05/14: 添加时间行为系统;
                             2025/05/15: 添加占位符工厂;
                             2025/05/16: 修复退出功能;
+                            2026/10/16: 主循环只在显示帧变化时更新主窗口，使用动画缓存的QPixmap;
+                            2026/10/16: 统计面板数据改由后台采样器收集，主循环只发布新快照;
+                            2026/10/16: 主更新定时器改由帧调度器按动画帧率自适应唤醒，交互时立即唤醒;
+                            2026/10/16: 窗口位置变化事件按帧合并，在主更新循环中统一投递;
+                            2026/10/16: 按帧合并声明属于StatusPet实例，退出或实例回收时取消;
+                            2026/10/16: 更新出错时仍安排下一次更新，窗口重新显示时立即唤醒;
+                            2026/10/16: 界面线程发出的节流事件，其尾随事件交回界面线程处理;
+                            2026/10/16: 按配置创建唯一的磁盘帧缓存并传给占位符工厂和时间动画管理器;
+                            2026/10/16: 重新显示统计面板时不再重新发布隐藏前的旧快照;
 ----
 """
 
 import logging
 import sys
+import threading
 import time
+import weakref
 from typing import Optional, Dict, Any, List, Tuple
 
 import os
@@ -44,15 +55,19 @@ logger = logging.getLogger("StatusApp")
 from status.ui.main_pet_window import MainPetWindow
 from status.ui.system_tray import SystemTrayManager
 from status.ui.stats_panel import StatsPanel
+from status.ui.thread_invoker import ThreadInvoker
 
 from status.animation.animation import Animation
+from status.animation.frame_scheduler import FrameScheduler
 from status.core.event_system import Event, EventType
+from status.events.event_manager import EventManager as AdvancedEventManager, FrameCoalescing
 
 from status.behavior.pet_state import PetState
 from status.behavior.pet_state_machine import PetStateMachine
 from status.behavior.system_state_adapter import SystemStateAdapter
 
-from status.monitoring.system_monitor import publish_stats
+from status.monitoring.system_monitor import publish_stats, publish_stats_data
+from status.monitoring.stats_sampler import StatsSampler
 
 from status.interaction.interaction_handler import InteractionHandler
 from status.behavior.interaction_tracker import InteractionTracker
@@ -61,6 +76,8 @@ from status.behavior.time_based_behavior import TimeBasedBehaviorSystem, TimePer
 from status.behavior.time_state_bridge import TimeStateBridge
 
 from status.pet_assets.placeholder_factory import PlaceholderFactory
+from status.resources.frame_cache import FrameDiskCache
+from status.core.config import config_manager
 
 # 全局实例，允许其他模块访问
 instance = None
@@ -68,6 +85,12 @@ instance = None
 # 未来可能需要的模块
 import math
 
+
+def _release_event_hooks(event_manager: AdvancedEventManager, coalescing: FrameCoalescing, thread_id: int) -> None:
+    """撤销 StatusPet 在事件管理器中的按帧合并声明和界面线程投递器"""
+    event_manager.set_thread_dispatcher(thread_id, None)
+    event_manager.stop_coalescing(coalescing)
+
 class StatusPet:
     """Status Pet 应用主类"""
     
@@ -100,6 +123,10 @@ class StatusPet:
         # 统计面板 (新增)
         self.stats_panel: Optional[StatsPanel] = None
         
+        # 统计面板的后台采样器（面板显示时运行），以及已发布的快照版本
+        self.stats_sampler: Optional[StatsSampler] = StatsSampler()
+        self._published_stats_version = 0
+        
         # 动画
         self.idle_animation: Optional[Animation] = None  # 待机动画
         self.busy_animation: Optional[Animation] = None  # 忙碌动画
@@ -114,6 +141,9 @@ class StatusPet:
         # 状态到动画的映射
         self.state_to_animation_map: Dict[PetState, Optional[Animation]] = {}
         
+        # 磁盘帧缓存 - 在 initialize 中按配置创建
+        self.frame_cache: Optional[FrameDiskCache] = None
+        
         # 占位符工厂 - 用于动态加载状态占位符
         self.placeholder_factory = None
         
@@ -136,9 +166,23 @@ class StatusPet:
         
         # 更新相关
         self._last_update_time = time.perf_counter()
+        self._displayed_frame: Optional[Tuple[Animation, QImage]] = None  # 主窗口当前显示的(动画, 帧)
         self._update_timer = QTimer()
-        self._update_timer.setInterval(1000)  # 修改此处，原为33ms (约30fps)
+        self._update_timer.setInterval(1000)  # 首次唤醒间隔，之后由帧调度器按动画帧率安排
         self._update_timer.timeout.connect(self.update)
+        self.frame_scheduler = FrameScheduler(self._update_timer)
+        
+        # 拖动窗口时每个鼠标移动都会产生位置变化事件，按帧合并后每帧最多投递一次
+        self.advanced_event_manager = AdvancedEventManager()
+        self._position_coalescing = self.advanced_event_manager.coalesce_per_frame(
+            EventType.WINDOW_POSITION_CHANGED.name, requester=self.frame_scheduler.request_frame)
+        # 界面线程发出的节流事件，其尾随事件交回界面线程处理
+        self._thread_invoker = ThreadInvoker()
+        self._gui_thread_id = threading.get_ident()
+        self.advanced_event_manager.set_thread_dispatcher(self._gui_thread_id, self._thread_invoker.post)
+        # 以上注册属于本实例：退出或实例被回收时撤销，不影响事件管理器的其他使用者
+        self._release_event_hooks = weakref.finalize(
+            self, _release_event_hooks, self.advanced_event_manager, self._position_coalescing, self._gui_thread_id)
     
     def create_main_window(self):
         """创建主窗口"""
@@ -153,6 +197,11 @@ class StatusPet:
         # if placeholder_image:
         #     self.main_window.set_image(placeholder_image)
         
+        # 交互事件和窗口重新显示时立即唤醒更新循环（隐藏期间的唤醒间隔很长）
+        for signal in (self.main_window.clicked, self.main_window.double_clicked, self.main_window.dragged,
+                       self.main_window.dropped, self.main_window.mouse_moved, self.main_window.shown):
+            signal.connect(self._wake_update)
+        
         logger.info(f"MainPetWindow创建完成。初始大小: {self.main_window.size()}")
 
         return self.main_window
@@ -260,11 +309,17 @@ class StatusPet:
                 if self.main_window:
                     self.stats_panel.update_position(self.main_window.pos(), self.main_window.size())
                     self.stats_panel.show()
-                # 发布一次最新的统计数据以填充面板
-                publish_stats(include_details=True) 
+                # 启动后台采样，面板在采样器发布新快照后收到数据；保留已发布的版本，
+                # 隐藏前的旧快照不会被重新发布
+                if self.stats_sampler:
+                    self.stats_sampler.start()
+                else:
+                    publish_stats(include_details=True)
             else:
                 logger.debug("隐藏统计面板")
                 self.stats_panel.hide()
+                if self.stats_sampler:
+                    self.stats_sampler.stop()
         else:
             logger.warning("统计面板未初始化，无法切换显示状态。")
 
@@ -274,6 +329,11 @@ class StatusPet:
         
         # 停止所有定时器
         self._update_timer.stop()
+        
+        # 撤销本实例在事件管理器中的注册，等待中的按帧合并事件立即投递
+        release_event_hooks = getattr(self, '_release_event_hooks', None)
+        if release_event_hooks is not None:
+            release_event_hooks()
         if self.main_window and self.main_window.smoothing_timer.isActive():
             self.main_window.smoothing_timer.stop()
         if self.main_window and self.main_window.watchdog_timer.isActive():
@@ -290,6 +350,10 @@ class StatusPet:
             self.main_window.deleteLater()
             self.main_window = None
             
+        # 停止统计采样
+        if getattr(self, 'stats_sampler', None):
+            self.stats_sampler.stop()
+        
         # 清理统计面板
         if self.stats_panel:
             self.stats_panel.close()
@@ -322,6 +386,7 @@ class StatusPet:
             logger.error("PlaceholderFactory未初始化。无法创建角色精灵。")
             if self.main_window: # 如果工厂失败，也尝试设置回退图像
                 self.main_window.set_image(fallback_image)
+                self._displayed_frame = None
             return
 
         # 使用 PlaceholderFactory 获取各种状态的动画
@@ -389,6 +454,7 @@ class StatusPet:
         # 统一设置图像
         if self.main_window:
             self.main_window.set_image(initial_image_to_set)
+            self._displayed_frame = None  # 直接设置的图像不对应动画帧，下次更新时重新显示
         else:
             logger.warning("Main window 不存在，无法设置初始图像。")
 
@@ -458,115 +524,182 @@ class StatusPet:
         
         logger.debug("状态到动画的映射表已初始化")
 
+    def _show_current_frame(self) -> bool:
+        """将当前动画的当前帧显示到主窗口，与已显示的帧相同时直接返回
+        
+        Returns:
+            bool: 当前帧是否有效（已显示或无需重新显示）
+        """
+        animation = self.current_animation
+        frame = animation.current_frame() if animation else None
+        if frame is None or frame.isNull():
+            return False
+        
+        displayed = getattr(self, '_displayed_frame', None)
+        if displayed is not None and displayed[0] is animation and displayed[1] is frame:
+            return True
+        
+        pixmap = animation.current_pixmap()
+        if pixmap is None or pixmap.isNull():
+            return False
+        self.main_window.set_image(pixmap)
+        self._displayed_frame = (animation, frame)
+        return True
+    
+    def _wake_update(self, *args) -> None:
+        """立即唤醒更新循环（交互事件、动画切换时调用）"""
+        scheduler = getattr(self, 'frame_scheduler', None)
+        if scheduler is not None:
+            scheduler.wake()
+        elif hasattr(self, '_update_timer'):
+            self._update_timer.start()
+    
+    def _is_pet_visible(self) -> bool:
+        """主窗口是否可见（未隐藏、未最小化且未被完全遮挡）"""
+        window = self.main_window
+        if not window or not window.isVisible() or window.isMinimized():
+            return False
+        handle = window.windowHandle()
+        return handle is None or handle.isExposed()
+    
+    def _schedule_next_update(self) -> None:
+        """根据当前动画距下一帧的时间和窗口可见性安排下一次更新"""
+        scheduler = getattr(self, 'frame_scheduler', None)
+        if scheduler is None:
+            return
+        # 统计面板显示时至少每秒刷新一次数据
+        deadline_ms = 1000 if self.stats_panel and self.stats_panel.isVisible() else None
+        scheduler.schedule(self.current_animation, self._is_pet_visible(), deadline_ms)
+    
+    def _publish_latest_stats(self) -> None:
+        """采样器有新快照时发布系统统计事件，没有采样器时同步收集"""
+        sampler = getattr(self, 'stats_sampler', None)
+        if sampler is None:
+            publish_stats(include_details=True)
+            return
+        
+        if not sampler.is_running():
+            sampler.start()
+        snapshot = sampler.get_snapshot()
+        if snapshot.version == 0 or snapshot.version == getattr(self, '_published_stats_version', 0):
+            return
+        self._published_stats_version = snapshot.version
+        publish_stats_data(snapshot.to_dict())
+    
     def update(self):
         """应用主更新循环，由QTimer调用"""
-        current_time = time.perf_counter()
-        dt = current_time - self._last_update_time
-        self._last_update_time = current_time
+        try:
+            current_time = time.perf_counter()
+            dt = current_time - self._last_update_time
+            self._last_update_time = current_time
 
-        # 1. 状态机驱动的更新 (如果未来有需要，例如连续状态更新)
-        # if self.state_machine:
-        #     self.state_machine.tick(dt)
+            # 0. 投递本帧内合并的事件（如窗口位置变化）
+            event_manager = getattr(self, 'advanced_event_manager', None)
+            if event_manager is not None:
+                event_manager.flush_coalesced()
 
-        # 2. 处理动画播放
-        if self.current_animation:
-            self.current_animation.update(dt) # Animation.update 控制帧切换
+            # 1. 状态机驱动的更新 (如果未来有需要，例如连续状态更新)
+            # if self.state_machine:
+            #     self.state_machine.tick(dt)
+
+            # 2. 处理动画播放
+            if self.current_animation:
+                self.current_animation.update(dt) # Animation.update 控制帧切换
             
-            # 如果是一次性交互动画播放完毕，则切换到背景状态对应的动画
-            if not self.current_animation.is_looping and \
-               not self.current_animation.is_playing and \
-               (self.current_animation == self.clicked_animation or self.current_animation == self.petted_animation):
-                logger.debug(f"一次性动画 {self.current_animation.name} 在update中检测到播放完毕。切换到背景动画。")
+                # 如果是一次性交互动画播放完毕，则切换到背景状态对应的动画
+                if not self.current_animation.is_looping and \
+                   not self.current_animation.is_playing and \
+                   (self.current_animation == self.clicked_animation or self.current_animation == self.petted_animation):
+                    logger.debug(f"一次性动画 {self.current_animation.name} 在update中检测到播放完毕。切换到背景动画。")
                 
-                current_actual_state = PetState.IDLE # 默认回到IDLE
-                if self.state_machine: # 检查state_machine是否存在
-                    current_actual_state = self.state_machine.get_state() 
-                else:
-                    logger.warning("Update: 状态机不可用，默认回到IDLE动画。")
+                    current_actual_state = PetState.IDLE # 默认回到IDLE
+                    if self.state_machine: # 检查state_machine是否存在
+                        current_actual_state = self.state_machine.get_state() 
+                    else:
+                        logger.warning("Update: 状态机不可用，默认回到IDLE动画。")
                 
-                background_animation = self.state_to_animation_map.get(current_actual_state, self.idle_animation)
+                    background_animation = self.state_to_animation_map.get(current_actual_state, self.idle_animation)
                 
-                if background_animation and background_animation != self.current_animation:
-                    logger.info(f"一次性动画结束，切换到背景动画: {background_animation.name} (基于状态: {current_actual_state.name})")
-                    # self.current_animation.stop() # 旧动画已经is_playing=False了，不需要stop
-                    self.current_animation = background_animation
-                    self.current_animation.reset()
-                    self.current_animation.play()
-                elif not self.current_animation.is_playing: 
-                    # 如果没有找到特定的背景动画，或者目标就是当前（已停止的）动画，则确保idle动画播放
-                    logger.debug(f"未找到特定背景动画或目标是当前已停止动画 {self.current_animation.name}。确保idle动画播放。")
-                    if self.idle_animation and self.current_animation != self.idle_animation:
-                        self.current_animation = self.idle_animation
+                    if background_animation and background_animation != self.current_animation:
+                        logger.info(f"一次性动画结束，切换到背景动画: {background_animation.name} (基于状态: {current_actual_state.name})")
+                        # self.current_animation.stop() # 旧动画已经is_playing=False了，不需要stop
+                        self.current_animation = background_animation
                         self.current_animation.reset()
                         self.current_animation.play()
-                    elif self.idle_animation and not self.idle_animation.is_playing: # 如果当前就是idle但没播放
-                        self.idle_animation.reset()
-                        self.idle_animation.play()
-
-            # 3. 更新主窗口图像
-            if self.main_window and self.current_animation: # 再次检查 self.current_animation 是否有效
-                current_frame_image = self.current_animation.current_frame() # 使用正确的方法名
-                if current_frame_image and not current_frame_image.isNull():
-                    self.main_window.set_image(current_frame_image)
-                # else:
-                    # logger.warning(f"当前动画 {self.current_animation.name} 的当前帧图像无效。") # 暂时注释掉，新的逻辑会覆盖
-
-            # 如果没有当前动画或当前帧无效，尝试设置idle
-            needs_fallback = False
-            fallback_reason = ""
-
-            if not self.current_animation:
-                needs_fallback = True
-                fallback_reason = "self.current_animation is None"
-            elif self.current_animation.current_frame() is None:
-                needs_fallback = True
-                fallback_reason = f"Animation '{self.current_animation.name}' current_frame() is None"
-            elif self.current_animation.current_frame().isNull():
-                needs_fallback = True
-                fallback_reason = f"Animation '{self.current_animation.name}' current_frame().isNull() is True"
-
-            if needs_fallback:
-                if self.main_window and self.idle_animation:
-                    # 只有当真实需要切换到idle时才记录这个warning，避免日志刷屏
-                    if self.current_animation != self.idle_animation or not self.idle_animation.is_playing:
-                        logger.warning(f"动画回退 ({fallback_reason})，切换到idle动画。")
-                    self.current_animation = self.idle_animation
-                    if not self.current_animation.is_playing: # 确保idle动画在播放
-                        self.current_animation.reset()
-                    self.current_animation.play()
+                    elif not self.current_animation.is_playing: 
+                        # 如果没有找到特定的背景动画，或者目标就是当前（已停止的）动画，则确保idle动画播放
+                        logger.debug(f"未找到特定背景动画或目标是当前已停止动画 {self.current_animation.name}。确保idle动画播放。")
+                        if self.idle_animation and self.current_animation != self.idle_animation:
+                            self.current_animation = self.idle_animation
+                            self.current_animation.reset()
+                            self.current_animation.play()
+                        elif self.idle_animation and not self.idle_animation.is_playing: # 如果当前就是idle但没播放
+                            self.idle_animation.reset()
+                            self.idle_animation.play()
+
+                # 3. 更新主窗口图像（帧未变化时不触碰窗口）
+                if self.main_window and self.current_animation: # 再次检查 self.current_animation 是否有效
+                    self._show_current_frame()
+                    # else:
+                        # logger.warning(f"当前动画 {self.current_animation.name} 的当前帧图像无效。") # 暂时注释掉，新的逻辑会覆盖
+
+                # 如果没有当前动画或当前帧无效，尝试设置idle
+                needs_fallback = False
+                fallback_reason = ""
+
+                if not self.current_animation:
+                    needs_fallback = True
+                    fallback_reason = "self.current_animation is None"
+                elif self.current_animation.current_frame() is None:
+                    needs_fallback = True
+                    fallback_reason = f"Animation '{self.current_animation.name}' current_frame() is None"
+                elif self.current_animation.current_frame().isNull():
+                    needs_fallback = True
+                    fallback_reason = f"Animation '{self.current_animation.name}' current_frame().isNull() is True"
+
+                if needs_fallback:
+                    if self.main_window and self.idle_animation:
+                        # 只有当真实需要切换到idle时才记录这个warning，避免日志刷屏
+                        if self.current_animation != self.idle_animation or not self.idle_animation.is_playing:
+                            logger.warning(f"动画回退 ({fallback_reason})，切换到idle动画。")
+                        self.current_animation = self.idle_animation
+                        if not self.current_animation.is_playing: # 确保idle动画在播放
+                            self.current_animation.reset()
+                        self.current_animation.play()
 
-                    current_frame_image = self.current_animation.current_frame()
-                    if current_frame_image and not current_frame_image.isNull():
-                        self.main_window.set_image(current_frame_image)
+                        if not self._show_current_frame():
+                            logger.error("CRITICAL: 回退到Idle动画后，其第一帧也无效！无法显示宠物。") 
                     else:
-                        logger.error("CRITICAL: 回退到Idle动画后，其第一帧也无效！无法显示宠物。") 
-                else:
-                    logger.error(f"CRITICAL: 动画回退 ({fallback_reason})，且无法回退到idle动画 (main_window or idle_animation is None)。无法显示宠物。")
+                        logger.error(f"CRITICAL: 动画回退 ({fallback_reason})，且无法回退到idle动画 (main_window or idle_animation is None)。无法显示宠物。")
 
-        # 4. 更新统计面板 (如果可见且有数据)
-        if self.stats_panel and self.main_window and self.stats_panel.isVisible():
-            # 发布最新的系统统计数据
-            publish_stats(include_details=True)  
+            # 4. 更新统计面板 (如果可见且有数据)
+            if self.stats_panel and self.main_window and self.stats_panel.isVisible():
+                # 发布采样器的最新快照（不在界面线程中采样）
+                self._publish_latest_stats()
             
-            # 更新统计面板位置，使用存储的位置比较来检测移动
-            pet_pos = self.main_window.pos()
-            pet_size = self.main_window.size()
+                # 更新统计面板位置，使用存储的位置比较来检测移动
+                pet_pos = self.main_window.pos()
+                pet_size = self.main_window.size()
             
-            # 存储主窗口位置，用于检测窗口是否移动
-            if not hasattr(self, '_last_window_pos') or not hasattr(self, '_last_window_size'):
-                self._last_window_pos = pet_pos
-                self._last_window_size = pet_size
-                self.stats_panel.update_position(pet_pos, pet_size)
-                logger.debug(f"初始化统计面板位置: {pet_pos}，大小: {pet_size}")
-            elif self._last_window_pos != pet_pos or self._last_window_size != pet_size:
-                self._last_window_pos = pet_pos
-                self._last_window_size = pet_size
-                self.stats_panel.update_position(pet_pos, pet_size)
-                logger.debug(f"已更新统计面板位置，主窗口移动到: {pet_pos}，大小: {pet_size}")
-
-        # 更新托盘可见性状态 (这个逻辑似乎不属于高频update，可以移到实际切换可见性的地方)
-        if self.system_tray and self.main_window:
-            self.system_tray.set_window_visibility(self.main_window.isVisible())
+                # 存储主窗口位置，用于检测窗口是否移动
+                if not hasattr(self, '_last_window_pos') or not hasattr(self, '_last_window_size'):
+                    self._last_window_pos = pet_pos
+                    self._last_window_size = pet_size
+                    self.stats_panel.update_position(pet_pos, pet_size)
+                    logger.debug(f"初始化统计面板位置: {pet_pos}，大小: {pet_size}")
+                elif self._last_window_pos != pet_pos or self._last_window_size != pet_size:
+                    self._last_window_pos = pet_pos
+                    self._last_window_size = pet_size
+                    self.stats_panel.update_position(pet_pos, pet_size)
+                    logger.debug(f"已更新统计面板位置，主窗口移动到: {pet_pos}，大小: {pet_size}")
+
+            # 更新托盘可见性状态 (这个逻辑似乎不属于高频update，可以移到实际切换可见性的地方)
+            if self.system_tray and self.main_window:
+                self.system_tray.set_window_visibility(self.main_window.isVisible())
+        
+        finally:
+            # 5. 安排下一次更新（单次定时器，即使本次更新出错也要继续循环）
+            self._schedule_next_update()
     
     def initialize(self):
         """初始化应用"""
@@ -589,8 +722,11 @@ class StatusPet:
         # 创建 StatsPanel 实例 (但不显示)
         self.stats_panel = StatsPanel()
         
+        # 创建磁盘帧缓存，由占位符工厂和时间动画管理器共用
+        self.frame_cache = FrameDiskCache(enabled=config_manager.get("performance.cache_enabled", True))
+        
         # 初始化占位符工厂 (移到 create_character_sprite 之前)
-        self.placeholder_factory = PlaceholderFactory()
+        self.placeholder_factory = PlaceholderFactory(frame_cache=self.frame_cache)
         logger.info("占位符工厂已初始化")
 
         # 创建角色精灵/动画 (现在 PlaceholderFactory 已初始化)
@@ -629,7 +765,7 @@ class StatusPet:
         
         # 创建时间动画管理器
         from status.animation.time_animation_manager import TimeAnimationManager
-        self.time_animation_manager = TimeAnimationManager()
+        self.time_animation_manager = TimeAnimationManager(frame_cache=self.frame_cache)
         
         # 将已创建的时间动画添加到管理器中
         from status.behavior.time_based_behavior import TimePeriod
@@ -708,9 +844,9 @@ class StatusPet:
         if self.system_tray and self.main_window:
             self.system_tray.set_window_visibility(self.main_window.isVisible())
             
-        # 启动更新定时器 (之前未启动)
-        logger.info("启动更新定时器，间隔: 1000ms (约10fps)") # 修改日志消息
-        self._update_timer.start()
+        # 启动更新循环 (之前未启动)，之后的唤醒间隔由帧调度器决定
+        logger.info("启动更新循环（自适应帧率）")
+        self._wake_update()
     
     def _handle_state_change(self, event: Event):
         """处理状态机状态变化事件，切换动画"""
@@ -761,6 +897,7 @@ class StatusPet:
             self.current_animation = target_animation
             self.current_animation.reset() # 确保从第一帧开始
             self.current_animation.play()
+            self._wake_update()
         elif not target_animation:
             logger.warning(f"状态 {current_pet_state.name} 没有配置对应的动画，将使用idle动画。")
             if self.current_animation != self.idle_animation and self.idle_animation:
@@ -769,6 +906,7 @@ class StatusPet:
                 self.current_animation = self.idle_animation
                 self.current_animation.reset()
                 self.current_animation.play()
+                self._wake_update()
     
     def connect_interaction_handler(self):
         """将窗口的鼠标事件连接到交互处理器"""
@@ -847,8 +985,8 @@ class StatusPet:
         if self.main_window:
             self.main_window.show()
         
-        # 启动更新定时器
-        self._update_timer.start()
+        # 启动更新循环
+        self._wake_update()
         
         # 进入应用事件循环
         logger.info("Starting Status Pet event loop...")
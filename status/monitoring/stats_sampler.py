@@ -0,0 +1,174 @@
+"""
+---------------------------------------------------------------
+File name:                  stats_sampler.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                系统统计后台采样器，按指标组的间隔在工作线程采样并发布不可变快照
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+----
+"""
+
+import copy
+import time
+import logging
+import threading
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from status.monitoring import system_monitor
+
+
+class MetricGroup:
+    """一组一起采样的指标"""
+
+    def __init__(self, name: str, interval: float, collector: Callable[[], Dict[str, Any]]):
+        """初始化指标组
+
+        Args:
+            name: 指标组名称
+            interval: 采样间隔（秒）
+            collector: 采样函数，返回要合并进快照的键值
+        """
+        self.name = name
+        self.interval = interval
+        self.collector = collector
+
+
+class StatsSnapshot:
+    """一次发布的统计快照（只读）
+
+    data 为只读映射；采样器每次发布都会创建新的快照，不会修改已发布快照中的值，
+    界面线程可以直接读取而无需加锁。需要可修改的字典时使用 to_dict()。
+    """
+
+    __slots__ = ("version", "timestamp", "data", "updated_at")
+
+    def __init__(self, version: int, timestamp: float, data: Dict[str, Any], updated_at: Dict[str, float]):
+        self.version = version
+        self.timestamp = timestamp
+        self.data: Mapping[str, Any] = MappingProxyType(data)
+        self.updated_at: Mapping[str, float] = MappingProxyType(updated_at)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """返回快照数据的深拷贝"""
+        return copy.deepcopy(dict(self.data))
+
+
+def default_metric_groups() -> List[MetricGroup]:
+    """默认指标组：CPU/内存快速采样，IO中速，磁盘和GPU慢速，日历数据每分钟一次"""
+    return [
+        MetricGroup("cpu_memory", 1.0, lambda: {**system_monitor.collect_basic_stats(),
+                                                **system_monitor.collect_cpu_memory_details()}),
+        MetricGroup("io", 2.0, system_monitor.collect_io_stats),
+        MetricGroup("gpu", 5.0, system_monitor.collect_gpu_stats),
+        MetricGroup("disk", 10.0, system_monitor.collect_disk_stats),
+        MetricGroup("calendar", 60.0, system_monitor.get_time_data),
+    ]
+
+
+class StatsSampler:
+    """系统统计后台采样器
+
+    在工作线程中按各指标组自己的间隔采样，把结果合并为新的 StatsSnapshot 并原子替换。
+    界面线程通过 get_snapshot() 读取最新快照，不会被psutil、GPUtil等调用阻塞。
+    """
+
+    def __init__(self, groups: Optional[List[MetricGroup]] = None):
+        """初始化采样器
+
+        Args:
+            groups: 指标组列表，默认为 default_metric_groups()
+        """
+        self.logger = logging.getLogger(__name__)
+        self._groups = groups if groups is not None else default_metric_groups()
+        self._next_due: Dict[str, float] = {}
+        self._snapshot = StatsSnapshot(0, 0.0, {}, {})
+        self._sample_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def get_snapshot(self) -> StatsSnapshot:
+        """获取最新快照（不阻塞）"""
+        return self._snapshot
+
+    def is_running(self) -> bool:
+        """采样线程是否在运行"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """启动采样线程，所有指标组立即采样一次"""
+        if self.is_running():
+            return
+        self._stop_event.clear()
+        self._next_due = {group.name: 0.0 for group in self._groups}
+        self._thread = threading.Thread(target=self._run, name="StatsSampler", daemon=True)
+        self._thread.start()
+        self.logger.debug("系统统计采样器已启动")
+
+    def stop(self, timeout: Optional[float] = 2.0) -> None:
+        """停止采样线程
+
+        Args:
+            timeout: 等待线程退出的最长时间（秒）
+        """
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        self._thread = None
+        self.logger.debug("系统统计采样器已停止")
+
+    def sample_now(self, names: Optional[List[str]] = None) -> StatsSnapshot:
+        """在当前线程立即采样指定指标组（默认全部）并发布快照
+
+        Args:
+            names: 指标组名称列表
+
+        Returns:
+            StatsSnapshot: 新快照
+        """
+        groups = [group for group in self._groups if names is None or group.name in names]
+        return self._sample(groups, time.monotonic())
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            now = time.monotonic()
+            due = [group for group in self._groups if self._next_due.get(group.name, 0.0) <= now]
+            if due:
+                self._sample(due, now)
+            if not self._next_due:
+                return
+            timeout = min(self._next_due.values()) - time.monotonic()
+            self._stop_event.wait(max(0.0, timeout))
+
+    def _sample(self, groups: List[MetricGroup], now: float) -> StatsSnapshot:
+        with self._sample_lock:
+            results: Dict[str, Any] = {}
+            sampled: List[str] = []
+            for group in groups:
+                try:
+                    results.update(group.collector() or {})
+                    sampled.append(group.name)
+                except Exception as e:
+                    self.logger.error(f"采样指标组 {group.name} 失败: {e}")
+                self._next_due[group.name] = now + group.interval
+
+            previous = self._snapshot
+            if not sampled:
+                return previous
+
+            data = dict(previous.data)
+            data.update(results)
+            updated_at = dict(previous.updated_at)
+            timestamp = time.time()
+            for name in sampled:
+                updated_at[name] = timestamp
+            # 引用赋值是原子的，读取方总是拿到完整的快照
+            self._snapshot = StatsSnapshot(previous.version + 1, timestamp, data, updated_at)
+            return self._snapshot
+
+
+__all__ = ['MetricGroup', 'StatsSnapshot', 'StatsSampler', 'default_metric_groups']
@@ -10,6 +10,8 @@ Changed history:
                             2025/04/07: 初始创建;
                             2025/04/08: 添加详细系统信息;
                             2025/05/14: 添加时间数据功能;
+                            2026/10/16: 统计信息按指标组拆分收集函数，供后台采样器按不同间隔调用;
+                            2026/10/16: 发布统计信息时的日志改为延迟格式化;
 ----
 """
 
@@ -550,56 +552,93 @@ def get_time_data() -> Dict[str, Any]:
     
     return time_data
 
-def publish_stats(include_details: bool = False):
-    """收集系统统计信息并发布事件"""
-    logger.info("开始收集系统统计信息...")
-    stats: Dict[str, Any] = {}
-
-    # 基本信息
-    stats['cpu'] = get_cpu_usage()
-    stats['memory'] = get_memory_usage()
-
-    if include_details:
-        stats['cpu_cores'] = get_cpu_cores_usage()
-        stats['memory_details'] = get_memory_details()
-        
-        # 获取所有挂载点的磁盘使用情况
-        disk_partitions = psutil.disk_partitions(all=False) # all=False 仅物理设备
-        disk_usage_list = []
-        for partition in disk_partitions:
-            if os.name == 'nt': # Windows 系统
-                # 仅处理固定磁盘，避免光驱等设备
-                if 'fixed' in partition.opts or partition.fstype != '':
-                    try:
-                        usage = get_disk_usage(partition.mountpoint)
-                        usage['mountpoint'] = partition.mountpoint
-                        usage['fstype'] = partition.fstype
-                        disk_usage_list.append(usage)
-                    except PermissionError:
-                        logger.warning(f"无权限访问磁盘: {partition.mountpoint}")
-                    except Exception as e:
-                        logger.error(f"获取磁盘 {partition.mountpoint} 信息失败: {e}")
-            else: # Linux/MacOS 系统
+def collect_basic_stats() -> Dict[str, Any]:
+    """收集CPU和内存使用率"""
+    return {
+        'cpu': get_cpu_usage(),
+        'memory': get_memory_usage()
+    }
+
+def collect_cpu_memory_details() -> Dict[str, Any]:
+    """收集各CPU核心使用率和内存详情"""
+    return {
+        'cpu_cores': get_cpu_cores_usage(),
+        'memory_details': get_memory_details()
+    }
+
+def collect_disk_stats() -> Dict[str, Any]:
+    """收集所有挂载点的磁盘使用情况"""
+    disk_partitions = psutil.disk_partitions(all=False) # all=False 仅物理设备
+    disk_usage_list = []
+    for partition in disk_partitions:
+        if os.name == 'nt': # Windows 系统
+            # 仅处理固定磁盘，避免光驱等设备
+            if 'fixed' in partition.opts or partition.fstype != '':
                 try:
                     usage = get_disk_usage(partition.mountpoint)
                     usage['mountpoint'] = partition.mountpoint
                     usage['fstype'] = partition.fstype
                     disk_usage_list.append(usage)
+                except PermissionError:
+                    logger.warning(f"无权限访问磁盘: {partition.mountpoint}")
                 except Exception as e:
                     logger.error(f"获取磁盘 {partition.mountpoint} 信息失败: {e}")
-        stats['disk'] = disk_usage_list
+        else: # Linux/MacOS 系统
+            try:
+                usage = get_disk_usage(partition.mountpoint)
+                usage['mountpoint'] = partition.mountpoint
+                usage['fstype'] = partition.fstype
+                disk_usage_list.append(usage)
+            except Exception as e:
+                logger.error(f"获取磁盘 {partition.mountpoint} 信息失败: {e}")
+    return {'disk': disk_usage_list}
+
+def collect_io_stats() -> Dict[str, Any]:
+    """收集网络总量和实时磁盘IO/网速"""
+    return {
+        'network': get_network_info(), # 总发送/接收
+        'disk_io': get_disk_io_speed(), # 实时磁盘IO
+        'network_speed': get_network_speed() # 实时网速
+    }
+
+def collect_gpu_stats() -> Dict[str, Any]:
+    """收集GPU信息"""
+    gpu_info_list = get_gpu_info() # 这会返回一个列表
+    # 确保列表不为空，否则为空列表，取决于StatsPanel如何处理
+    return {'gpu': gpu_info_list if gpu_info_list else []}
+
+def publish_stats_data(stats: Dict[str, Any]) -> None:
+    """将已收集的统计信息作为系统统计更新事件发布
 
+    Args:
+        stats: 统计信息字典
+    """
+    # 获取事件管理器实例 (适配器)
+    event_manager = EventManager() # This should be the adapter's get_instance()
+    logger.debug("[publish_stats] EventManager type: %s, id: %s", type(event_manager), id(event_manager))
+    
+    # 创建并发布事件
+    # 关键点: SystemStatsUpdatedEvent 应该使用 stats_data 参数
+    system_event = SystemStatsUpdatedEvent(stats_data=stats) 
+    event_manager.emit(EventType.SYSTEM_STATS_UPDATED, system_event) # event_data is SystemStatsUpdatedEvent instance
 
-        stats['network'] = get_network_info() # 总发送/接收
-        stats['disk_io'] = get_disk_io_speed() # 实时磁盘IO
-        stats['network_speed'] = get_network_speed() # 实时网速
+    logger.info("System stats event published: CPU %s%%, Mem %s%%", stats.get('cpu', 'N/A'), stats.get('memory', 'N/A'))
+
+def publish_stats(include_details: bool = False):
+    """收集系统统计信息并发布事件（同步收集，界面定时刷新请使用StatsSampler）"""
+    logger.info("开始收集系统统计信息...")
+    stats: Dict[str, Any] = {}
+
+    # 基本信息
+    stats.update(collect_basic_stats())
+
+    if include_details:
+        stats.update(collect_cpu_memory_details())
+        stats.update(collect_disk_stats())
+        stats.update(collect_io_stats())
         
         # 尝试获取GPU信息
-        gpu_info_list = get_gpu_info() # 这会返回一个列表
-        if gpu_info_list: # 确保列表不为空
-            stats['gpu'] = gpu_info_list
-        else:
-            stats['gpu'] = [] # 或者 None，取决于StatsPanel如何处理
+        stats.update(collect_gpu_stats())
 
         # 添加时间相关数据
         time_data = get_time_data() # { 'period': 'MORNING', 'special_date': None, 'upcoming_dates': [] }
@@ -607,15 +646,6 @@ def publish_stats(include_details: bool = False):
             stats.update(time_data) # 将时间数据合并到stats字典
             logger.info(f"系统统计包含时间数据: 包含{list(time_data.keys())}")
 
-    # 获取事件管理器实例 (适配器)
-    event_manager = EventManager() # This should be the adapter's get_instance()
-    logger.info(f"[publish_stats] EventManager type: {type(event_manager)}, id: {id(event_manager)}")
-    
-    # 创建并发布事件
-    # 关键点: SystemStatsUpdatedEvent 应该使用 stats_data 参数
-    system_event = SystemStatsUpdatedEvent(stats_data=stats) 
-    event_manager.emit(EventType.SYSTEM_STATS_UPDATED, system_event) # event_data is SystemStatsUpdatedEvent instance
-
-    logger.info(f"System stats event published: CPU {stats.get('cpu', 'N/A')}%, Mem {stats.get('memory', 'N/A')}%")
+    publish_stats_data(stats)
 
 # 可以在这里添加其他系统监控函数
\ No newline at end of file
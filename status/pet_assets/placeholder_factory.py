@@ -10,27 +10,38 @@ Changed history:
                             2025/05/15: 初始创建;
                             2025/05/15: 添加缓存机制;
                             2025/05/15: 添加缓存统计功能;
+                            2026/10/16: 占位符帧持久化到磁盘帧缓存，启动时映射缓存而不重新绘制;
+                            2026/10/16: 默认不启用磁盘帧缓存；缓存键包含占位符直接引用的status模块源码;
 ----
 """
 import importlib
+import inspect
 import logging
 from collections import OrderedDict
+from typing import List, Optional
 from status.behavior.pet_state import PetState
 from status.animation.animation import Animation
+from status.resources.frame_cache import FrameDiskCache
 
 logger = logging.getLogger(__name__)
 
 class PlaceholderFactory:
     """占位符工厂，负责动态加载和提供各状态的占位符动画"""
     
-    def __init__(self, cache_size_limit=5):
+    # 占位符生成代码的版本。缓存键只包含占位符模块及其直接引用的status模块源码，
+    # 绘制逻辑在更深层的辅助代码中变化时必须递增此版本以使磁盘帧缓存失效
+    GENERATOR_VERSION = 1
+    
+    def __init__(self, cache_size_limit=5, frame_cache: Optional[FrameDiskCache] = None):
         """初始化占位符工厂
         
         Args:
             cache_size_limit: 缓存的最大容量，默认为5
+            frame_cache: 磁盘帧缓存，为None时每次都重新绘制
         """
         self._animation_cache = OrderedDict()  # 使用OrderedDict实现LRU缓存
         self._cache_size_limit = cache_size_limit
+        self._frame_cache = frame_cache
         
         # 初始化缓存统计
         self._stats = {
@@ -76,7 +87,7 @@ class PlaceholderFactory:
             logger.debug(f"尝试加载占位符模块: {module_path}")
             placeholder_module = importlib.import_module(module_path)
             if hasattr(placeholder_module, "create_animation"):
-                animation_instance = placeholder_module.create_animation()
+                animation_instance = self._create_animation(placeholder_module)
                 if isinstance(animation_instance, Animation):
                     logger.debug(f"成功加载{state.name}状态的占位符动画")
                     
@@ -97,6 +108,57 @@ class PlaceholderFactory:
             logger.error(f"加载状态{state.name}的占位符时发生意外错误: {e}")
             return None 
             
+    @staticmethod
+    def _source_files(placeholder_module) -> List[str]:
+        """收集占位符模块及其全局名称直接引用的status包模块的源文件"""
+        files = {placeholder_module.__file__}
+        for value in vars(placeholder_module).values():
+            module = value if inspect.ismodule(value) else inspect.getmodule(value)
+            if module is None or module is placeholder_module:
+                continue
+            if not module.__name__.split(".")[0] == "status":
+                continue
+            path = getattr(module, "__file__", None)
+            if isinstance(path, str):
+                files.add(path)
+        return sorted(files)
+    
+    def _frame_cache_key(self, placeholder_module) -> Optional[str]:
+        """由占位符模块及其引用的status模块源码哈希和生成器版本计算磁盘帧缓存键，无法定位源码时返回None"""
+        if self._frame_cache is None:
+            return None
+        if not isinstance(getattr(placeholder_module, "__file__", None), str):
+            return None
+        source_hashes = []
+        for path in self._source_files(placeholder_module):
+            source_hash = self._frame_cache.hash_file(path)
+            if source_hash is None:
+                return None
+            source_hashes.append(source_hash)
+        return self._frame_cache.make_key("placeholder", placeholder_module.__name__,
+                                          *source_hashes, self.GENERATOR_VERSION)
+    
+    def _create_animation(self, placeholder_module):
+        """创建占位符动画，优先从磁盘帧缓存映射，未命中时绘制并写入缓存
+        
+        Args:
+            placeholder_module: 占位符模块
+            
+        Returns:
+            create_animation的返回值或从缓存重建的Animation
+        """
+        cache_key = self._frame_cache_key(placeholder_module)
+        if cache_key is not None:
+            animation = self._frame_cache.load_animation(cache_key)
+            if animation is not None:
+                logger.debug(f"从磁盘帧缓存加载占位符动画: {placeholder_module.__name__}")
+                return animation
+        
+        animation = placeholder_module.create_animation()
+        if cache_key is not None and isinstance(animation, Animation) and animation.frames:
+            self._frame_cache.store_animation(cache_key, animation)
+        return animation
+    
     def _add_to_cache(self, state: PetState, animation: Animation) -> None:
         """将动画添加到缓存中，如果缓存已满则移除最久未使用的项
         
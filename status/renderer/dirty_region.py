@@ -0,0 +1,147 @@
+"""
+---------------------------------------------------------------
+File name:                  dirty_region.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                脏矩形跟踪，记录两帧之间画面发生变化的区域
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+                            2026/10/16: 只在渲染器启用跟踪时记录变化;
+----
+"""
+
+import threading
+import weakref
+from typing import TYPE_CHECKING, List, Optional
+
+from status.renderer.renderer_base import Rect
+
+if TYPE_CHECKING:
+    from status.renderer.drawable import Drawable
+
+
+class DirtyRegion:
+    """脏区域
+
+    可绘制对象的位置、尺寸、缩放、旋转、透明度、可见性或绘制内容改变时，先记录其旧的世界边界，
+    并把对象加入待定集合；渲染器取走脏区域时再补上这些对象当前的世界边界。
+    同一对象在一帧内多次改变只计算一次旧边界。不经过可绘制对象绘制的内容
+    （如粒子、场景转场）需要调用 add_rect 或 mark_all。
+
+    只有渲染器启用跟踪（enable）后才记录变化，未启用时 invalidate 不加锁直接返回。
+    """
+
+    # 矩形数量超过该值时合并为一个外接矩形
+    MAX_RECTS = 32
+
+    def __init__(self):
+        """初始化脏区域（首帧需要全部重绘）"""
+        self._rects: List[Rect] = []
+        self._pending: "weakref.WeakSet[Drawable]" = weakref.WeakSet()
+        self._full = True
+        self._lock = threading.Lock()
+        # 启用跟踪的渲染器数量
+        self._trackers = 0
+
+    @property
+    def enabled(self) -> bool:
+        """是否有渲染器在跟踪脏区域"""
+        return self._trackers > 0
+
+    def enable(self) -> None:
+        """开始跟踪变化（下一帧全部重绘）"""
+        with self._lock:
+            self._trackers += 1
+            self._full = True
+            self._rects.clear()
+
+    def disable(self) -> None:
+        """停止跟踪变化，最后一个跟踪者停止时丢弃已记录的变化"""
+        with self._lock:
+            self._trackers = max(0, self._trackers - 1)
+            if not self._trackers:
+                self._pending.clear()
+                self._rects.clear()
+                self._full = True
+
+    def add_rect(self, rect: Rect) -> None:
+        """标记一个矩形区域为脏"""
+        if not self._trackers or rect.width <= 0 or rect.height <= 0:
+            return
+        with self._lock:
+            self._add(rect)
+
+    def _add(self, rect: Rect) -> None:
+        if self._full:
+            return
+        self._rects.append(rect)
+        if len(self._rects) > self.MAX_RECTS:
+            self._rects = [_bounding(self._rects)]
+
+    def invalidate(self, drawable: 'Drawable') -> None:
+        """可绘制对象即将改变：记录其（及子对象）当前的边界，帧结束时再记录新边界
+
+        Args:
+            drawable: 可绘制对象
+        """
+        if not self._trackers:
+            return
+        with self._lock:
+            self._invalidate(drawable)
+
+    def _invalidate(self, drawable: 'Drawable') -> None:
+        if drawable in self._pending:
+            return
+        if not self._full and drawable.visible:
+            self._add(drawable.dirty_bounds)
+        self._pending.add(drawable)
+        for child in drawable.children:
+            self._invalidate(child)
+
+    def mark_all(self) -> None:
+        """标记整个画面需要重绘"""
+        with self._lock:
+            self._full = True
+            self._rects.clear()
+
+    def is_dirty(self) -> bool:
+        """是否有需要重绘的区域"""
+        with self._lock:
+            return self._full or bool(self._rects) or len(self._pending) > 0
+
+    def collect(self) -> Optional[List[Rect]]:
+        """取走本帧的脏区域并重置
+
+        Returns:
+            Optional[List[Rect]]: None表示需要全部重绘，空列表表示没有变化
+        """
+        with self._lock:
+            pending = list(self._pending)
+            self._pending.clear()
+            if self._full:
+                self._full = False
+                self._rects.clear()
+                return None
+            for drawable in pending:
+                if drawable.visible:
+                    self._add(drawable.dirty_bounds)
+            rects = [rect for rect in self._rects if rect.width > 0 and rect.height > 0]
+            self._rects = []
+            return rects
+
+
+def _bounding(rects: List[Rect]) -> Rect:
+    left = min(rect.x for rect in rects)
+    top = min(rect.y for rect in rects)
+    right = max(rect.x + rect.width for rect in rects)
+    bottom = max(rect.y + rect.height for rect in rects)
+    return Rect(left, top, right - left, bottom - top)
+
+
+# 全局默认脏区域，可绘制对象默认向其报告变化
+default_dirty_region = DirtyRegion()
+
+
+__all__ = ['DirtyRegion', 'default_dirty_region']
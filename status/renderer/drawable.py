@@ -9,6 +9,10 @@ Description:                可绘制对象基类，定义可绘制对象的接
 Changed history:            
                             2025/04/03: 初始创建;
                             2025/05/15: 修复类型提示错误;
+                            2026/10/16: 位置、尺寸、缩放、旋转、透明度和可见性改变时报告脏区域;
+                            2026/10/16: 缓存世界变换矩阵，只在自身或祖先变换改变时失效;
+                            2026/10/16: 添加 invalidate_region 供内容改变时报告脏区域，未启用跟踪时不加锁;
+                            2026/10/16: 世界变换矩阵绕 origin 旋转，点包含检测与图元绘制一致;
 ----
 """
 
@@ -17,6 +21,7 @@ from typing import Tuple, Dict, Any, Optional, List, Set, cast
 import math
 
 from status.renderer.renderer_base import RendererBase, Rect, RenderLayer
+from status.renderer.dirty_region import DirtyRegion, default_dirty_region
 
 class Transform:
     """表示2D变换的类，包括位置、旋转和缩放"""
@@ -173,9 +178,85 @@ class Transform:
                 f"origin=({self.origin_x}, {self.origin_y}))")
 
 
+# 2D仿射矩阵 (a, b, c, d, tx, ty)：x' = a*x + c*y + tx，y' = b*x + d*y + ty
+Matrix = Tuple[float, float, float, float, float, float]
+
+IDENTITY_MATRIX: Matrix = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+
+def _compose_matrix(x: float, y: float, rotation: float, scale_x: float, scale_y: float,
+                    origin_x: float = 0.0, origin_y: float = 0.0) -> Matrix:
+    """由位置、旋转（度）、缩放和原点得到仿射矩阵
+    
+    与图元的绘制方式一致：先缩放，再绕原点旋转，原点缩放后位于 (x + origin_x * scale_x, y + origin_y * scale_y)，
+    即 translate(x, y) · translate(S·origin) · R · S · translate(-origin)。原点为(0, 0)时绕左上角旋转。
+    """
+    if rotation:
+        angle_rad = math.radians(rotation)
+        cos_val = math.cos(angle_rad)
+        sin_val = math.sin(angle_rad)
+    else:
+        cos_val, sin_val = 1.0, 0.0
+    a, b = cos_val * scale_x, sin_val * scale_x
+    c, d = -sin_val * scale_y, cos_val * scale_y
+    tx = x + origin_x * scale_x - (a * origin_x + c * origin_y)
+    ty = y + origin_y * scale_y - (b * origin_x + d * origin_y)
+    return (a, b, c, d, tx, ty)
+
+
+class _RegionAttribute:
+    """赋值时向脏区域报告变化的属性
+    
+    值保存在实例字典的 "_<属性名>" 中。值改变前先让脏区域记录对象的旧边界；
+    影响变换的属性还会使世界变换缓存失效。子类的绘制内容（颜色、源矩形等）使用 transform=False。
+    """
+    
+    def __init__(self, transform: bool = True):
+        self.transform = transform
+    
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.attr = "_" + name
+    
+    def __get__(self, obj: Optional['Drawable'], owner: type) -> Any:
+        if obj is None:
+            return self
+        try:
+            return obj.__dict__[self.attr]
+        except KeyError:
+            raise AttributeError(self.attr[1:]) from None
+    
+    def __set__(self, obj: 'Drawable', value: Any) -> None:
+        values = obj.__dict__
+        if self.attr in values:
+            if values[self.attr] == value:
+                return
+            region = obj.dirty_region
+            if region.enabled:
+                region.invalidate(obj)
+            if self.transform:
+                obj._invalidate_transform()
+        values[self.attr] = value
+
+
 class Drawable:
     """可绘制对象基类"""
     
+    # 影响绘制区域的属性
+    x = _RegionAttribute()
+    y = _RegionAttribute()
+    width = _RegionAttribute()
+    height = _RegionAttribute()
+    scale_x = _RegionAttribute()
+    scale_y = _RegionAttribute()
+    rotation = _RegionAttribute()
+    origin_x = _RegionAttribute()
+    origin_y = _RegionAttribute()
+    visible = _RegionAttribute(transform=False)
+    opacity = _RegionAttribute(transform=False)
+    
+    # 报告变化的脏区域
+    dirty_region: DirtyRegion = default_dirty_region
+    
     def __init__(self, x: float = 0, y: float = 0, width: float = 0, height: float = 0, 
                 layer: RenderLayer = RenderLayer.MIDDLE, priority: int = 0, visible: bool = True):
         """初始化可绘制对象
@@ -215,7 +296,12 @@ class Drawable:
         self._world_scale_x: float = self.scale_x
         self._world_scale_y: float = self.scale_y
         self._world_rotation: float = self.rotation
-        self._dirty: bool = True  # Whether the world transform needs updating
+        self._world_matrix: Matrix = IDENTITY_MATRIX
+        # Whether the world transform needs updating; a dirty node's descendants are always dirty too
+        self._dirty: bool = True
+        
+        # 新对象的区域需要绘制
+        self.invalidate_region()
     
     @property
     def position(self) -> Tuple[float, float]:
@@ -226,7 +312,7 @@ class Drawable:
     def position(self, value: Tuple[float, float]) -> None:
         """设置位置"""
         self.x, self.y = value
-        self._dirty = True
+        self._invalidate_transform()
     
     @property
     def size(self) -> Tuple[float, float]:
@@ -237,7 +323,7 @@ class Drawable:
     def size(self, value: Tuple[float, float]) -> None:
         """设置尺寸"""
         self.width, self.height = value
-        self._dirty = True
+        self._invalidate_transform()
     
     @property
     def center(self) -> Tuple[float, float]:
@@ -250,7 +336,7 @@ class Drawable:
         cx, cy = value
         self.x = cx - self.width / 2
         self.y = cy - self.height / 2
-        self._dirty = True
+        self._invalidate_transform()
     
     @property
     def rect(self) -> Rect:
@@ -262,14 +348,14 @@ class Drawable:
         if child not in self.children:
             self.children.append(child)
             child.parent = self
-            child._dirty = True
+            child._invalidate_transform()
     
     def remove_child(self, child: 'Drawable') -> bool:
         """移除子对象"""
         if child in self.children:
             self.children.remove(child)
             child.parent = None
-            child._dirty = True
+            child._invalidate_transform()
             return True
         return False
     
@@ -285,35 +371,35 @@ class Drawable:
         """设置旋转和缩放的原点（相对于对象左上角）"""
         self.origin_x = origin_x
         self.origin_y = origin_y
-        self._dirty = True
+        self._invalidate_transform()
     
     def set_center_origin(self) -> None:
         """设置旋转和缩放的原点为对象中心"""
         self.origin_x = self.width / 2
         self.origin_y = self.height / 2
-        self._dirty = True
+        self._invalidate_transform()
     
     def move(self, dx: float, dy: float) -> None:
         """移动对象"""
         self.x += dx
         self.y += dy
-        self._dirty = True
+        self._invalidate_transform()
     
     def rotate(self, angle: float) -> None:
         """增加旋转角度"""
         self.rotation += angle
-        self._dirty = True
+        self._invalidate_transform()
     
     def set_rotation(self, angle: float) -> None:
         """设置旋转角度"""
         self.rotation = angle
-        self._dirty = True
+        self._invalidate_transform()
     
     def set_scale(self, scale_x: float, scale_y: float) -> None:
         """设置缩放"""
         self.scale_x = scale_x
         self.scale_y = scale_y
-        self._dirty = True
+        self._invalidate_transform()
     
     def set_opacity(self, opacity: float) -> None:
         """设置透明度 (0.0 - 1.0)"""
@@ -351,43 +437,27 @@ class Drawable:
         return 0 <= local_x <= self.width and 0 <= local_y <= self.height
     
     def contains_point_world(self, x: float, y: float) -> bool:
-        """检查世界坐标点是否在对象边界内"""
-        # 这是一个简化的实现，只考虑了平移和缩放，没有考虑旋转和原点
-        # 更精确的实现需要将世界坐标点反向变换到对象的局部坐标系，再进行判断
-        # 考虑父对象的世界变换
-        if self.parent:
-            parent_world_x, parent_world_y = self.parent.world_position
-            parent_world_scale_x, parent_world_scale_y = self.parent.world_scale
-            parent_world_rotation = self.parent.world_rotation
-
-            # 反向应用父对象的平移
-            relative_x = x - parent_world_x
-            relative_y = y - parent_world_y
-
-            # 反向应用父对象的旋转 (简化处理)
-            # angle_rad = math.radians(-parent_world_rotation)
-            # cos_val = math.cos(angle_rad)
-            # sin_val = math.sin(angle_rad)
-            # rotated_x = relative_x * cos_val - relative_y * sin_val
-            # rotated_y = relative_x * sin_val + relative_y * cos_val
-            rotated_x, rotated_y = relative_x, relative_y # 暂时忽略旋转
-
-            # 反向应用父对象的缩放
-            local_x = rotated_x / parent_world_scale_x if parent_world_scale_x != 0 else rotated_x
-            local_y = rotated_y / parent_world_scale_y if parent_world_scale_y != 0 else rotated_y
-
-            # 再减去对象自身的局部位置，得到相对于对象左上角的坐标
-            object_local_x = local_x - self.x
-            object_local_y = local_y - self.y
-
-        else:
-            # 没有父对象，世界坐标就是局部坐标
-            object_local_x = x - self.x
-            object_local_y = y - self.y
-
-        # 检查点是否在对象的局部边界内
-        return 0 <= object_local_x <= self.width * self.scale_x and \
-               0 <= object_local_y <= self.height * self.scale_y
+        """检查世界坐标点是否在对象边界内（考虑缩放和绕原点的旋转，与图元的绘制一致）"""
+        local = self.world_to_local(x, y)
+        if local is None:
+            return False
+        local_x, local_y = local
+        return 0 <= local_x <= self.width and 0 <= local_y <= self.height
+    
+    def local_to_world(self, x: float, y: float) -> Tuple[float, float]:
+        """将对象局部坐标（相对于左上角、未缩放）变换到世界坐标"""
+        a, b, c, d, tx, ty = self.world_matrix
+        return (a * x + c * y + tx, b * x + d * y + ty)
+    
+    def world_to_local(self, x: float, y: float) -> Optional[Tuple[float, float]]:
+        """将世界坐标变换到对象局部坐标，缩放为0（矩阵不可逆）时返回None"""
+        a, b, c, d, tx, ty = self.world_matrix
+        det = a * d - b * c
+        if det == 0:
+            return None
+        rel_x = x - tx
+        rel_y = y - ty
+        return ((d * rel_x - c * rel_y) / det, (a * rel_y - b * rel_x) / det)
     
     def intersects(self, other: 'Drawable') -> bool:
         """检查是否与另一个可绘制对象相交（考虑世界变换）"""
@@ -412,40 +482,42 @@ class Drawable:
         # 默认实现为空，子类可以重写此方法
         pass
     
+    def invalidate_region(self) -> None:
+        """绘制内容即将改变（图像、颜色等）：在脏区域中记录对象的区域，未启用脏矩形渲染时什么也不做"""
+        region = self.dirty_region
+        if region.enabled:
+            region.invalidate(self)
+    
+    def _invalidate_transform(self) -> None:
+        """使自身及所有子对象的世界变换缓存失效
+        
+        已失效节点的子对象必然也已失效，可以直接返回，连续修改时只遍历一次子树。
+        """
+        if self._dirty:
+            return
+        self._dirty = True
+        for child in self.children:
+            child._invalidate_transform()
+    
     def _update_world_transform(self) -> None:
         """更新世界坐标变换缓存"""
         if not self._dirty:
             return
 
-        if self.parent:
-            # Recursive update of parent's transform
-            self.parent._update_world_transform()
-
-            # Calculate world position, scale, and rotation
-            parent_world_x, parent_world_y = self.parent.world_position
-            parent_world_scale_x, parent_world_scale_y = self.parent.world_scale
-            parent_world_rotation = self.parent.world_rotation
-
-            # Apply parent's scale and rotation to local position
-            # This is a simplified 2D transformation composition
-            translated_x = self.x * parent_world_scale_x
-            translated_y = self.y * parent_world_scale_y
+        parent = self.parent
+        if parent:
+            # Parent's cache is reused if still valid
+            parent._update_world_transform()
 
-            angle_rad = math.radians(parent_world_rotation)
-            cos_val = math.cos(angle_rad)
-            sin_val = math.sin(angle_rad)
-                
-            rotated_x = translated_x * cos_val - translated_y * sin_val
-            rotated_y = translated_x * sin_val + translated_y * cos_val
-                
-            # Apply parent's world position
-            self._world_x = parent_world_x + rotated_x
-            self._world_y = parent_world_y + rotated_y
+            # Apply parent's world matrix to local position
+            a, b, c, d, tx, ty = parent._world_matrix
+            self._world_x = a * self.x + c * self.y + tx
+            self._world_y = b * self.x + d * self.y + ty
 
             # Combine scales and rotations
-            self._world_scale_x = self.scale_x * parent_world_scale_x
-            self._world_scale_y = self.scale_y * parent_world_scale_y
-            self._world_rotation = self.rotation + parent_world_rotation
+            self._world_scale_x = self.scale_x * parent._world_scale_x
+            self._world_scale_y = self.scale_y * parent._world_scale_y
+            self._world_rotation = self.rotation + parent._world_rotation
 
         else:
             # No parent, world transform is same as local transform
@@ -454,8 +526,17 @@ class Drawable:
             self._world_scale_x = self.scale_x
             self._world_scale_y = self.scale_y
             self._world_rotation = self.rotation
-            
+        
+        self._world_matrix = _compose_matrix(self._world_x, self._world_y, self._world_rotation,
+                                             self._world_scale_x, self._world_scale_y,
+                                             self.origin_x, self.origin_y)
         self._dirty = False
+    
+    @property
+    def world_matrix(self) -> Matrix:
+        """获取世界变换矩阵 (a, b, c, d, tx, ty)，将局部坐标（相对于左上角）变换到世界坐标，旋转绕原点进行"""
+        self._update_world_transform()
+        return self._world_matrix
         
     @property
     def world_position(self) -> Tuple[float, float]:
@@ -471,14 +552,29 @@ class Drawable:
         # This calculation needs to transform the object's four corner points to world coordinates,
         # then find the min/max coordinates. This is a simplified implementation.
         # We'll use world position and world size, ignoring rotation for the bounding box.
-        world_x, world_y = self.world_position
-        world_scale_x, world_scale_y = self.world_scale
-        world_width = self.width * world_scale_x
-        world_height = self.height * world_scale_y
+        self._update_world_transform()
+        world_x, world_y = self._world_x, self._world_y
+        world_width = self.width * self._world_scale_x
+        world_height = self.height * self._world_scale_y
         # Need to consider the origin if width/height are used relative to it.
         # For simplicity, assuming origin (0,0) relative to top-left for this rect.
         return Rect(world_x, world_y, world_width, world_height)
 
+    @property
+    def dirty_bounds(self) -> Rect:
+        """获取对象绘制内容在世界坐标系中的保守边界（考虑旋转，外扩1像素用于抗锯齿）"""
+        rect = self.world_rect
+        left, right = sorted((rect.x, rect.x + rect.width))
+        top, bottom = sorted((rect.y, rect.y + rect.height))
+        if self.world_rotation % 360:
+            # 绕原点旋转后的内容不会超出以原点为圆心、到最远角距离为半径的圆
+            world_scale_x, world_scale_y = self.world_scale
+            cx = rect.x + self.origin_x * world_scale_x
+            cy = rect.y + self.origin_y * world_scale_y
+            radius = max(math.hypot(px - cx, py - cy) for px in (left, right) for py in (top, bottom))
+            left, right, top, bottom = cx - radius, cx + radius, cy - radius, cy + radius
+        return Rect(left - 1, top - 1, right - left + 2, bottom - top + 2)
+    
     @property
     def world_scale(self) -> Tuple[float, float]:
         """获取对象在世界坐标系中的缩放"""
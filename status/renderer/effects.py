@@ -8,6 +8,7 @@ Description:                特效系统，提供各种视觉效果
 
 Changed history:            
                             2025/04/03: 初始创建;
+                            2026/10/16: 有活动特效时标记全部重绘，跳过无变化的帧;
 ----
 """
 
@@ -20,6 +21,7 @@ from typing import Dict, List, Tuple, Callable, Optional, Any, Union, Protocol
 
 from status.renderer.drawable import Drawable
 from status.renderer.renderer_base import RendererBase, Color, BlendMode
+from status.renderer.dirty_region import default_dirty_region
 from status.core.event_system import EventSystem, Event, EventType
 
 
@@ -784,6 +786,10 @@ class EffectManager:
             return
             
         with self.lock:
+            if self.effects:
+                # 特效（颜色、粒子等）的绘制范围无法从对象边界得出，有活动特效时整体重绘
+                default_dirty_region.mark_all()
+            
             # 更新所有特效
             for effect in list(self.effects):  # 创建副本以避免迭代过程中的修改
                 effect.update(delta_time)
@@ -798,6 +804,10 @@ class EffectManager:
         Args:
             renderer: 渲染器
         """
+        # 画面没有变化，保留上一帧
+        if renderer.is_frame_skipped():
+            return
+        
         with self.lock:
             # 绘制所有特效
             for effect in self.effects:
@@ -8,6 +8,10 @@ Description:                粒子系统，用于创建各种粒子效果
 
 Changed history:            
                             2025/04/03: 初始创建;
+                            2026/10/16: 粒子系统改用结构数组存储批量更新粒子，绘制时只设置一次混合模式;
+                            2026/10/16: 粒子系统通过渲染器的批量接口一次绘制所有粒子;
+                            2026/10/16: 批量绘制的粒子列由 ParticleBuffer.circle_batch 按列计算;
+                            2026/10/16: ParticleSystem.particles 返回只读快照，修改快照不再影响粒子系统;
 ----
 """
 
@@ -16,11 +20,12 @@ import math
 import logging
 import time
 from enum import Enum, auto
-from typing import Dict, List, Tuple, Callable, Optional, Any, Union
+from typing import Dict, List, Tuple, Callable, Optional, Any, Union, Mapping
 
 from status.renderer.drawable import Drawable
 from status.renderer.renderer_base import RendererBase, Color, BlendMode
 from status.renderer.effects import Effect, EffectState
+from status.renderer.particle_buffer import ParticleBuffer, FIELDS
 from status.core.event_system import EventSystem, Event, EventType
 
 
@@ -78,6 +83,24 @@ class Particle(Drawable):
         self.lifetime = max(0.001, lifetime)  # 避免除零错误
         self.age = 0.0
         self.is_alive = True
+    
+    @classmethod
+    def from_values(cls, values: Mapping[str, float]) -> 'Particle':
+        """由粒子属性创建粒子对象
+        
+        Args:
+            values: 属性名到值的映射，键见 particle_buffer.FIELDS
+            
+        Returns:
+            粒子
+        """
+        color = Color(int(values["r"]), int(values["g"]), int(values["b"]), int(values["a"]))
+        particle = cls(values["x"], values["y"], values["size"], color, values["lifetime"])
+        for name in ("velocity_x", "velocity_y", "acceleration_x", "acceleration_y",
+                     "rotation", "rotation_velocity", "scale_x", "scale_y",
+                     "scale_velocity_x", "scale_velocity_y", "alpha_velocity", "age"):
+            setattr(particle, name, values[name])
+        return particle
         
     @property
     def size(self) -> Tuple[float, float]:
@@ -475,12 +498,20 @@ class ParticleEmitter:
         Returns:
             新创建的粒子
         """
+        return Particle.from_values(dict(zip(FIELDS, self._sample_particle())))
+    
+    def _sample_particle(self) -> Tuple[float, ...]:
+        """随机生成单个粒子的初始属性
+        
+        Returns:
+            按 particle_buffer.FIELDS 顺序排列的属性值
+        """
         # 计算发射位置
         pos_x, pos_y = self._get_emission_position()
         
         # 计算生命周期
         variance_factor = 1.0 - self.particle_lifetime_variance / 2 + random.random() * self.particle_lifetime_variance
-        lifetime = self.particle_lifetime * variance_factor
+        lifetime = max(0.001, self.particle_lifetime * variance_factor)  # 避免除零错误
         
         # 计算大小
         variance_factor = 1.0 - self.particle_size_variance / 2 + random.random() * self.particle_size_variance
@@ -489,41 +520,40 @@ class ParticleEmitter:
         # 计算颜色
         color = self._get_random_color(self.particle_color, self.particle_color_variance)
         
-        # 创建粒子
-        particle = Particle(pos_x, pos_y, size, color, lifetime)
-        
-        # 设置速度
+        # 计算速度
         velocity = self.velocity_min + random.random() * (self.velocity_max - self.velocity_min)
         angle_rad = math.radians(self.velocity_angle + 
                                (random.random() * 2 - 1) * self.velocity_angle_variance)
-        particle.velocity_x = velocity * math.cos(angle_rad)
-        particle.velocity_y = velocity * math.sin(angle_rad)
-        
-        # 设置加速度
-        particle.acceleration_x = self.acceleration_x + self.gravity_x
-        particle.acceleration_y = self.acceleration_y + self.gravity_y
-        
-        # 设置旋转
-        particle.rotation = self.rotation_initial + (random.random() * 2 - 1) * self.rotation_variance
-        particle.rotation_velocity = self.rotation_velocity + (random.random() * 2 - 1) * self.rotation_velocity_variance
-        
-        # 设置缩放
-        scale_variance = (random.random() * 2 - 1) * self.scale_variance
-        particle.scale_x = self.scale_initial * (1.0 + scale_variance)
-        particle.scale_y = particle.scale_x  # 使用相同的缩放比例
-        
-        # 计算缩放速度
-        if self.scale_initial != self.scale_end:
-            scale_delta = self.scale_end - self.scale_initial
-            particle.scale_velocity_x = scale_delta / lifetime
-            particle.scale_velocity_y = scale_delta / lifetime
-            
+        
+        # 计算旋转
+        rotation = self.rotation_initial + (random.random() * 2 - 1) * self.rotation_variance
+        rotation_velocity = self.rotation_velocity + (random.random() * 2 - 1) * self.rotation_velocity_variance
+        
+        # 计算缩放（X/Y使用相同的缩放比例）和缩放速度
+        scale = self.scale_initial * (1.0 + (random.random() * 2 - 1) * self.scale_variance)
+        scale_velocity = (self.scale_end - self.scale_initial) / lifetime
+        
         # 计算透明度变化速度
-        if self.alpha_initial != self.alpha_end:
-            alpha_delta = self.alpha_end - self.alpha_initial
-            particle.alpha_velocity = alpha_delta / lifetime
-            
-        return particle
+        alpha_velocity = (self.alpha_end - self.alpha_initial) / lifetime
+        
+        return (pos_x, pos_y,
+                velocity * math.cos(angle_rad), velocity * math.sin(angle_rad),
+                self.acceleration_x + self.gravity_x, self.acceleration_y + self.gravity_y,
+                rotation, rotation_velocity,
+                scale, scale,
+                scale_velocity, scale_velocity,
+                size, 0.0, lifetime,
+                color.r, color.g, color.b, color.a, alpha_velocity)
+    
+    def emit_into(self, buffer: ParticleBuffer, count: int) -> None:
+        """直接向粒子存储发射粒子，不创建粒子对象
+        
+        Args:
+            buffer: 粒子存储
+            count: 粒子数量
+        """
+        for _ in range(count):
+            buffer.add(self._sample_particle())
     
     def _get_emission_position(self) -> Tuple[float, float]:
         """根据发射形状获取发射位置
@@ -587,23 +617,35 @@ class ParticleEmitter:
         Returns:
             本次更新发射的粒子列表
         """
+        return [self._create_particle() for _ in range(self.pending_count(delta_time))]
+    
+    def pending_count(self, delta_time: float) -> int:
+        """推进发射计时并返回本次更新应发射的粒子数量
+        
+        Args:
+            delta_time: 时间增量（秒）
+            
+        Returns:
+            应发射的粒子数量
+        """
         if not self.is_active:
-            return []
+            return 0
             
         if self.emission_mode == EmissionMode.BURST:
-            if not self.burst_emitted:
-                return self.emit()
-            return []
+            if self.burst_emitted:
+                return 0
+            self.burst_emitted = True
+            return self.burst_count
             
         # 连续发射模式
-        particles = []
+        count = 0
         self.emission_timer += delta_time
         
         while self.emission_timer >= self.emission_interval:
             self.emission_timer -= self.emission_interval
-            particles.extend(self.emit())
+            count += 1
             
-        return particles 
+        return count
 
 
 class ParticleSystem(Effect):
@@ -633,8 +675,8 @@ class ParticleSystem(Effect):
         # 发射器列表
         self.emitters: List[ParticleEmitter] = []
         
-        # 粒子列表
-        self.particles: List[Particle] = []
+        # 粒子存储（结构数组）
+        self.buffer = ParticleBuffer()
         
         # 最大粒子数量
         self.max_particles = 1000
@@ -686,9 +728,21 @@ class ParticleSystem(Effect):
             emitter.x += dx
             emitter.y += dy
     
+    @property
+    def particles(self) -> List[Particle]:
+        """获取当前粒子的只读快照（会为每个粒子创建对象，仅用于调试和兼容）
+        
+        粒子存储在 buffer 的列中，返回的 Particle 是按当前值新建的副本，修改它们不会影响
+        粒子系统。需要修改粒子时直接写 buffer.column(name) 中对应下标的值。
+        
+        Returns:
+            粒子列表
+        """
+        return [Particle.from_values(values) for values in self.buffer.rows()]
+    
     def clear_particles(self) -> None:
         """清除所有粒子"""
-        self.particles.clear()
+        self.buffer.clear()
     
     def set_max_particles(self, max_count: int) -> None:
         """设置最大粒子数量
@@ -698,10 +752,8 @@ class ParticleSystem(Effect):
         """
         self.max_particles = max(1, max_count)  # 允许更小的粒子数量限制
         
-        # 如果当前粒子数量超过最大值，移除多余的粒子
-        if len(self.particles) > self.max_particles:
-            # 保留最新的粒子
-            self.particles = self.particles[-self.max_particles:]
+        # 如果当前粒子数量超过最大值，保留最新的粒子
+        self.buffer.keep_newest(self.max_particles)
     
     def update(self, delta_time: float) -> None:
         """更新粒子系统
@@ -715,28 +767,23 @@ class ParticleSystem(Effect):
         if self._state != EffectState.PLAYING:
             return
         
-        # 更新所有发射器并收集新粒子
-        new_particles = []
-        for emitter in self.emitters:
-            particles = emitter.update(delta_time)
-            new_particles.extend(particles)
-        
-        # 先更新现有粒子的状态
-        alive_particles = []
-        for particle in self.particles:
-            particle.update(delta_time)
-            if particle.is_alive:
-                alive_particles.append(particle)
-        
-        # 合并现有粒子和新粒子，确保不超过最大限制
-        self.particles = alive_particles + new_particles
-        if len(self.particles) > self.max_particles:
-            # 保留最新的粒子
-            self.particles = self.particles[-self.max_particles:]
+        # 更新所有发射器，统计本次要发射的粒子数量
+        pending = [(emitter, emitter.pending_count(delta_time)) for emitter in self.emitters]
+        
+        # 先更新现有粒子的状态（按列批量积分并压缩死亡粒子）
+        self.buffer.update(delta_time)
+        
+        # 追加新粒子，确保不超过最大限制（保留最新的粒子，超出部分不再生成）
+        skip = max(0, sum(count for _, count in pending) - self.max_particles)
+        for emitter, count in pending:
+            dropped = min(skip, count)
+            skip -= dropped
+            emitter.emit_into(self.buffer, count - dropped)
+        self.buffer.keep_newest(self.max_particles)
         
         # 如果需要排序粒子
-        if self.sort_particles and self.particles:
-            self.particles.sort(key=lambda p: p.y)
+        if self.sort_particles:
+            self.buffer.sort_by("y")
     
     def draw(self, renderer: RendererBase) -> None:
         """绘制粒子系统
@@ -747,9 +794,31 @@ class ParticleSystem(Effect):
         if self._state != EffectState.PLAYING:
             return
         
-        # 绘制所有粒子
-        for particle in self.particles:
-            particle.draw(renderer)
+        buffer = self.buffer
+        if not buffer.count:
+            return
+        
+        # 所有粒子使用相同的混合模式
+        renderer.set_blend_mode(BlendMode.ALPHA_BLEND)
+        
+        # 等比缩放的圆形不受旋转影响，按缩放后的半径批量绘制
+        batch, irregular = buffer.circle_batch()
+        renderer.draw_particles_batch(*batch)
+        
+        # 非等比缩放的粒子逐个应用变换绘制
+        if irregular:
+            xs, ys, sizes = buffer.column("x"), buffer.column("y"), buffer.column("size")
+            rs, gs, bs, alphas = buffer.column("r"), buffer.column("g"), buffer.column("b"), buffer.column("a")
+            scale_xs, scale_ys = buffer.column("scale_x"), buffer.column("scale_y")
+            rotations = buffer.column("rotation")
+            for i in irregular:
+                color = Color(int(rs[i]), int(gs[i]), int(bs[i]), int(alphas[i]))
+                renderer.push_transform()
+                renderer.translate(xs[i], ys[i])
+                renderer.rotate(rotations[i])
+                renderer.scale(scale_xs[i], scale_ys[i])
+                renderer.draw_circle(0, 0, sizes[i] / 2, color)
+                renderer.pop_transform()
     
     def start(self) -> None:
         """开始粒子系统"""
@@ -771,7 +840,7 @@ class ParticleSystem(Effect):
             emitter.is_active = False
         
         # 清除所有粒子
-        self.particles.clear()
+        self.buffer.clear()
     
     def pause(self) -> None:
         """暂停粒子系统"""
@@ -795,7 +864,7 @@ class ParticleSystem(Effect):
         Returns:
             当前粒子数量
         """
-        return len(self.particles)
+        return self.buffer.count
 
 
 # 预设特效
@@ -0,0 +1,253 @@
+"""
+---------------------------------------------------------------
+File name:                  particle_buffer.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                结构数组（SoA）粒子存储，按列批量积分和压缩粒子
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+                            2026/10/16: 添加 circle_batch，按列计算批量绘制的粒子列和半径;
+----
+"""
+
+from array import array
+from itertools import compress
+from typing import Any, Dict, List, Sequence, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None  # type: ignore[assignment]
+    HAS_NUMPY = False
+
+
+# 粒子属性列，add() 接收的值按此顺序排列
+FIELDS = (
+    "x", "y",
+    "velocity_x", "velocity_y",
+    "acceleration_x", "acceleration_y",
+    "rotation", "rotation_velocity",
+    "scale_x", "scale_y",
+    "scale_velocity_x", "scale_velocity_y",
+    "size", "age", "lifetime",
+    "r", "g", "b", "a", "alpha_velocity",
+)
+
+# 生命周期短于该值的粒子不会因到期而消亡（与 Particle.update 的行为一致）
+MIN_EXPIRING_LIFETIME = 0.5
+
+
+class ParticleBuffer:
+    """结构数组粒子存储
+
+    每个粒子属性保存在一列连续的 float64 数组中（可用时为NumPy数组，否则为
+    array('d')），更新时逐列积分，不再为每个粒子创建对象或颜色。死亡粒子在原地压缩，
+    列中始终按发射先后排列，最旧的粒子在前。
+    """
+
+    def __init__(self, capacity: int = 64, use_numpy: bool = HAS_NUMPY):
+        """初始化粒子存储
+
+        Args:
+            capacity: 初始容量（仅NumPy后端预分配）
+            use_numpy: 是否使用NumPy后端（NumPy不可用时忽略）
+        """
+        self.use_numpy = use_numpy and HAS_NUMPY
+        self.count = 0
+        if self.use_numpy:
+            self._columns: Dict[str, Any] = {name: np.zeros(max(1, capacity)) for name in FIELDS}
+        else:
+            self._columns = {name: array('d') for name in FIELDS}
+
+    def __len__(self) -> int:
+        return self.count
+
+    def column(self, name: str) -> Sequence[float]:
+        """获取存活粒子的某一列（NumPy后端返回视图，勿保留到下一次更新之后）
+
+        Args:
+            name: 列名，见 FIELDS
+
+        Returns:
+            Sequence[float]: 列数据
+        """
+        col = self._columns[name]
+        return col[:self.count] if self.use_numpy else col
+
+    def get(self, index: int) -> Dict[str, float]:
+        """获取单个粒子的全部属性"""
+        return {name: float(self._columns[name][index]) for name in FIELDS}
+
+    def add(self, values: Sequence[float]) -> None:
+        """追加一个粒子
+
+        Args:
+            values: 按 FIELDS 顺序排列的属性值
+        """
+        if self.use_numpy:
+            self._reserve(self.count + 1)
+            for name, value in zip(FIELDS, values):
+                self._columns[name][self.count] = value
+        else:
+            for name, value in zip(FIELDS, values):
+                self._columns[name].append(value)
+        self.count += 1
+
+    def _reserve(self, capacity: int) -> None:
+        current = len(self._columns["x"])
+        if capacity <= current:
+            return
+        new_capacity = max(capacity, current * 2)
+        for name, col in self._columns.items():
+            grown = np.zeros(new_capacity)
+            grown[:self.count] = col[:self.count]
+            self._columns[name] = grown
+
+    def clear(self) -> None:
+        """移除所有粒子"""
+        if not self.use_numpy:
+            for col in self._columns.values():
+                del col[:]
+        self.count = 0
+
+    def discard_oldest(self, n: int) -> None:
+        """移除最旧的 n 个粒子"""
+        n = min(n, self.count)
+        if n <= 0:
+            return
+        if self.use_numpy:
+            for col in self._columns.values():
+                col[:self.count - n] = col[n:self.count]
+        else:
+            for col in self._columns.values():
+                del col[:n]
+        self.count -= n
+
+    def keep_newest(self, limit: int) -> None:
+        """只保留最新的 limit 个粒子"""
+        self.discard_oldest(self.count - limit)
+
+    def update(self, delta_time: float) -> int:
+        """推进所有粒子并压缩掉死亡粒子
+
+        Args:
+            delta_time: 时间增量（秒）
+
+        Returns:
+            int: 本次移除的粒子数量
+        """
+        if self.count == 0:
+            return 0
+        if self.use_numpy:
+            return self._update_numpy(delta_time)
+        return self._update_array(delta_time)
+
+    def _update_numpy(self, dt: float) -> int:
+        n = self.count
+        c = {name: col[:n] for name, col in self._columns.items()}
+        c["age"] += dt
+        alive = ~((c["age"] >= c["lifetime"]) & (c["lifetime"] >= MIN_EXPIRING_LIFETIME))
+
+        c["velocity_x"] += c["acceleration_x"] * dt
+        c["velocity_y"] += c["acceleration_y"] * dt
+        c["x"] += c["velocity_x"] * dt
+        c["y"] += c["velocity_y"] * dt
+        c["rotation"] += c["rotation_velocity"] * dt
+        c["scale_x"] += c["scale_velocity_x"] * dt
+        c["scale_y"] += c["scale_velocity_y"] * dt
+        c["a"] += c["alpha_velocity"] * dt
+        np.clip(c["a"], 0.0, 255.0, out=c["a"])
+
+        if alive.all():
+            return 0
+        kept = int(alive.sum())
+        for col in c.values():
+            col[:kept] = col[alive]
+        self.count = kept
+        return n - kept
+
+    def _update_array(self, dt: float) -> int:
+        c = self._columns
+        age = c["age"]
+        age[:] = array('d', [t + dt for t in age])
+        alive = [not (t >= lt and lt >= MIN_EXPIRING_LIFETIME) for t, lt in zip(age, c["lifetime"])]
+
+        def integrate(value: str, rate: str) -> None:
+            col = c[value]
+            col[:] = array('d', [v + d * dt for v, d in zip(col, c[rate])])
+
+        integrate("velocity_x", "acceleration_x")
+        integrate("velocity_y", "acceleration_y")
+        integrate("x", "velocity_x")
+        integrate("y", "velocity_y")
+        integrate("rotation", "rotation_velocity")
+        integrate("scale_x", "scale_velocity_x")
+        integrate("scale_y", "scale_velocity_y")
+        alpha = c["a"]
+        alpha[:] = array('d', [min(255.0, max(0.0, a + d * dt)) for a, d in zip(alpha, c["alpha_velocity"])])
+
+        if all(alive):
+            return 0
+        for col in c.values():
+            col[:] = array('d', compress(col, alive))
+        removed = self.count - len(age)
+        self.count = len(age)
+        return removed
+
+    def sort_by(self, name: str) -> None:
+        """按某一列稳定排序所有粒子"""
+        if self.count < 2:
+            return
+        if self.use_numpy:
+            order = np.argsort(self._columns[name][:self.count], kind="stable")
+            for col in self._columns.values():
+                col[:self.count] = col[:self.count][order]
+        else:
+            key_col = self._columns[name]
+            order = sorted(range(self.count), key=key_col.__getitem__)
+            for col in self._columns.values():
+                col[:] = array('d', [col[i] for i in order])
+
+    def circle_batch(self) -> Tuple[List[Sequence[float]], List[int]]:
+        """获取可按圆批量绘制的粒子列，以及需要单独应用变换绘制的粒子下标
+
+        等比缩放（scale_x == scale_y）的粒子不受旋转影响，按缩放后的半径返回
+        x、y、半径、r、g、b、a 七列；NumPy后端用数组运算筛选和计算后转换为Python列表，
+        避免调用方逐个迭代NumPy标量。全部粒子等比缩放时 array 后端直接返回原列。
+
+        Returns:
+            Tuple[List[Sequence[float]], List[int]]: (七列数据, 非等比缩放粒子的下标)
+        """
+        names = ("x", "y", "size", "r", "g", "b", "a")
+        columns = [self.column(name) for name in names]
+        scale_xs, scale_ys = self.column("scale_x"), self.column("scale_y")
+
+        if self.use_numpy:
+            uniform = scale_xs == scale_ys
+            irregular = np.flatnonzero(~uniform).tolist()
+            if irregular:
+                columns = [col[uniform] for col in columns]
+                scale_xs = scale_xs[uniform]
+            columns[2] = columns[2] * 0.5 * np.abs(scale_xs)
+            return [col.tolist() for col in columns], irregular
+
+        # array 整列比较在C中完成，常见的全部等比缩放情况无需逐个判断
+        if scale_xs == scale_ys:
+            irregular = []
+        else:
+            uniform = [sx == sy for sx, sy in zip(scale_xs, scale_ys)]
+            irregular = [i for i, is_uniform in enumerate(uniform) if not is_uniform]
+            columns = [list(compress(col, uniform)) for col in columns]
+            scale_xs = compress(scale_xs, uniform)
+        columns[2] = [size * 0.5 * abs(sx) for size, sx in zip(columns[2], scale_xs)]
+        return columns, irregular
+
+    def rows(self) -> List[Dict[str, float]]:
+        """获取所有粒子的属性（调试和兼容用途，会为每个粒子创建字典）"""
+        return [self.get(i) for i in range(self.count)]
+
+
+__all__ = ['ParticleBuffer', 'FIELDS', 'HAS_NUMPY']
@@ -8,6 +8,8 @@ Description:                基本图形元素实现，包括点、线、矩形
 
 Changed history:            
                             2025/04/03: 初始创建;
+                            2026/10/16: 几何改变时使自身及子对象的世界变换缓存失效;
+                            2026/10/16: 颜色、线宽、填充和顶点改变时报告脏区域;
 ----
 """
 
@@ -15,11 +17,15 @@ from typing import List, Tuple, Optional
 import math
 
 from status.renderer.renderer_base import RendererBase, Color, Rect, RenderLayer
-from status.renderer.drawable import Drawable
+from status.renderer.drawable import Drawable, _RegionAttribute
 
 class Point(Drawable):
     """点元素"""
     
+    # 影响绘制内容的属性
+    color = _RegionAttribute(transform=False)
+    point_size = _RegionAttribute(transform=False)
+    
     def __init__(self, x: float, y: float, color: Color = Color(255, 255, 255), 
                 point_size: float = 1.0, layer: RenderLayer = RenderLayer.MIDDLE, priority: int = 0):
         """初始化点元素
@@ -58,6 +64,14 @@ class Point(Drawable):
 class Line(Drawable):
     """线段元素"""
     
+    # 影响绘制内容的属性
+    x1 = _RegionAttribute(transform=False)
+    y1 = _RegionAttribute(transform=False)
+    x2 = _RegionAttribute(transform=False)
+    y2 = _RegionAttribute(transform=False)
+    color = _RegionAttribute(transform=False)
+    thickness = _RegionAttribute(transform=False)
+    
     def __init__(self, x1: float, y1: float, x2: float, y2: float, 
                 color: Color = Color(255, 255, 255), thickness: float = 1.0,
                 layer: RenderLayer = RenderLayer.MIDDLE, priority: int = 0):
@@ -114,7 +128,7 @@ class Line(Drawable):
         self.width = abs(self.x2 - self.x1)
         self.height = abs(self.y2 - self.y1)
         
-        self._dirty = True
+        self._invalidate_transform()
     
     def set_end_point(self, x: float, y: float) -> None:
         """设置终点
@@ -141,7 +155,7 @@ class Line(Drawable):
         self.width = abs(self.x2 - self.x1)
         self.height = abs(self.y2 - self.y1)
         
-        self._dirty = True
+        self._invalidate_transform()
     
     def get_start_point(self) -> Tuple[float, float]:
         """获取起点（世界坐标）
@@ -189,6 +203,11 @@ class Line(Drawable):
 class Rectangle(Drawable):
     """矩形元素"""
     
+    # 影响绘制内容的属性
+    color = _RegionAttribute(transform=False)
+    thickness = _RegionAttribute(transform=False)
+    filled = _RegionAttribute(transform=False)
+    
     def __init__(self, x: float, y: float, width: float, height: float, 
                 color: Color = Color(255, 255, 255), thickness: float = 1.0,
                 filled: bool = False, layer: RenderLayer = RenderLayer.MIDDLE, priority: int = 0):
@@ -260,6 +279,12 @@ class Rectangle(Drawable):
 class Circle(Drawable):
     """圆形元素"""
     
+    # 影响绘制内容的属性
+    radius = _RegionAttribute(transform=False)
+    color = _RegionAttribute(transform=False)
+    thickness = _RegionAttribute(transform=False)
+    filled = _RegionAttribute(transform=False)
+    
     def __init__(self, x: float, y: float, radius: float, 
                 color: Color = Color(255, 255, 255), thickness: float = 1.0,
                 filled: bool = False, layer: RenderLayer = RenderLayer.MIDDLE, priority: int = 0):
@@ -292,7 +317,7 @@ class Circle(Drawable):
     def center_x(self, value: float) -> None:
         """设置中心X坐标"""
         self.x = value - self.radius
-        self._dirty = True
+        self._invalidate_transform()
     
     @property
     def center_y(self) -> float:
@@ -303,7 +328,7 @@ class Circle(Drawable):
     def center_y(self, value: float) -> None:
         """设置中心Y坐标"""
         self.y = value - self.radius
-        self._dirty = True
+        self._invalidate_transform()
     
     def set_radius(self, radius: float) -> None:
         """设置半径
@@ -323,7 +348,7 @@ class Circle(Drawable):
         self.x = center_x - radius
         self.y = center_y - radius
         
-        self._dirty = True
+        self._invalidate_transform()
     
     def contains_point(self, x: float, y: float) -> bool:
         """检查点是否在圆内（局部坐标）
@@ -370,6 +395,12 @@ class Circle(Drawable):
 class Polygon(Drawable):
     """多边形元素"""
     
+    # 影响绘制内容的属性
+    relative_points = _RegionAttribute(transform=False)
+    color = _RegionAttribute(transform=False)
+    thickness = _RegionAttribute(transform=False)
+    filled = _RegionAttribute(transform=False)
+    
     def __init__(self, points: List[Tuple[float, float]], 
                 color: Color = Color(255, 255, 255), thickness: float = 1.0,
                 filled: bool = False, layer: RenderLayer = RenderLayer.MIDDLE, priority: int = 0):
@@ -440,7 +471,7 @@ class Polygon(Drawable):
         center_y = height / 2
         self.set_origin(center_x, center_y)
         
-        self._dirty = True
+        self._invalidate_transform()
     
     def get_world_points(self) -> List[Tuple[float, float]]:
         """获取世界坐标系中的顶点列表
@@ -10,16 +10,28 @@ Changed history:
                             2025/04/17: 从PyQt渲染器迁移到PySide渲染器;
                             2025/05/11: 修复枚举类型使用方式；
                             2025/05/11: 修复元类冲突问题；
+                            2026/10/16: 实现粒子批量绘制，按颜色分桶合并为路径;
+                            2026/10/16: draw_image 缓存裁剪/缩放/翻转/旋转后的QPixmap;
+                            2026/10/16: draw_image 只裁剪时以源矩形直接绘制，支持纹理图集;
+                            2026/10/16: 支持脏矩形渲染，只重绘并提交发生变化的区域;
+                            2026/10/16: reset_target 恢复原渲染缓冲区，关闭时清空离屏表面池;
+                            2026/10/16: 脏区域只在启用脏矩形渲染期间跟踪变化;
+                            2026/10/16: draw_image 以文件路径和修改时间作为缓存键，文件修改后重新加载;
+                            2026/10/16: 粒子批量绘制改为按桶逐个drawEllipse，保留重叠粒子的透明度叠加;
+                            2026/10/16: 粒子批量绘制按列量化，按桶预渲染精灵并逐个贴图;
 ----
 """
 
 import logging
-from typing import Tuple, List, Optional, Dict, Any, Union, cast
+import math
+import os
+from collections import OrderedDict
+from typing import Tuple, List, Optional, Dict, Any, Union, Sequence, Hashable, cast
 
-from PySide6.QtCore import Qt, QPoint, QRect, QSize
+from PySide6.QtCore import Qt, QPoint, QPointF, QRect, QSize
 from PySide6.QtGui import (
     QPixmap, QPainter, QColor, QPen, QBrush, QFont, QFontMetrics,
-    QTransform, QPainterPath, QImage, QPolygon
+    QTransform, QPainterPath, QImage, QPolygon, QRegion
 )
 from PySide6.QtWidgets import QWidget, QApplication
 from PySide6.QtCore import Signal, QObject
@@ -27,6 +39,8 @@ from PySide6.QtCore import Signal, QObject
 from status.renderer.renderer_base import (
     RendererBase, Color, Rect, BlendMode, TextAlign, RenderLayer
 )
+from status.renderer.dirty_region import DirtyRegion, default_dirty_region
+from status.renderer.surface_pool import SurfacePool
 
 # 设置日志记录器
 logger = logging.getLogger(__name__)
@@ -38,6 +52,15 @@ class PySideRenderer(RendererBase):
     rendering_started = Signal()
     rendering_finished = Signal()
     
+    # 批量绘制粒子时颜色分桶的量化步长、半径分桶的量化步长（像素）和粒子精灵缓存容量
+    PARTICLE_COLOR_STEP = 8
+    PARTICLE_RADIUS_STEP = 0.5
+    PARTICLE_SPRITE_CACHE_SIZE = 256
+    
+    # draw_image 变换结果缓存的容量和旋转角度量化步长（度）
+    IMAGE_CACHE_SIZE = 256
+    ROTATION_STEP = 0.5
+    
     def __init__(self):
         """初始化PySide渲染器"""
         super().__init__()  # 初始化 RendererBase 基类
@@ -52,6 +75,22 @@ class PySideRenderer(RendererBase):
         self.blend_mode = BlendMode.NORMAL  # 当前混合模式
         self.fonts_cache = {}  # 字体缓存
         
+        # draw_image 的变换结果缓存（LRU）
+        self._image_cache: "OrderedDict[Hashable, QPixmap]" = OrderedDict()
+        self._image_cache_hits = 0
+        self._image_cache_misses = 0
+        
+        # draw_particles_batch 按（颜色, 半径, 是否填充）缓存的粒子精灵（LRU）
+        self._particle_sprites: "OrderedDict[Tuple[int, int, int, int, bool], QPixmap]" = OrderedDict()
+        
+        # 脏矩形渲染：跟踪的脏区域、本帧的重绘区域以及本帧是否被跳过
+        self.dirty_region: Optional[DirtyRegion] = None
+        self._dirty_clip: Optional[QRegion] = None
+        self._frame_skipped = False
+        
+        # set_target 切换到离屏表面时保存的原渲染缓冲区
+        self._screen_pixmap: Optional[QPixmap] = None
+        
         # 创建默认字体
         self.default_font = QFont()
         self.default_font.setFamily("Arial")
@@ -83,6 +122,8 @@ class PySideRenderer(RendererBase):
             self.pixmap = QPixmap(width, height)
             # 使用透明色填充
             self.pixmap.fill(QColor(0, 0, 0, 0))
+            if self.dirty_region:
+                self.dirty_region.mark_all()
             logger.info(f"PySide渲染器初始化成功 ({width}x{height})")
             return True
         except Exception as e:
@@ -97,7 +138,14 @@ class PySideRenderer(RendererBase):
         self.painter = None
         self.pixmap = None
         self.widget = None
+        self._screen_pixmap = None
         self.fonts_cache.clear()
+        self.clear_image_cache()
+        self._particle_sprites.clear()
+        self.disable_dirty_tracking()
+        pool = SurfacePool.find_for_renderer(self)
+        if pool is not None:
+            pool.clear()
         
         logger.info("PySide渲染器已关闭")
     
@@ -109,12 +157,41 @@ class PySideRenderer(RendererBase):
         """
         if not self.pixmap:
             return
-            
-        if color:
-            self.pixmap.fill(QColor(color.r, color.g, color.b, color.a))
+        
+        fill_color = QColor(color.r, color.g, color.b, color.a) if color else QColor(0, 0, 0, 0)
+        if self.painter and self.painter.isActive():
+            # 绘制过程中通过画笔清除，只影响裁剪区域（脏矩形渲染时为本帧的重绘区域）
+            mode = self.painter.compositionMode()
+            self.painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+            self.painter.fillRect(self.pixmap.rect(), fill_color)
+            self.painter.setCompositionMode(mode)
         else:
-            # 使用透明色填充
-            self.pixmap.fill(QColor(0, 0, 0, 0))
+            self.pixmap.fill(fill_color)
+    
+    def enable_dirty_tracking(self, region: Optional[DirtyRegion] = None) -> None:
+        """启用脏矩形渲染
+        
+        启用后 begin_frame 只重绘脏区域：没有变化时跳过整帧，否则将绘制裁剪到脏区域并先清除该区域。
+        不经过可绘制对象绘制的内容需要自行调用脏区域的 add_rect 或 mark_all。
+        
+        Args:
+            region: 跟踪的脏区域，默认为全局脏区域
+        """
+        if self.dirty_region:
+            self.dirty_region.disable()
+        self.dirty_region = region or default_dirty_region
+        self.dirty_region.enable()
+    
+    def disable_dirty_tracking(self) -> None:
+        """关闭脏矩形渲染，恢复每帧全部重绘"""
+        if self.dirty_region:
+            self.dirty_region.disable()
+        self.dirty_region = None
+        self._dirty_clip = None
+    
+    def is_frame_skipped(self) -> bool:
+        """当前帧是否因画面没有变化而被跳过"""
+        return self._frame_skipped
     
     def begin_frame(self) -> None:
         """开始一帧渲染"""
@@ -124,12 +201,28 @@ class PySideRenderer(RendererBase):
             
         if self.painter and self.painter.isActive():
             self.painter.end()
+        
+        self._frame_skipped = False
+        self._dirty_clip = None
+        if self.dirty_region:
+            rects = self.dirty_region.collect()
+            if rects is not None:
+                if not rects:
+                    # 画面没有变化，保留上一帧的内容
+                    self._frame_skipped = True
+                    return
+                self._dirty_clip = self._region_from_rects(rects)
             
         self.painter = QPainter(self.pixmap)
         self.painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
         self.painter.setRenderHint(QPainter.RenderHint.TextAntialiasing, True)
         self.painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
         
+        if self._dirty_clip is not None:
+            # 只重绘脏区域：裁剪到脏区域并清除其中的旧内容
+            self.painter.setClipRegion(self._dirty_clip)
+            self.clear()
+        
         # 发射信号
         self.rendering_started.emit()
     
@@ -141,9 +234,12 @@ class PySideRenderer(RendererBase):
         self.painter.end()
         self.painter = None
         
-        # 如果有绑定的widget，触发重绘
+        # 如果有绑定的widget，触发重绘（脏矩形渲染时只提交变化的区域）
         if self.widget:
-            self.widget.update()
+            if self._dirty_clip is not None:
+                self.widget.update(self._dirty_clip.boundingRect())
+            else:
+                self.widget.update()
             
         # 发射信号
         self.rendering_finished.emit()
@@ -186,9 +282,24 @@ class PySideRenderer(RendererBase):
                 int(rect.x), int(rect.y), 
                 int(rect.width), int(rect.height)
             ))
+            if self._dirty_clip is not None:
+                # 不能画到本帧的重绘区域之外
+                self.painter.setClipRegion(self._dirty_clip, Qt.ClipOperation.IntersectClip)
+        elif self._dirty_clip is not None:
+            self.painter.setClipRegion(self._dirty_clip)
         else:
             self.painter.setClipping(False)
     
+    @staticmethod
+    def _region_from_rects(rects: List[Rect]) -> QRegion:
+        """将脏矩形（向外取整）合并为QRegion"""
+        region = QRegion()
+        for rect in rects:
+            left, top = math.floor(rect.x), math.floor(rect.y)
+            right, bottom = math.ceil(rect.x + rect.width), math.ceil(rect.y + rect.height)
+            region = region.united(QRect(left, top, right - left, bottom - top))
+        return region
+    
     def set_blend_mode(self, mode: BlendMode) -> None:
         """设置混合模式
         
@@ -307,6 +418,106 @@ class PySideRenderer(RendererBase):
             int(radius * 2), int(radius * 2)
         )
     
+    def draw_particles_batch(self, xs: Sequence[float], ys: Sequence[float], radii: Sequence[float],
+                             reds: Sequence[float], greens: Sequence[float], blues: Sequence[float],
+                             alphas: Sequence[float], filled: bool = False) -> None:
+        """批量绘制圆形粒子
+        
+        颜色按 PARTICLE_COLOR_STEP、半径按 PARTICLE_RADIUS_STEP 量化分桶（每列一次查表，
+        不逐粒子调用量化函数）。每个（颜色, 半径）桶的圆只预渲染一次为不透明精灵并缓存，
+        粒子透明度由每个桶一次 setOpacity 设置，桶内每个粒子只需一次 drawPixmap 贴图，
+        不再逐个光栅化抗锯齿椭圆；重叠的半透明粒子按形状分别合成，透明度叠加。
+        量化后完全透明或半径非正的粒子直接跳过。
+        
+        Args:
+            xs: 中心X坐标
+            ys: 中心Y坐标
+            radii: 半径
+            reds: 红色分量 (0-255)
+            greens: 绿色分量 (0-255)
+            blues: 蓝色分量 (0-255)
+            alphas: 透明度 (0-255)
+            filled: 是否填充
+        """
+        if not self.painter or not self.painter.isActive():
+            return
+        
+        step = self.PARTICLE_COLOR_STEP
+        half = step // 2
+        # 四舍五入到步长的整数倍，保证0和255不变
+        levels = [min(255, (value + half) // step * step) for value in range(256)]
+        
+        def quantize(column: Sequence[float]) -> List[int]:
+            return [levels[v] if 0 <= v <= 255 else levels[255 if v > 0 else 0] for v in map(int, column)]
+        
+        # 半径向上取整到步长的整数倍，非正半径得到非正的桶号
+        radius_keys = map(math.ceil, map((1.0 / self.PARTICLE_RADIUS_STEP).__mul__, radii))
+        
+        # 先按精灵（颜色, 半径）分组，再按透明度分组，每个精灵只查找一次
+        groups: Dict[Tuple[int, int, int, int], Dict[int, List[Tuple[float, float]]]] = {}
+        for x, y, k, r, g, b, a in zip(xs, ys, radius_keys, quantize(reds), quantize(greens),
+                                       quantize(blues), quantize(alphas)):
+            if a == 0 or k <= 0:
+                continue
+            by_alpha = groups.get((r, g, b, k))
+            if by_alpha is None:
+                by_alpha = groups[(r, g, b, k)] = {}
+            centers = by_alpha.get(a)
+            if centers is None:
+                centers = by_alpha[a] = []
+            centers.append((x, y))
+        
+        painter = self.painter
+        draw_pixmap = painter.drawPixmap
+        opacity = painter.opacity()
+        try:
+            for (r, g, b, k), by_alpha in groups.items():
+                sprite = self._particle_sprite(r, g, b, k, filled)
+                offset = sprite.width() / 2
+                for a, centers in by_alpha.items():
+                    painter.setOpacity(opacity * a / 255)
+                    for x, y in centers:
+                        draw_pixmap(QPointF(x - offset, y - offset), sprite)
+        finally:
+            painter.setOpacity(opacity)
+    
+    def _particle_sprite(self, r: int, g: int, b: int, radius_key: int, filled: bool) -> QPixmap:
+        """获取（必要时渲染并缓存）不透明的粒子精灵
+        
+        Args:
+            r: 量化后的红色分量
+            g: 量化后的绿色分量
+            b: 量化后的蓝色分量
+            radius_key: 半径桶号，半径为 radius_key * PARTICLE_RADIUS_STEP
+            filled: 是否填充
+            
+        Returns:
+            QPixmap: 以粒子中心为中心的正方形精灵
+        """
+        key = (r, g, b, radius_key, filled)
+        sprite = self._particle_sprites.get(key)
+        if sprite is not None:
+            self._particle_sprites.move_to_end(key)
+            return sprite
+        
+        radius = radius_key * self.PARTICLE_RADIUS_STEP
+        # 1像素画笔向外延伸半个像素，两侧各留1像素边距
+        size = math.ceil(radius * 2) + 2
+        sprite = QPixmap(size, size)
+        sprite.fill(Qt.GlobalColor.transparent)
+        color = QColor(r, g, b)
+        painter = QPainter(sprite)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        painter.setPen(QPen(color, 1.0))
+        painter.setBrush(QBrush(color) if filled else QBrush())
+        painter.drawEllipse(QPointF(size / 2, size / 2), radius, radius)
+        painter.end()
+        
+        self._particle_sprites[key] = sprite
+        while len(self._particle_sprites) > self.PARTICLE_SPRITE_CACHE_SIZE:
+            self._particle_sprites.popitem(last=False)
+        return sprite
+    
     def draw_polygon(self, points: List[Tuple[float, float]], color: Color, thickness: float = 1.0, filled: bool = False) -> None:
         """绘制多边形
         
@@ -410,36 +621,94 @@ class PySideRenderer(RendererBase):
         """
         if not self.painter or not self.painter.isActive():
             return
-            
+        
+        # 获取源图像标识
+        if isinstance(image, (QPixmap, QImage)):
+            source_key: Hashable = (type(image).__name__, image.cacheKey())
+        elif isinstance(image, str):
+            # 文件修改时间参与缓存键，磁盘上的图像被修改后重新加载
+            try:
+                mtime_ns: Optional[int] = os.stat(image).st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            source_key = ("path", image, mtime_ns)
+        else:
+            logger.error(f"不支持的图像类型: {type(image)}")
+            return
+        
+        # 旋转角度量化后参与缓存键，保证相近角度共用同一结果
+        rotation = round(rotation / self.ROTATION_STEP) * self.ROTATION_STEP % 360
+        target_size = (int(width), int(height)) if width is not None and height is not None else None
+        src = (int(source_rect.x), int(source_rect.y),
+               int(source_rect.width), int(source_rect.height)) if source_rect else None
+        
+        draw_rect = None
+        if isinstance(image, QPixmap) and target_size is None and not flip_h and not flip_v and rotation == 0:
+            # 无需变换（或只需裁剪，如纹理图集中的帧），以源矩形直接绘制，不复制像素
+            pixmap = image
+            if src is not None:
+                draw_rect = QRect(*src)
+        else:
+            key = (source_key, src, target_size, flip_h, flip_v, rotation,
+                   tuple(origin) if rotation and origin else None)
+            cached = self._image_cache.get(key)
+            if cached is not None:
+                self._image_cache.move_to_end(key)
+                self._image_cache_hits += 1
+                pixmap = cached
+            else:
+                self._image_cache_misses += 1
+                pixmap = self._transform_image(image, src, target_size, flip_h, flip_v, rotation, origin)
+                if pixmap is None:
+                    return
+                self._image_cache[key] = pixmap
+                while len(self._image_cache) > self.IMAGE_CACHE_SIZE:
+                    self._image_cache.popitem(last=False)
+        
+        # 应用不透明度
+        if opacity < 1.0:
+            self.painter.setOpacity(opacity)
+        
+        # 绘制图像
+        if draw_rect is None:
+            self.painter.drawPixmap(int(x), int(y), pixmap)
+        else:
+            self.painter.drawPixmap(QPoint(int(x), int(y)), pixmap, draw_rect)
+        
+        # 重置不透明度
+        if opacity < 1.0:
+            self.painter.setOpacity(1.0)
+    
+    def _transform_image(self, image: Any, src: Optional[Tuple[int, int, int, int]],
+                         target_size: Optional[Tuple[int, int]], flip_h: bool, flip_v: bool,
+                         rotation: float, origin: Optional[Tuple[float, float]]) -> Optional[QPixmap]:
+        """对图像依次应用裁剪、缩放、翻转和旋转
+        
+        Returns:
+            Optional[QPixmap]: 变换后的图像，加载失败时返回None
+        """
         # 获取QPixmap
-        pixmap = None
         if isinstance(image, QPixmap):
             pixmap = image
         elif isinstance(image, QImage):
             pixmap = QPixmap.fromImage(image)
-        elif isinstance(image, str):
+        else:
             # 尝试从文件加载
             pixmap = QPixmap(image)
             if pixmap.isNull():
                 logger.error(f"无法加载图像: {image}")
-                return
-        else:
-            logger.error(f"不支持的图像类型: {type(image)}")
-            return
+                return None
         
         # 应用裁剪
-        if source_rect:
-            src_rect = QRect(
-                int(source_rect.x), int(source_rect.y),
-                int(source_rect.width), int(source_rect.height)
-            )
-            pixmap = pixmap.copy(src_rect)
+        if src:
+            pixmap = pixmap.copy(QRect(*src))
         
         # 应用缩放
-        if width is not None and height is not None:
-            if int(width) != pixmap.width() or int(height) != pixmap.height():
+        if target_size is not None:
+            width, height = target_size
+            if width != pixmap.width() or height != pixmap.height():
                 pixmap = pixmap.scaled(
-                    int(width), int(height),
+                    width, height,
                     Qt.AspectRatioMode.KeepAspectRatio,
                     Qt.TransformationMode.SmoothTransformation
                 )
@@ -467,16 +736,11 @@ class PySideRenderer(RendererBase):
             
             pixmap = pixmap.transformed(transform, Qt.TransformationMode.SmoothTransformation)
         
-        # 应用不透明度
-        if opacity < 1.0:
-            self.painter.setOpacity(opacity)
-        
-        # 绘制图像
-        self.painter.drawPixmap(int(x), int(y), pixmap)
-        
-        # 重置不透明度
-        if opacity < 1.0:
-            self.painter.setOpacity(1.0)
+        return pixmap
+    
+    def clear_image_cache(self) -> None:
+        """清空 draw_image 的变换结果缓存（文件路径的缓存键包含修改时间，文件修改后无需调用）"""
+        self._image_cache.clear()
     
     def get_text_size(self, text: str, font_name: str = "default", font_size: int = 12, 
                      bold: bool = False, italic: bool = False) -> Tuple[float, float]:
@@ -589,7 +853,13 @@ class PySideRenderer(RendererBase):
                 "alpha_blending",
                 "antialiasing",
                 "transformations"
-            ]
+            ],
+            "image_cache": {
+                "hits": self._image_cache_hits,
+                "misses": self._image_cache_misses,
+                "size": len(self._image_cache),
+                "capacity": self.IMAGE_CACHE_SIZE
+            }
         }
     
     def set_alpha(self, alpha: float) -> None:
@@ -678,15 +948,24 @@ class PySideRenderer(RendererBase):
         # 结束当前绘制
         self.painter.end()
         
-        # 如果没有提供表面，使用默认表面
+        # 如果没有提供表面，恢复原渲染缓冲区
         if surface is None:
-            self.pixmap = QPixmap(self.width, self.height)
+            if self._screen_pixmap is not None:
+                self.pixmap = self._screen_pixmap
+                self._screen_pixmap = None
         else:
-            # 否则，使用提供的表面
+            # 否则，使用提供的表面（保存原渲染缓冲区以便恢复）
+            if self._screen_pixmap is None:
+                self._screen_pixmap = self.pixmap
             self.pixmap = surface
         
         # 在新表面上开始绘制
         self.painter.begin(self.pixmap)
+        self.painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        self.painter.setRenderHint(QPainter.RenderHint.TextAntialiasing, True)
+        self.painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
+        if self._screen_pixmap is None and self._dirty_clip is not None:
+            self.painter.setClipRegion(self._dirty_clip)
     
     # 添加reset_target方法
     def reset_target(self) -> None:
@@ -9,11 +9,13 @@ Description:                渲染器基类，定义渲染系统的抽象接口
 Changed history:            
                             2025/04/03: 初始创建;
                             2025/05/11: 创建混合元类以解决QObject和ABC的元类冲突；
+                            2026/10/16: 添加批量绘制粒子的接口;
+                            2026/10/16: 添加 is_frame_skipped 接口，支持脏矩形渲染跳过无变化的帧;
 ----
 """
 
 from abc import ABC, ABCMeta, abstractmethod
-from typing import Tuple, List, Optional, Dict, Any, Union
+from typing import Tuple, List, Optional, Dict, Any, Union, Sequence
 import enum
 
 from PySide6.QtCore import QObject, Signal
@@ -258,6 +260,13 @@ class RendererBase(QObject, ABC, metaclass=QObjectABCMeta):
         """结束一帧渲染并提交"""
         pass
     
+    def is_frame_skipped(self) -> bool:
+        """当前帧是否因画面没有变化而被跳过（跳过时调用方不必绘制）
+        
+        默认实现总是返回False，支持脏矩形渲染的后端可覆盖。
+        """
+        return False
+    
     @abstractmethod
     def set_viewport(self, x: int, y: int, width: int, height: int) -> None:
         """设置视口
@@ -340,6 +349,27 @@ class RendererBase(QObject, ABC, metaclass=QObjectABCMeta):
         """
         pass
     
+    def draw_particles_batch(self, xs: Sequence[float], ys: Sequence[float], radii: Sequence[float],
+                             reds: Sequence[float], greens: Sequence[float], blues: Sequence[float],
+                             alphas: Sequence[float], filled: bool = False) -> None:
+        """批量绘制圆形粒子
+        
+        各参数为等长的列（结构数组），第 i 个粒子由每列的第 i 个元素描述。
+        默认实现逐个调用 draw_circle，渲染后端可覆盖为批量绘制。
+        
+        Args:
+            xs: 中心X坐标
+            ys: 中心Y坐标
+            radii: 半径
+            reds: 红色分量 (0-255)
+            greens: 绿色分量 (0-255)
+            blues: 蓝色分量 (0-255)
+            alphas: 透明度 (0-255)
+            filled: 是否填充
+        """
+        for x, y, radius, r, g, b, a in zip(xs, ys, radii, reds, greens, blues, alphas):
+            self.draw_circle(x, y, radius, Color(int(r), int(g), int(b), int(a)), filled=filled)
+    
     @abstractmethod
     def draw_polygon(self, points: List[Tuple[float, float]], color: Color, thickness: float = 1.0, filled: bool = False) -> None:
         """绘制多边形
@@ -8,6 +8,9 @@ Description:                精灵渲染系统，实现精灵和精灵表支持
 
 Changed history:            
                             2025/04/03: 初始创建;
+                            2026/10/16: 精灵帧可直接引用已加载的图像（如纹理图集页）;
+                            2026/10/16: 加载图像后使自身及子对象的世界变换缓存失效;
+                            2026/10/16: 图像、帧、源矩形和翻转改变时报告脏区域;
 ----
 """
 
@@ -17,20 +20,22 @@ import time
 import logging
 
 from status.renderer.renderer_base import RendererBase, Color, Rect, RenderLayer
-from status.renderer.drawable import Drawable
+from status.renderer.drawable import Drawable, _RegionAttribute
 from status.resources.asset_manager import AssetManager
 from PySide6.QtGui import QImage, QPixmap
 
 class SpriteFrame:
     """精灵帧类，表示精灵表中的一帧"""
     
-    def __init__(self, image_path: str, source_rect: Rect, pivot: Optional[Tuple[float, float]] = None):
+    def __init__(self, image_path: str, source_rect: Rect, pivot: Optional[Tuple[float, float]] = None,
+                 image: Optional[Union[QImage, QPixmap]] = None):
         """初始化精灵帧
         
         Args:
             image_path: 图像路径
             source_rect: 源矩形，指定图像的子区域
             pivot: 锚点，相对于左上角的偏移，默认为中心点
+            image: 已加载的图像（如纹理图集页），提供时不再通过资源管理器加载
         """
         self.image_path = image_path
         self.source_rect = source_rect
@@ -42,7 +47,7 @@ class SpriteFrame:
             self.pivot = pivot
         
         # 缓存
-        self._image = None
+        self._image = image
     
     def get_image(self, asset_manager: AssetManager) -> Any:
         """获取图像资源
@@ -239,6 +244,10 @@ class SpriteSheet:
 class Sprite(Drawable):
     """精灵类，用于绘制图像和动画"""
     
+    # 影响绘制内容的属性
+    source_rect = _RegionAttribute(transform=False)
+    pivot = _RegionAttribute(transform=False)
+    
     def __init__(self, x: float = 0, y: float = 0, width: float = 0, height: float = 0,
                  image: Optional[Union[str, QImage, QPixmap]] = None, 
                  layer: RenderLayer = RenderLayer.MIDDLE, priority: int = 0):
@@ -285,6 +294,8 @@ class Sprite(Drawable):
         Args:
             image: 图像路径、QImage 或 QPixmap 对象
         """
+        self.invalidate_region()
+        
         # 重置动画和源矩形相关状态
         self.current_animation = None
         self.source_rect = None
@@ -331,7 +342,7 @@ class Sprite(Drawable):
             self._image = None
         
         # 标记为脏以便更新渲染
-        self._dirty = True
+        self._invalidate_transform()
     
     def set_source_rect(self, x: float, y: float, width: float, height: float) -> None:
         """设置源矩形（用于精灵表）
@@ -355,6 +366,7 @@ class Sprite(Drawable):
             horizontal: 是否水平翻转
             vertical: 是否垂直翻转
         """
+        self.invalidate_region()
         self.flip_h = horizontal
         self.flip_v = vertical
     
@@ -436,11 +448,13 @@ class Sprite(Drawable):
             else:
                 # 理论上 frame_data 不为 None 时 frame 也不应为 None，但以防万一
                 logging.warning(f"Sprite: get_frame 返回了有效的元组，但帧对象无效")
+                self.invalidate_region()
                 self._image = None
         else:
             # 动画可能没有帧或已结束 (get_frame 返回 None)
             # 可以选择保持最后一帧或清空
             # logging.debug(f"Sprite: get_frame 未返回有效帧数据")
+            self.invalidate_region()
             self._image = None # 或者保持 self._image 不变？取决于期望行为
             
     def set_frame(self, frame: SpriteFrame) -> None:
@@ -449,6 +463,7 @@ class Sprite(Drawable):
         Args:
             frame: SpriteFrame 对象
         """
+        self.invalidate_region()
         self.current_animation = None
         self.image_path = frame.image_path
         self.source_rect = frame.source_rect
@@ -0,0 +1,173 @@
+"""
+---------------------------------------------------------------
+File name:                  surface_pool.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                离屏表面池，按尺寸复用渲染器创建的离屏表面
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+                            2026/10/16: 渲染器的表面池只弱引用渲染器，添加不创建表面池的 find_for_renderer;
+----
+"""
+
+import logging
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+Size = Tuple[int, int]
+
+
+class SurfacePool:
+    """离屏表面池
+
+    按 (宽, 高) 分桶保存空闲表面。acquire 优先取出同尺寸的空闲表面，没有时才通过工厂函数创建；
+    release 将表面放回对应的桶。取出的表面内容是上次使用留下的，使用前需要自行清除。
+    空闲表面总数超过上限时丢弃最久未使用尺寸的表面。
+    """
+
+    # 每个渲染器对应的表面池
+    _renderer_pools: "weakref.WeakKeyDictionary[Any, SurfacePool]" = weakref.WeakKeyDictionary()
+    _registry_lock = threading.Lock()
+
+    def __init__(self, factory: Callable[[int, int], Any], max_idle: int = 8):
+        """初始化表面池
+
+        Args:
+            factory: 创建表面的函数，参数为 (宽, 高)
+            max_idle: 最多保留的空闲表面数量
+        """
+        self.factory = factory
+        self.max_idle = max_idle
+        self._idle: "OrderedDict[Size, List[Any]]" = OrderedDict()
+        self._in_use: Dict[int, Tuple[Any, Size]] = {}
+        self._idle_count = 0
+        self._created = 0
+        self._reused = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_renderer(cls, renderer: Any) -> 'SurfacePool':
+        """获取渲染器的表面池（首次调用时创建，表面由 renderer.create_surface 创建）
+
+        Args:
+            renderer: 渲染器
+
+        Returns:
+            SurfacePool: 该渲染器的表面池
+        """
+        with cls._registry_lock:
+            pool = cls._renderer_pools.get(renderer)
+            if pool is None:
+                pool = cls._renderer_pools[renderer] = cls(_renderer_factory(renderer))
+            return pool
+
+    @classmethod
+    def find_for_renderer(cls, renderer: Any) -> Optional['SurfacePool']:
+        """获取渲染器已有的表面池，不存在时不创建
+
+        Args:
+            renderer: 渲染器
+
+        Returns:
+            Optional[SurfacePool]: 该渲染器的表面池，尚未创建时返回None
+        """
+        with cls._registry_lock:
+            return cls._renderer_pools.get(renderer)
+
+    def acquire(self, width: int, height: int) -> Any:
+        """取出一个指定尺寸的表面
+
+        Args:
+            width: 宽度
+            height: 高度
+
+        Returns:
+            Any: 表面对象，用完后调用 release 归还
+        """
+        size = (int(width), int(height))
+        with self._lock:
+            bucket = self._idle.get(size)
+            if bucket:
+                surface = bucket.pop()
+                self._idle_count -= 1
+                if not bucket:
+                    del self._idle[size]
+                self._reused += 1
+            else:
+                surface = None
+
+        if surface is None:
+            surface = self.factory(*size)
+            with self._lock:
+                self._created += 1
+
+        with self._lock:
+            self._in_use[id(surface)] = (surface, size)
+        return surface
+
+    def release(self, surface: Any) -> None:
+        """归还 acquire 取出的表面
+
+        Args:
+            surface: 表面对象
+        """
+        with self._lock:
+            entry = self._in_use.pop(id(surface), None)
+            if entry is None:
+                logger.debug("忽略不是从表面池取出的表面")
+                return
+            size = entry[1]
+            bucket = self._idle.setdefault(size, [])
+            self._idle.move_to_end(size)
+            if any(idle is surface for idle in bucket):
+                return
+            bucket.append(surface)
+            self._idle_count += 1
+            while self._idle_count > self.max_idle:
+                oldest_size, oldest = next(iter(self._idle.items()))
+                oldest.pop(0)
+                self._idle_count -= 1
+                if not oldest:
+                    del self._idle[oldest_size]
+
+    def clear(self) -> None:
+        """丢弃所有空闲表面"""
+        with self._lock:
+            self._idle.clear()
+            self._idle_count = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """获取统计信息（创建数、复用数、空闲数、使用中数）"""
+        with self._lock:
+            return {
+                "created": self._created,
+                "reused": self._reused,
+                "idle": self._idle_count,
+                "in_use": len(self._in_use)
+            }
+
+
+def _renderer_factory(renderer: Any) -> Callable[[int, int], Any]:
+    """创建通过 renderer.create_surface 创建表面的工厂函数
+
+    工厂只持有渲染器的弱引用：表面池是以渲染器为键的弱引用字典的值，
+    若持有强引用（如绑定方法 renderer.create_surface），渲染器和表面池都永远不会被回收。
+    """
+    renderer_ref = weakref.ref(renderer)
+
+    def factory(width: int, height: int) -> Any:
+        owner = renderer_ref()
+        if owner is None:
+            raise ReferenceError("渲染器已被回收，无法创建表面")
+        return owner.create_surface(width, height)
+
+    return factory
+
+
+__all__ = ['SurfacePool']
@@ -0,0 +1,301 @@
+"""
+---------------------------------------------------------------
+File name:                  texture_atlas.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                纹理图集，将多帧图像打包到少量大图中并以子区域引用
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+----
+"""
+
+import logging
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QImage, QPainter, QPixmap
+
+from status.animation.animation import Animation
+from status.renderer.renderer_base import RendererBase, Rect
+from status.renderer.sprite import SpriteAnimation, SpriteFrame, SpriteSheet
+
+logger = logging.getLogger(__name__)
+
+
+class AtlasRegion(NamedTuple):
+    """图集中的一个子区域"""
+    page: int
+    rect: Rect
+
+
+class ShelfPacker:
+    """货架式矩形装箱
+
+    按高度从高到低依次放置，每行（货架）高度由该行第一个矩形决定，
+    当前页放不下时换到新的一页。
+    """
+
+    def __init__(self, max_width: int, max_height: int, padding: int = 1):
+        """初始化装箱器
+
+        Args:
+            max_width: 每页最大宽度
+            max_height: 每页最大高度
+            padding: 矩形之间的间距（避免平滑缩放时相邻帧的像素渗入）
+        """
+        self.max_width = max_width
+        self.max_height = max_height
+        self.padding = padding
+
+    def pack(self, sizes: List[Tuple[int, int]]) -> Tuple[List[Tuple[int, int, int]], List[Tuple[int, int]]]:
+        """计算每个矩形的位置
+
+        Args:
+            sizes: 矩形尺寸列表 (宽, 高)
+
+        Returns:
+            Tuple: (每个矩形的 (页, x, y)，每页实际使用的 (宽, 高))
+        """
+        positions: List[Tuple[int, int, int]] = [(0, 0, 0)] * len(sizes)
+        pages: List[Tuple[int, int]] = []
+        pad = self.padding
+        page = -1
+        x = y = shelf_height = used_width = 0
+
+        for index in sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0])):
+            width, height = sizes[index]
+            if x > 0 and x + width > self.max_width:
+                # 换行
+                y += shelf_height + pad
+                x = shelf_height = 0
+            if page < 0 or (y > 0 and y + height > self.max_height):
+                # 换页（超出页尺寸的矩形独占一行）
+                page += 1
+                pages.append((0, 0))
+                x = y = shelf_height = used_width = 0
+            positions[index] = (page, x, y)
+            shelf_height = max(shelf_height, height)
+            used_width = max(used_width, x + width)
+            pages[page] = (used_width, y + shelf_height)
+            x += width + pad
+
+        return positions, pages
+
+
+class TextureAtlas:
+    """纹理图集
+
+    图集页以QImage保存，首次绘制时才在界面线程上转换为QPixmap（每页只上传一次）。
+    帧通过名称引用所在页和子区域，绘制时由渲染器以源矩形直接绘制页图像。
+    """
+
+    def __init__(self, name: str, pages: List[QImage], regions: Dict[str, AtlasRegion],
+                 animations: Optional[Dict[str, Tuple[List[str], float, bool]]] = None):
+        """初始化图集
+
+        Args:
+            name: 图集名称
+            pages: 图集页图像
+            regions: 帧名称到子区域的映射
+            animations: 动画名称到 (帧名称列表, 每帧时长, 是否循环) 的映射
+        """
+        self.name = name
+        self.regions = regions
+        self.animations = animations or {}
+        self._page_images = pages
+        self._page_pixmaps: List[Optional[QPixmap]] = [None] * len(pages)
+
+    @property
+    def page_count(self) -> int:
+        """图集页数"""
+        return len(self._page_images)
+
+    def get_region(self, name: str) -> Optional[AtlasRegion]:
+        """获取帧所在的子区域"""
+        return self.regions.get(name)
+
+    def get_page_image(self, index: int) -> QImage:
+        """获取图集页图像"""
+        return self._page_images[index]
+
+    def get_page(self, index: int) -> QPixmap:
+        """获取图集页的QPixmap（须在界面线程调用）"""
+        pixmap = self._page_pixmaps[index]
+        if pixmap is None:
+            pixmap = self._page_pixmaps[index] = QPixmap.fromImage(self._page_images[index])
+        return pixmap
+
+    def get_frame_image(self, name: str) -> Optional[QImage]:
+        """复制出单帧图像（调试或导出用途，绘制时应使用 draw）"""
+        region = self.regions.get(name)
+        if region is None:
+            return None
+        rect = region.rect
+        return self._page_images[region.page].copy(int(rect.x), int(rect.y), int(rect.width), int(rect.height))
+
+    def draw(self, renderer: RendererBase, name: str, x: float, y: float, **kwargs) -> bool:
+        """绘制图集中的一帧
+
+        Args:
+            renderer: 渲染器
+            name: 帧名称
+            x: X坐标
+            y: Y坐标
+            **kwargs: 传给 renderer.draw_image 的其他参数
+
+        Returns:
+            bool: 帧是否存在
+        """
+        region = self.regions.get(name)
+        if region is None:
+            return False
+        renderer.draw_image(self.get_page(region.page), x, y, source_rect=region.rect, **kwargs)
+        return True
+
+    def create_frame(self, name: str, pivot: Optional[Tuple[float, float]] = None) -> SpriteFrame:
+        """创建引用图集子区域的精灵帧
+
+        Args:
+            name: 帧名称
+            pivot: 锚点
+
+        Returns:
+            SpriteFrame: 精灵帧
+
+        Raises:
+            KeyError: 帧不存在
+        """
+        region = self.regions[name]
+        return SpriteFrame(f"{self.name}#{region.page}", region.rect, pivot, image=self.get_page(region.page))
+
+    def create_sprite_sheet(self) -> SpriteSheet:
+        """创建引用图集的精灵表，包含所有帧和已记录的动画
+
+        Returns:
+            SpriteSheet: 精灵表
+        """
+        sheet = SpriteSheet(f"{self.name}#0")
+        for name in self.regions:
+            sheet.frames[name] = self.create_frame(name)
+        for anim_name, (frame_names, frame_duration, loop) in self.animations.items():
+            sheet.add_animation(anim_name, frame_names, frame_duration, loop)
+        return sheet
+
+    def get_stats(self) -> Dict[str, int]:
+        """获取图集统计（页数、帧数、像素总数）"""
+        return {
+            "pages": self.page_count,
+            "frames": len(self.regions),
+            "pixels": sum(image.width() * image.height() for image in self._page_images)
+        }
+
+
+class TextureAtlasBuilder:
+    """纹理图集构建器
+
+    收集帧图像后一次性装箱并绘制到图集页中。构建只使用QImage，可以在工作线程中执行。
+    """
+
+    def __init__(self, max_size: int = 2048, padding: int = 1):
+        """初始化构建器
+
+        Args:
+            max_size: 图集页的最大边长
+            padding: 帧之间的间距
+        """
+        self.max_size = max_size
+        self.padding = padding
+        self._images: Dict[str, QImage] = {}
+        self._animations: Dict[str, Tuple[List[str], float, bool]] = {}
+
+    def add(self, name: str, image: Union[QImage, QPixmap]) -> None:
+        """添加一帧
+
+        Args:
+            name: 帧名称（同名会覆盖）
+            image: 帧图像
+        """
+        if isinstance(image, QPixmap):
+            image = image.toImage()
+        if image.isNull():
+            logger.warning(f"忽略空图像帧: {name}")
+            return
+        self._images[name] = image
+
+    def add_animation(self, name: str, animation: Animation) -> List[str]:
+        """添加动画的所有帧，帧名称为 "<动画名>/<序号>"
+
+        Args:
+            name: 动画名称
+            animation: 动画
+
+        Returns:
+            List[str]: 帧名称列表
+        """
+        frame_names = []
+        for index, frame in enumerate(animation.frames):
+            frame_name = f"{name}/{index}"
+            self.add(frame_name, frame)
+            frame_names.append(frame_name)
+        frame_duration = 1.0 / animation.fps if animation.fps > 0 else 0.1
+        self._animations[name] = ([n for n in frame_names if n in self._images], frame_duration,
+                                  animation.is_looping)
+        return frame_names
+
+    def build(self, name: str = "atlas") -> TextureAtlas:
+        """装箱并生成图集
+
+        Args:
+            name: 图集名称
+
+        Returns:
+            TextureAtlas: 图集
+        """
+        names = list(self._images)
+        sizes = [(self._images[n].width(), self._images[n].height()) for n in names]
+        positions, page_sizes = ShelfPacker(self.max_size, self.max_size, self.padding).pack(sizes)
+
+        pages = []
+        for width, height in page_sizes:
+            page = QImage(max(1, width), max(1, height), QImage.Format.Format_ARGB32_Premultiplied)
+            page.fill(Qt.GlobalColor.transparent)
+            pages.append(page)
+
+        painters = [QPainter(page) for page in pages]
+        regions: Dict[str, AtlasRegion] = {}
+        try:
+            for frame_name, (page, x, y), (width, height) in zip(names, positions, sizes):
+                painters[page].drawImage(x, y, self._images[frame_name])
+                regions[frame_name] = AtlasRegion(page, Rect(x, y, width, height))
+        finally:
+            for painter in painters:
+                painter.end()
+
+        atlas = TextureAtlas(name, pages, regions, dict(self._animations))
+        logger.debug(f"图集 {name} 构建完成: {len(regions)} 帧打包为 {len(pages)} 页")
+        return atlas
+
+
+def build_animation_atlas(animations: Dict[str, Animation], name: str = "atlas",
+                          max_size: int = 2048) -> Tuple[TextureAtlas, Dict[str, SpriteAnimation]]:
+    """将一组动画（如某个宠物的所有状态动画）打包为图集
+
+    Args:
+        animations: 动画名称到动画的映射
+        name: 图集名称
+        max_size: 图集页的最大边长
+
+    Returns:
+        Tuple[TextureAtlas, Dict[str, SpriteAnimation]]: 图集和引用图集子区域的精灵动画
+    """
+    builder = TextureAtlasBuilder(max_size)
+    for anim_name, animation in animations.items():
+        builder.add_animation(anim_name, animation)
+    atlas = builder.build(name)
+    sheet = atlas.create_sprite_sheet()
+    return atlas, dict(sheet.animations)
+
+
+__all__ = ['AtlasRegion', 'ShelfPacker', 'TextureAtlas', 'TextureAtlasBuilder', 'build_animation_atlas']
@@ -54,7 +54,7 @@ from .resource_pack import (
 from .resource_loader import ResourceLoader
 
 # --- 缓存相关 --- (假设 cache.py 只定义类)
-from .cache import Cache, CacheStrategy, CacheItemStatus
+from .cache import Cache, CacheStrategy, CacheItemStatus, SizeEstimatorRegistry, size_estimator_registry
 
 
 # 导出的API
@@ -81,5 +81,7 @@ __all__ = [
     # 缓存相关
     'Cache',
     'CacheStrategy',
-    'CacheItemStatus'
+    'CacheItemStatus',
+    'SizeEstimatorRegistry',
+    'size_estimator_registry'
 ]
\ No newline at end of file
@@ -10,6 +10,9 @@ Changed history:
                             2025/04/03: 初始创建;
                             2025/04/05: 添加load_resource方法，修复clear_cache方法返回值处理;
                             2025/04/05: 完善错误处理和异常传递;
+                            2026/10/16: 缓存项按资源路径/资源包打标签，资源包事件只失效受影响的项并可后台重新解码;
+                            2026/10/16: 预加载和图像序列改用带优先级的并行解码线程池;
+                            2026/10/16: 同一缓存键的并发加载合并为一次，统计中报告被合并的请求数;
 ----
 """
 
@@ -20,9 +23,12 @@ from typing import Dict, Any, Optional, List, Tuple, Union, Set, Callable
 import threading
 import json
 import uuid
+from concurrent.futures import Future
 
 from status.resources import ResourceType, ResourceError, ImageFormat
 from status.resources.cache import Cache, CacheStrategy
+from status.resources.decode_pool import DecodePool
+from status.resources.single_flight import SingleFlight
 from status.events.event_manager import EventManager
 from status.events.event_types import ResourceEventType
 
@@ -84,6 +90,18 @@ class AssetManager:
             default_ttl=300              # 5分钟
         )
         
+        # 解码线程池（按需创建），decode_workers为None时使用CPU核心数
+        self.decode_workers: Optional[int] = None
+        self._decode_pool: Optional[DecodePool] = None
+        self._decode_pool_lock = threading.Lock()
+        
+        # 进行中的加载，同一缓存键的并发未命中等待同一次加载
+        self._inflight = SingleFlight()
+        
+        # 资源包事件导致缓存失效时，是否在后台重新解码被失效的资源
+        self.redecode_invalidated: bool = False
+        self.loader.add_invalidation_listener(self._on_resources_invalidated)
+        
         # 资源预加载列表
         self.preload_list: Set[str] = set()
         
@@ -220,6 +238,56 @@ class AssetManager:
         # 这里可以添加自定义的事件回调处理
         # 方便测试或其他模块监听缓存事件
     
+    def _tag_cache_entry(self, cache: Cache, cache_key: str, tags: Set[str]) -> None:
+        """为缓存项关联失效标签
+        
+        Args:
+            cache: 缓存实例
+            cache_key: 缓存键
+            tags: 标签集合
+        """
+        add_tags = getattr(cache, 'add_tags', None)
+        if callable(add_tags):
+            add_tags(cache_key, tags)
+    
+    def _on_resources_invalidated(self, tags: Set[str]) -> None:
+        """ResourceLoader因资源包事件失效缓存时的回调，只移除受影响的缓存项
+        
+        Args:
+            tags: 失效的标签集合
+        """
+        removed: List[str] = []
+        for cache in (self.image_cache, self.audio_cache, self.other_cache):
+            invalidate = getattr(cache, 'invalidate_tags', None)
+            if callable(invalidate):
+                removed.extend(invalidate(tags))
+        
+        if removed:
+            self.logger.debug(f"资源包变化导致 {len(removed)} 个缓存项失效")
+            if self.redecode_invalidated:
+                self.redecode_async(removed)
+    
+    def redecode_async(self, cache_keys: List[str], priority: int = -1) -> Future:
+        """在解码线程池中重新加载被失效的缓存项，使其在下一帧需要之前就绪
+        
+        只处理可由缓存键还原加载方式的项：普通资源（无额外参数）和图像序列。
+        
+        Args:
+            cache_keys: 缓存键列表
+            priority: 优先级，默认低于普通加载
+            
+        Returns:
+            Future: 全部完成时结果为 (success_count, total_count)
+        """
+        tasks: List[Tuple[str, Callable[[], Any], int]] = []
+        for cache_key in cache_keys:
+            path, _, params = cache_key.partition("##")
+            if not params:
+                tasks.append((path, (lambda p=path: self.load_asset(p)), priority))
+            elif params == "sequence=True":
+                tasks.append((path, (lambda p=path: self.load_image_sequence(p)), priority))
+        return self._run_batch(tasks)
+    
     def _get_cache_for_type(self, resource_type: ResourceType) -> Cache:
         """根据资源类型获取对应的缓存
         
@@ -343,13 +411,20 @@ class AssetManager:
             self.logger.debug(f"AssetManager不使用缓存加载: {path}")
             return load_func()
 
-        final_asset = target_cache.get(cache_key, loader=load_func, ttl=kwargs.get('ttl'))
+        def load_and_cache() -> Any:
+            asset = target_cache.get(cache_key, loader=load_func, ttl=kwargs.get('ttl'))
+            if asset is not None:
+                if cache_decision and not cache_decision(asset, effective_resource_type):
+                    self.logger.debug(f"自定义缓存决策拒绝缓存资源: {cache_key}")
+                    target_cache.remove_method(cache_key)
+                else:
+                    self._tag_cache_entry(target_cache, cache_key, self.loader.get_resource_tags(path))
+            return asset
+
+        # 同一缓存键的并发未命中只加载一次，其余调用共享结果
+        final_asset = self._inflight.do((effective_resource_type, cache_key), load_and_cache)
         
-        if final_asset is not None:
-            if cache_decision and not cache_decision(final_asset, effective_resource_type):
-                self.logger.debug(f"自定义缓存决策拒绝缓存资源: {cache_key}")
-                target_cache.remove_method(cache_key)
-        else:
+        if final_asset is None:
             self.logger.warning(f"AssetManager最终未能加载或获取资源: {path}")
 
         return final_asset
@@ -674,7 +749,7 @@ class AssetManager:
         """获取缓存统计信息
         
         Returns:
-            Dict[str, Dict[str, Any]]: 统计信息，包括各缓存类型和总计
+            Dict[str, Dict[str, Any]]: 统计信息，包括各缓存类型、总计和被合并的并发请求数
         """
         # 获取各个缓存的统计数据
         image_stats = self.image_cache.get_stats()
@@ -684,20 +759,27 @@ class AssetManager:
         # 计算总计
         total_stats = {}
         for key in set(list(image_stats.keys()) + list(audio_stats.keys()) + list(other_stats.keys())):
-            total_stats[key] = 0
-            if key in image_stats:
-                total_stats[key] += image_stats[key]
-            if key in audio_stats:
-                total_stats[key] += audio_stats[key]
-            if key in other_stats:
-                total_stats[key] += other_stats[key]
+            # 只汇总数值项（策略名等字符串项不参与求和）
+            values = [stats[key] for stats in (image_stats, audio_stats, other_stats)
+                      if isinstance(stats.get(key), (int, float))]
+            if values:
+                total_stats[key] = sum(values)
+        
+        # 被合并的并发加载请求数（AssetManager层含等待缓存中进行中加载的请求，以及ResourceLoader层）
+        asset_coalesced = self._inflight.get_coalesced_count() + total_stats.get("coalesced", 0)
+        loader_coalesced = self.loader.get_cache_stats().get("coalesced", 0)
         
         # 返回包含总计的统计数据
         return {
             "image": image_stats,
             "audio": audio_stats,
             "other": other_stats,
-            "total": total_stats
+            "total": total_stats,
+            "coalesced": {
+                "asset": asset_coalesced,
+                "loader": loader_coalesced,
+                "total": asset_coalesced + loader_coalesced
+            }
         }
     
     def get_resource_info(self, path: str) -> Optional[Dict[str, Any]]:
@@ -798,44 +880,128 @@ class AssetManager:
         """
         return list(self.preloaded_groups.keys())
         
-    def preload_async(self, paths: List[str], 
-                     callback: Optional[Callable[[str, bool], None]] = None,
-                     on_complete: Optional[Callable[[int, int], None]] = None) -> threading.Thread:
-        """异步预加载多个资源
+    def get_decode_pool(self) -> DecodePool:
+        """获取解码线程池，首次调用时创建
+        
+        Returns:
+            DecodePool: 解码线程池
+        """
+        with self._decode_pool_lock:
+            if self._decode_pool is None:
+                self._decode_pool = DecodePool(max_workers=self.decode_workers, name="AssetDecode")
+            return self._decode_pool
+    
+    def _run_batch(self, tasks: List[Tuple[str, Callable[[], Any], int]],
+                   callback: Optional[Callable[[str, bool], None]] = None,
+                   on_complete: Optional[Callable[[int, int], None]] = None) -> Future:
+        """在解码线程池中并行执行一批加载任务
         
         Args:
-            paths: 要预加载的资源路径列表
-            callback: 每个资源加载完成时的回调函数，参数为 (path, success)
-            on_complete: 所有资源加载完成时的回调函数，参数为 (success_count, total_count)
+            tasks: (资源路径, 加载函数, 优先级) 列表，加载函数返回None或抛出异常视为失败
+            callback: 每个任务完成时的回调函数，参数为 (path, success)
+            on_complete: 全部完成时的回调函数，参数为 (success_count, total_count)
             
         Returns:
-            Thread: 加载线程
+            Future: 全部完成时结果为 (success_count, total_count)
         """
-        total_count = len(paths)
-        success_count = 0
+        batch_future: Future = Future()
+        total_count = len(tasks)
+        state = {"remaining": total_count, "success": 0}
+        state_lock = threading.Lock()
         
-        def preload_task():
-            nonlocal success_count
-            for path in paths:
-                success = False
+        def finish() -> None:
+            result = (state["success"], total_count)
+            if on_complete:
                 try:
-                    self.load_asset(path)
-                    success = True
-                    success_count += 1
+                    on_complete(*result)
                 except Exception as e:
-                    self.logger.error(f"异步预加载资源失败: {path}, 错误: {str(e)}")
-                
+                    self.logger.error(f"预加载完成回调执行失败: {str(e)}")
+            batch_future.set_result(result)
+        
+        if total_count == 0:
+            finish()
+            return batch_future
+        
+        def make_done(path: str) -> Callable[[Future], None]:
+            def done(future: Future) -> None:
+                success = not future.cancelled() and future.exception() is None and future.result() is not None
+                if not success and not future.cancelled() and future.exception() is not None:
+                    self.logger.error(f"异步预加载资源失败: {path}, 错误: {str(future.exception())}")
                 if callback:
-                    callback(path, success)
+                    try:
+                        callback(path, success)
+                    except Exception as e:
+                        self.logger.error(f"预加载回调执行失败: {path}, 错误: {str(e)}")
+                with state_lock:
+                    state["success"] += int(success)
+                    state["remaining"] -= 1
+                    last = state["remaining"] == 0
+                if last:
+                    finish()
+            return done
+        
+        pool = self.get_decode_pool()
+        for path, load, priority in tasks:
+            pool.submit(load, priority=priority, callback=make_done(path))
+        return batch_future
+    
+    def preload_async(self, paths: List[str], 
+                     callback: Optional[Callable[[str, bool], None]] = None,
+                     on_complete: Optional[Callable[[int, int], None]] = None,
+                     priority: int = 0) -> Future:
+        """异步预加载多个资源，各资源在解码线程池中并行读取和解码
+        
+        Args:
+            paths: 要预加载的资源路径列表
+            callback: 每个资源加载完成时的回调函数，参数为 (path, success)（在工作线程中调用）
+            on_complete: 所有资源加载完成时的回调函数，参数为 (success_count, total_count)
+            priority: 优先级，数值越大越先解码（如当前可见状态的资源）
             
-            if on_complete:
-                on_complete(success_count, total_count)
+        Returns:
+            Future: 全部完成时结果为 (success_count, total_count)
+        """
+        tasks = [(path, (lambda p=path: self.load_asset(p)), priority) for path in paths]
+        return self._run_batch(tasks, callback, on_complete)
+    
+    def preload_sequences_async(self, directory_paths: List[str],
+                                priorities: Optional[Dict[str, int]] = None,
+                                callback: Optional[Callable[[str, bool], None]] = None,
+                                on_complete: Optional[Callable[[int, int], None]] = None) -> Future:
+        """异步预加载多个图像序列（如各状态的动画），不同序列在解码线程池中并行解码
         
-        thread = threading.Thread(target=preload_task)
-        thread.daemon = True
-        thread.start()
+        Args:
+            directory_paths: 图像序列目录列表
+            priorities: 可选，目录 -> 优先级，未列出的为0；当前可见状态应给予更高优先级
+            callback: 每个序列加载完成时的回调函数，参数为 (directory_path, success)
+            on_complete: 全部完成时的回调函数，参数为 (success_count, total_count)
+            
+        Returns:
+            Future: 全部完成时结果为 (success_count, total_count)
+        """
+        priorities = priorities or {}
+        tasks = [
+            (directory, (lambda d=directory: self.load_image_sequence(d)), priorities.get(directory, 0))
+            for directory in directory_paths
+        ]
+        return self._run_batch(tasks, callback, on_complete)
+    
+    def load_image_sequence_async(self, directory_path: str, use_cache: bool = True, priority: int = 0,
+                                  callback: Optional[Callable[[Future], None]] = None) -> Future:
+        """异步加载图像序列
         
-        return thread
+        Args:
+            directory_path: 图像序列目录
+            use_cache: 是否使用或填充图像缓存
+            priority: 优先级，数值越大越先解码
+            callback: 完成时的回调，参数为Future
+            
+        Returns:
+            Future: 结果为图像列表或None
+        """
+        return self.get_decode_pool().submit(
+            self.load_image_sequence, directory_path, use_cache=use_cache,
+            priority=priority, callback=callback
+        )
     
     def load_resources(self, paths: List[str], callback: Optional[Callable[[int, int, str], None]] = None,
                       use_cache: bool = True, **kwargs) -> List[Tuple[str, Any]]:
@@ -964,7 +1130,8 @@ class AssetManager:
         return self.loader.load_json(self._get_full_path(path), **kwargs)
 
     def load_image_sequence(self, directory_path: str, use_cache: bool = True,
-                            cache_decision: Optional[Callable[[Any, ResourceType], bool]] = None) -> Optional[List[Any]]:
+                            cache_decision: Optional[Callable[[Any, ResourceType], bool]] = None,
+                            priority: int = 0) -> Optional[List[Any]]:
         """加载指定目录下的所有图像文件作为一个动画序列。
 
         Args:
@@ -975,6 +1142,7 @@ class AssetManager:
                 接收加载的资源和资源类型作为参数，返回True表示缓存，False表示不缓存。
                 如果为None，则始终根据use_cache参数决定。
                 Defaults to None.
+            priority (int, optional): 帧在解码线程池中的优先级，数值越大越先解码. Defaults to 0.
 
         Returns:
             Optional[List[Any]]: 加载的图像 Surface 列表，按自然顺序排序。
@@ -992,7 +1160,11 @@ class AssetManager:
         self.logger.debug(f"加载图像序列: {directory_path}")
         try:
             # 注意：这里的ResourceLoader是AssetManager的实例变量self.loader
-            loaded_sequence = self.loader.load_image_sequence(directory_path, use_cache=use_cache)
+            # 各帧在解码线程池中并行读取和解码
+            loaded_sequence = self.loader.load_image_sequence(
+                directory_path, use_cache=use_cache,
+                decode_pool=self.get_decode_pool(), priority=priority
+            )
             
             if loaded_sequence is not None and use_cache:
                 should_cache = True
@@ -1010,6 +1182,11 @@ class AssetManager:
                         
                 if should_cache:
                     cache.put(cache_key, loaded_sequence)
+                    # 序列依赖目录本身（新增或删除帧）以及每一帧
+                    tags = {self.loader.dir_tag(directory_path)}
+                    for frame_path in self.loader.get_sequence_frame_paths(directory_path):
+                        tags |= self.loader.get_resource_tags(frame_path)
+                    self._tag_cache_entry(cache, cache_key, tags)
                     self.logger.debug(f"图像序列已缓存: {directory_path}")
                 else:
                     self.logger.debug(f"根据 cache_decision，图像序列未缓存: {directory_path}")
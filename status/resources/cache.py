@@ -9,17 +9,210 @@ Description:                缓存系统，实现资源缓存逻辑，优化资
 Changed history:            
                             2025/04/03: 初始创建;
                             2025/05/12: 修复类型提示;
+                            2026/10/16: 逐出引擎改为有序字典/频率桶/过期堆，逐出与过期为O(1)/O(log n);
+                            2026/10/16: 添加按类型注册的大小估算器，支持容器递归与QImage/QPixmap/Animation;
+                            2026/10/16: 添加标签反向索引，支持按资源路径/资源包精确失效;
+                            2026/10/16: 统计等待同一键进行中加载的请求数;
+                            2026/10/16: LFU最低频率增量维护，移除项时不再遍历频率桶;
 ----
 """
 
+import sys
 import time
+import heapq
+import itertools
 import logging
 import threading
-from typing import Dict, Any, Optional, List, Tuple, Callable, cast
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Set, Tuple, Callable, Iterable, cast
 from enum import Enum, auto
 import weakref
 import gc
 
+# 尝试导入Qt图像类型，用于精确估算图像占用
+try:
+    from PySide6.QtGui import QImage, QPixmap
+    HAS_GUI = True
+except ImportError:
+    HAS_GUI = False
+
+# 大小估算函数：接收对象和递归估算回调，返回字节数
+SizeEstimator = Callable[[Any, Callable[[Any], int]], int]
+
+
+class SizeEstimatorRegistry:
+    """按类型注册的对象大小估算器
+    
+    查找时沿对象类型的MRO匹配最近注册的估算器；容器类型通过回调递归估算其元素，
+    回调内置循环引用保护，同一对象只计算一次。
+    """
+    
+    def __init__(self, default_size: int = 1024):
+        """初始化估算器注册表
+        
+        Args:
+            default_size: 无法估算时使用的默认大小（字节）
+        """
+        self.default_size = default_size
+        self._estimators: Dict[type, SizeEstimator] = {}
+        self._resolved: Dict[type, Optional[SizeEstimator]] = {}
+        self._lock = threading.RLock()
+    
+    def register(self, obj_type: type, estimator: SizeEstimator) -> None:
+        """注册类型的大小估算器
+        
+        Args:
+            obj_type: 对象类型（子类同样适用）
+            estimator: 估算函数，签名为 estimator(obj, recurse) -> int
+        """
+        with self._lock:
+            self._estimators[obj_type] = estimator
+            self._resolved.clear()
+    
+    def unregister(self, obj_type: type) -> bool:
+        """注销类型的大小估算器
+        
+        Args:
+            obj_type: 对象类型
+            
+        Returns:
+            bool: 是否注销成功
+        """
+        with self._lock:
+            if self._estimators.pop(obj_type, None) is None:
+                return False
+            self._resolved.clear()
+            return True
+    
+    def get_estimator(self, obj_type: type) -> Optional[SizeEstimator]:
+        """获取适用于指定类型的估算器
+        
+        Args:
+            obj_type: 对象类型
+            
+        Returns:
+            Optional[SizeEstimator]: 估算器，未注册时返回None
+        """
+        try:
+            return self._resolved[obj_type]
+        except KeyError:
+            pass
+        with self._lock:
+            estimator = None
+            for base in getattr(obj_type, '__mro__', (obj_type,)):
+                if base in self._estimators:
+                    estimator = self._estimators[base]
+                    break
+            self._resolved[obj_type] = estimator
+            return estimator
+    
+    def estimate(self, obj: Any) -> int:
+        """估算对象的内存大小（字节）
+        
+        Args:
+            obj: 要估算的对象
+            
+        Returns:
+            int: 估算的内存大小（字节）
+        """
+        seen: set = set()
+        
+        def recurse(child: Any) -> int:
+            child_id = id(child)
+            if child_id in seen:
+                return 0
+            seen.add(child_id)
+            try:
+                estimator = self.get_estimator(type(child))
+                if estimator is not None:
+                    return max(0, int(estimator(child, recurse)))
+                return self._estimate_fallback(child)
+            except Exception:
+                return self.default_size
+        
+        return recurse(obj)
+    
+    def _estimate_fallback(self, obj: Any) -> int:
+        """未注册类型的估算，按常见属性推断
+        
+        Args:
+            obj: 要估算的对象
+            
+        Returns:
+            int: 估算的内存大小（字节）
+        """
+        if hasattr(obj, 'sizeInBytes'):  # Qt图像类
+            return int(obj.sizeInBytes())
+        elif hasattr(obj, 'nbytes'):  # 例如numpy数组
+            return int(obj.nbytes)
+        elif hasattr(obj, 'width') and hasattr(obj, 'height') and callable(obj.width):
+            # 类似图像的对象：假设4字节RGBA
+            return int(obj.width() * obj.height() * 4)
+        elif hasattr(obj, 'size') and isinstance(obj.size, tuple) and len(obj.size) >= 2:
+            # 假设是PIL图像，size是(width, height)
+            return int(obj.size[0] * obj.size[1] * 4)
+        
+        try:
+            return sys.getsizeof(obj)
+        except TypeError:
+            return self.default_size
+
+
+def _estimate_buffer(obj: Any, recurse: Callable[[Any], int]) -> int:
+    """字节缓冲区按内容长度计算"""
+    return len(obj) if not isinstance(obj, memoryview) else obj.nbytes
+
+
+def _estimate_sequence(obj: Any, recurse: Callable[[Any], int]) -> int:
+    """序列和集合：容器本身加上各元素"""
+    return sys.getsizeof(obj) + sum(recurse(item) for item in obj)
+
+
+def _estimate_mapping(obj: Any, recurse: Callable[[Any], int]) -> int:
+    """字典：容器本身加上各键值"""
+    return sys.getsizeof(obj) + sum(recurse(k) + recurse(v) for k, v in obj.items())
+
+
+def _estimate_scalar(obj: Any, recurse: Callable[[Any], int]) -> int:
+    """标量与字符串直接取解释器中的对象大小"""
+    return sys.getsizeof(obj)
+
+
+def _estimate_qimage(obj: Any, recurse: Callable[[Any], int]) -> int:
+    """QImage按实际像素格式占用计算"""
+    return int(obj.sizeInBytes())
+
+
+def _estimate_qpixmap(obj: Any, recurse: Callable[[Any], int]) -> int:
+    """QPixmap没有sizeInBytes，按像素位深计算其后备存储"""
+    if obj.isNull():
+        return 0
+    return obj.width() * obj.height() * max(obj.depth(), 8) // 8
+
+
+def _estimate_animation(obj: Any, recurse: Callable[[Any], int]) -> int:
+    """Animation按各帧大小求和"""
+    return sys.getsizeof(obj) + sum(recurse(frame) for frame in obj.frames)
+
+
+# 全局默认估算器注册表
+size_estimator_registry = SizeEstimatorRegistry()
+for _buffer_type in (bytes, bytearray, memoryview):
+    size_estimator_registry.register(_buffer_type, _estimate_buffer)
+for _sequence_type in (list, tuple, set, frozenset):
+    size_estimator_registry.register(_sequence_type, _estimate_sequence)
+size_estimator_registry.register(dict, _estimate_mapping)
+for _scalar_type in (str, int, float, bool, type(None)):
+    size_estimator_registry.register(_scalar_type, _estimate_scalar)
+if HAS_GUI:
+    size_estimator_registry.register(QImage, _estimate_qimage)
+    size_estimator_registry.register(QPixmap, _estimate_qpixmap)
+    try:
+        from status.animation.animation import Animation
+        size_estimator_registry.register(Animation, _estimate_animation)
+    except ImportError:
+        pass
+
 
 class CacheStrategy(Enum):
     """缓存策略枚举"""
@@ -66,24 +259,7 @@ class CacheItem:
         Returns:
             int: 估计的内存大小（字节）
         """
-        # 对于某些已知类型，使用其内部方法或属性来获取大小
-        if hasattr(obj, 'nbytes'):  # 例如numpy数组
-            return int(obj.nbytes)  # 确保返回int类型
-        elif hasattr(obj, 'width') and hasattr(obj, 'height'):  # QImage或类似的图像对象
-            # 估计图像大小：宽x高x像素深度（假设4字节RGBA）
-            return int(obj.width() * obj.height() * 4)
-        elif hasattr(obj, 'size'):  # PIL.Image或具有size属性的对象
-            if isinstance(obj.size, tuple) and len(obj.size) >= 2:
-                # 假设是PIL图像，size是(width, height)
-                width, height = obj.size[0], obj.size[1]  # 只取前两个元素
-                return int(width * height * 4)  # 假设4字节RGBA
-        elif isinstance(obj, (bytes, bytearray)):
-            return len(obj)
-        elif isinstance(obj, str):
-            return len(obj) * 2  # 假设UTF-16编码，每个字符2字节
-        
-        # 默认大小：对于复杂对象，这只是一个很粗略的估计
-        return 1024  # 1KB默认大小
+        return size_estimator_registry.estimate(obj)
     
     def access(self) -> None:
         """访问缓存项，更新访问时间和计数"""
@@ -102,6 +278,16 @@ class CacheItem:
         current_time = time.time()
         return (current_time - self.created_at) > self.max_age
     
+    def get_expire_time(self) -> Optional[float]:
+        """获取缓存项的过期时间点
+        
+        Returns:
+            Optional[float]: 过期时间戳，永不过期时返回None
+        """
+        if self.max_age <= 0:
+            return None
+        return self.created_at + self.max_age
+    
     def get_age(self) -> float:
         """获取缓存项的年龄（秒）
         
@@ -143,10 +329,26 @@ class Cache:
         self.default_ttl = default_ttl
         self.cleanup_interval = cleanup_interval
         
-        self._cache: Dict[str, CacheItem] = {}
+        # 缓存项按逐出顺序存放：LRU下访问时移到末尾，FIFO下保持插入顺序，
+        # 因此逐出时取首项即可，不再需要全表扫描
+        self._cache: "OrderedDict[str, CacheItem]" = OrderedDict()
         self._current_size = 0
+        
+        # LFU频率桶：访问次数 -> 按进入该桶先后排列的键
+        self._freq_buckets: Dict[int, "OrderedDict[str, None]"] = {}
+        self._min_freq = 0
+        
+        # 过期最小堆：(过期时间, 序号, 键)，移除项时惰性删除
+        self._expiry_heap: List[Tuple[float, int, str]] = []
+        self._expiry_seq: Dict[str, int] = {}
+        self._seq_counter = itertools.count()
+        
+        # 标签反向索引：标签 -> 键，键 -> 标签（如资源路径、资源包ID），用于精确失效
+        self._tag_index: Dict[str, Set[str]] = {}
+        self._key_tags: Dict[str, Set[str]] = {}
         self._lock = threading.RLock()
         self._loading_locks: Dict[str, threading.Lock] = {}
+        self._coalesced = 0  # 等待进行中加载而未重复加载的请求数
         self._logger = logging.getLogger("Cache")
         
         # 将核心方法定义为可调用的实例变量，并用内部实现初始化
@@ -203,7 +405,7 @@ class Cache:
             
             # 如果存在且未过期，更新访问信息并返回
             if item is not None and item.status == CacheItemStatus.READY and not item.is_expired():
-                item.access()
+                self._touch_item(item)
                 return item.value
             
             # 如果存在但已过期，将其从缓存中移除
@@ -215,6 +417,7 @@ class Cache:
             if item is not None and item.status == CacheItemStatus.LOADING:
                 loading_lock = self._loading_locks.get(key)
                 if loading_lock is not None:
+                    self._coalesced += 1
                     self._lock.release()
                     try:
                         loading_lock.acquire()
@@ -222,7 +425,7 @@ class Cache:
                         self._lock.acquire()
                         item = self._cache.get(key)
                         if item is not None and item.status == CacheItemStatus.READY:
-                            item.access()
+                            self._touch_item(item)
                             return item.value
                     except Exception as e:
                         self._logger.error(f"等待加载缓存项时发生错误: {str(e)}")
@@ -234,7 +437,9 @@ class Cache:
                 self._loading_locks[key] = loading_lock
                 temp_item = CacheItem(key, None, ttl or self.default_ttl)
                 temp_item.status = CacheItemStatus.LOADING
+                temp_item.size = 0  # 占位项不计入缓存大小
                 self._cache[key] = temp_item
+                self._index_add(key, temp_item)
                 self._lock.release()
                 try:
                     value = loader()
@@ -253,11 +458,14 @@ class Cache:
                     return item.value
             return default
     
-    def _default_put_impl(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+    def _default_put_impl(self, key: str, value: Any, ttl: Optional[float] = None,
+                          tags: Optional[Iterable[str]] = None) -> None:
         """添加或更新缓存项的默认实现"""
         with self._lock:
             item = CacheItem(key, value, ttl or self.default_ttl)
             self._add_item(key, item)
+            if tags:
+                self.add_tags(key, tags)
     
     def _add_item(self, key: str, item: CacheItem) -> None:
         """添加缓存项到缓存
@@ -276,6 +484,7 @@ class Cache:
         # 添加缓存项
         self._cache[key] = item
         self._current_size += item.size
+        self._index_add(key, item)
     
     def _remove_item(self, key: str) -> None:
         """从缓存中移除一个项
@@ -286,6 +495,191 @@ class Cache:
         item_popped = self._cache.pop(key, None)
         if item_popped is not None:
             self._current_size -= item_popped.size
+            self._index_remove(key, item_popped)
+            self._untag(key)
+    
+    def _untag(self, key: str) -> None:
+        """从标签反向索引中注销键
+        
+        Args:
+            key: 缓存键
+        """
+        for tag in self._key_tags.pop(key, ()):
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
+    
+    def add_tags(self, key: str, tags: Iterable[str]) -> bool:
+        """为已缓存的项关联标签，项被移除时标签自动注销
+        
+        Args:
+            key: 缓存键
+            tags: 标签（如 "path:images/a.png"、"pack:default"）
+            
+        Returns:
+            bool: 键存在并已关联时返回True
+        """
+        with self._lock:
+            if key not in self._cache:
+                return False
+            key_tags = self._key_tags.setdefault(key, set())
+            for tag in tags:
+                key_tags.add(tag)
+                self._tag_index.setdefault(tag, set()).add(key)
+            return True
+    
+    def get_tagged_keys(self, tag: str) -> List[str]:
+        """获取关联了指定标签的缓存键
+        
+        Args:
+            tag: 标签
+            
+        Returns:
+            List[str]: 缓存键列表
+        """
+        with self._lock:
+            return list(self._tag_index.get(tag, ()))
+    
+    def invalidate_tags(self, tags: Iterable[str]) -> List[str]:
+        """移除关联了任一指定标签的缓存项
+        
+        Args:
+            tags: 标签
+            
+        Returns:
+            List[str]: 被移除的缓存键
+        """
+        with self._lock:
+            keys: Set[str] = set()
+            for tag in tags:
+                keys.update(self._tag_index.get(tag, ()))
+            for key in keys:
+                self._remove_item(key)
+            return list(keys)
+    
+    def _touch_item(self, item: CacheItem) -> None:
+        """记录一次命中，并按策略调整逐出顺序
+        
+        Args:
+            item: 被访问的缓存项
+        """
+        old_count = item.access_count
+        item.access()
+        if self.strategy == CacheStrategy.LFU:
+            self._freq_move(item.key, old_count, item.access_count)
+        elif self.strategy != CacheStrategy.FIFO:
+            self._cache.move_to_end(item.key)
+    
+    def _index_add(self, key: str, item: CacheItem) -> None:
+        """将新加入的缓存项登记到频率桶和过期堆
+        
+        Args:
+            key: 缓存键
+            item: 缓存项
+        """
+        if self.strategy == CacheStrategy.LFU:
+            self._freq_buckets.setdefault(item.access_count, OrderedDict())[key] = None
+            if len(self._freq_buckets) == 1 or item.access_count < self._min_freq:
+                self._min_freq = item.access_count
+        
+        expire_time = item.get_expire_time()
+        if expire_time is not None:
+            seq = next(self._seq_counter)
+            self._expiry_seq[key] = seq
+            heapq.heappush(self._expiry_heap, (expire_time, seq, key))
+            # 惰性删除会留下失效条目，过多时重建堆以限制内存
+            if len(self._expiry_heap) > 2 * len(self._cache) + 64:
+                self._rebuild_expiry_heap()
+    
+    def _index_remove(self, key: str, item: CacheItem) -> None:
+        """将缓存项从频率桶和过期堆中注销
+        
+        过期堆采用惰性删除，此处只丢弃序号，堆顶弹出时再跳过失效条目；
+        最低频率同样惰性维护，只保证不大于实际最低频率。
+        
+        Args:
+            key: 缓存键
+            item: 缓存项
+        """
+        self._expiry_seq.pop(key, None)
+        if self.strategy == CacheStrategy.LFU:
+            bucket = self._freq_buckets.get(item.access_count)
+            if bucket is not None:
+                bucket.pop(key, None)
+                if not bucket:
+                    # 最低频率桶被清空时不立即重算，_evict 取不到该桶时再惰性求最小值
+                    del self._freq_buckets[item.access_count]
+    
+    def _freq_move(self, key: str, old_count: int, new_count: int) -> None:
+        """把键从旧频率桶移动到新频率桶
+        
+        Args:
+            key: 缓存键
+            old_count: 原访问次数
+            new_count: 新访问次数
+        """
+        bucket = self._freq_buckets.get(old_count)
+        if bucket is not None:
+            bucket.pop(key, None)
+            if not bucket:
+                del self._freq_buckets[old_count]
+                if self._min_freq == old_count:
+                    self._min_freq = new_count
+        self._freq_buckets.setdefault(new_count, OrderedDict())[key] = None
+    
+    def _rebuild_expiry_heap(self) -> None:
+        """按当前缓存项重建过期堆，丢弃失效条目"""
+        self._expiry_heap = []
+        self._expiry_seq = {}
+        for key, item in self._cache.items():
+            expire_time = item.get_expire_time()
+            if expire_time is not None:
+                seq = next(self._seq_counter)
+                self._expiry_seq[key] = seq
+                self._expiry_heap.append((expire_time, seq, key))
+        heapq.heapify(self._expiry_heap)
+    
+    def _rebuild_index(self) -> None:
+        """按当前策略重建逐出顺序和频率桶（仅在切换策略时调用）"""
+        if self.strategy == CacheStrategy.FIFO:
+            order = sorted(self._cache.values(), key=lambda it: it.created_at)
+        else:
+            order = sorted(self._cache.values(), key=lambda it: it.last_accessed)
+        self._cache = OrderedDict((it.key, it) for it in order)
+        
+        self._freq_buckets = {}
+        self._min_freq = 0
+        if self.strategy == CacheStrategy.LFU:
+            for key, item in self._cache.items():
+                self._freq_buckets.setdefault(item.access_count, OrderedDict())[key] = None
+            if self._freq_buckets:
+                self._min_freq = min(self._freq_buckets)
+    
+    def _pop_expired(self, limit: Optional[int] = None) -> int:
+        """从过期堆顶依次移除已过期的缓存项
+        
+        Args:
+            limit: 最多移除的数量，None表示不限
+            
+        Returns:
+            int: 实际移除的数量
+        """
+        removed = 0
+        now = time.time()
+        heap = self._expiry_heap
+        while heap and (limit is None or removed < limit):
+            expire_time, seq, key = heap[0]
+            if self._expiry_seq.get(key) != seq:
+                heapq.heappop(heap)  # 失效条目
+                continue
+            if expire_time >= now:
+                break
+            heapq.heappop(heap)
+            self._remove_item(key)
+            removed += 1
+        return removed
     
     def _ensure_capacity(self, required_size: int) -> None:
         """确保缓存有足够的空间
@@ -303,25 +697,21 @@ class Cache:
         if not self._cache:
             return
         
-        # 首先移除已过期的项
-        expired_keys = [k for k, v in self._cache.items() if v.is_expired()]
-        if expired_keys:
-            for key_to_evict_expired in expired_keys[:1]:  # 每次只移除一项，避免一次性移除太多
-                self._remove_item(key_to_evict_expired)
+        # 首先移除已过期的项（每次只移除一项，避免一次性移除太多）
+        if self._pop_expired(limit=1):
             return
         
         # 根据策略选择要逐出的项
-        if self.strategy == CacheStrategy.LRU:
-            # 最近最少使用：移除最久未访问的项
-            key_to_evict = min(self._cache.items(), key=lambda x: x[1].last_accessed)[0]
-        elif self.strategy == CacheStrategy.FIFO:
-            # 先进先出：移除最早创建的项
-            key_to_evict = min(self._cache.items(), key=lambda x: x[1].created_at)[0]
-        elif self.strategy == CacheStrategy.LFU:
-            # 最少使用频率：移除访问次数最少的项
-            key_to_evict = min(self._cache.items(), key=lambda x: x[1].access_count)[0]
-        else:  # 默认LRU
-            key_to_evict = min(self._cache.items(), key=lambda x: x[1].last_accessed)[0]
+        if self.strategy == CacheStrategy.LFU and self._freq_buckets:
+            # 最少使用频率：移除最低频率桶中最早进入的项
+            bucket = self._freq_buckets.get(self._min_freq)
+            if bucket is None:
+                self._min_freq = min(self._freq_buckets)
+                bucket = self._freq_buckets[self._min_freq]
+            key_to_evict = next(iter(bucket))
+        else:
+            # LRU：首项即最久未访问的项；FIFO：首项即最早加入的项
+            key_to_evict = next(iter(self._cache))
         
         # 移除选中的项
         self._remove_item(key_to_evict)
@@ -340,6 +730,12 @@ class Cache:
             cleared_count = len(self._cache)
             self._cache.clear()
             self._current_size = 0
+            self._freq_buckets.clear()
+            self._min_freq = 0
+            self._expiry_heap.clear()
+            self._expiry_seq.clear()
+            self._tag_index.clear()
+            self._key_tags.clear()
             self._logger.info(f"缓存已清空，移除了 {cleared_count} 个条目")
             return cleared_count
     
@@ -350,10 +746,7 @@ class Cache:
             int: 清理的项数量
         """
         with self._lock:
-            expired_keys = [k for k, v in self._cache.items() if v.is_expired()]
-            for key in expired_keys:
-                self._remove_item(key)
-            return len(expired_keys)
+            return self._pop_expired()
     
     def get_stats(self) -> Dict[str, Any]:
         """获取缓存统计信息
@@ -371,7 +764,8 @@ class Cache:
                 "strategy": self.strategy.name,
                 "expired_items": sum(1 for v in self._cache.values() if v.is_expired()),
                 "loading_items": sum(1 for v in self._cache.values() if v.status == CacheItemStatus.LOADING),
-                "error_items": sum(1 for v in self._cache.values() if v.status == CacheItemStatus.ERROR)
+                "error_items": sum(1 for v in self._cache.values() if v.status == CacheItemStatus.ERROR),
+                "coalesced": self._coalesced
             }
     
     def set_strategy(self, strategy: CacheStrategy) -> None:
@@ -381,7 +775,10 @@ class Cache:
             strategy: 新的缓存策略
         """
         with self._lock:
+            if strategy == self.strategy:
+                return
             self.strategy = strategy
+            self._rebuild_index()
     
     def set_max_size(self, max_size: int) -> None:
         """设置最大缓存大小
@@ -0,0 +1,201 @@
+"""
+---------------------------------------------------------------
+File name:                  decode_pool.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                带优先级的有界解码线程池，用于并行读取和解码资源
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+----
+"""
+
+import os
+import queue
+import logging
+import itertools
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+class DecodePool:
+    """带优先级的有界解码线程池
+
+    文件读取和QImage解码都会释放GIL，因此多个工作线程可以真正并行。
+    任务按优先级出队（数值越大越先执行），同优先级按提交顺序执行；
+    工作线程在首次提交任务时按需创建，数量不超过上限。
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, name: str = "DecodePool"):
+        """初始化解码线程池
+
+        Args:
+            max_workers: 最大工作线程数，默认为CPU核心数
+            name: 工作线程名前缀
+        """
+        self.max_workers = max(1, max_workers or os.cpu_count() or 2)
+        self.name = name
+        self.logger = logging.getLogger("Status.DecodePool")
+
+        # 队列元素：(-优先级, 提交序号, (future, fn, args, kwargs))，None任务为关闭哨兵
+        self._queue: queue.PriorityQueue = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._workers: List[threading.Thread] = []
+        self._idle_workers = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._shutdown = False
+        self._completed = 0
+        self._failed = 0
+
+    def _ensure_worker(self) -> None:
+        """排队任务多于空闲线程且未达上限时创建新的工作线程（调用方需持有锁）"""
+        if len(self._workers) >= self.max_workers or self._queue.qsize() <= self._idle_workers:
+            return
+        worker = threading.Thread(
+            target=self._worker_loop,
+            name=f"{self.name}-{len(self._workers)}",
+            daemon=True
+        )
+        self._workers.append(worker)
+        worker.start()
+
+    def _worker_loop(self) -> None:
+        self._local.is_worker = True
+        while True:
+            with self._lock:
+                self._idle_workers += 1
+            try:
+                _, _, task = self._queue.get()
+            finally:
+                with self._lock:
+                    self._idle_workers -= 1
+            if task is None:
+                # 关闭哨兵
+                return
+
+            future, fn, args, kwargs = task
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                with self._lock:
+                    self._failed += 1
+                future.set_exception(e)
+            else:
+                with self._lock:
+                    self._completed += 1
+                future.set_result(result)
+
+    def is_worker_thread(self) -> bool:
+        """当前线程是否为本线程池的工作线程"""
+        return getattr(self._local, "is_worker", False)
+
+    def submit(self, fn: Callable[..., Any], *args: Any, priority: int = 0,
+               callback: Optional[Callable[[Future], None]] = None, **kwargs: Any) -> Future:
+        """提交任务
+
+        Args:
+            fn: 要执行的函数
+            *args: 位置参数
+            priority: 优先级，数值越大越先执行
+            callback: 任务完成（含失败和取消）时的回调，参数为Future
+            **kwargs: 关键字参数
+
+        Returns:
+            Future: 任务的Future对象
+        """
+        future: Future = Future()
+        if callback is not None:
+            future.add_done_callback(callback)
+
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("解码线程池已关闭")
+            self._queue.put((-priority, next(self._seq), (future, fn, args, kwargs)))
+            self._ensure_worker()
+        return future
+
+    def map_ordered(self, fn: Callable[[Any], Any], items: Iterable[Any], priority: int = 0) -> List[Any]:
+        """并行执行 fn(item) 并按输入顺序返回结果，单项失败时该项结果为None
+
+        在工作线程内调用时直接顺序执行，避免工作线程互相等待造成死锁。
+
+        Args:
+            fn: 处理函数
+            items: 输入项
+            priority: 优先级
+
+        Returns:
+            List[Any]: 与输入顺序一致的结果列表
+        """
+        items = list(items)
+        if self.is_worker_thread() or len(items) <= 1:
+            results: List[Any] = []
+            for item in items:
+                try:
+                    results.append(fn(item))
+                except Exception as e:
+                    self.logger.error(f"解码任务失败: {item}, 错误: {str(e)}")
+                    results.append(None)
+            return results
+
+        futures = [self.submit(fn, item, priority=priority) for item in items]
+        results = []
+        for item, future in zip(items, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                self.logger.error(f"解码任务失败: {item}, 错误: {str(e)}")
+                results.append(None)
+        return results
+
+    def shutdown(self, wait: bool = True) -> None:
+        """关闭线程池，取消尚未开始的任务
+
+        Args:
+            wait: 是否等待工作线程退出
+        """
+        with self._lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            workers = list(self._workers)
+
+        # 取消排队中的任务
+        while True:
+            try:
+                _, _, task = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if task is not None:
+                task[0].cancel()
+
+        # 哨兵的优先级最低，保证在剩余任务之后出队
+        for _ in workers:
+            self._queue.put((1 << 62, next(self._seq), None))
+        if wait:
+            for worker in workers:
+                worker.join()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取线程池统计信息
+
+        Returns:
+            Dict[str, Any]: 统计信息
+        """
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "workers": len(self._workers),
+                "idle_workers": self._idle_workers,
+                "pending": self._queue.qsize(),
+                "completed": self._completed,
+                "failed": self._failed
+            }
+
+
+__all__ = ['DecodePool']
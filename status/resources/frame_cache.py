@@ -0,0 +1,343 @@
+"""
+---------------------------------------------------------------
+File name:                  frame_cache.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                动画帧磁盘缓存，将解码/绘制后的帧以可内存映射的二进制容器持久化
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+                            2026/10/16: 移除全局默认实例，由应用按配置创建；默认目录提取为 DEFAULT_CACHE_DIR;
+----
+"""
+
+import os
+import json
+import mmap
+import struct
+import hashlib
+import logging
+import tempfile
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from PySide6.QtCore import qVersion
+from PySide6.QtGui import QImage
+
+from status.animation.animation import Animation
+
+
+# 容器格式：
+#   文件头   <4sHHII  魔数、格式版本、保留、帧数、元数据长度
+#   元数据   UTF-8 JSON（动画名称、fps、循环标志和可序列化的metadata）
+#   帧表     每帧 <IIIQ  宽、高、每行字节数、数据偏移
+#   帧数据   预乘ARGB32原始像素，每帧按 _ALIGNMENT 对齐
+_MAGIC = b"SFRC"
+_HEADER = struct.Struct("<4sHHII")
+_FRAME_ENTRY = struct.Struct("<IIIQ")
+_ALIGNMENT = 64
+_PIXEL_FORMAT = QImage.Format.Format_ARGB32_Premultiplied
+_FILE_SUFFIX = ".frames"
+
+# 默认缓存目录（测试中可替换为临时目录）
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".status", "cache", "frames")
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+class FrameDiskCache:
+    """动画帧磁盘缓存
+
+    每个缓存项是一个文件，保存一组预乘ARGB32原始帧数据。读取时以写时复制方式
+    映射文件并直接包装为QImage，不再重新绘制或解码PNG。缓存键由调用方根据来源
+    （占位符模块源码哈希、图像目录签名）和生成器版本计算，来源变化后自然失效。
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, cache_dir: Optional[str] = None, max_size: int = 256 * 1024 * 1024,
+                 enabled: bool = True):
+        """初始化帧缓存
+
+        Args:
+            cache_dir: 缓存目录，默认为 DEFAULT_CACHE_DIR（~/.status/cache/frames）
+            max_size: 缓存目录的最大总大小（字节），超出时删除最久未使用的缓存项
+            enabled: 是否启用
+        """
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.max_size = max_size
+        self.enabled = enabled
+        self.logger = logging.getLogger("Status.FrameDiskCache")
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "errors": 0}
+
+    # --- 缓存键 ---
+
+    def make_key(self, kind: str, *parts: Any) -> str:
+        """由来源描述生成缓存键
+
+        Args:
+            kind: 来源类别，如 "placeholder"、"directory"
+            *parts: 来源描述（源码哈希、生成器版本等）
+
+        Returns:
+            str: 缓存键（十六进制摘要）
+        """
+        digest = hashlib.sha1()
+        for part in (self.FORMAT_VERSION, qVersion(), kind) + parts:
+            digest.update(str(part).encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    @staticmethod
+    def hash_file(path: str) -> Optional[str]:
+        """计算文件内容哈希，文件不可读时返回None"""
+        try:
+            with open(path, "rb") as f:
+                return hashlib.sha1(f.read()).hexdigest()
+        except OSError:
+            return None
+
+    @staticmethod
+    def directory_signature(directory: str, files: Iterable[str]) -> Optional[str]:
+        """由目录中文件的名称、大小和修改时间计算签名，任一文件不可访问时返回None
+
+        Args:
+            directory: 目录路径
+            files: 参与签名的文件名（按加载顺序）
+
+        Returns:
+            Optional[str]: 签名
+        """
+        digest = hashlib.sha1(os.path.abspath(directory).encode("utf-8"))
+        try:
+            for name in files:
+                st = os.stat(os.path.join(directory, name))
+                digest.update(f"\0{name}\0{st.st_size}\0{st.st_mtime_ns}".encode("utf-8"))
+        except OSError:
+            return None
+        return digest.hexdigest()
+
+    def _path_for(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + _FILE_SUFFIX)
+
+    # --- 读写 ---
+
+    def load_frames(self, key: str) -> Optional[Tuple[List[QImage], Dict[str, Any]]]:
+        """读取缓存的帧
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            Optional[Tuple[List[QImage], Dict[str, Any]]]: (帧列表, 元数据)，未命中或文件损坏时返回None
+        """
+        if not self.enabled:
+            return None
+        path = self._path_for(key)
+        try:
+            with open(path, "rb") as f:
+                # 写时复制映射：QImage可在原地修改像素而不影响缓存文件
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError):
+            self._count("misses")
+            return None
+
+        try:
+            frames, meta = self._parse(mapped)
+        except (struct.error, ValueError, KeyError) as e:
+            self.logger.warning(f"帧缓存文件损坏，已删除: {path}, 错误: {e}")
+            self._count("errors")
+            self._discard(path)
+            return None
+
+        # 更新访问时间，供容量淘汰参考
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self._count("hits")
+        return frames, meta
+
+    def _parse(self, mapped: mmap.mmap) -> Tuple[List[QImage], Dict[str, Any]]:
+        magic, version, _, frame_count, meta_len = _HEADER.unpack_from(mapped, 0)
+        if magic != _MAGIC or version != self.FORMAT_VERSION:
+            raise ValueError("魔数或格式版本不匹配")
+        offset = _HEADER.size
+        meta = json.loads(bytes(mapped[offset:offset + meta_len]).decode("utf-8"))
+        offset += meta_len
+
+        view = memoryview(mapped)
+        frames: List[QImage] = []
+        for i in range(frame_count):
+            width, height, bytes_per_line, data_offset = _FRAME_ENTRY.unpack_from(
+                mapped, offset + i * _FRAME_ENTRY.size)
+            end = data_offset + bytes_per_line * height
+            if end > len(mapped):
+                raise ValueError("帧数据越界")
+            # QImage持有缓冲区引用，映射在所有帧释放后才会关闭
+            frames.append(QImage(view[data_offset:end], width, height, bytes_per_line, _PIXEL_FORMAT))
+        return frames, meta
+
+    def store_frames(self, key: str, frames: List[QImage], meta: Optional[Dict[str, Any]] = None) -> bool:
+        """将帧写入缓存（先写临时文件再原子替换）
+
+        Args:
+            key: 缓存键
+            frames: 帧列表
+            meta: 可JSON序列化的元数据
+
+        Returns:
+            bool: 是否写入成功
+        """
+        if not self.enabled or not frames:
+            return False
+
+        images = [frame if frame.format() == _PIXEL_FORMAT else frame.convertToFormat(_PIXEL_FORMAT)
+                  for frame in frames]
+        if any(image.isNull() for image in images):
+            return False
+        meta_bytes = json.dumps(meta or {}, ensure_ascii=False).encode("utf-8")
+
+        data_offset = _align(_HEADER.size + len(meta_bytes) + _FRAME_ENTRY.size * len(images))
+        table = []
+        for image in images:
+            table.append(_FRAME_ENTRY.pack(image.width(), image.height(), image.bytesPerLine(), data_offset))
+            data_offset = _align(data_offset + image.sizeInBytes())
+
+        temp_path = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(suffix=".tmp", dir=self.cache_dir)
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, self.FORMAT_VERSION, 0, len(images), len(meta_bytes)))
+                f.write(meta_bytes)
+                f.write(b"".join(table))
+                for image in images:
+                    f.seek(_align(f.tell()))
+                    f.write(image.constBits())
+            os.replace(temp_path, self._path_for(key))
+        except OSError as e:
+            self.logger.warning(f"写入帧缓存失败: {key}, 错误: {e}")
+            self._count("errors")
+            if temp_path:
+                self._discard(temp_path)
+            return False
+
+        self._count("stores")
+        self._enforce_size_limit()
+        return True
+
+    # --- 动画 ---
+
+    def load_animation(self, key: str) -> Optional[Animation]:
+        """从缓存重建动画对象
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            Optional[Animation]: 动画，未命中时返回None
+        """
+        loaded = self.load_frames(key)
+        if loaded is None:
+            return None
+        frames, meta = loaded
+        animation = Animation(name=meta.get("name", ""), frames=frames, fps=meta.get("fps", 10))
+        animation.metadata.update(meta.get("metadata", {}))
+        animation.set_loop(meta.get("loop", True))
+        return animation
+
+    def store_animation(self, key: str, animation: Animation) -> bool:
+        """将动画的帧和可序列化的元数据写入缓存
+
+        Args:
+            key: 缓存键
+            animation: 动画
+
+        Returns:
+            bool: 是否写入成功
+        """
+        metadata = {}
+        for name, value in animation.metadata.items():
+            try:
+                json.dumps(value)
+            except (TypeError, ValueError):
+                continue
+            metadata[name] = value
+        meta = {
+            "name": animation.name,
+            "fps": animation.fps,
+            "loop": animation.is_looping,
+            "metadata": metadata
+        }
+        return self.store_frames(key, animation.frames, meta)
+
+    # --- 维护 ---
+
+    def invalidate(self, key: str) -> bool:
+        """删除指定缓存项"""
+        return self._discard(self._path_for(key))
+
+    def clear(self) -> int:
+        """删除所有缓存项
+
+        Returns:
+            int: 删除的缓存项数量
+        """
+        removed = 0
+        for path, _, _ in self._entries():
+            if self._discard(path):
+                removed += 1
+        return removed
+
+    def _entries(self) -> List[Tuple[str, float, int]]:
+        """列出缓存项 (路径, 最后访问时间, 大小)"""
+        entries = []
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(_FILE_SUFFIX):
+                        try:
+                            st = entry.stat()
+                        except OSError:
+                            continue
+                        entries.append((entry.path, max(st.st_atime, st.st_mtime), st.st_size))
+        except OSError:
+            pass
+        return entries
+
+    def _enforce_size_limit(self) -> None:
+        if self.max_size <= 0:
+            return
+        entries = self._entries()
+        total = sum(size for _, _, size in entries)
+        if total <= self.max_size:
+            return
+        for path, _, size in sorted(entries, key=lambda e: e[1]):
+            if total <= self.max_size:
+                break
+            if self._discard(path):
+                total -= size
+
+    def _discard(self, path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        """获取命中/未命中/写入/错误统计"""
+        with self._lock:
+            return dict(self._stats)
+
+
+__all__ = ['FrameDiskCache', 'DEFAULT_CACHE_DIR']
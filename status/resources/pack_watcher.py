@@ -0,0 +1,482 @@
+"""
+---------------------------------------------------------------
+File name:                  pack_watcher.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                资源包文件变化检测，Linux下使用inotify，其他平台使用增量stat缓存
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+                            2026/10/16: PackWatcher 改为抽象基类;
+----
+"""
+
+import os
+import sys
+import errno
+import select
+import struct
+import logging
+import threading
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Dict, List, Optional, Set, Tuple
+
+
+class ChangeKind(Enum):
+    """文件变化类型"""
+    CREATED = "created"
+    MODIFIED = "modified"
+    DELETED = "deleted"
+
+
+def _merge_change(changes: Dict[str, ChangeKind], path: str, kind: ChangeKind) -> None:
+    """合并同一路径在一次检测周期内的多次变化"""
+    previous = changes.get(path)
+    if previous is None:
+        changes[path] = kind
+    elif previous == ChangeKind.CREATED:
+        if kind == ChangeKind.DELETED:
+            # 创建后又删除，等同于没有发生
+            del changes[path]
+    elif previous == ChangeKind.DELETED:
+        if kind != ChangeKind.DELETED:
+            # 删除后重新创建，视为修改
+            changes[path] = ChangeKind.MODIFIED
+    else:
+        if kind == ChangeKind.DELETED:
+            changes[path] = kind
+
+
+class PackWatcher(ABC):
+    """资源包变化检测后端基类
+
+    监控的路径可以是目录（可选递归）或单个文件。poll() 返回自上次调用以来
+    发生变化的文件绝对路径及变化类型；目录被整体删除时报告目录路径本身。
+    """
+
+    # 是否由系统事件驱动（为False时需要调用方定期轮询）
+    event_driven: bool = False
+
+    def __init__(self):
+        self.logger = logging.getLogger("Status.PackWatcher")
+        self._lock = threading.RLock()
+        self._roots: Dict[str, bool] = {}  # 监控路径 -> 是否递归
+
+    def add_path(self, path: str, recursive: bool = False) -> bool:
+        """添加监控路径
+
+        Args:
+            path: 目录或文件路径
+            recursive: 目录是否递归监控
+
+        Returns:
+            bool: 是否成功添加
+        """
+        with self._lock:
+            if path in self._roots:
+                return True
+            if not self._watch(path, recursive):
+                return False
+            self._roots[path] = recursive
+            return True
+
+    def remove_path(self, path: str) -> None:
+        """移除监控路径"""
+        with self._lock:
+            if path in self._roots:
+                self._unwatch(path)
+                del self._roots[path]
+
+    def get_paths(self) -> Dict[str, bool]:
+        """获取当前监控的路径"""
+        with self._lock:
+            return dict(self._roots)
+
+    def wait(self, timeout: float) -> bool:
+        """等待可能的变化
+
+        Args:
+            timeout: 最长等待时间（秒）
+
+        Returns:
+            bool: 是否可能有待处理的变化
+        """
+        return True
+
+    @abstractmethod
+    def poll(self) -> Dict[str, ChangeKind]:
+        """获取自上次调用以来的变化（不阻塞）"""
+        pass
+
+    def close(self) -> None:
+        """释放检测后端持有的资源"""
+        with self._lock:
+            for path in list(self._roots):
+                self._unwatch(path)
+            self._roots.clear()
+
+    @abstractmethod
+    def _watch(self, path: str, recursive: bool) -> bool:
+        """开始监控路径，返回是否成功"""
+        pass
+
+    @abstractmethod
+    def _unwatch(self, path: str) -> None:
+        """停止监控路径"""
+        pass
+
+
+class StatCacheWatcher(PackWatcher):
+    """基于增量stat缓存的变化检测
+
+    缓存每个目录的mtime及其条目列表，目录mtime未变化时直接复用条目，
+    只对文件执行stat；只有条目发生增删的目录才会重新列出。
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._dirs: Dict[str, Tuple[int, List[str], List[str]]] = {}  # 目录 -> (mtime_ns, 文件名, 子目录名)
+        self._files: Dict[str, Tuple[int, int]] = {}  # 文件 -> (mtime_ns, size)
+
+    def _watch(self, path: str, recursive: bool) -> bool:
+        if not os.path.exists(path):
+            return False
+        self._scan(path, recursive, {})
+        return True
+
+    def _unwatch(self, path: str) -> None:
+        if self._roots.get(path):
+            prefix = path + os.sep
+            covered = lambda p: p == path or p.startswith(prefix)
+        else:
+            covered = lambda p: p == path or os.path.dirname(p) == path
+        for cached in [p for p in self._dirs if covered(p)]:
+            del self._dirs[cached]
+        for cached in [p for p in self._files if covered(p)]:
+            del self._files[cached]
+
+    def poll(self) -> Dict[str, ChangeKind]:
+        changes: Dict[str, ChangeKind] = {}
+        with self._lock:
+            for path, recursive in self._roots.items():
+                self._scan(path, recursive, changes)
+        return changes
+
+    def _stat_file(self, path: str, changes: Dict[str, ChangeKind]) -> None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            if self._files.pop(path, None) is not None:
+                _merge_change(changes, path, ChangeKind.DELETED)
+            return
+
+        signature = (st.st_mtime_ns, st.st_size)
+        previous = self._files.get(path)
+        if previous != signature:
+            self._files[path] = signature
+            _merge_change(changes, path, ChangeKind.CREATED if previous is None else ChangeKind.MODIFIED)
+
+    def _forget_dir(self, directory: str, changes: Dict[str, ChangeKind]) -> None:
+        cached = self._dirs.pop(directory, None)
+        if cached is None:
+            return
+        _, files, subdirs = cached
+        for name in files:
+            file_path = os.path.join(directory, name)
+            if self._files.pop(file_path, None) is not None:
+                _merge_change(changes, file_path, ChangeKind.DELETED)
+        for name in subdirs:
+            self._forget_dir(os.path.join(directory, name), changes)
+
+    def _scan(self, root: str, recursive: bool, changes: Dict[str, ChangeKind]) -> None:
+        if root not in self._dirs and not os.path.isdir(root):
+            # 单个文件
+            self._stat_file(root, changes)
+            return
+
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            try:
+                mtime_ns = os.stat(directory).st_mtime_ns
+            except OSError:
+                self._forget_dir(directory, changes)
+                continue
+
+            cached = self._dirs.get(directory)
+            if cached is not None and cached[0] == mtime_ns:
+                _, files, subdirs = cached
+            else:
+                files, subdirs = [], []
+                try:
+                    with os.scandir(directory) as entries:
+                        for entry in entries:
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirs.append(entry.name)
+                            elif entry.is_file():
+                                files.append(entry.name)
+                except OSError:
+                    self._forget_dir(directory, changes)
+                    continue
+
+                if cached is not None:
+                    # 已消失的条目
+                    for name in set(cached[1]) - set(files):
+                        file_path = os.path.join(directory, name)
+                        if self._files.pop(file_path, None) is not None:
+                            _merge_change(changes, file_path, ChangeKind.DELETED)
+                    for name in set(cached[2]) - set(subdirs):
+                        self._forget_dir(os.path.join(directory, name), changes)
+                self._dirs[directory] = (mtime_ns, files, subdirs)
+
+            for name in files:
+                self._stat_file(os.path.join(directory, name), changes)
+            if recursive:
+                stack.extend(os.path.join(directory, name) for name in subdirs)
+
+
+class InotifyWatcher(PackWatcher):
+    """基于Linux inotify的变化检测
+
+    每个被监控的目录注册一个watch，新建的子目录在收到事件时自动加入；
+    单个文件通过监控其父目录并按文件名过滤实现，以便跟踪原子替换。
+    """
+
+    event_driven = True
+
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    IN_CLOEXEC = 0o2000000
+    IN_NONBLOCK = 0o4000
+
+    WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+                  IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+
+    _EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self):
+        super().__init__()
+        import ctypes
+        import ctypes.util
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        self._libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._fd: int = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 失败")
+
+        self._wd_dirs: Dict[int, str] = {}  # watch描述符 -> 目录
+        self._dir_wds: Dict[str, int] = {}  # 目录 -> watch描述符
+        self._dir_refs: Dict[str, int] = {}  # 目录 -> 引用计数（多个监控路径可能共享目录）
+        self._file_roots: Dict[str, Set[str]] = {}  # 父目录 -> 被单独监控的文件
+        self._pending: Dict[str, ChangeKind] = {}
+
+    def _add_dir_watch(self, directory: str) -> bool:
+        if directory in self._dir_wds:
+            self._dir_refs[directory] += 1
+            return True
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), self.WATCH_MASK)
+        if wd < 0:
+            return False
+        self._wd_dirs[wd] = directory
+        self._dir_wds[directory] = wd
+        self._dir_refs[directory] = 1
+        return True
+
+    def _remove_dir_watch(self, directory: str) -> None:
+        refs = self._dir_refs.get(directory, 0) - 1
+        if refs > 0:
+            self._dir_refs[directory] = refs
+            return
+        self._dir_refs.pop(directory, None)
+        wd = self._dir_wds.pop(directory, None)
+        if wd is not None:
+            self._wd_dirs.pop(wd, None)
+            self._libc.inotify_rm_watch(self._fd, wd)
+
+    def _add_tree(self, root: str, report: Optional[Dict[str, ChangeKind]] = None) -> None:
+        for directory, subdirs, files in os.walk(root):
+            self._add_dir_watch(directory)
+            if report is not None:
+                # 新目录在注册watch之前写入的文件
+                for name in files:
+                    _merge_change(report, os.path.join(directory, name), ChangeKind.CREATED)
+
+    def _watch(self, path: str, recursive: bool) -> bool:
+        if os.path.isdir(path):
+            if recursive:
+                self._add_tree(path)
+                return True
+            return self._add_dir_watch(path)
+
+        parent = os.path.dirname(path)
+        if not os.path.isdir(parent) or not self._add_dir_watch(parent):
+            return False
+        self._file_roots.setdefault(parent, set()).add(path)
+        return True
+
+    def _unwatch(self, path: str) -> None:
+        recursive = self._roots.get(path, False)
+        parent = os.path.dirname(path)
+        if path in self._file_roots.get(parent, ()):
+            self._file_roots[parent].discard(path)
+            if not self._file_roots[parent]:
+                del self._file_roots[parent]
+            self._remove_dir_watch(parent)
+        elif recursive:
+            prefix = path + os.sep
+            for directory in [d for d in self._dir_wds if d == path or d.startswith(prefix)]:
+                self._remove_dir_watch(directory)
+        else:
+            self._remove_dir_watch(path)
+
+    def _root_for(self, path: str) -> Optional[Tuple[str, bool]]:
+        """查找覆盖该路径的监控路径"""
+        for root, recursive in self._roots.items():
+            if path == root:
+                return root, recursive
+            if recursive and path.startswith(root + os.sep):
+                return root, recursive
+            if not recursive and os.path.dirname(path) == root:
+                return root, recursive
+        return None
+
+    def wait(self, timeout: float) -> bool:
+        if self._pending:
+            return True
+        try:
+            readable, _, _ = select.select([self._fd], [], [], timeout)
+        except (OSError, ValueError):
+            return False
+        return bool(readable)
+
+    def _read_events(self) -> None:
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return
+            except OSError as e:
+                if e.errno == errno.EINTR:
+                    continue
+                raise
+            if not data:
+                return
+
+            offset = 0
+            while offset + self._EVENT_HEADER.size <= len(data):
+                wd, mask, _, name_len = self._EVENT_HEADER.unpack_from(data, offset)
+                offset += self._EVENT_HEADER.size
+                name = os.fsdecode(data[offset:offset + name_len].rstrip(b"\0"))
+                offset += name_len
+                self._handle_event(wd, mask, name)
+
+    def _handle_event(self, wd: int, mask: int, name: str) -> None:
+        if mask & self.IN_Q_OVERFLOW:
+            # 事件队列溢出，无法得知具体变化，报告所有监控路径
+            self.logger.warning("inotify事件队列溢出，将完整重新扫描")
+            for root in self._roots:
+                _merge_change(self._pending, root, ChangeKind.MODIFIED)
+            return
+
+        directory = self._wd_dirs.get(wd)
+        if directory is None:
+            return
+        if mask & self.IN_IGNORED:
+            # watch已被内核移除（目录删除或主动移除）
+            self._wd_dirs.pop(wd, None)
+            if self._dir_wds.get(directory) == wd:
+                del self._dir_wds[directory]
+                self._dir_refs.pop(directory, None)
+            return
+        if mask & (self.IN_DELETE_SELF | self.IN_MOVE_SELF):
+            if directory in self._roots:
+                _merge_change(self._pending, directory, ChangeKind.DELETED)
+            return
+
+        path = os.path.join(directory, name) if name else directory
+        watched_files = self._file_roots.get(directory)
+        if watched_files is not None and path in watched_files:
+            root_info: Optional[Tuple[str, bool]] = (path, False)
+        else:
+            root_info = self._root_for(path)
+        if root_info is None:
+            return
+        recursive = root_info[1]
+
+        if mask & self.IN_ISDIR:
+            if not recursive:
+                return
+            if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                self._add_tree(path, self._pending)
+            elif mask & (self.IN_DELETE | self.IN_MOVED_FROM):
+                prefix = path + os.sep
+                for sub in [d for d in self._dir_wds if d == path or d.startswith(prefix)]:
+                    self._remove_dir_watch(sub)
+                _merge_change(self._pending, path, ChangeKind.DELETED)
+            return
+
+        if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+            _merge_change(self._pending, path, ChangeKind.CREATED)
+        elif mask & (self.IN_DELETE | self.IN_MOVED_FROM):
+            _merge_change(self._pending, path, ChangeKind.DELETED)
+        else:
+            _merge_change(self._pending, path, ChangeKind.MODIFIED)
+
+    def poll(self) -> Dict[str, ChangeKind]:
+        with self._lock:
+            self._read_events()
+            changes, self._pending = self._pending, {}
+            return changes
+
+    def close(self) -> None:
+        with self._lock:
+            super().close()
+            if self._fd >= 0:
+                os.close(self._fd)
+                self._fd = -1
+
+    def __del__(self) -> None:
+        try:
+            if getattr(self, "_fd", -1) >= 0:
+                os.close(self._fd)
+        except Exception:
+            pass
+
+
+def create_pack_watcher(prefer_events: bool = True) -> PackWatcher:
+    """创建当前平台可用的变化检测后端
+
+    Args:
+        prefer_events: 是否优先使用系统事件（inotify）
+
+    Returns:
+        PackWatcher: 检测后端实例
+    """
+    if prefer_events and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher()
+        except (OSError, AttributeError) as e:
+            logging.getLogger("Status.PackWatcher").debug(f"inotify不可用，使用stat缓存检测: {e}")
+    return StatCacheWatcher()
+
+
+__all__ = [
+    'ChangeKind',
+    'PackWatcher',
+    'StatCacheWatcher',
+    'InotifyWatcher',
+    'create_pack_watcher'
+]
@@ -10,13 +10,20 @@ Changed history:
                             2025/04/04: 初始创建;
                             2025/05/12: 修复类型提示;
                             2025/05/15: 添加热加载事件响应支持;
+                            2026/10/16: 图像加载改用mmap缓冲区，直接交给QImage解码;
+                            2026/10/16: 资源包管理器返回已排序的列表时不再重复排序;
+                            2026/10/16: 资源包重载事件携带变化路径时只清除对应缓存;
+                            2026/10/16: 缓存按资源路径/资源包打标签，资源包事件只失效受影响的项;
+                            2026/10/16: 图像序列可在解码线程池中并行解码，内部LRU缓存加锁;
+                            2026/10/16: 同一资源的并发加载合并为一次读取和解码;
 ----
 """
 
 import os
-import re
 import json
 import logging
+import mmap
+import threading
 import importlib.util
 import time
 from pathlib import Path
@@ -62,14 +69,14 @@ else:
 
 # 导入核心类型
 from status.core.types import PathLike
+from status.resources.decode_pool import DecodePool
+from status.resources.single_flight import SingleFlight
 from status.resources import ResourceType # 添加导入
 
 # 配置日志
 logger = logging.getLogger(__name__)
 
-def natural_sort_key(s: str) -> List[Union[int, str]]:
-    """用于文件的自然排序 (如 frame1.png, frame2.png, ..., frame10.png)"""
-    return [int(c) if c.isdigit() else c.lower() for c in re.split(r'(\d+)', str(s))]
+from status.resources.resource_pack import natural_sort_key
 
 # 用于类型标注的声明
 T = TypeVar('T')
@@ -85,6 +92,43 @@ class ResourceManager(Protocol):
     def reload(self) -> bool: ...
     def initialize(self) -> bool: ...
 
+# QImage.loadFromData是否接受memoryview（部分PySide6版本的绑定不接受），首次解码时探测
+_QIMAGE_ACCEPTS_BUFFER: Optional[bool] = None
+# 探测需串行进行：绑定在参数不匹配时生成错误信息的过程不是线程安全的
+_QIMAGE_PROBE_LOCK = threading.Lock()
+
+
+def _load_qimage_from_buffer(qimage: Any, data: Union[bytes, memoryview]) -> bool:
+    """将缓冲区交给QImage解码，尽量避免中间复制
+    
+    Args:
+        qimage: QImage实例
+        data: 图像数据（bytes或memoryview）
+        
+    Returns:
+        bool: 是否解码成功
+    """
+    global _QIMAGE_ACCEPTS_BUFFER
+    if isinstance(data, memoryview):
+        if isinstance(data.obj, bytes) and data.nbytes == len(data.obj):
+            # 只是bytes的完整视图，直接传原对象
+            return bool(qimage.loadFromData(data.obj))
+        if _QIMAGE_ACCEPTS_BUFFER is None:
+            with _QIMAGE_PROBE_LOCK:
+                if _QIMAGE_ACCEPTS_BUFFER is None:
+                    try:
+                        result = bool(qimage.loadFromData(data))
+                        _QIMAGE_ACCEPTS_BUFFER = True
+                        return result
+                    except Exception:
+                        _QIMAGE_ACCEPTS_BUFFER = False
+        if _QIMAGE_ACCEPTS_BUFFER:
+            return bool(qimage.loadFromData(data))
+        # 绑定不接受memoryview时退化为一次复制
+        return bool(qimage.loadFromData(data.tobytes()))
+    return bool(qimage.loadFromData(data))
+
+
 class LRUCache:
     """LRU缓存实现，用于ResourceLoader缓存管理
     
@@ -100,6 +144,9 @@ class LRUCache:
         self.capacity = capacity
         self.cache = OrderedDict() #恢复 OrderedDict
         self.access_times = {}  # 记录每个键的最后访问时间
+        self.tag_index: Dict[str, Set[Any]] = {}  # 标签 -> 键（资源路径、资源包等反向索引）
+        self.key_tags: Dict[Any, Set[str]] = {}  # 键 -> 标签
+        self._lock = threading.RLock()  # 解码线程池会并发读写缓存
         
     def get(self, key):
         """获取缓存项
@@ -110,38 +157,74 @@ class LRUCache:
         Returns:
             缓存项的值，如果不存在则返回None
         """
-        if key not in self.cache:
-            return None
+        with self._lock:
+            if key not in self.cache:
+                return None
         
-        # 移动到末尾（最近使用）
-        value = self.cache.pop(key)
-        self.cache[key] = value
+            # 移动到末尾（最近使用）
+            value = self.cache.pop(key)
+            self.cache[key] = value
         
-        # 更新访问时间
-        self.access_times[key] = time.time()
+            # 更新访问时间
+            self.access_times[key] = time.time()
         
-        return value
+            return value
 
-    def put(self, key, value):
+    def put(self, key, value, tags=None):
         """添加缓存项
         
         Args:
             key: 缓存项的键
             value: 缓存项的值
+            tags: 可选，关联的标签，用于按标签失效
         """
-        # 如果已存在，先移除
-        if key in self.cache:
-            self.cache.pop(key)
-        
-        # 如果已达到容量上限，移除最早使用的项
-        if len(self.cache) >= self.capacity:
-            oldest_key, _ = self.cache.popitem(last=False)
-            if oldest_key in self.access_times:
-                del self.access_times[oldest_key]
-        
-        # 添加新项
-        self.cache[key] = value
-        self.access_times[key] = time.time()
+        with self._lock:
+            # 如果已存在，先移除
+            if key in self.cache:
+                self.cache.pop(key)
+                self._untag(key)
+        
+            # 如果已达到容量上限，移除最早使用的项
+            if len(self.cache) >= self.capacity:
+                oldest_key, _ = self.cache.popitem(last=False)
+                if oldest_key in self.access_times:
+                    del self.access_times[oldest_key]
+                self._untag(oldest_key)
+        
+            # 添加新项
+            self.cache[key] = value
+            self.access_times[key] = time.time()
+            if tags:
+                key_tags = self.key_tags.setdefault(key, set())
+                for tag in tags:
+                    key_tags.add(tag)
+                    self.tag_index.setdefault(tag, set()).add(key)
+    
+    def _untag(self, key):
+        """从标签反向索引中注销键"""
+        for tag in self.key_tags.pop(key, ()):
+            keys = self.tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.tag_index[tag]
+    
+    def invalidate_tags(self, tags) -> int:
+        """移除关联了任一指定标签的缓存项
+        
+        Args:
+            tags: 标签
+            
+        Returns:
+            int: 移除的项数
+        """
+        with self._lock:
+            keys = set()
+            for tag in tags:
+                keys.update(self.tag_index.get(tag, ()))
+            for key in keys:
+                self.remove(key)
+            return len(keys)
     
     def remove(self, key):
         """移除缓存项
@@ -152,17 +235,22 @@ class LRUCache:
         Returns:
             bool: 是否成功移除
         """
-        if key in self.cache:
-            self.cache.pop(key)
-            if key in self.access_times:
-                del self.access_times[key]
-            return True
-        return False
+        with self._lock:
+            if key in self.cache:
+                self.cache.pop(key)
+                if key in self.access_times:
+                    del self.access_times[key]
+                self._untag(key)
+                return True
+            return False
 
     def clear(self):
         """清空缓存"""
-        self.cache.clear()
-        self.access_times.clear()
+        with self._lock:
+            self.cache.clear()
+            self.access_times.clear()
+            self.tag_index.clear()
+            self.key_tags.clear()
     
     def clean_old_entries(self, max_age_seconds: int = 3600):
         """清理过期的缓存项
@@ -173,20 +261,21 @@ class LRUCache:
         Returns:
             int: 清理的项数
         """
-        now = time.time()
-        keys_to_remove = []
-        
-        # 找出需要清理的键
-        # 在迭代时复制 access_times.items() 以允许在循环中删除
-        for key, access_time in list(self.access_times.items()):
-            if now - access_time > max_age_seconds:
-                keys_to_remove.append(key)
-        
-        # 清理缓存
-        for key_to_remove in keys_to_remove:
-            self.remove(key_to_remove)
+        with self._lock:
+            now = time.time()
+            keys_to_remove = []
+        
+            # 找出需要清理的键
+            # 在迭代时复制 access_times.items() 以允许在循环中删除
+            for key, access_time in list(self.access_times.items()):
+                if now - access_time > max_age_seconds:
+                    keys_to_remove.append(key)
+        
+            # 清理缓存
+            for key_to_remove in keys_to_remove:
+                self.remove(key_to_remove)
             
-        return len(keys_to_remove)
+            return len(keys_to_remove)
     
     def __len__(self):
         """获取缓存项数量"""
@@ -229,6 +318,12 @@ class ResourceLoader:
             "errors": 0              # 错误次数
         }
         
+        # 进行中的加载，同一资源的并发请求合并为一次读取和解码
+        self._inflight = SingleFlight()
+        
+        # 缓存失效监听器（如AssetManager），参数为失效的标签集合
+        self._invalidation_listeners: List[Callable[[Set[str]], None]] = []
+        
         # 事件系统集成
         self._event_system = None
         if HAS_EVENT_SYSTEM:
@@ -388,6 +483,44 @@ class ResourceLoader:
         
         return content
 
+    def get_resource_buffer(self, path: str) -> Optional[memoryview]:
+        """获取资源内容的只读视图
+        
+        资源包中的目录文件和未压缩ZIP成员、以及文件系统中的文件通过mmap映射，
+        不复制数据；其他来源退化为普通读取后的视图。
+        
+        Args:
+            path: 资源路径
+            
+        Returns:
+            Optional[memoryview]: 资源内容视图，如果资源不存在则返回None
+        """
+        mgr = self.manager
+        not_in_manager = mgr is None
+        
+        if mgr and hasattr(mgr, 'get_resource_buffer'):
+            try:
+                buffer = mgr.get_resource_buffer(path)
+                if isinstance(buffer, memoryview):
+                    return buffer
+                not_in_manager = buffer is None
+            except Exception as e:
+                self.logger.warning(f"映射资源'{path}'失败，改为普通读取: {e}")
+        
+        # 资源包中没有该资源时，直接映射文件系统中的文件
+        if not_in_manager and os.path.isfile(path):
+            try:
+                with open(path, 'rb') as f:
+                    size = os.fstat(f.fileno()).st_size
+                    if size == 0:
+                        return memoryview(b"")
+                    return memoryview(mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ))
+            except Exception as e:
+                self.logger.warning(f"映射文件'{path}'失败，改为普通读取: {e}")
+        
+        content = self.get_resource_content(path)
+        return memoryview(content) if content is not None else None
+
     def clear_cache(self) -> None:
         """清除所有缓存"""
         self.logger.debug("清除所有资源缓存")
@@ -400,6 +533,118 @@ class ResourceLoader:
         self._text_cache.clear()
         self._general_cache.clear()
 
+    @staticmethod
+    def path_tag(path: str) -> str:
+        """资源路径对应的缓存标签"""
+        return f"path:{path}"
+    
+    @staticmethod
+    def dir_tag(directory: str) -> str:
+        """目录（如图像序列）对应的缓存标签"""
+        return f"dir:{directory.rstrip('/')}"
+    
+    @staticmethod
+    def pack_tag(pack_id: str) -> str:
+        """资源包对应的缓存标签"""
+        return f"pack:{pack_id}"
+    
+    def get_resource_tags(self, path: str) -> Set[str]:
+        """获取缓存资源时应关联的标签：资源路径及提供该资源的资源包
+        
+        Args:
+            path: 资源路径
+            
+        Returns:
+            Set[str]: 标签集合
+        """
+        path = path.replace("\\", "/")
+        tags = {self.path_tag(path)}
+        pack_map = getattr(self.manager, 'resource_pack_map', None)
+        if isinstance(pack_map, dict):
+            pack_id = pack_map.get(path)
+            if pack_id:
+                tags.add(self.pack_tag(pack_id))
+        return tags
+    
+    def get_invalidation_tags(self, paths: List[str]) -> Set[str]:
+        """获取资源路径变化时需要失效的标签：路径本身及其所有上级目录
+        
+        Args:
+            paths: 变化的资源路径
+            
+        Returns:
+            Set[str]: 标签集合
+        """
+        tags: Set[str] = set()
+        for path in paths:
+            path = path.replace("\\", "/")
+            tags.add(self.path_tag(path))
+            parts = path.split("/")
+            for i in range(1, len(parts)):
+                tags.add(self.dir_tag("/".join(parts[:i])))
+        return tags
+    
+    def add_invalidation_listener(self, listener: Callable[[Set[str]], None]) -> None:
+        """添加缓存失效监听器，资源包事件导致失效时以标签集合回调
+        
+        Args:
+            listener: 回调函数
+        """
+        if listener not in self._invalidation_listeners:
+            self._invalidation_listeners.append(listener)
+    
+    def remove_invalidation_listener(self, listener: Callable[[Set[str]], None]) -> None:
+        """移除缓存失效监听器"""
+        if listener in self._invalidation_listeners:
+            self._invalidation_listeners.remove(listener)
+    
+    def invalidate_tags(self, tags: Set[str]) -> int:
+        """清除关联了指定标签的缓存项，并通知失效监听器
+        
+        Args:
+            tags: 标签集合
+            
+        Returns:
+            int: 本加载器中被清除的缓存项数量
+        """
+        removed = 0
+        for cache in (self._image_cache, self._sound_cache, self._font_cache,
+                      self._json_cache, self._text_cache, self._general_cache):
+            removed += cache.invalidate_tags(tags)
+        
+        for listener in list(self._invalidation_listeners):
+            try:
+                listener(tags)
+            except Exception as e:
+                self.logger.error(f"缓存失效监听器执行失败: {e}")
+        return removed
+    
+    def invalidate_resources(self, paths: List[str]) -> int:
+        """只清除指定资源路径（及包含它们的图像序列）的缓存项
+        
+        Args:
+            paths: 资源路径列表
+            
+        Returns:
+            int: 被清除的缓存项数量
+        """
+        removed = self.invalidate_tags(self.get_invalidation_tags(paths))
+        self.logger.debug(f"已清除 {len(paths)} 个资源路径的缓存，共 {removed} 项")
+        return removed
+    
+    def invalidate_pack(self, pack_id: str) -> int:
+        """清除由指定资源包提供的所有缓存项
+        
+        Args:
+            pack_id: 资源包ID
+            
+        Returns:
+            int: 被清除的缓存项数量
+        """
+        removed = self.invalidate_tags({self.pack_tag(pack_id)})
+        self.logger.debug(f"已清除资源包 {pack_id} 的缓存，共 {removed} 项")
+        return removed
+
     def _check_clean_cache(self) -> None:
         """检查是否需要清理缓存，并在必要时执行清理"""
         now = time.time()
@@ -439,7 +684,7 @@ class ResourceLoader:
         """获取缓存统计信息
         
         Returns:
-            Dict[str, int]: 包含各类缓存数量的字典
+            Dict[str, int]: 包含各类缓存数量及被合并的并发加载请求数的字典
         """
         return {
             'image_cache': len(self._image_cache),
@@ -447,7 +692,8 @@ class ResourceLoader:
             'font_cache': len(self._font_cache),
             'json_cache': len(self._json_cache),
             'text_cache': len(self._text_cache),
-            'total': len(self._image_cache) + len(self._sound_cache) + len(self._font_cache) + len(self._json_cache) + len(self._text_cache)
+            'total': len(self._image_cache) + len(self._sound_cache) + len(self._font_cache) + len(self._json_cache) + len(self._text_cache),
+            'coalesced': self._inflight.get_coalesced_count()
         }
 
     def reload(self) -> bool:
@@ -527,6 +773,9 @@ class ResourceLoader:
         resources: List[str] = []
         if self.manager and hasattr(self.manager, 'list_resources'):
             resources = self.manager.list_resources(prefix)
+            # 资源包管理器的前缀索引已按自然顺序返回，无需重复排序
+            if resources and getattr(self.manager, 'sorted_listing', False) is True:
+                return resources
         
         # 如果 ResourcePackManager 没有返回任何资源，尝试从文件系统扫描
         if not resources:
@@ -624,9 +873,47 @@ class ResourceLoader:
         if actual_internal_cache_usage_enabled : #表示我们尝试了使用内部缓存
              self._load_stats["cache_misses"] += 1
 
-        # 从文件或资源包加载
+        # 从文件或资源包加载，同一资源的并发加载只执行一次
         self.logger.debug(f"从源加载资源 '{path}' (类型: {r_type.value})，内部缓存旁路: {not actual_internal_cache_usage_enabled}")
-        content: Optional[bytes] = self.get_resource_content(path)
+        flight_key = (path, r_type, compressed, compression_type,
+                      tuple(sorted((k, repr(v)) for k, v in kwargs.items())))
+        result = self._inflight.do(
+            flight_key,
+            lambda: self._load_resource_from_source(path, r_type, compressed, compression_type, **kwargs)
+        )
+        if result is None:
+            return None
+
+        # 存入内部缓存 (如果允许且适用)
+        if actual_internal_cache_usage_enabled and cache is not None:
+            try:
+                cache.put(path, result, tags=self.get_resource_tags(path))
+                self.logger.debug(f"资源 '{path}' 已存入ResourceLoader内部缓存。")
+            except Exception as e:
+                self.logger.error(f"将资源 '{path}' 存入ResourceLoader内部缓存失败: {e}")
+        
+        return result
+
+    def _load_resource_from_source(self, path: str, r_type: ResourceType, compressed: bool,
+                                   compression_type: str, **kwargs: Any) -> Any:
+        """从文件或资源包读取、解压并解析资源（不经过内部缓存）
+        
+        Args:
+            path: 资源路径
+            r_type: 资源类型
+            compressed: 资源是否已压缩
+            compression_type: 压缩算法
+            **kwargs: 其他特定于资源类型的参数
+            
+        Returns:
+            解析后的资源对象，或在失败时返回None
+        """
+        content: Optional[Union[bytes, memoryview]]
+        if r_type == ResourceType.IMAGE and not compressed:
+            # 未压缩图像走零复制路径，缓冲区直接交给解码器
+            content = self.get_resource_buffer(path)
+        else:
+            content = self.get_resource_content(path)
 
         if content is None:
             self.logger.error(f"无法加载资源内容: {path}")
@@ -639,7 +926,7 @@ class ResourceLoader:
         # 解压缩 (如果需要)
         if compressed:
             try:
-                content = self._decompress_data(content, algorithm=compression_type)
+                content = self._decompress_data(cast(bytes, content), algorithm=compression_type)
             except zlib.error as ze: # 专门捕获zlib.error
                 self.logger.error(f"解压缩资源 '{path}' (zlib) 失败: {ze}")
                 self._load_stats["errors"] += 1
@@ -664,9 +951,9 @@ class ResourceLoader:
             if r_type == ResourceType.IMAGE:
                 result = self._parse_image_data(content, path, **kwargs)
             elif r_type == ResourceType.SOUND:
-                result = self._parse_sound_data(content, path, **kwargs)
+                result = self._parse_sound_data(cast(bytes, content), path, **kwargs)
             elif r_type == ResourceType.FONT:
-                result = self._parse_font_data(content, path, **kwargs)
+                result = self._parse_font_data(cast(bytes, content), path, **kwargs)
             elif r_type == ResourceType.JSON:
                 result = json.loads(content.decode(kwargs.get('encoding', 'utf-8')))
             elif r_type == ResourceType.TEXT:
@@ -690,14 +977,6 @@ class ResourceLoader:
             self._load_stats["by_type"][r_type.value]["errors"] += 1
             return None
 
-        # 存入内部缓存 (如果允许且适用)
-        if actual_internal_cache_usage_enabled and cache is not None:
-            try:
-                cache.put(path, result)
-                self.logger.debug(f"资源 '{path}' 已存入ResourceLoader内部缓存。")
-            except Exception as e:
-                self.logger.error(f"将资源 '{path}' 存入ResourceLoader内部缓存失败: {e}")
-
         if r_type.value not in self._load_stats["by_type"]:
             self._load_stats["by_type"][r_type.value] = {"loads": 0, "cache_hits": 0, "errors": 0}
         self._load_stats["by_type"][r_type.value]["loads"] += 1
@@ -754,11 +1033,11 @@ class ResourceLoader:
             self.logger.error(f"保存资源 '{file_path}' 时发生未知错误: {e}")
             return False
 
-    def _parse_image_data(self, data: bytes, path: str, **kwargs: Any) -> Optional[Any]:
+    def _parse_image_data(self, data: Union[bytes, memoryview], path: str, **kwargs: Any) -> Optional[Any]:
         """解析图像资源
         
         Args:
-            data: 图像数据
+            data: 图像数据（bytes或mmap支持的memoryview）
             path: 图像路径
             **kwargs: 其他参数
         
@@ -778,58 +1057,28 @@ class ResourceLoader:
             if cached_image is not None:
                 return cached_image
         
-        # 获取资源实际路径
-        real_path = self.get_resource_path(path)
+        if data is None or len(data) == 0:
+            self.logger.error(f"找不到图像: {path}")
+            return None
         
-        # 如果获取不到实际路径，尝试直接从内容加载
-        if not real_path:
-            content = self.get_resource_content(path)
-            if not content:
-                self.logger.error(f"找不到图像: {path}")
-                return None
-                
-            # 从二进制数据加载QImage
-            try:
-                qimage = QImage()
-                success = qimage.loadFromData(data)
-                
-                if success:
-                    # 确保图像有正确的格式（保持透明度）
-                    if qimage.hasAlphaChannel():
-                        # 确保保留Alpha通道
-                        qimage = qimage.convertToFormat(QImage.Format.Format_ARGB32)
-                    
-                    # 加载成功
-                    if self._cache_enabled:
-                        self._image_cache.put(path, qimage)
-                    return qimage
-                else:
-                    # 加载失败
-                    self.logger.error(f"使用 QImage.loadFromData 加载图像失败: {path}")
-                    return None
-            
-            except Exception as e:
-                self.logger.error(f"加载图像失败: {path}, 错误: {e}")
-                return None
-            
-        # 直接从文件路径加载
+        # 从已读取的缓冲区解码，不再按路径重新读取文件
         try:
-            qimage = QImage(real_path)
+            qimage = QImage()
+            success = _load_qimage_from_buffer(qimage, data)
             
-            if qimage.isNull():
-                self.logger.error(f"QImage加载图像失败: {path}")
+            if not success:
+                self.logger.error(f"使用 QImage.loadFromData 加载图像失败: {path}")
                 return None
             
             # 确保图像有正确的格式（保持透明度）
             if qimage.hasAlphaChannel():
                 # 确保保留Alpha通道
                 qimage = qimage.convertToFormat(QImage.Format.Format_ARGB32)
-                
+            
             if self._cache_enabled:
-                self._image_cache.put(path, qimage)
-                
+                self._image_cache.put(path, qimage, tags=self.get_resource_tags(path))
             return qimage
-            
+        
         except Exception as e:
             self.logger.error(f"加载图像失败: {path}, 错误: {e}")
             return None
@@ -904,7 +1153,7 @@ class ResourceLoader:
                 font.setPointSize(kwargs.get('size', 16))
                 
                 if self._cache_enabled:
-                    self._font_cache.put(cache_key, font)
+                    self._font_cache.put(cache_key, font, tags=self.get_resource_tags(path))
                     
                 return font
             
@@ -932,7 +1181,7 @@ class ResourceLoader:
             font.setPointSize(kwargs.get('size', 16))
             
             if self._cache_enabled:
-                self._font_cache.put(cache_key, font)
+                self._font_cache.put(cache_key, font, tags=self.get_resource_tags(path))
         
             return font
         
@@ -1046,7 +1295,22 @@ class ResourceLoader:
         """
         return self.load_resource(binary_path, ResourceType.BINARY, use_cache=use_cache, use_internal_cache=use_internal_cache)
 
-    def load_image_sequence(self, directory_path: str, use_cache: bool = True, use_internal_cache: bool = True) -> Optional[List[Any]]:
+    def get_sequence_frame_paths(self, directory_path: str) -> List[str]:
+        """获取图像序列目录中各帧的资源路径（按自然顺序）
+        
+        Args:
+            directory_path: 包含图像序列的目录路径
+            
+        Returns:
+            List[str]: 帧的资源路径列表
+        """
+        return [
+            image_file if image_file.startswith(directory_path) else os.path.join(directory_path, image_file)
+            for image_file in self.list_resources(directory_path, resource_type="image")
+        ]
+
+    def load_image_sequence(self, directory_path: str, use_cache: bool = True, use_internal_cache: bool = True,
+                            decode_pool: Optional['DecodePool'] = None, priority: int = 0) -> Optional[List[Any]]:
         """加载图像序列 (如动画帧)。
         会查找目录中所有支持的图像文件，并按自然顺序排序。
 
@@ -1054,26 +1318,27 @@ class ResourceLoader:
             directory_path: 包含图像序列的目录路径。
             use_cache: 是否对序列中的每个图像使用缓存。
             use_internal_cache: 是否对序列中的每个图像使用此ResourceLoader实例的内部缓存。
+            decode_pool: 可选，提供时各帧在该线程池中并行读取和解码。
+            priority: 在线程池中的优先级，数值越大越先解码。
 
 
         Returns:
             QImage或QPixmap对象列表，或在失败时返回None。
         """
         # 列出目录中的所有图像
-        image_files = self.list_resources(directory_path, resource_type="image")
+        image_files = self.get_sequence_frame_paths(directory_path)
         
         if not image_files:
             self.logger.error(f"目录中没有图像: {directory_path}")
             return None
     
-        # 加载每个图像
-        images: List[Any] = []
-        for image_file in image_files:
-            full_path = os.path.join(directory_path, image_file) if not image_file.startswith(directory_path) else image_file
-            image = self.load_image(full_path, use_cache, use_internal_cache)
-            
-            if image:
-                images.append(image)
+        # 加载每个图像，有线程池时并行解码，结果保持帧顺序
+        load_frame = lambda frame_path: self.load_image(frame_path, use_cache, use_internal_cache)
+        if decode_pool is not None:
+            decoded = decode_pool.map_ordered(load_frame, image_files, priority=priority)
+        else:
+            decoded = [load_frame(frame_path) for frame_path in image_files]
+        images: List[Any] = [image for image in decoded if image]
             
         if not images:
             self.logger.error(f"没有成功加载任何图像: {directory_path}")
@@ -1141,16 +1406,21 @@ class ResourceLoader:
         """处理资源包重载事件
         
         Args:
-            event_data: 事件数据，包含pack_id字段
+            event_data: 事件数据，包含pack_id字段，可选changed_paths字段（变化的资源路径）
         """
         if not event_data or "pack_id" not in event_data:
             return
             
         pack_id = event_data["pack_id"]
+        changed_paths = event_data.get("changed_paths")
         self.logger.info(f"接收到资源包重载事件: {pack_id}")
         
-        # 清除所有缓存，确保使用最新的资源
-        self.clear_cache()
+        if changed_paths is not None:
+            # 已知变化的路径时只清除这些资源的缓存
+            self.invalidate_resources(changed_paths)
+        else:
+            # 否则清除该资源包提供的全部缓存
+            self.invalidate_pack(pack_id)
     
     def handle_resource_pack_added(self, event_data: Dict[str, Any]) -> None:
         """处理资源包添加事件
@@ -1164,7 +1434,12 @@ class ResourceLoader:
         pack_id = event_data["pack_id"]
         self.logger.info(f"接收到资源包添加事件: {pack_id}")
         
-        # 对于新添加的资源包，不需要清除缓存，因为还没有相关缓存
+        # 新资源包可能覆盖其他资源包提供的同名资源，只清除这些路径的缓存
+        pack_map = getattr(self.manager, 'resource_pack_map', None)
+        if isinstance(pack_map, dict):
+            shadowed = [path for path, owner in pack_map.items() if owner == pack_id]
+            if shadowed:
+                self.invalidate_resources(shadowed)
     
     def handle_resource_pack_removed(self, event_data: Dict[str, Any]) -> None:
         """处理资源包移除事件
@@ -1178,8 +1453,8 @@ class ResourceLoader:
         pack_id = event_data["pack_id"]
         self.logger.info(f"接收到资源包移除事件: {pack_id}")
         
-        # 清除所有缓存，因为可能有使用被移除资源包的资源
-        self.clear_cache()
+        # 只清除由被移除资源包提供的缓存
+        self.invalidate_pack(pack_id)
 
 # 创建资源加载器实例
 # resource_loader = ResourceLoader() # 实例应由 AssetManager 创建和管理
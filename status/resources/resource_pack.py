@@ -10,20 +10,29 @@ Changed history:
                             2025/04/03: 初始创建;
                             2025/05/12: 修复类型提示;
                             2025/05/15: 添加热加载功能;
+                            2026/10/16: ZIP资源包改用句柄池读取，中央目录只解析一次;
+                            2026/10/16: 添加基于mmap的零复制读取接口（目录文件与未压缩ZIP成员）;
+                            2026/10/16: 添加资源路径前缀索引，list_resources不再线性扫描;
+                            2026/10/16: 热加载改用inotify/增量stat检测，只重载变化的资源包和路径;
 ----
 """
 
 import os
+import re
 import json
 import logging
+import mmap
+import struct
 import zipfile
+import zlib
 import shutil
-from typing import Dict, Any, List, Optional, Set, Tuple, cast, TypeVar, Type
+from typing import Dict, Any, List, Optional, Set, Tuple, Union, Iterable, cast, TypeVar, Type, BinaryIO
 from enum import Enum, auto
 import threading
 import time
 
 from status.core.config import config_manager
+from status.resources.pack_watcher import PackWatcher, ChangeKind, create_pack_watcher
 from status.core.types import PathLike
 
 # 尝试导入事件系统
@@ -63,6 +72,435 @@ class ResourcePackValidationError(ResourcePackError):
     pass
 
 
+def natural_sort_key(s: str) -> List[Union[int, str]]:
+    """用于文件的自然排序 (如 frame1.png, frame2.png, ..., frame10.png)"""
+    return [int(c) if c.isdigit() else c.lower() for c in re.split(r'(\d+)', str(s))]
+
+
+def map_file_region(fileno: int, offset: int = 0, length: Optional[int] = None) -> memoryview:
+    """以只读方式内存映射文件的一段区域
+    
+    返回的memoryview持有映射对象的引用，最后一个视图释放后映射随之关闭。
+    
+    Args:
+        fileno: 文件描述符
+        offset: 区域起始偏移
+        length: 区域长度，None表示到文件末尾
+        
+    Returns:
+        memoryview: 区域内容的只读视图
+    """
+    if length is None:
+        length = os.fstat(fileno).st_size - offset
+    if length <= 0:
+        return memoryview(b"")
+    
+    # mmap的偏移必须按分配粒度对齐
+    aligned = offset - offset % mmap.ALLOCATIONGRANULARITY
+    mapped = mmap.mmap(fileno, length + offset - aligned, access=mmap.ACCESS_READ, offset=aligned)
+    return memoryview(mapped)[offset - aligned:]
+
+
+class ZipHandlePool:
+    """ZIP文件句柄池
+    
+    中央目录只在首次访问时解析一次，此后按成员缓存数据区偏移；读取时从池中借出一个
+    原始文件句柄，直接定位到成员数据并解压，不再为每次读取重新构造ZipFile。
+    池中同时打开的句柄数有上限，多个加载线程可并发读取同一资源包。
+    """
+    
+    # ZIP本地文件头：签名、版本、标志、压缩方式、时间、日期、CRC、压缩大小、原始大小、文件名长度、扩展字段长度
+    _LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+    _LOCAL_HEADER_SIGNATURE = b"PK\003\004"
+    
+    def __init__(self, zip_path: str, max_handles: int = 4):
+        """初始化句柄池
+        
+        Args:
+            zip_path: ZIP文件路径
+            max_handles: 最多同时打开的文件句柄数
+        """
+        self.zip_path = zip_path
+        self.max_handles = max(1, max_handles)
+        
+        self._cond = threading.Condition(threading.Lock())
+        self._idle: List[BinaryIO] = []  # 空闲句柄
+        self._open_count = 0  # 已打开的句柄数（含借出的）
+        self._generation = 0  # 失效代数，归还旧代句柄时直接关闭
+        
+        self._infos: Optional[Dict[str, zipfile.ZipInfo]] = None  # 成员信息（中央目录解析结果）
+        self._data_offsets: Dict[str, int] = {}  # 成员数据区偏移
+        self._directory_parses = 0  # 中央目录解析次数，便于诊断
+    
+    def _load_directory(self) -> Dict[str, zipfile.ZipInfo]:
+        """解析中央目录（只在首次访问或失效后执行）
+        
+        Returns:
+            Dict[str, zipfile.ZipInfo]: 成员名 -> 成员信息
+        """
+        with self._cond:
+            if self._infos is None:
+                with zipfile.ZipFile(self.zip_path, "r") as zip_file:
+                    self._infos = {info.filename: info for info in zip_file.infolist()}
+                self._directory_parses += 1
+            return self._infos
+    
+    def infolist(self) -> List[zipfile.ZipInfo]:
+        """获取所有成员信息
+        
+        Returns:
+            List[zipfile.ZipInfo]: 成员信息列表
+        """
+        return list(self._load_directory().values())
+    
+    def has_member(self, name: str) -> bool:
+        """判断成员是否存在
+        
+        Args:
+            name: 成员名
+            
+        Returns:
+            bool: 是否存在
+        """
+        return name in self._load_directory()
+    
+    def get_info(self, name: str) -> zipfile.ZipInfo:
+        """获取成员信息
+        
+        Args:
+            name: 成员名
+            
+        Returns:
+            zipfile.ZipInfo: 成员信息
+            
+        Raises:
+            KeyError: 成员不存在时抛出
+        """
+        info = self._load_directory().get(name)
+        if info is None:
+            raise KeyError(f"ZIP中不存在成员: {name}")
+        return info
+    
+    def _acquire(self) -> Tuple[BinaryIO, int]:
+        """借出一个文件句柄，达到上限时等待其他线程归还
+        
+        Returns:
+            Tuple[BinaryIO, int]: 文件句柄和借出时的失效代数
+        """
+        with self._cond:
+            while not self._idle and self._open_count >= self.max_handles:
+                self._cond.wait()
+            if self._idle:
+                return self._idle.pop(), self._generation
+            self._open_count += 1
+            generation = self._generation
+        try:
+            return cast(BinaryIO, open(self.zip_path, "rb")), generation
+        except Exception:
+            with self._cond:
+                self._open_count -= 1
+                self._cond.notify()
+            raise
+    
+    def _release(self, handle: BinaryIO, generation: int) -> None:
+        """归还文件句柄
+        
+        Args:
+            handle: 文件句柄
+            generation: 借出时的失效代数
+        """
+        with self._cond:
+            if generation == self._generation:
+                self._idle.append(handle)
+                self._cond.notify()
+                return
+        # 句柄池已失效，旧句柄直接关闭（计数已在invalidate中重置）
+        handle.close()
+    
+    def _get_data_offset(self, handle: BinaryIO, info: zipfile.ZipInfo) -> int:
+        """获取成员数据区的偏移（读取本地文件头后缓存）
+        
+        Args:
+            handle: 文件句柄
+            info: 成员信息
+            
+        Returns:
+            int: 数据区偏移
+        """
+        offset = self._data_offsets.get(info.filename)
+        if offset is not None:
+            return offset
+        
+        handle.seek(info.header_offset)
+        header = self._LOCAL_HEADER.unpack(handle.read(self._LOCAL_HEADER.size))
+        if header[0] != self._LOCAL_HEADER_SIGNATURE:
+            raise zipfile.BadZipFile(f"ZIP成员本地文件头损坏: {info.filename}")
+        offset = info.header_offset + self._LOCAL_HEADER.size + header[10] + header[11]
+        self._data_offsets[info.filename] = offset
+        return offset
+    
+    def read(self, name: str) -> bytes:
+        """读取成员内容
+        
+        Args:
+            name: 成员名
+            
+        Returns:
+            bytes: 解压后的成员内容
+            
+        Raises:
+            KeyError: 成员不存在时抛出
+            zipfile.BadZipFile: 数据损坏时抛出
+        """
+        info = self.get_info(name)
+        
+        # 加密或非常见压缩方式交给zipfile处理
+        if info.flag_bits & 0x1 or info.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            with zipfile.ZipFile(self.zip_path, "r") as zip_file:
+                return zip_file.read(name)
+        
+        handle, generation = self._acquire()
+        try:
+            handle.seek(self._get_data_offset(handle, info))
+            raw = handle.read(info.compress_size)
+        finally:
+            self._release(handle, generation)
+        
+        if info.compress_type == zipfile.ZIP_DEFLATED:
+            data = zlib.decompress(raw, -15)
+        else:
+            data = raw
+        
+        if zlib.crc32(data) != info.CRC:
+            raise zipfile.BadZipFile(f"ZIP成员CRC校验失败: {name}")
+        return data
+    
+    def read_buffer(self, name: str) -> memoryview:
+        """以memoryview读取成员内容
+        
+        未压缩（STORED）成员直接映射ZIP文件中的数据区，不产生复制；
+        压缩成员只能解压，返回解压结果的视图。
+        
+        Args:
+            name: 成员名
+            
+        Returns:
+            memoryview: 成员内容的只读视图
+            
+        Raises:
+            KeyError: 成员不存在时抛出
+            zipfile.BadZipFile: 数据损坏时抛出
+        """
+        info = self.get_info(name)
+        if info.flag_bits & 0x1 or info.compress_type != zipfile.ZIP_STORED:
+            return memoryview(self.read(name))
+        
+        handle, generation = self._acquire()
+        try:
+            view = map_file_region(handle.fileno(), self._get_data_offset(handle, info), info.compress_size)
+        finally:
+            self._release(handle, generation)
+        
+        if zlib.crc32(view) != info.CRC:
+            raise zipfile.BadZipFile(f"ZIP成员CRC校验失败: {name}")
+        return view
+    
+    def invalidate(self) -> None:
+        """使句柄池失效：关闭空闲句柄并丢弃目录与偏移缓存
+        
+        借出中的句柄在归还时关闭。下次访问会重新解析中央目录。
+        """
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._open_count = 0
+            self._generation += 1
+            self._infos = None
+            self._data_offsets = {}
+            self._cond.notify_all()
+        for handle in idle:
+            try:
+                handle.close()
+            except Exception:
+                pass
+    
+    def close(self) -> None:
+        """关闭句柄池"""
+        self.invalidate()
+    
+    def __del__(self) -> None:
+        """析构函数，确保空闲句柄被关闭"""
+        try:
+            self.invalidate()
+        except Exception:
+            pass
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """获取句柄池统计信息
+        
+        Returns:
+            Dict[str, Any]: 统计信息
+        """
+        with self._cond:
+            return {
+                "open_handles": self._open_count,
+                "idle_handles": len(self._idle),
+                "max_handles": self.max_handles,
+                "cached_offsets": len(self._data_offsets),
+                "directory_parses": self._directory_parses
+            }
+
+
+class ResourcePathIndex:
+    """资源路径前缀索引
+
+    按路径分段组织的字典树，每个节点的子节点按自然顺序排序并缓存。
+    前缀查询只需沿路径下降后遍历命中的子树，结果天然按自然顺序排列，
+    增删单个路径只影响其所在分支。
+    """
+
+    class _Node:
+        """索引节点"""
+        __slots__ = ("children", "ordered", "terminal", "count")
+
+        def __init__(self) -> None:
+            self.children: Dict[str, 'ResourcePathIndex._Node'] = {}
+            self.ordered: Optional[List[str]] = None  # 自然排序的子节点名缓存
+            self.terminal: bool = False  # 该节点本身是否为资源路径
+            self.count: int = 0  # 子树中的资源路径数量
+
+        def ordered_children(self) -> List[str]:
+            if self.ordered is None:
+                self.ordered = sorted(self.children, key=lambda name: (natural_sort_key(name), name))
+            return self.ordered
+
+    def __init__(self, paths: Optional[Iterable[str]] = None):
+        """初始化索引
+
+        Args:
+            paths: 初始资源路径
+        """
+        self._root = ResourcePathIndex._Node()
+        self._lock = threading.RLock()
+        if paths:
+            for path in paths:
+                self.add(path)
+
+    def __len__(self) -> int:
+        return self._root.count
+
+    def __contains__(self, path: object) -> bool:
+        if not isinstance(path, str):
+            return False
+        with self._lock:
+            node = self._find(path.split("/"))
+            return node is not None and node.terminal
+
+    def _find(self, segments: List[str]) -> Optional['ResourcePathIndex._Node']:
+        node = self._root
+        for segment in segments:
+            child = node.children.get(segment)
+            if child is None:
+                return None
+            node = child
+        return node
+
+    def add(self, path: str) -> bool:
+        """添加资源路径
+
+        Args:
+            path: 资源路径（使用正斜杠）
+
+        Returns:
+            bool: 路径此前不存在时返回True
+        """
+        segments = path.split("/")
+        with self._lock:
+            if path in self:
+                return False
+
+            node = self._root
+            node.count += 1
+            for segment in segments:
+                child = node.children.get(segment)
+                if child is None:
+                    child = ResourcePathIndex._Node()
+                    node.children[segment] = child
+                    node.ordered = None
+                node = child
+                node.count += 1
+            node.terminal = True
+            return True
+
+    def remove(self, path: str) -> bool:
+        """移除资源路径，并裁剪不再包含资源的分支
+
+        Args:
+            path: 资源路径
+
+        Returns:
+            bool: 路径存在并被移除时返回True
+        """
+        segments = path.split("/")
+        with self._lock:
+            if path not in self:
+                return False
+
+            node = self._root
+            node.count -= 1
+            for segment in segments:
+                child = node.children[segment]
+                child.count -= 1
+                if child.count == 0:
+                    # 整个分支已空，直接摘除
+                    del node.children[segment]
+                    node.ordered = None
+                    return True
+                node = child
+            node.terminal = False
+            return True
+
+    def clear(self) -> None:
+        """清空索引"""
+        with self._lock:
+            self._root = ResourcePathIndex._Node()
+
+    def list(self, prefix: str = "") -> List[str]:
+        """列出以指定前缀开头的资源路径
+
+        前缀按字符串匹配（与 str.startswith 语义一致），最后一段可以是不完整的名称。
+
+        Args:
+            prefix: 资源路径前缀
+
+        Returns:
+            List[str]: 按自然顺序排列的资源路径列表
+        """
+        result: List[str] = []
+        with self._lock:
+            segments = prefix.split("/")
+            parent_segments, partial = segments[:-1], segments[-1]
+            parent = self._find(parent_segments)
+            if parent is None:
+                return result
+
+            base = "/".join(parent_segments)
+            base = base + "/" if parent_segments else ""
+            for name in parent.ordered_children():
+                if name.startswith(partial):
+                    self._collect(parent.children[name], base + name, result)
+        return result
+
+    def _collect(self, node: 'ResourcePathIndex._Node', path: str, result: List[str]) -> None:
+        # 显式栈遍历，避免深层目录触发递归限制
+        stack = [(node, path)]
+        while stack:
+            current, current_path = stack.pop()
+            if current.terminal:
+                result.append(current_path)
+            for name in reversed(current.ordered_children()):
+                stack.append((current.children[name], f"{current_path}/{name}"))
+
+
 class ResourcePackMetadata:
     """资源包元数据"""
     
@@ -180,6 +618,11 @@ class ResourcePack:
         
         # 加载锁
         self._load_lock: threading.Lock = threading.Lock()
+        
+        # ZIP句柄池（仅ZIP资源包使用）
+        self._zip_pool: Optional[ZipHandlePool] = None
+        if pack_type == ResourcePackType.ZIP:
+            self._zip_pool = ZipHandlePool(str(path))
     
     def load(self) -> bool:
         """加载资源包
@@ -238,12 +681,11 @@ class ResourcePack:
                 if not zipfile.is_zipfile(self.path):
                     raise ResourcePackLoadError(f"无效的ZIP资源包: {self.path}")
                 
-                with zipfile.ZipFile(str(self.path), "r") as zip_file:
-                    if "pack.json" not in zip_file.namelist():
-                        raise ResourcePackLoadError(f"ZIP资源包中缺少元数据文件: {self.path}")
-                    
-                    with zip_file.open("pack.json") as f:
-                        metadata_content = json.loads(f.read().decode("utf-8"))
+                zip_pool = self._get_zip_pool()
+                if not zip_pool.has_member("pack.json"):
+                    raise ResourcePackLoadError(f"ZIP资源包中缺少元数据文件: {self.path}")
+                
+                metadata_content = json.loads(zip_pool.read("pack.json").decode("utf-8"))
             
             elif self.type == ResourcePackType.BUILTIN:
                 # 内置资源包，元数据可能是硬编码的
@@ -334,18 +776,106 @@ class ResourcePack:
         Args:
             zip_path: ZIP文件路径
         """
-        with zipfile.ZipFile(zip_path, "r") as zip_file:
-            for file_info in zip_file.infolist():
-                # 跳过目录和元数据文件
-                if file_info.filename.endswith("/") or file_info.filename == "pack.json":
-                    continue
-                    
-                # 统一使用正斜杠
-                rel_path = file_info.filename.replace("\\", "/")
-                    
-                self.files.append(rel_path)
-                # 对于ZIP文件，映射存储完整路径
-                self.file_mapping[rel_path] = f"{zip_path}:{rel_path}"
+        for file_info in self._get_zip_pool().infolist():
+            # 跳过目录和元数据文件
+            if file_info.filename.endswith("/") or file_info.filename == "pack.json":
+                continue
+                
+            # 统一使用正斜杠
+            rel_path = file_info.filename.replace("\\", "/")
+                
+            self.files.append(rel_path)
+            # 对于ZIP文件，映射存储完整路径
+            self.file_mapping[rel_path] = f"{zip_path}:{rel_path}"
+    
+    def _get_zip_pool(self) -> ZipHandlePool:
+        """获取ZIP句柄池，必要时创建
+        
+        Returns:
+            ZipHandlePool: 句柄池
+        """
+        if self._zip_pool is None:
+            self._zip_pool = ZipHandlePool(str(self.path))
+        return self._zip_pool
+    
+    def close(self) -> None:
+        """释放资源包持有的文件句柄和目录缓存"""
+        if self._zip_pool is not None:
+            self._zip_pool.invalidate()
+
+    def get_member_signatures(self) -> Dict[str, Tuple[int, int]]:
+        """获取ZIP成员的签名（CRC与原始大小），用于比较两次加载之间的差异
+
+        Returns:
+            Dict[str, Tuple[int, int]]: 成员路径 -> (CRC, 大小)；非ZIP资源包返回空字典
+        """
+        if self.type != ResourcePackType.ZIP or not self.loaded:
+            return {}
+        try:
+            return {
+                info.filename.replace("\\", "/"): (info.CRC, info.file_size)
+                for info in self._get_zip_pool().infolist()
+                if not info.filename.endswith("/") and info.filename != "pack.json"
+            }
+        except (OSError, zipfile.BadZipFile) as e:
+            self.logger.warning(f"读取ZIP成员签名失败: {self.path}, 错误: {str(e)}")
+            return {}
+
+    def update_files(self, relative_paths: List[str]) -> Tuple[Set[str], bool]:
+        """按磁盘现状增量更新目录资源包中的指定文件
+
+        已存在的文件加入（或保留在）文件列表，不存在的路径连同其下的所有文件被移除。
+
+        Args:
+            relative_paths: 发生变化的相对路径（文件或目录）
+
+        Returns:
+            Tuple[Set[str], bool]: (受影响的资源路径, 文件列表是否有增删)
+        """
+        affected: Set[str] = set()
+        membership_changed = False
+        if self.type != ResourcePackType.DIRECTORY:
+            return affected, membership_changed
+
+        root = str(self.path)
+        removed: Set[str] = set()
+        for rel_path in relative_paths:
+            rel_path = rel_path.replace("\\", "/").strip("/")
+            if not rel_path or rel_path == "pack.json":
+                continue
+            file_path = os.path.join(root, *rel_path.split("/"))
+
+            if os.path.isfile(file_path):
+                if rel_path not in self.file_mapping:
+                    self.files.append(rel_path)
+                    self.file_mapping[rel_path] = file_path
+                    membership_changed = True
+                affected.add(rel_path)
+            elif os.path.isdir(file_path):
+                for dir_root, _, names in os.walk(file_path):
+                    for name in names:
+                        sub_path = os.path.join(dir_root, name)
+                        sub_rel = os.path.relpath(sub_path, root).replace("\\", "/")
+                        if sub_rel not in self.file_mapping:
+                            self.files.append(sub_rel)
+                            self.file_mapping[sub_rel] = sub_path
+                            membership_changed = True
+                        affected.add(sub_rel)
+            elif rel_path in self.file_mapping:
+                removed.add(rel_path)
+            else:
+                # 被删除的目录
+                prefix = rel_path + "/"
+                removed.update(p for p in self.file_mapping if p.startswith(prefix))
+
+        if removed:
+            for rel_path in removed:
+                del self.file_mapping[rel_path]
+            self.files = [p for p in self.files if p not in removed]
+            affected |= removed
+            membership_changed = True
+
+        return affected, membership_changed
 
     def get_file_path(self, relative_path: str) -> Optional[str]:
         """获取文件实际路径
@@ -387,27 +917,77 @@ class ResourcePack:
         # 统一使用正斜杠
         relative_path = relative_path.replace("\\", "/")
         
+        try:
+            return self.read_file(relative_path)
+        except Exception as e:
+            self.logger.error(f"读取文件失败: {relative_path}, 错误: {str(e)}")
+            return None
+    
+    def read_file(self, relative_path: str) -> Optional[bytes]:
+        """读取文件内容，读取失败时抛出异常
+        
+        Args:
+            relative_path: 相对路径
+            
+        Returns:
+            Optional[bytes]: 文件内容，如果文件不存在则返回None
+        """
+        # 统一使用正斜杠
+        relative_path = relative_path.replace("\\", "/")
+        
         # 获取实际文件路径
         file_path = self.file_mapping.get(relative_path)
         
         if not file_path:
             return None
         
+        # 处理ZIP文件：成员名即相对路径，经句柄池读取
+        if self.type == ResourcePackType.ZIP:
+            return self._get_zip_pool().read(relative_path)
+        
+        # 直接打开文件
+        with open(file_path, "rb") as f:
+            return f.read()
+    
+    def get_file_buffer(self, relative_path: str) -> Optional[memoryview]:
+        """获取文件内容的只读视图
+        
+        Args:
+            relative_path: 相对路径
+            
+        Returns:
+            Optional[memoryview]: 文件内容视图，如果文件不存在或读取失败则返回None
+        """
         try:
-            # 处理ZIP文件
-            if self.type == ResourcePackType.ZIP:
-                # ZIP文件的路径格式为 "zip_path:file_path"
-                zip_path, inner_path = file_path.split(":", 1)
-                
-                with zipfile.ZipFile(zip_path, "r") as zip_file:
-                    return zip_file.read(inner_path)
-            else:
-                # 直接打开文件
-                with open(file_path, "rb") as f:
-                    return f.read()
+            return self.read_file_buffer(relative_path)
         except Exception as e:
-            self.logger.error(f"读取文件失败: {relative_path}, 错误: {str(e)}")
+            self.logger.error(f"映射文件失败: {relative_path}, 错误: {str(e)}")
+            return None
+    
+    def read_file_buffer(self, relative_path: str) -> Optional[memoryview]:
+        """以memoryview读取文件内容，读取失败时抛出异常
+        
+        目录文件和未压缩的ZIP成员通过mmap映射，不复制数据。
+        
+        Args:
+            relative_path: 相对路径
+            
+        Returns:
+            Optional[memoryview]: 文件内容视图，如果文件不存在则返回None
+        """
+        # 统一使用正斜杠
+        relative_path = relative_path.replace("\\", "/")
+        
+        file_path = self.file_mapping.get(relative_path)
+        
+        if not file_path:
             return None
+        
+        if self.type == ResourcePackType.ZIP:
+            return self._get_zip_pool().read_buffer(relative_path)
+        
+        with open(file_path, "rb") as f:
+            return map_file_region(f.fileno())
     
     def get_info(self) -> Dict[str, Any]:
         """获取资源包信息
@@ -457,6 +1037,9 @@ class ResourcePackManager:
     _instance: Optional['ResourcePackManager'] = None
     _lock: threading.Lock = threading.Lock()
     
+    # list_resources 的结果已按自然顺序排列，调用方无需再次排序
+    sorted_listing: bool = True
+    
     @classmethod
     def get_instance(cls) -> 'ResourcePackManager':
         """获取单例实例
@@ -487,7 +1070,9 @@ class ResourcePackManager:
         self.active_packs: List[str] = []  # 激活的资源包ID列表
         
         # 资源路径映射，用于快速查找资源
-        self.resource_path_map: Dict[str, str] = {}  # 资源相对路径 -> 资源包ID
+        self.resource_path_map: Dict[str, str] = {}  # 资源相对路径 -> 资源文件实际路径
+        self.resource_pack_map: Dict[str, str] = {}  # 资源相对路径 -> 提供该资源的资源包ID
+        self._resource_index: ResourcePathIndex = ResourcePathIndex()  # 资源路径前缀索引
         
         # 初始化状态
         self.initialized: bool = False
@@ -497,7 +1082,10 @@ class ResourcePackManager:
         self._monitor_thread: Optional[threading.Thread] = None  # 监控线程
         self._monitor_interval: float = 5.0  # 监控间隔（秒）
         self._last_check_time: float = 0.0  # 上次检查时间
-        self._directory_state: Dict[str, Any] = {}  # 目录状态缓存
+        self._directory_state: Dict[str, Any] = {}  # 已登记的监控路径 -> 监控参数
+        self._watcher: Optional[PackWatcher] = None  # 文件变化检测后端
+        self._monitor_lock: threading.RLock = threading.RLock()  # 保护检测后端与变化处理
+        self._debounce_interval: float = 0.2  # 事件驱动时的去抖间隔（秒）
         self._stop_event: threading.Event = threading.Event()  # 用于停止监控线程的事件
         
         self._instance_init_lock = threading.Lock() # Add instance-level lock
@@ -684,9 +1272,13 @@ class ResourcePackManager:
                 self.logger.warning("未找到默认资源包，资源系统可能无法正常工作")
     
     def _update_resource_path_map(self) -> None:
-        """更新资源路径映射"""
+        """更新资源路径映射
+        
+        映射整体重建，前缀索引只按新旧路径集合的差异增量更新。
+        """
         # 清空当前映射
         self.resource_path_map.clear()
+        self.resource_pack_map.clear()
         
         # 逆序遍历活跃资源包（低优先级资源包在前，被高优先级覆盖）
         for pack_id in reversed(self.active_packs):
@@ -704,6 +1296,14 @@ class ResourcePackManager:
                 actual_file_path = pack.get_file_path(file_path)
                 if actual_file_path: # 确保路径不是None
                     self.resource_path_map[resource_path] = actual_file_path
+                    self.resource_pack_map[resource_path] = pack_id
+        
+        # 增量更新前缀索引，未变化的分支保留已排序的子节点缓存
+        for resource_path in self._resource_index.list():
+            if resource_path not in self.resource_path_map:
+                self._resource_index.remove(resource_path)
+        for resource_path in self.resource_path_map:
+            self._resource_index.add(resource_path)
         
         self.logger.debug(f"已更新资源路径映射，共 {len(self.resource_path_map)} 个资源")
     
@@ -716,9 +1316,13 @@ class ResourcePackManager:
         self.logger.info("正在重新加载资源包...")
         
         # 清空当前状态
+        for pack in self.resource_packs.values():
+            pack.close()
         self.resource_packs.clear()
         self.active_packs.clear()
         self.resource_path_map.clear()
+        self.resource_pack_map.clear()
+        self._resource_index.clear()
         self.initialized = False
         
         # 重新初始化
@@ -848,6 +1452,7 @@ class ResourcePackManager:
             
             # 从已加载资源包中移除
             del self.resource_packs[pack_id]
+            pack.close()
             
             # 如果是ZIP资源包，尝试从用户目录删除文件
             if pack.type == ResourcePackType.ZIP:
@@ -1082,6 +1687,14 @@ class ResourcePackManager:
             return None
         
         try:
+            # 优先通过提供该资源的资源包读取（ZIP资源包复用句柄池）
+            pack_id = self.resource_pack_map.get(path)
+            pack = self.resource_packs.get(pack_id) if pack_id else None
+            if pack is not None:
+                content = pack.read_file(path)
+                if content is not None:
+                    return content
+            
             # 处理ZIP文件中的资源
             if file_path.startswith("zip:"):
                 zip_path, internal_path = file_path[4:].split("!", 1)
@@ -1096,6 +1709,37 @@ class ResourcePackManager:
         except Exception as e:
             raise ResourcePackError(f"读取资源文件失败: {str(e)}")
     
+    def get_resource_buffer(self, path: str) -> Optional[memoryview]:
+        """获取资源文件内容的只读视图（零复制）
+        
+        Args:
+            path: 资源相对路径
+            
+        Returns:
+            Optional[memoryview]: 文件内容视图，如果不存在则返回None
+            
+        Raises:
+            ResourcePackError: 读取失败时抛出
+        """
+        # 确保已初始化
+        if not self.initialized:
+            self.initialize()
+        
+        # 统一路径格式
+        path = path.replace("\\", "/")
+        
+        pack_id = self.resource_pack_map.get(path)
+        pack = self.resource_packs.get(pack_id) if pack_id else None
+        if pack is None:
+            # 没有资源包归属信息时退化为普通读取
+            content = self.get_resource_content(path)
+            return memoryview(content) if content is not None else None
+        
+        try:
+            return pack.read_file_buffer(path)
+        except Exception as e:
+            raise ResourcePackError(f"映射资源文件失败: {str(e)}")
+    
     def has_resource(self, path: str) -> bool:
         """检查资源是否存在
         
@@ -1122,7 +1766,7 @@ class ResourcePackManager:
             prefix: 资源路径前缀
             
         Returns:
-            List[str]: 资源路径列表
+            List[str]: 按自然顺序排列的资源路径列表
         """
         # 确保已初始化
         if not self.initialized:
@@ -1131,14 +1775,7 @@ class ResourcePackManager:
         # 统一路径格式
         prefix = prefix.replace("\\", "/")
         
-        # 筛选资源
-        result = []
-        
-        for resource_path in self.resource_path_map.keys():
-            if resource_path.startswith(prefix):
-                result.append(resource_path)
-        
-        return result
+        return self._resource_index.list(prefix)
     
     def create_resource_pack(self, pack_id: str, name: str, output_path: Optional[str] = None) -> Optional[str]:
         """创建新的资源包
@@ -1284,8 +1921,9 @@ class ResourcePackManager:
         # 记录当前时间
         self._last_check_time = time.time()
         
-        # 获取初始目录状态
-        self._directory_state = self._get_directory_state()
+        # 创建检测后端并登记初始监控路径
+        with self._monitor_lock:
+            self._get_watcher()
         
         # 重置停止事件
         self._stop_event.clear()
@@ -1298,7 +1936,8 @@ class ResourcePackManager:
         )
         self._monitor_thread.start()
         
-        self.logger.info(f"已启动资源包目录监控，监控间隔: {self._monitor_interval}秒")
+        backend = type(self._watcher).__name__ if self._watcher else "none"
+        self.logger.info(f"已启动资源包目录监控，检测后端: {backend}，监控间隔: {self._monitor_interval}秒")
         return True
     
     def stop_monitoring(self) -> bool:
@@ -1327,6 +1966,14 @@ class ResourcePackManager:
                 self.logger.warning("资源包监控线程未能在2秒内正常退出")
         
         self._monitor_thread = None
+        
+        # 释放检测后端
+        with self._monitor_lock:
+            if self._watcher is not None:
+                self._watcher.close()
+                self._watcher = None
+            self._directory_state = {}
+        
         self.logger.info("已停止资源包目录监控")
         return True
     
@@ -1334,7 +1981,7 @@ class ResourcePackManager:
         """设置监控间隔
         
         Args:
-            interval: 监控间隔（秒）
+            interval: 监控间隔（秒），事件驱动的后端只在等待事件时使用
         """
         if interval < 0.5:
             interval = 0.5  # 最小0.5秒
@@ -1343,94 +1990,113 @@ class ResourcePackManager:
         self.logger.info(f"已设置资源包目录监控间隔为 {interval} 秒")
     
     def _monitor_worker(self) -> None:
-        """监控工作线程，定期检查目录变化"""
+        """监控工作线程，等待文件变化事件或定期轮询"""
         self.logger.debug("资源包监控线程已启动")
         
         try:
             while self._monitoring and not self._stop_event.is_set():
-                # 检查目录变化
-                self._check_directory_changes()
+                watcher = self._watcher
+                if watcher is None:
+                    break
                 
-                # 等待指定的间隔时间，同时检查停止事件
-                # 每0.5秒检查一次停止事件，以便及时响应停止请求
-                for _ in range(int(self._monitor_interval * 2)):
-                    if self._stop_event.is_set():
+                if watcher.event_driven:
+                    # 等待系统事件，每0.5秒检查一次停止事件
+                    if not watcher.wait(min(0.5, self._monitor_interval)):
+                        continue
+                    # 短暂去抖，合并同一次保存产生的多个事件
+                    if self._stop_event.wait(self._debounce_interval):
+                        break
+                    self._check_directory_changes()
+                else:
+                    self._check_directory_changes()
+                    if self._stop_event.wait(self._monitor_interval):
                         break
-                    time.sleep(0.5)
         except Exception as e:
             self.logger.error(f"资源包监控线程发生异常: {str(e)}")
         finally:
             self.logger.debug("资源包监控线程已退出")
     
-    def _get_directory_state(self) -> Dict[str, Any]:
-        """获取当前资源包目录状态
+    def _get_watcher(self) -> PackWatcher:
+        """获取变化检测后端，必要时创建（调用方需持有 _monitor_lock）
         
         Returns:
-            Dict[str, Any]: 目录状态
+            PackWatcher: 检测后端
         """
-        state = {}
-        
-        # 检查用户目录
-        if os.path.exists(self.user_dir):
-            user_state = {
-                "mtime": os.path.getmtime(self.user_dir),
-                "files": {}
-            }
-            
-            # 获取所有文件的修改时间
-            for file in os.listdir(self.user_dir):
-                file_path = os.path.join(self.user_dir, file)
-                if os.path.isfile(file_path):
-                    user_state["files"][file_path] = os.path.getmtime(file_path)
-            
-            state[self.user_dir] = user_state
+        if self._watcher is None:
+            self._watcher = create_pack_watcher()
+            self._directory_state = {}
+            self._sync_watched_paths()
+        return self._watcher
+    
+    def _sync_watched_paths(self) -> None:
+        """使监控路径与当前的用户目录和已加载资源包保持一致"""
+        if self._watcher is None:
+            return
         
-        # 检查已加载的目录类型资源包
-        for pack_id, pack in self.resource_packs.items():
+        desired: Dict[str, bool] = {}
+        if self.user_dir and os.path.isdir(self.user_dir):
+            desired[os.path.normpath(self.user_dir)] = False
+        for pack in self.resource_packs.values():
             if pack.type == ResourcePackType.DIRECTORY:
-                dir_path = str(pack.path)
-                if os.path.exists(dir_path) and os.path.isdir(dir_path):
-                    dir_state = {
-                        "mtime": os.path.getmtime(dir_path),
-                        "files": {}
-                    }
-                    
-                    # 递归获取所有文件的修改时间
-                    for root, _, files in os.walk(dir_path):
-                        for file in files:
-                            file_path = os.path.join(root, file)
-                            dir_state["files"][file_path] = os.path.getmtime(file_path)
-                    
-                    state[dir_path] = dir_state
-        
-        return state
+                desired[os.path.normpath(str(pack.path))] = True
+            elif pack.type == ResourcePackType.ZIP:
+                desired[os.path.normpath(str(pack.path))] = False
+        
+        for path in list(self._directory_state):
+            if path not in desired:
+                self._watcher.remove_path(path)
+                del self._directory_state[path]
+        
+        for path, recursive in desired.items():
+            if path not in self._directory_state and self._watcher.add_path(path, recursive):
+                self._directory_state[path] = {"recursive": recursive}
     
-    def _check_directory_changes(self) -> None:
-        """检查目录变化，必要时重新加载资源包"""
-        current_time = time.time()
-        
-        # 获取当前目录状态
-        current_state = self._get_directory_state()
+    def _find_pack_for_path(self, file_path: str) -> Optional[Tuple[str, str]]:
+        """查找包含指定文件的资源包
         
-        # 检查用户目录是否有新文件
-        user_dir = self.user_dir
-        if os.path.exists(user_dir):
-            # 获取上次检查时的用户目录状态
-            prev_user_state = self._directory_state.get(user_dir, {"mtime": 0, "files": {}})
-            
-            # 获取当前用户目录状态
-            curr_user_state = current_state.get(user_dir, {"mtime": 0, "files": {}})
-            
-            # 检查是否有新文件
-            prev_files = set(prev_user_state.get("files", {}).keys())
-            curr_files = set(curr_user_state.get("files", {}).keys())
-            
-            # 新增的文件
-            new_files = curr_files - prev_files
+        Args:
+            file_path: 文件绝对路径
             
-            # 处理新文件
-            for file_path in new_files:
-                if zipfile.is_zipfile(file_path):
+        Returns:
+            Optional[Tuple[str, str]]: (资源包ID, 资源包内的相对路径)，路径为资源包本身时相对路径为空字符串
+        """
+        best: Optional[Tuple[str, str]] = None
+        best_len = -1
+        for pack_id, pack in self.resource_packs.items():
+            root = os.path.normpath(str(pack.path))
+            if file_path == root:
+                rel_path = ""
+            elif pack.type == ResourcePackType.DIRECTORY and file_path.startswith(root + os.sep):
+                rel_path = os.path.relpath(file_path, root).replace("\\", "/")
+            else:
+                continue
+            # 嵌套时取最内层的资源包
+            if len(root) > best_len:
+                best, best_len = (pack_id, rel_path), len(root)
+        return best
+    
+    def _check_directory_changes(self) -> None:
+        """检查目录变化，只重新加载发生变化的资源包和路径"""
+        with self._monitor_lock:
+            watcher = self._get_watcher()
+            self._sync_watched_paths()
+            changes = watcher.poll()
+            self._last_check_time = time.time()
+            if not changes:
+                return
+            
+            user_dir = os.path.normpath(self.user_dir) if self.user_dir else ""
+            pack_changes: Dict[str, Set[str]] = {}
+            
+            for file_path, kind in changes.items():
+                owner = self._find_pack_for_path(file_path)
+                if owner is not None:
+                    pack_changes.setdefault(owner[0], set()).add(owner[1])
+                    continue
+                
+                # 用户目录中出现的新资源包
+                if (kind != ChangeKind.DELETED and user_dir and os.path.dirname(file_path) == user_dir
+                        and zipfile.is_zipfile(file_path)):
                     self.logger.info(f"发现新资源包: {file_path}")
                     try:
                         # 添加资源包
@@ -1446,53 +2112,34 @@ class ResourcePackManager:
                                 })
                     except Exception as e:
                         self.logger.error(f"自动加载资源包失败: {file_path}, 错误: {str(e)}")
-        
-        # 检查目录类型资源包是否有变化
-        for pack_id, pack in list(self.resource_packs.items()):
-            if pack.type == ResourcePackType.DIRECTORY:
-                dir_path = str(pack.path)
-                if not os.path.exists(dir_path) or not os.path.isdir(dir_path):
-                    # 目录已被删除
-                    self.logger.warning(f"资源包目录已被删除: {dir_path}")
+            
+            for pack_id, rel_paths in pack_changes.items():
+                pack = self.resource_packs.get(pack_id)
+                if pack is None:
+                    continue
+                if not os.path.exists(str(pack.path)):
+                    self.logger.warning(f"资源包已被删除: {pack.path}")
                     continue
                 
-                # 获取上次检查时的目录状态
-                prev_dir_state = self._directory_state.get(dir_path, {"mtime": 0, "files": {}})
-                
-                # 获取当前目录状态
-                curr_dir_state = current_state.get(dir_path, {"mtime": 0, "files": {}})
-                
-                # 检查文件是否有变化
-                prev_files = prev_dir_state.get("files", {})
-                curr_files = curr_dir_state.get("files", {})
-                
-                # 检查修改的文件
-                changed = False
-                for file_path, curr_mtime in curr_files.items():
-                    prev_mtime = prev_files.get(file_path, 0)
-                    if curr_mtime > prev_mtime:
-                        # 文件已修改
-                        changed = True
-                        self.logger.debug(f"资源包文件已修改: {file_path}")
-                
-                if changed:
-                    self.logger.info(f"检测到资源包变更: {pack_id}")
-                    try:
-                        # 热重载资源包
-                        if self.hot_reload_pack(pack_id):
-                            self.logger.info(f"已自动重新加载资源包: {pack_id}")
-                    except Exception as e:
-                        self.logger.error(f"自动重新加载资源包失败: {pack_id}, 错误: {str(e)}")
-        
-        # 更新目录状态
-        self._directory_state = current_state
-        self._last_check_time = current_time
+                self.logger.info(f"检测到资源包变更: {pack_id}，共 {len(rel_paths)} 个路径")
+                try:
+                    # 资源包本身变化（ZIP文件或事件溢出）时整体重载，否则只更新变化的路径
+                    if "" in rel_paths or pack.type != ResourcePackType.DIRECTORY:
+                        reloaded = self.hot_reload_pack(pack_id)
+                    else:
+                        reloaded = self.hot_reload_pack(pack_id, changed_paths=sorted(rel_paths))
+                    if reloaded:
+                        self.logger.info(f"已自动重新加载资源包: {pack_id}")
+                except Exception as e:
+                    self.logger.error(f"自动重新加载资源包失败: {pack_id}, 错误: {str(e)}")
     
-    def hot_reload_pack(self, pack_id: str) -> bool:
+    def hot_reload_pack(self, pack_id: str, changed_paths: Optional[List[str]] = None) -> bool:
         """热重载指定的资源包
         
         Args:
             pack_id: 资源包ID
+            changed_paths: 发生变化的相对路径；提供时目录资源包只更新这些路径，
+                否则整体重新加载
             
         Returns:
             bool: 重载是否成功
@@ -1505,43 +2152,66 @@ class ResourcePackManager:
         # 获取资源包
         pack = self.resource_packs[pack_id]
         
-        # 清空资源文件列表缓存
-        pack.files = []
-        pack.file_mapping = {}
-        
-        # 标记为未加载
-        pack.loaded = False
-        
-        # 重新加载资源包
         try:
-            # 调用资源包的load方法
-            if not pack.load():
-                self.logger.error(f"热重载资源包失败: 无法加载资源包 {pack_id}")
-                return False
-            
-            # 更新资源路径映射
-            self._update_resource_path_map()
+            affected: Optional[Set[str]] = None
+            
+            if (changed_paths is not None and pack.type == ResourcePackType.DIRECTORY and pack.loaded
+                    and "pack.json" not in changed_paths):
+                # 增量更新：只处理变化的路径
+                affected, membership_changed = pack.update_files(changed_paths)
+                if membership_changed:
+                    self._update_resource_path_map()
+            else:
+                # 记录ZIP成员签名，重载后比较得出变化的资源
+                old_signatures = pack.get_member_signatures()
+                
+                # 清空资源文件列表缓存，并使ZIP句柄池失效
+                pack.files = []
+                pack.file_mapping = {}
+                pack.close()
+                
+                # 标记为未加载
+                pack.loaded = False
+                
+                # 调用资源包的load方法
+                if not pack.load():
+                    self.logger.error(f"热重载资源包失败: 无法加载资源包 {pack_id}")
+                    return False
+                
+                # 更新资源路径映射
+                self._update_resource_path_map()
+                
+                if pack.type == ResourcePackType.ZIP and old_signatures:
+                    new_signatures = pack.get_member_signatures()
+                    affected = {
+                        path for path in old_signatures.keys() | new_signatures.keys()
+                        if old_signatures.get(path) != new_signatures.get(path)
+                    }
             
             self.logger.info(f"已热重载资源包: {pack_id}")
             
-            # 触发事件
+            # 触发事件；已知变化路径时一并发送，便于只失效相关缓存
             if self._event_system and hasattr(self._event_system, 'publish'):
-                self._event_system.publish("resource_pack.reloaded", {
-                    "pack_id": pack_id
-                })
+                event_data: Dict[str, Any] = {"pack_id": pack_id}
+                if affected is not None:
+                    event_data["changed_paths"] = sorted(affected)
+                self._event_system.publish("resource_pack.reloaded", event_data)
             
             return True
         except Exception as e:
             self.logger.error(f"热重载资源包失败: {pack_id}, 错误: {str(e)}")
             return False
 
-
 # 创建资源包管理器实例
 resource_pack_manager = ResourcePackManager.get_instance()
 
 
 # 导出的API
 __all__ = [
+    'map_file_region',
+    'ZipHandlePool',
+    'natural_sort_key',
+    'ResourcePathIndex',
     'ResourcePack',
     'ResourcePackManager',
     'ResourcePackError',
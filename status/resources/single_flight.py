@@ -0,0 +1,92 @@
+"""
+---------------------------------------------------------------
+File name:                  single_flight.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                请求合并（single-flight），同一键的并发加载只执行一次
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+----
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+class SingleFlight:
+    """请求合并表
+
+    同一键的加载正在进行时，后到的调用不再重复加载，而是等待进行中的那次加载
+    并共享其结果（或异常）。加载结束后立即从表中移除，不承担缓存职责。
+    """
+
+    def __init__(self):
+        """初始化请求合并表"""
+        # 键 -> (发起加载的线程ID, 结果Future)
+        self._calls: Dict[Hashable, Tuple[int, Future]] = {}
+        self._lock = threading.Lock()
+        self._coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """执行 fn，同一键的并发调用只执行一次
+
+        同一线程重入同一键时直接执行 fn，避免等待自己造成死锁。
+
+        Args:
+            key: 合并键
+            fn: 加载函数
+
+        Returns:
+            Any: fn 的返回值（合并的调用共享同一结果）
+
+        Raises:
+            Exception: fn 抛出的异常会传递给所有合并的调用方
+        """
+        thread_id = threading.get_ident()
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                future: Future = Future()
+                self._calls[key] = (thread_id, future)
+            elif call[0] != thread_id:
+                self._coalesced += 1
+
+        if call is not None:
+            if call[0] == thread_id:
+                return fn()
+            return call[1].result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    def get_coalesced_count(self) -> int:
+        """获取被合并（未重复加载）的请求数量"""
+        with self._lock:
+            return self._coalesced
+
+    def get_stats(self) -> Dict[str, int]:
+        """获取统计信息
+
+        Returns:
+            Dict[str, int]: 进行中的加载数量和被合并的请求数量
+        """
+        with self._lock:
+            return {
+                "in_flight": len(self._calls),
+                "coalesced": self._coalesced
+            }
+
+
+__all__ = ['SingleFlight']
@@ -8,6 +8,7 @@ Description:                场景管理器，管理场景切换和转场效果
 
 Changed history:            
                             2025/04/03: 初始创建;
+                            2026/10/16: 转场和场景切换时标记全部重绘，跳过无变化的帧;
 ----
 """
 
@@ -17,6 +18,7 @@ from typing import Dict, Any, Optional, List
 from status.scenes.scene_base import SceneBase
 from status.scenes.scene_transition import TransitionManager, SceneTransition, TransitionState
 from status.renderer.renderer_base import RendererBase
+from status.renderer.dirty_region import default_dirty_region
 from status.core.event_system import EventSystem, EventType, Event
 
 class SceneManager:
@@ -208,6 +210,9 @@ class SceneManager:
         
         # 重置转场
         self.transition = None
+        
+        # 场景已切换，整个画面需要重绘
+        default_dirty_region.mark_all()
     
     def update(self, delta_time: float, system_data: Optional[Dict[str, Any]] = None) -> None:
         """更新场景管理器
@@ -218,6 +223,8 @@ class SceneManager:
         """
         # 更新转场动画
         if self.transition and self.transition.state != TransitionState.COMPLETED:
+            # 转场效果不经过可绘制对象，每帧整体重绘
+            default_dirty_region.mark_all()
             if self.transition.update(delta_time):
                 self._complete_transition()
         
@@ -231,6 +238,10 @@ class SceneManager:
         Args:
             renderer: 渲染器
         """
+        # 画面没有变化，保留上一帧
+        if renderer.is_frame_skipped():
+            return
+        
         # 如果有转场动画且未完成，渲染转场
         if self.transition and self.transition.state != TransitionState.COMPLETED:
             self.transition.render(renderer, self.current_scene, self.next_scene)
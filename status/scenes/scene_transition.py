@@ -10,6 +10,7 @@ Changed history:
                             2025/04/03: 初始创建;
                             2025/04/03: 添加对过渡效果系统的支持;
                             2025/05/18: 修复类型错误，解决命名冲突问题;
+                            2026/10/16: 离屏表面从表面池取用，支持只渲染一次离开场景的快照模式;
 ----
 """
 
@@ -19,6 +20,7 @@ from typing import Tuple, Any, Optional, Dict, Callable, Type, cast, Union
 import math
 
 from status.renderer.renderer_base import RendererBase
+from status.renderer.surface_pool import SurfacePool
 from status.renderer.animation import EasingType, Animator
 # 重命名导入的类以避免命名冲突
 from status.renderer.transition import TransitionManager as RTTransitionManager 
@@ -39,19 +41,27 @@ class TransitionState(Enum):
 class SceneTransition(ABC):
     """场景转场基类"""
     
-    def __init__(self, duration: float = 0.5, easing: EasingType = EasingType.EASE_IN_OUT):
+    def __init__(self, duration: float = 0.5, easing: EasingType = EasingType.EASE_IN_OUT,
+                 snapshot: bool = False):
         """初始化转场效果
         
         Args:
             duration: 转场持续时间（秒）
             easing: 缓动类型
+            snapshot: 是否只渲染一次离开的场景（当前场景）到离屏表面，之后每帧绘制该快照。
+                      适用于转场期间当前场景画面不变的情况
         """
         self.duration = duration
         self.easing = easing
+        self.snapshot = snapshot
         self.state = TransitionState.IDLE
         self.elapsed_time = 0.0
         self.progress = 0.0  # 0.0到1.0之间的进度值
         
+        # 快照模式下离开场景的离屏表面及其所属渲染器
+        self._snapshot_surface: Any = None
+        self._snapshot_renderer: Optional[RendererBase] = None
+        
     def start_transition(self, is_entering: bool) -> None:
         """开始转场动画
         
@@ -61,6 +71,7 @@ class SceneTransition(ABC):
         self.state = TransitionState.ENTERING if is_entering else TransitionState.LEAVING
         self.elapsed_time = 0.0
         self.progress = 0.0
+        self.release_snapshot()
         
     def update(self, delta_time: float) -> bool:
         """更新转场动画
@@ -87,6 +98,7 @@ class SceneTransition(ABC):
         if raw_progress >= 1.0:
             self.state = TransitionState.COMPLETED
             self.progress = 1.0
+            self.release_snapshot()
             return True
             
         return False
@@ -108,6 +120,68 @@ class SceneTransition(ABC):
         # 渲染转场效果
         self._render_transition(renderer, current_scene, next_scene)
     
+    def release_snapshot(self) -> None:
+        """将离开场景的快照表面归还表面池"""
+        if self._snapshot_surface is not None and self._snapshot_renderer is not None:
+            SurfacePool.for_renderer(self._snapshot_renderer).release(self._snapshot_surface)
+        self._snapshot_surface = None
+        self._snapshot_renderer = None
+    
+    def _render_to_surface(self, renderer: RendererBase, scene: Any) -> Any:
+        """从表面池取出视口大小的离屏表面，清除后将场景渲染到其中
+        
+        Args:
+            renderer: 渲染器
+            scene: 场景
+            
+        Returns:
+            Any: 离屏表面，用完后需要归还表面池
+        """
+        width, height = renderer.get_viewport_size()
+        surface = SurfacePool.for_renderer(renderer).acquire(width, height)
+        renderer.set_target(surface)
+        renderer.clear()
+        scene.render(renderer)
+        renderer.reset_target()
+        return surface
+    
+    def _outgoing_surface(self, renderer: RendererBase, scene: Any) -> Any:
+        """获取离开场景的离屏表面
+        
+        快照模式下只在第一次调用时渲染并保留到转场结束；否则每次重新渲染，由调用方归还。
+        
+        Args:
+            renderer: 渲染器
+            scene: 离开的场景
+            
+        Returns:
+            Any: 离屏表面
+        """
+        if not self.snapshot:
+            return self._render_to_surface(renderer, scene)
+        if self._snapshot_surface is None or self._snapshot_renderer is not renderer:
+            self.release_snapshot()
+            self._snapshot_surface = self._render_to_surface(renderer, scene)
+            self._snapshot_renderer = renderer
+        return self._snapshot_surface
+    
+    def _release_surface(self, renderer: RendererBase, surface: Any) -> None:
+        """归还离屏表面（快照表面在转场结束时归还）"""
+        if surface is not None and surface is not self._snapshot_surface:
+            SurfacePool.for_renderer(renderer).release(surface)
+    
+    def _render_outgoing(self, renderer: RendererBase, scene: Any) -> None:
+        """渲染离开的场景（当前场景），快照模式下绘制快照而不重新渲染场景
+        
+        Args:
+            renderer: 渲染器
+            scene: 离开的场景
+        """
+        if self.snapshot:
+            renderer.draw_surface(self._outgoing_surface(renderer, scene), 0, 0)
+        else:
+            scene.render(renderer)
+    
     @abstractmethod
     def _render_transition(self, renderer: RendererBase, current_scene: Any, next_scene: Any) -> None:
         """渲染转场效果的具体实现
@@ -133,7 +207,7 @@ class FadeTransition(SceneTransition):
         if self.state == TransitionState.ENTERING:
             # 进入动画：先渲染当前场景，再渲染下一场景（逐渐显示）
             if current_scene:
-                current_scene.render(renderer)
+                self._render_outgoing(renderer, current_scene)
             
             if next_scene:
                 # 保存当前透明度
@@ -161,7 +235,7 @@ class FadeTransition(SceneTransition):
                 renderer.set_opacity(1.0 - self.progress)
                 
                 # 渲染当前场景
-                current_scene.render(renderer)
+                self._render_outgoing(renderer, current_scene)
                 
                 # 恢复透明度
                 renderer.set_opacity(original_opacity)
@@ -170,15 +244,16 @@ class SlideTransition(SceneTransition):
     """滑动转场效果"""
     
     def __init__(self, direction: str = "left", duration: float = 0.5, 
-                easing: EasingType = EasingType.EASE_IN_OUT):
+                easing: EasingType = EasingType.EASE_IN_OUT, snapshot: bool = False):
         """初始化滑动转场效果
         
         Args:
             direction: 滑动方向，可选值："left", "right", "up", "down"
             duration: 转场持续时间（秒）
             easing: 缓动类型
+            snapshot: 是否使用离开场景的快照
         """
-        super().__init__(duration, easing)
+        super().__init__(duration, easing, snapshot)
         self.direction = direction
     
     def _render_transition(self, renderer: RendererBase, current_scene: Any, next_scene: Any) -> None:
@@ -210,7 +285,7 @@ class SlideTransition(SceneTransition):
         if self.state == TransitionState.ENTERING:
             # 先渲染当前场景
             if current_scene:
-                current_scene.render(renderer)
+                self._render_outgoing(renderer, current_scene)
             
             # 渲染下一场景，带位移
             if next_scene:
@@ -233,7 +308,7 @@ class SlideTransition(SceneTransition):
                 elif self.direction == "down":
                     renderer.translate(0.0, float(height) * self.progress)
                 
-                current_scene.render(renderer)
+                self._render_outgoing(renderer, current_scene)
         
         # 恢复变换
         renderer.restore_state()
@@ -242,15 +317,16 @@ class ZoomTransition(SceneTransition):
     """缩放转场效果"""
     
     def __init__(self, zoom_in: bool = True, duration: float = 0.5, 
-                easing: EasingType = EasingType.EASE_IN_OUT):
+                easing: EasingType = EasingType.EASE_IN_OUT, snapshot: bool = False):
         """初始化缩放转场效果
         
         Args:
             zoom_in: 是否为缩小到放大效果（True）或放大到缩小效果（False）
             duration: 转场持续时间（秒）
             easing: 缓动类型
+            snapshot: 是否使用离开场景的快照
         """
-        super().__init__(duration, easing)
+        super().__init__(duration, easing, snapshot)
         self.zoom_in = zoom_in
     
     def _render_transition(self, renderer: RendererBase, current_scene: Any, next_scene: Any) -> None:
@@ -271,7 +347,7 @@ class ZoomTransition(SceneTransition):
         if self.state == TransitionState.ENTERING:
             # 先渲染当前场景
             if current_scene:
-                current_scene.render(renderer)
+                self._render_outgoing(renderer, current_scene)
             
             # 渲染下一场景，带缩放
             if next_scene:
@@ -309,7 +385,7 @@ class ZoomTransition(SceneTransition):
                 original_opacity = renderer.get_opacity()
                 renderer.set_opacity(1.0 - self.progress)
                 
-                current_scene.render(renderer)
+                self._render_outgoing(renderer, current_scene)
                 
                 # 恢复透明度
                 renderer.set_opacity(original_opacity)
@@ -321,15 +397,16 @@ class DissolveTransition(SceneTransition):
     """溶解转场效果"""
     
     def __init__(self, pattern_path: Optional[str] = None, duration: float = 0.5, 
-                easing: EasingType = EasingType.EASE_IN_OUT):
+                easing: EasingType = EasingType.EASE_IN_OUT, snapshot: bool = False):
         """初始化溶解转场效果
         
         Args:
             pattern_path: 溶解纹理路径（可选）
             duration: 转场持续时间（秒）
             easing: 缓动类型
+            snapshot: 是否使用离开场景的快照
         """
-        super().__init__(duration, easing)
+        super().__init__(duration, easing, snapshot)
         self.pattern_path = pattern_path
         self.pattern = None
         
@@ -353,7 +430,7 @@ class DissolveTransition(SceneTransition):
         if self.state == TransitionState.ENTERING:
             # 先渲染当前场景
             if current_scene:
-                current_scene.render(renderer)
+                self._render_outgoing(renderer, current_scene)
             
             # 使用溶解效果渲染下一场景
             if next_scene:
@@ -379,13 +456,13 @@ class DissolveTransition(SceneTransition):
                 if self.pattern:
                     # 使用纹理进行溶解
                     renderer.set_dissolve_effect(self.pattern, 1.0 - self.progress)
-                    current_scene.render(renderer)
+                    self._render_outgoing(renderer, current_scene)
                     renderer.clear_effects()
                 else:
                     # 简单透明度溶解
                     original_opacity = renderer.get_opacity()
                     renderer.set_opacity(1.0 - self.progress)
-                    current_scene.render(renderer)
+                    self._render_outgoing(renderer, current_scene)
                     renderer.set_opacity(original_opacity)
 
 class TransitionEffectBridge(SceneTransition):
@@ -402,7 +479,8 @@ class TransitionEffectBridge(SceneTransition):
             **effect_kwargs: 传递给具体过渡效果的参数
         """
         # 调用父类初始化，但不使用父类的缓动类型，而是使用新系统的缓动函数
-        super().__init__(duration, EasingType.LINEAR)  # 使用LINEAR作为占位符
+        snapshot = bool(effect_kwargs.pop('snapshot', False))
+        super().__init__(duration, EasingType.LINEAR, snapshot)  # 使用LINEAR作为占位符
         
         # 保存新的缓动类型
         self.transition_easing = easing
@@ -525,15 +603,12 @@ class TransitionEffectBridge(SceneTransition):
         if self.state == TransitionState.ENTERING:
             # 先渲染当前场景
             if current_scene:
-                current_scene.render(renderer)
+                self._render_outgoing(renderer, current_scene)
             
             # 使用淡入淡出效果渲染黑色遮罩
             if next_scene:
                 # 先创建目标场景的内容
-                next_scene_surface = renderer.create_surface()
-                renderer.set_target(next_scene_surface)
-                next_scene.render(renderer)
-                renderer.reset_target()
+                next_scene_surface = self._render_to_surface(renderer, next_scene)
                 
                 # 根据进度渲染 - 添加类型检查
                 original_opacity = renderer.get_opacity()
@@ -542,6 +617,7 @@ class TransitionEffectBridge(SceneTransition):
                 renderer.set_opacity(opacity)
                 renderer.draw_surface(next_scene_surface, 0, 0)
                 renderer.set_opacity(original_opacity)
+                self._release_surface(renderer, next_scene_surface)
         
         elif self.state == TransitionState.LEAVING:
             # 先渲染下一场景
@@ -551,10 +627,7 @@ class TransitionEffectBridge(SceneTransition):
             # 使用淡入淡出效果渲染当前场景
             if current_scene:
                 # 先创建当前场景的内容
-                current_scene_surface = renderer.create_surface()
-                renderer.set_target(current_scene_surface)
-                current_scene.render(renderer)
-                renderer.reset_target()
+                current_scene_surface = self._outgoing_surface(renderer, current_scene)
                 
                 # 根据进度渲染 - 添加类型检查
                 original_opacity = renderer.get_opacity()
@@ -563,27 +636,15 @@ class TransitionEffectBridge(SceneTransition):
                 renderer.set_opacity(1.0 - opacity)
                 renderer.draw_surface(current_scene_surface, 0, 0)
                 renderer.set_opacity(original_opacity)
+                self._release_surface(renderer, current_scene_surface)
     
     def _render_slide_transition(self, renderer: RendererBase, current_scene: Any, next_scene: Any) -> None:
         """渲染滑动效果"""
         width, height = renderer.get_viewport_size()
         
         # 创建场景表面
-        if current_scene:
-            current_scene_surface = renderer.create_surface()
-            renderer.set_target(current_scene_surface)
-            current_scene.render(renderer)
-            renderer.reset_target()
-        else:
-            current_scene_surface = None
-            
-        if next_scene:
-            next_scene_surface = renderer.create_surface()
-            renderer.set_target(next_scene_surface)
-            next_scene.render(renderer)
-            renderer.reset_target()
-        else:
-            next_scene_surface = None
+        current_scene_surface = self._outgoing_surface(renderer, current_scene) if current_scene else None
+        next_scene_surface = self._render_to_surface(renderer, next_scene) if next_scene else None
         
         # 使用SlideEffect渲染 - 修复参数调用
         # 为保证代码与不同签名的draw方法兼容，我们使用自定义渲染逻辑
@@ -604,7 +665,11 @@ class TransitionEffectBridge(SceneTransition):
                 renderer.draw_surface(current_scene_surface, 0, 0)
             if next_scene_surface:
                 renderer.draw_surface(next_scene_surface, 0, 0)
-                
+        
+        # 归还离屏表面
+        self._release_surface(renderer, current_scene_surface)
+        self._release_surface(renderer, next_scene_surface)
+    
     def _calculate_slide_offset(self, width: int, height: int) -> Tuple[int, int]:
         """计算滑动偏移量
         
@@ -634,21 +699,8 @@ class TransitionEffectBridge(SceneTransition):
         width, height = renderer.get_viewport_size()
         
         # 创建场景表面
-        if current_scene:
-            current_scene_surface = renderer.create_surface()
-            renderer.set_target(current_scene_surface)
-            current_scene.render(renderer)
-            renderer.reset_target()
-        else:
-            current_scene_surface = None
-            
-        if next_scene:
-            next_scene_surface = renderer.create_surface()
-            renderer.set_target(next_scene_surface)
-            next_scene.render(renderer)
-            renderer.reset_target()
-        else:
-            next_scene_surface = None
+        current_scene_surface = self._outgoing_surface(renderer, current_scene) if current_scene else None
+        next_scene_surface = self._render_to_surface(renderer, next_scene) if next_scene else None
         
         # 使用缩放效果渲染
         zoom_in = getattr(self.effect, 'zoom_in', getattr(self, 'zoom_in', True))
@@ -712,27 +764,18 @@ class TransitionEffectBridge(SceneTransition):
                 
                 # 恢复变换
                 renderer.restore_state()
+        
+        # 归还离屏表面
+        self._release_surface(renderer, current_scene_surface)
+        self._release_surface(renderer, next_scene_surface)
     
     def _render_flip_transition(self, renderer: RendererBase, current_scene: Any, next_scene: Any) -> None:
         """渲染翻转效果"""
         width, height = renderer.get_viewport_size()
         
         # 创建场景表面
-        if current_scene:
-            current_scene_surface = renderer.create_surface()
-            renderer.set_target(current_scene_surface)
-            current_scene.render(renderer)
-            renderer.reset_target()
-        else:
-            current_scene_surface = None
-            
-        if next_scene:
-            next_scene_surface = renderer.create_surface()
-            renderer.set_target(next_scene_surface)
-            next_scene.render(renderer)
-            renderer.reset_target()
-        else:
-            next_scene_surface = None
+        current_scene_surface = self._outgoing_surface(renderer, current_scene) if current_scene else None
+        next_scene_surface = self._render_to_surface(renderer, next_scene) if next_scene else None
         
         # 简化的翻转渲染
         try:
@@ -779,6 +822,10 @@ class TransitionEffectBridge(SceneTransition):
                 renderer.draw_surface(current_scene_surface, 0, 0)
             if next_scene_surface:
                 renderer.draw_surface(next_scene_surface, 0, 0)
+        
+        # 归还离屏表面
+        self._release_surface(renderer, current_scene_surface)
+        self._release_surface(renderer, next_scene_surface)
 
 class TransitionManager:
     """转场管理器，负责管理和提供转场效果"""
@@ -15,6 +15,9 @@ Changed history:
                             2025/05/13: 优化拖拽精度并通过TDD测试;
                             2025/05/13: 修复拖动功能有时不响应的问题;
                             2025/05/16: 修复窗口大小改变事件处理;
+                            2026/10/16: set_image跳过重复设置的同一图像，尺寸不变时不再调整窗口大小;
+                            2026/10/16: 移动事件的调试日志改为延迟格式化（位置变化事件由事件系统按帧合并）;
+                            2026/10/16: 添加 shown 信号，窗口重新显示时通知;
 ----
 """
 
@@ -25,7 +28,7 @@ from typing import Optional, Tuple
 from PySide6.QtWidgets import QMainWindow, QWidget, QApplication, QVBoxLayout, QLabel
 from PySide6.QtGui import (
     QPixmap, QPainter, QMouseEvent, QImage, QPaintEvent, QCursor,
-    QResizeEvent, QMoveEvent, Qt, QGuiApplication, QScreen
+    QResizeEvent, QMoveEvent, QShowEvent, Qt, QGuiApplication, QScreen
 )
 from PySide6.QtCore import QPoint, QSize, QRect, QTimer, Signal, Slot, QObject, QTime, QElapsedTimer
 
@@ -62,6 +65,7 @@ class MainPetWindow(QMainWindow):
     mouse_moved = Signal(QPoint)     # 鼠标移动信号，参数为鼠标位置
     size_changed = Signal(QSize)     # 大小改变信号，参数为新大小
     position_changed = Signal(QPoint)  # 位置改变信号，参数为新位置
+    shown = Signal()                 # 窗口显示信号（包括隐藏或最小化后重新显示）
     
     def __init__(self, parent=None):
         """初始化主窗口"""
@@ -90,6 +94,7 @@ class MainPetWindow(QMainWindow):
         
         # 初始化变量
         self.image = None  # 当前显示的图像
+        self._image_source = None  # 最近一次传给set_image的对象，用于跳过重复设置
         self.is_dragging = False  # 是否正在拖拽
         self.drag_start_pos = QPoint()  # 拖拽开始位置
         self.window_start_pos = QPoint()  # 窗口开始位置
@@ -152,6 +157,10 @@ class MainPetWindow(QMainWindow):
         Args:
             image: QImage、QPixmap或文件路径
         """
+        # 同一图像对象重复设置时无需重新上传像素和重绘
+        if image is self._image_source and self.image is not None and not isinstance(image, str):
+            return
+        
         logger.debug(f"MainPetWindow.set_image called with: {type(image)}, {image}")
         pixmap = None
         
@@ -171,11 +180,14 @@ class MainPetWindow(QMainWindow):
             return
         
         # 更新图像
+        size_changed = self.image is None or self.image.size() != pixmap.size()
         self.image = pixmap
+        self._image_source = image
         self.image_label.setPixmap(pixmap)
         
-        # 调整窗口大小以适应图像
-        self.resize_to_image()
+        # 只有尺寸变化时才调整窗口大小
+        if size_changed:
+            self.resize_to_image()
         
         # 更新
         self.update()
@@ -514,6 +526,17 @@ class MainPetWindow(QMainWindow):
         
         super().resizeEvent(event)
     
+    def showEvent(self, event: QShowEvent) -> None:
+        """窗口显示事件处理
+        
+        Args:
+            event: 显示事件
+        """
+        super().showEvent(event)
+        
+        # 发送显示信号
+        self.shown.emit()
+    
     def moveEvent(self, event: QMoveEvent) -> None:
         """窗口位置改变事件处理
         
@@ -535,7 +558,7 @@ class MainPetWindow(QMainWindow):
         
         # 通过适配器的 emit 方法发送事件，传递旧的 EventType 和新的事件实例作为数据
         em.emit(OldEventType.WINDOW_POSITION_CHANGED, new_event)
-        logger.debug(f"发送窗口位置变化事件 (via adapter.emit): pos={self.pos()}, size={self.size()}")
+        logger.debug("发送窗口位置变化事件 (via adapter.emit): pos=%s, size=%s", new_event.position, new_event.size)
         
         super().moveEvent(event)
 
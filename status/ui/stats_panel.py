@@ -10,6 +10,7 @@ Changed history:
                             2025/05/13: 初始创建;
                             2025/05/13: 添加展开/折叠功能和详细系统信息显示;
                             2025/05/13: 添加调试日志和临时样式修复;
+                            2026/10/16: 统计更新的调试日志改为延迟格式化;
 ----
 """
 
@@ -722,7 +723,8 @@ class StatsPanel(QWidget):
                 logger.error(f"StatsPanel received SYSTEM_STATS_UPDATED but event.data is not a dict: {type(stats_data_from_event)}. Event data: {str(stats_data_from_event)[:200]}")
                 return
 
-            logger.debug(f"StatsPanel received SYSTEM_STATS_UPDATED. Data keys: {list(stats_data_from_event.keys())}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("StatsPanel received SYSTEM_STATS_UPDATED. Data keys: %s", list(stats_data_from_event.keys()))
             
             self.update_data(stats_data_from_event) # This will call _update_detailed_info if expanded
             
@@ -0,0 +1,52 @@
+"""
+---------------------------------------------------------------
+File name:                  thread_invoker.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                将回调排队到创建者线程（通常是界面线程）中执行
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+----
+"""
+
+import logging
+from typing import Callable
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+logger = logging.getLogger(__name__)
+
+
+class ThreadInvoker(QObject):
+    """线程调用器
+
+    对象属于创建它的线程。在任意线程调用 post 时，回调通过Qt排队连接在该线程的事件循环中执行，
+    用于把后台线程的结果（如节流的尾随事件）交回界面线程处理。
+    """
+
+    _invoke = Signal(object)
+
+    def __init__(self, parent: QObject = None):
+        """初始化线程调用器（应在目标线程中创建）"""
+        super().__init__(parent)
+        self._invoke.connect(self._run)
+
+    def post(self, callback: Callable[[], None]) -> None:
+        """安排回调在本对象所属的线程中执行
+
+        Args:
+            callback: 无参回调
+        """
+        self._invoke.emit(callback)
+
+    @Slot(object)
+    def _run(self, callback: Callable[[], None]) -> None:
+        try:
+            callback()
+        except Exception as e:
+            logger.error(f"排队回调执行出错: {str(e)}", exc_info=True)
+
+
+__all__ = ['ThreadInvoker']
@@ -0,0 +1,59 @@
+"""
+---------------------------------------------------------------
+File name:                  test_animation_pixmap.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                测试动画按帧缓存的QPixmap
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+"""
+
+import unittest
+
+from PySide6.QtGui import QColor, QImage
+from PySide6.QtWidgets import QApplication
+
+from status.animation.animation import Animation
+
+app = QApplication.instance() or QApplication([])
+
+
+def _frame(color: QColor) -> QImage:
+    image = QImage(4, 4, QImage.Format.Format_ARGB32)
+    image.fill(color)
+    return image
+
+
+class TestAnimationPixmapCache(unittest.TestCase):
+
+    def test_pixmap_converted_once_per_frame(self):
+        """同一帧只转换一次QPixmap"""
+        animation = Animation(name="test", frames=[_frame(QColor("red")), _frame(QColor("blue"))])
+
+        first = animation.current_pixmap()
+        self.assertIs(animation.current_pixmap(), first)
+        self.assertEqual(first.toImage().pixelColor(0, 0), QColor("red"))
+
+        animation.next_frame()
+        self.assertEqual(animation.current_pixmap().toImage().pixelColor(0, 0), QColor("blue"))
+        self.assertIsNone(animation.get_pixmap_at_index(5))
+
+    def test_replaced_frame_is_reconverted(self):
+        """帧被替换后重新转换"""
+        animation = Animation(name="test", frames=[_frame(QColor("red"))])
+        old = animation.current_pixmap()
+
+        animation.frames[0] = _frame(QColor("green"))
+
+        new = animation.current_pixmap()
+        self.assertIsNot(new, old)
+        self.assertEqual(new.toImage().pixelColor(0, 0), QColor("green"))
+
+        animation.clear_pixmap_cache()
+        self.assertIsNot(animation.current_pixmap(), new)
+
+
+if __name__ == "__main__":
+    unittest.main()
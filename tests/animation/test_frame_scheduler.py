@@ -0,0 +1,93 @@
+"""
+---------------------------------------------------------------
+File name:                  test_frame_scheduler.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                测试自适应帧调度器
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+                            2026/10/16: 添加 request_frame 测试;
+"""
+
+import time
+import unittest
+
+from PySide6.QtCore import QTimer
+from PySide6.QtGui import QImage
+from PySide6.QtWidgets import QApplication
+
+from status.animation.animation import Animation
+from status.animation.frame_scheduler import FrameScheduler
+
+app = QApplication.instance() or QApplication([])
+
+
+def _animation(fps: int = 10) -> Animation:
+    return Animation(name="test", frames=[QImage(4, 4, QImage.Format.Format_ARGB32) for _ in range(2)], fps=fps)
+
+
+class TestFrameScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.timer = QTimer()
+        self.scheduler = FrameScheduler(self.timer, min_interval_ms=8, max_interval_ms=1000,
+                                        idle_interval_ms=1000, hidden_interval_ms=5000)
+
+    def tearDown(self):
+        self.timer.stop()
+
+    def test_timer_is_single_shot(self):
+        self.assertTrue(self.timer.isSingleShot())
+
+    def test_interval_follows_frame_deadline(self):
+        """播放中的动画按距下一帧的时间唤醒"""
+        animation = _animation(fps=10)
+        animation.play()
+        interval = self.scheduler.compute_interval(animation, visible=True)
+        self.assertGreater(interval, 50)
+        self.assertLessEqual(interval, 100)
+
+        # 已到期的帧立即唤醒（不低于最短间隔）
+        animation.last_frame_time = time.perf_counter() - 1.0
+        self.assertEqual(self.scheduler.compute_interval(animation, visible=True), 8)
+
+    def test_idle_and_hidden_intervals(self):
+        """没有动画播放或窗口隐藏时降到低频"""
+        animation = _animation()
+        self.assertIsNone(animation.time_to_next_frame())
+        self.assertEqual(self.scheduler.compute_interval(animation, visible=True), 1000)
+        self.assertEqual(self.scheduler.compute_interval(None, visible=True), 1000)
+
+        animation.play()
+        self.assertEqual(self.scheduler.compute_interval(animation, visible=False), 5000)
+
+    def test_deadline_caps_interval(self):
+        self.assertEqual(self.scheduler.compute_interval(None, visible=False, deadline_ms=1000), 1000)
+
+    def test_schedule_and_wake(self):
+        self.assertEqual(self.scheduler.schedule(None, visible=False), 5000)
+        self.assertTrue(self.timer.isActive())
+        self.assertGreater(self.timer.remainingTime(), 1000)
+
+        self.scheduler.wake()
+        self.assertTrue(self.timer.isActive())
+        self.assertEqual(self.timer.remainingTime(), 0)
+
+        self.scheduler.stop()
+        self.assertFalse(self.timer.isActive())
+
+    def test_request_frame_within_one_frame(self):
+        """request_frame 把较晚的更新提前到一帧之内，但不会推迟更早的更新"""
+        self.scheduler.schedule(None, visible=True)
+        self.scheduler.request_frame()
+        self.assertLessEqual(self.timer.remainingTime(), 16)
+
+        self.scheduler.wake()
+        self.scheduler.request_frame()
+        self.assertEqual(self.timer.remainingTime(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
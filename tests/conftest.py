@@ -10,6 +10,7 @@ Description:                Pytest配置文件，提供全局测试夹具和设
 Changed history:            
                             2025/04/01: 初始创建;
                             2025/05/15: 增加TDD和覆盖率支持;
+                            2026/10/16: 磁盘帧缓存默认目录重定向到临时目录;
 ----
 """
 
@@ -130,6 +131,13 @@ def test_env():
     os.environ.clear()
     os.environ.update(old_env)
 
+# 隔离磁盘帧缓存
+@pytest.fixture(autouse=True)
+def isolate_frame_cache(tmp_path, monkeypatch):
+    """将磁盘帧缓存的默认目录重定向到临时目录，避免写入用户主目录或读取过期缓存"""
+    from status.resources import frame_cache
+    monkeypatch.setattr(frame_cache, "DEFAULT_CACHE_DIR", str(tmp_path / "frames"))
+
 # 简单的模拟事件系统，避免导入错误
 class MockEventSystem:
     def __init__(self):
@@ -0,0 +1,84 @@
+"""
+---------------------------------------------------------------
+File name:                  bench_event_emit.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                EventManager.emit 微基准测试，测量不同订阅数量下单次发出事件的耗时
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+----
+
+用法:
+    python tests/events/bench_event_emit.py [--iterations N]
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+from typing import Dict, Sequence
+
+# 将项目根目录添加到sys.path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.absolute()
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from status.events.event_manager import EventManager
+from status.events.event_types import EventPriority
+
+EVENT_TYPE = "bench.event"
+PRIORITIES = (EventPriority.HIGH, EventPriority.NORMAL, EventPriority.LOW)
+
+
+def _handler(event_type, event_data) -> None:
+    pass
+
+
+def measure_emit(subscriber_count: int, iterations: int = 10000, wildcards: int = 1) -> float:
+    """测量单次 emit 的平均耗时
+
+    Args:
+        subscriber_count: 订阅该事件类型的处理器数量
+        iterations: 发出事件的次数
+        wildcards: 额外的通配符订阅数量
+
+    Returns:
+        float: 每次 emit 的平均耗时（微秒）
+    """
+    manager = EventManager()
+    manager.unsubscribe_all()
+    try:
+        for i in range(subscriber_count):
+            manager.subscribe(EVENT_TYPE, _handler, priority=PRIORITIES[i % len(PRIORITIES)])
+        for _ in range(wildcards):
+            manager.subscribe("*", _handler)
+        event_data = {"value": 1}
+        seconds = timeit.timeit(lambda: manager.emit(EVENT_TYPE, event_data), number=iterations)
+    finally:
+        manager.unsubscribe_all()
+    return seconds / iterations * 1e6
+
+
+def run_benchmark(counts: Sequence[int] = (1, 10, 100), iterations: int = 10000) -> Dict[int, float]:
+    """对每个订阅数量运行基准测试
+
+    Returns:
+        Dict[int, float]: 订阅数量到每次 emit 平均耗时（微秒）的映射
+    """
+    return {count: measure_emit(count, iterations) for count in counts}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="EventManager.emit 微基准测试")
+    parser.add_argument("--iterations", type=int, default=10000, help="每组发出事件的次数")
+    args = parser.parse_args()
+
+    print(f"{'订阅数':>8}  {'每次emit(us)':>14}  {'每个订阅(us)':>14}")
+    for count, micros in run_benchmark(iterations=args.iterations).items():
+        print(f"{count:>8}  {micros:>14.2f}  {micros / (count + 1):>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
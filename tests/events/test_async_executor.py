@@ -0,0 +1,185 @@
+"""
+---------------------------------------------------------------
+File name:                  test_async_executor.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                测试有界、带优先级的异步事件执行器
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+----
+"""
+
+import threading
+import time
+import unittest
+
+from status.events.async_executor import AsyncEventExecutor
+from status.events.event_manager import EventManager
+from status.events.event_types import EventPriority, OverflowPolicy
+
+
+class TestAsyncEventExecutor(unittest.TestCase):
+
+    def setUp(self):
+        self.executor = AsyncEventExecutor(max_workers=1, max_pending=4)
+        self.results = []
+        self.gate = threading.Event()
+
+    def tearDown(self):
+        self.gate.set()
+        self.executor.shutdown(wait=True, timeout=1.0, cancel_pending=True)
+
+    def _block_worker(self):
+        """提交一个阻塞唯一工作线程的任务，使后续任务留在队列中"""
+        started = threading.Event()
+
+        def blocker():
+            started.set()
+            self.gate.wait(1.0)
+
+        self.executor.submit(blocker, lane="blocker")
+        self.assertTrue(started.wait(1.0))
+
+    def _drain(self):
+        self.gate.set()
+        self.executor.shutdown(wait=True, timeout=1.0)
+
+    def test_priority_order(self):
+        self._block_worker()
+        self.executor.submit(self.results.append, "low", priority=EventPriority.LOW.value)
+        self.executor.submit(self.results.append, "high", priority=EventPriority.HIGH.value)
+        self.executor.submit(self.results.append, "normal", priority=EventPriority.NORMAL.value)
+        self._drain()
+        self.assertEqual(self.results, ["high", "normal", "low"])
+
+    def test_lane_runs_serially_in_order(self):
+        executor = AsyncEventExecutor(max_workers=4, max_pending=100)
+        active = []
+        overlap = []
+
+        def handler(value):
+            active.append(value)
+            if len(active) > 1:
+                overlap.append(value)
+            time.sleep(0.001)
+            self.results.append(value)
+            active.remove(value)
+
+        for i in range(20):
+            executor.submit(handler, i, lane="subscription")
+        executor.shutdown(wait=True, timeout=2.0)
+
+        self.assertEqual(self.results, list(range(20)))
+        self.assertEqual(overlap, [])
+
+    def test_drop_oldest_bounds_queue(self):
+        self._block_worker()
+        for i in range(10):
+            self.executor.submit(self.results.append, i)
+        stats = self.executor.get_stats()
+        self.assertEqual(stats["pending"], 4)
+        self.assertEqual(stats["dropped"], 6)
+
+        self._drain()
+        self.assertEqual(self.results, [6, 7, 8, 9])
+
+    def test_drop_prefers_lowest_priority(self):
+        self._block_worker()
+        self.executor.submit(self.results.append, "high", priority=EventPriority.HIGH.value)
+        for i in range(4):
+            self.executor.submit(self.results.append, i, priority=EventPriority.LOW.value)
+        self._drain()
+        self.assertEqual(self.results, ["high", 1, 2, 3])
+
+    def test_coalesce_keeps_latest(self):
+        self._block_worker()
+        for i in range(100):
+            self.executor.submit(self.results.append, i, lane="stats", coalesce_key="SYSTEM_STATS_UPDATED")
+        stats = self.executor.get_stats()
+        self.assertEqual(stats["pending"], 1)
+        self.assertEqual(stats["coalesced"], 99)
+
+        self._drain()
+        self.assertEqual(self.results, [99])
+
+    def test_block_waits_for_free_slot(self):
+        self.executor.overflow = OverflowPolicy.BLOCK
+        self.executor.block_timeout = 2.0
+        self._block_worker()
+        for i in range(4):
+            self.executor.submit(self.results.append, i)
+
+        threading.Timer(0.05, self.gate.set).start()
+        self.executor.submit(self.results.append, 4)
+        self.executor.shutdown(wait=True, timeout=1.0)
+
+        self.assertEqual(self.results, [0, 1, 2, 3, 4])
+        self.assertEqual(self.executor.get_stats()["dropped"], 0)
+
+    def test_block_times_out_and_drops(self):
+        self.executor.overflow = OverflowPolicy.BLOCK
+        self.executor.block_timeout = 0.01
+        self._block_worker()
+        for i in range(5):
+            self.executor.submit(self.results.append, i)
+        self.assertEqual(self.executor.get_stats()["dropped"], 1)
+
+    def test_stats_and_failures(self):
+        def fail():
+            raise ValueError("boom")
+
+        self.executor.submit(fail)
+        self.executor.submit(self.results.append, 1)
+        self.executor.shutdown(wait=True, timeout=1.0)
+
+        stats = self.executor.get_stats()
+        self.assertEqual(stats["submitted"], 2)
+        self.assertEqual(stats["completed"], 1)
+        self.assertEqual(stats["failed"], 1)
+        self.assertEqual(stats["workers"], 0)
+        self.assertGreaterEqual(stats["max_latency_ms"], stats["avg_latency_ms"])
+
+
+class TestEventManagerAsyncExecutor(unittest.TestCase):
+
+    def setUp(self):
+        self.event_manager = EventManager()
+        self.event_manager.unsubscribe_all()
+        self.executor = AsyncEventExecutor(max_workers=1, max_pending=8)
+        self.original_executor = self.event_manager.async_executor
+        self.event_manager.async_executor = self.executor
+
+    def tearDown(self):
+        self.executor.shutdown(wait=True, timeout=1.0, cancel_pending=True)
+        self.event_manager.async_executor = self.original_executor
+        self.event_manager.unsubscribe_all()
+
+    def test_stats_burst_is_coalesced(self):
+        received = []
+        gate = threading.Event()
+
+        def handler(event_type, event_data):
+            gate.wait(1.0)
+            received.append(event_data["seq"])
+
+        self.event_manager.subscribe("SYSTEM_STATS_UPDATED", handler, is_async=True)
+        for i in range(1000):
+            self.event_manager.emit("SYSTEM_STATS_UPDATED", {"seq": i})
+
+        self.assertLessEqual(self.executor.get_stats()["pending"], 1)
+        gate.set()
+        self.executor.shutdown(wait=True, timeout=1.0)
+        self.assertEqual(received[-1], 999)
+        self.assertLessEqual(len(received), 2)
+
+    def test_configure_async_executor(self):
+        self.event_manager.configure_async_executor(max_pending=2, overflow=OverflowPolicy.COALESCE)
+        self.assertEqual(self.executor.max_pending, 2)
+        self.assertEqual(self.executor.overflow, OverflowPolicy.COALESCE)
+        self.assertEqual(self.event_manager.get_async_stats()["max_pending"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
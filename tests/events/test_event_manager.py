@@ -8,16 +8,19 @@ Description:                测试事件管理器
 
 Changed history:            
                             2025/05/14: 初始创建;
+                            2026/10/16: 通过 unsubscribe_all 清理订阅，添加分发表和基准测试脚本的测试;
 ----
 """
 
 import unittest
 import time
+import logging
 import threading
 from unittest.mock import MagicMock
 
 from status.events.event_manager import EventManager, EventSubscription
 from status.events.event_types import EventPriority, ThrottleMode
+from tests.events import bench_event_emit
 
 
 class TestEventSubscription(unittest.TestCase):
@@ -134,9 +137,8 @@ class TestEventManager(unittest.TestCase):
         """测试前准备"""
         self.event_manager = EventManager()
         
-        # 清空现有数据
-        self.event_manager.subscriptions.clear()
-        self.event_manager.wildcard_subscriptions.clear()
+        # 清空现有数据（通过 unsubscribe_all 使分发表同步清空）
+        self.event_manager.unsubscribe_all()
         self.event_manager.registered_event_types.clear()
         
         # 停止任何可能运行的异步线程
@@ -515,6 +517,58 @@ class TestEventManager(unittest.TestCase):
         self.assertEqual(self.event_manager.get_subscription_count("event2"), 1)
         self.assertEqual(self.event_manager.get_subscription_count("*"), 1)
         self.assertEqual(self.event_manager.get_subscription_count("nonexistent"), 0)
+    
+    def test_dispatch_table_merges_wildcards(self):
+        """测试分发表按优先级合并通配符订阅，同优先级时特定订阅在前"""
+        call_order = []
+        
+        def make_handler(name):
+            def handler(_, __):
+                call_order.append(name)
+            return handler
+        
+        self.event_manager.subscribe(self.event_type, make_handler("normal"))
+        wildcard = self.event_manager.subscribe("*", make_handler("wildcard"))
+        self.event_manager.subscribe("*", make_handler("wildcard_high"), priority=EventPriority.HIGH)
+        self.event_manager.subscribe(self.event_type, make_handler("low"), priority=EventPriority.LOW)
+        
+        self.event_manager.emit(self.event_type, self.event_data)
+        self.assertEqual(call_order, ["wildcard_high", "normal", "wildcard", "low"])
+        
+        # 取消通配符订阅后分发表随之重建
+        call_order.clear()
+        self.event_manager.unsubscribe(wildcard)
+        self.event_manager.emit(self.event_type, self.event_data)
+        self.event_manager.emit("other.event", self.event_data)
+        self.assertEqual(call_order, ["wildcard_high", "normal", "low", "wildcard_high"])
+    
+    def test_emit_does_not_format_payload_without_debug(self):
+        """测试未启用DEBUG日志时不格式化事件数据"""
+        formatted = []
+        
+        class Payload(dict):
+            def __repr__(self):
+                formatted.append(True)
+                return "payload"
+            __str__ = __repr__
+        
+        payload = Payload()
+        self.event_manager.subscribe(self.event_type, self.handler)
+        
+        self.event_manager.logger.setLevel(logging.INFO)
+        try:
+            self.event_manager.emit(self.event_type, payload)
+        finally:
+            self.event_manager.logger.setLevel(logging.NOTSET)
+        
+        self.handler.assert_called_once_with(self.event_type, payload)
+        self.assertEqual(formatted, [])
+    
+    def test_emit_benchmark_runs(self):
+        """测试微基准脚本可以运行"""
+        results = bench_event_emit.run_benchmark(counts=(1, 10), iterations=10)
+        self.assertEqual(set(results), {1, 10})
+        self.assertEqual(self.event_manager.get_subscription_count(), 0)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,129 @@
+"""
+---------------------------------------------------------------
+File name:                  test_frame_coalescing.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                测试事件管理器的按帧合并
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+                            2026/10/16: 合并声明改为可单独取消的对象;
+----
+"""
+
+import unittest
+from unittest.mock import MagicMock
+
+from PySide6.QtCore import QPoint, QSize
+
+from status.core.event_system import EventType
+from status.core.events import WindowPositionChangedEvent
+from status.events.event_manager import EventManager
+from status.events.legacy_adapter import LegacyEventManagerAdapter
+
+
+class TestFrameCoalescing(unittest.TestCase):
+
+    def setUp(self):
+        self.event_manager = EventManager()
+        self.event_manager.unsubscribe_all()
+        self.event_manager.flush_coalesced()
+        self.handler = MagicMock()
+        self.requester = MagicMock()
+        self.declarations = []
+
+    def tearDown(self):
+        for coalescing in self.declarations:
+            self.event_manager.stop_coalescing(coalescing)
+        self.event_manager.flush_coalesced()
+        self.event_manager.unsubscribe_all()
+
+    def coalesce(self, event_type, key=None):
+        coalescing = self.event_manager.coalesce_per_frame(event_type, key=key, requester=self.requester)
+        self.declarations.append(coalescing)
+        return coalescing
+
+    def test_latest_event_delivered_once_per_flush(self):
+        self.coalesce("ui.move")
+        self.event_manager.subscribe("ui.move", self.handler)
+
+        for x in range(144):
+            self.event_manager.emit("ui.move", {"x": x})
+        self.handler.assert_not_called()
+        self.requester.assert_called_once()
+
+        self.assertEqual(self.event_manager.flush_coalesced(), 1)
+        self.handler.assert_called_once_with("ui.move", {"x": 143})
+        self.assertEqual(self.event_manager.flush_coalesced(), 0)
+
+        # 下一帧的第一个事件再次请求帧更新
+        self.event_manager.emit("ui.move", {"x": 0})
+        self.assertEqual(self.requester.call_count, 2)
+
+    def test_key_function_keeps_one_event_per_key(self):
+        self.coalesce("ui.move", key=lambda data: data["window"])
+        self.event_manager.subscribe("ui.move", self.handler)
+
+        self.event_manager.emit("ui.move", {"window": "a", "x": 1})
+        self.event_manager.emit("ui.move", {"window": "b", "x": 1})
+        self.event_manager.emit("ui.move", {"window": "a", "x": 2})
+        self.event_manager.flush_coalesced()
+
+        delivered = [call.args[1] for call in self.handler.call_args_list]
+        self.assertEqual(delivered, [{"window": "b", "x": 1}, {"window": "a", "x": 2}])
+
+    def test_other_event_types_are_immediate(self):
+        self.coalesce("ui.move")
+        self.event_manager.subscribe("ui.hover", self.handler)
+
+        self.event_manager.emit("ui.hover", {"x": 1})
+        self.handler.assert_called_once()
+        self.requester.assert_not_called()
+
+    def test_stop_coalescing_delivers_pending_events(self):
+        coalescing = self.coalesce("ui.move")
+        self.event_manager.subscribe("ui.move", self.handler)
+
+        self.event_manager.emit("ui.move", {"x": 1})
+        self.handler.assert_not_called()
+        self.assertTrue(self.event_manager.stop_coalescing(coalescing))
+        self.handler.assert_called_once_with("ui.move", {"x": 1})
+        self.assertFalse(self.event_manager.stop_coalescing(coalescing))
+
+        # 取消后恢复立即分发
+        self.event_manager.emit("ui.move", {"x": 2})
+        self.assertEqual(self.handler.call_count, 2)
+
+    def test_type_stays_coalesced_until_last_declaration_stops(self):
+        first = self.coalesce("ui.move")
+        second = self.coalesce("ui.move")
+        self.event_manager.subscribe("ui.move", self.handler)
+
+        self.event_manager.stop_coalescing(first)
+        self.event_manager.emit("ui.move", {"x": 1})
+        self.handler.assert_not_called()
+
+        self.event_manager.stop_coalescing(second)
+        self.handler.assert_called_once_with("ui.move", {"x": 1})
+
+    def test_legacy_window_position_events(self):
+        event_type = EventType.WINDOW_POSITION_CHANGED
+        adapter = LegacyEventManagerAdapter.get_instance()
+        received = []
+        adapter.register_handler(event_type, received.append)
+        coalescing = self.event_manager.coalesce_per_frame(event_type.name)
+        try:
+            for x in range(10):
+                adapter.emit(event_type, WindowPositionChangedEvent(position=QPoint(x, 0), size=QSize(10, 10)))
+            self.event_manager.flush_coalesced()
+        finally:
+            self.event_manager.stop_coalescing(coalescing)
+            adapter.unregister_handler(event_type, received.append)
+
+        self.assertEqual(len(received), 1)
+        self.assertEqual(received[0].data.position, QPoint(9, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+"""
+---------------------------------------------------------------
+File name:                  test_legacy_adapter.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                测试旧版事件系统适配器的事件路由
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+----
+"""
+
+import logging
+import unittest
+from unittest.mock import MagicMock
+
+from PySide6.QtCore import QPoint, QSize
+
+from status.core.event_system import Event, EventType
+from status.core.events import SystemStatsUpdatedEvent, WindowPositionChangedEvent
+from status.events.event_manager import EventManager
+from status.events.legacy_adapter import LegacyEventManagerAdapter
+
+
+class _CountingStr:
+    """记录被格式化次数的载荷"""
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return "payload"
+
+
+class TestLegacyAdapterRouting(unittest.TestCase):
+
+    def setUp(self):
+        EventManager().unsubscribe_all()
+        self.adapter = LegacyEventManagerAdapter.get_instance()
+        self.adapter._registered_handlers.clear()
+        self.received = []
+        self.handler = self.received.append
+
+    def tearDown(self):
+        self.adapter.unregister_all_handlers()
+        EventManager().unsubscribe_all()
+
+    def test_stats_event_passes_dict_by_reference(self):
+        self.adapter.register_handler(EventType.SYSTEM_STATS_UPDATED, self.handler)
+        stats = {"cpu": 10, "memory": 20}
+        sender = object()
+
+        self.adapter.emit(EventType.SYSTEM_STATS_UPDATED, SystemStatsUpdatedEvent(stats, sender=sender))
+
+        self.assertEqual(len(self.received), 1)
+        event = self.received[0]
+        self.assertIs(event.type, EventType.SYSTEM_STATS_UPDATED)
+        self.assertIs(event.data, stats)
+        self.assertIs(event.sender, sender)
+
+    def test_window_event_is_payload(self):
+        self.adapter.register_handler(EventType.WINDOW_POSITION_CHANGED, self.handler)
+        window_event = WindowPositionChangedEvent(position=QPoint(1, 2), size=QSize(3, 4))
+
+        self.adapter.emit(EventType.WINDOW_POSITION_CHANGED, window_event)
+
+        self.assertIs(self.received[0].data, window_event)
+
+    def test_handlers_share_one_event(self):
+        other = []
+        self.adapter.register_handler(EventType.SYSTEM_STATS_UPDATED, self.handler)
+        self.adapter.register_handler(EventType.SYSTEM_STATS_UPDATED, other.append)
+
+        self.adapter.emit(EventType.SYSTEM_STATS_UPDATED, {"cpu": 1})
+
+        self.assertIs(self.received[0], other[0])
+        self.assertEqual(self.received[0].data, {"cpu": 1})
+
+    def test_old_event_is_unwrapped(self):
+        self.adapter.register_handler(EventType.SCENE_CHANGE, self.handler)
+        sender = object()
+        stats = {"cpu": 1}
+
+        self.adapter.emit(EventType.SCENE_CHANGE, Event(EventType.SCENE_CHANGE, sender, "data"))
+        self.adapter.emit(EventType.SCENE_CHANGE, Event(EventType.SCENE_CHANGE, sender, SystemStatsUpdatedEvent(stats)))
+
+        self.assertEqual([event.data for event in self.received], ["data", stats])
+        self.assertIs(self.received[0].sender, sender)
+
+    def test_dispatch_passes_event_through(self):
+        self.adapter.register_handler(EventType.SCENE_CHANGE, self.handler)
+        event = Event(EventType.SCENE_CHANGE, None, {"scene": "main"})
+
+        self.adapter.dispatch(event)
+
+        self.assertIs(self.received[0], event)
+
+    def test_async_subscriber_receives_copy(self):
+        manager = EventManager()
+        manager.async_executor.submit = MagicMock()
+        try:
+            manager.subscribe("SCENE_CHANGE", MagicMock(), is_async=True)
+            event = Event(EventType.SCENE_CHANGE, None, "data")
+            self.adapter.dispatch(event)
+
+            queued = manager.async_executor.submit.call_args.args[2]
+            self.assertIsNot(queued, event)
+            self.assertEqual(queued.data, "data")
+        finally:
+            del manager.async_executor.submit
+
+    def test_payload_not_formatted_without_debug(self):
+        self.adapter.register_handler(EventType.SYSTEM_STATS_UPDATED, self.handler)
+        payload = _CountingStr()
+        level = self.adapter.logger.level
+        self.adapter.logger.setLevel(logging.INFO)
+        try:
+            self.adapter.emit(EventType.SYSTEM_STATS_UPDATED, payload)
+        finally:
+            self.adapter.logger.setLevel(level)
+
+        self.assertIs(self.received[0].data, payload)
+        self.assertEqual(payload.formatted, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+"""
+---------------------------------------------------------------
+File name:                  test_throttle_scheduler.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                测试节流定时调度器和事件管理器的尾随事件投递
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+                            2026/10/16: 测试尾随事件交回发出事件的线程;
+----
+"""
+
+import threading
+import time
+import unittest
+
+from status.events.event_manager import EventManager
+from status.events.event_types import ThrottleMode
+from status.events.throttle_scheduler import ThrottleScheduler
+
+
+class TestThrottleScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = ThrottleScheduler()
+        self.fired = []
+
+    def tearDown(self):
+        self.scheduler.shutdown(wait=True, timeout=1.0)
+
+    def test_fires_at_deadline_in_order(self):
+        done = threading.Event()
+        now = time.time()
+        self.scheduler.schedule("b", now + 0.06, lambda: (self.fired.append(("b", time.time())), done.set()))
+        self.scheduler.schedule("a", now + 0.03, lambda: self.fired.append(("a", time.time())))
+
+        self.assertTrue(done.wait(1.0))
+        self.assertEqual([key for key, _ in self.fired], ["a", "b"])
+        self.assertGreaterEqual(self.fired[0][1], now + 0.03)
+        self.assertLess(self.fired[1][1], now + 0.06 + 0.05)
+
+    def test_one_timer_per_key(self):
+        deadline = time.time() + 10
+        self.assertTrue(self.scheduler.schedule("key", deadline, self.fired.append, 1))
+        self.assertFalse(self.scheduler.schedule("key", deadline, self.fired.append, 2))
+        self.assertEqual(self.scheduler.get_stats()["armed"], 1)
+
+    def test_cancelled_timer_does_not_fire(self):
+        deadline = time.time() + 0.03
+        self.scheduler.schedule("a", deadline, self.fired.append, "a")
+        self.scheduler.schedule("b", deadline, self.fired.append, "b")
+        self.assertTrue(self.scheduler.cancel("a"))
+
+        time.sleep(0.1)
+        self.assertEqual(self.fired, ["b"])
+        self.assertFalse(self.scheduler.is_armed("b"))
+
+    def test_run_due_skips_future_timers(self):
+        self.scheduler.schedule("a", time.time() + 10, self.fired.append, "a")
+        self.assertEqual(self.scheduler.run_due(), 0)
+        self.assertTrue(self.scheduler.is_armed("a"))
+
+    def test_idle_thread_exits_on_shutdown(self):
+        self.scheduler.schedule("a", time.time(), self.fired.append, "a")
+        self.scheduler.shutdown(wait=True, timeout=1.0)
+        self.assertFalse(self.scheduler.get_stats()["running"])
+
+
+class TestThrottledTrailingEvents(unittest.TestCase):
+
+    def setUp(self):
+        self.event_manager = EventManager()
+        self.event_manager.unsubscribe_all()
+        self.calls = []
+        self.delivered = threading.Event()
+
+    def tearDown(self):
+        self.event_manager.unsubscribe_all()
+
+    def _handler(self, event_type, event_data):
+        self.calls.append((event_data["seq"], time.time()))
+        if len(self.calls) >= 2:
+            self.delivered.set()
+
+    def test_last_delivered_at_deadline_without_polling(self):
+        subscription = self.event_manager.subscribe("test.throttle", self._handler,
+                                                    throttle=(ThrottleMode.LAST, 0.1))
+        for seq in range(1, 4):
+            self.event_manager.emit("test.throttle", {"seq": seq})
+
+        self.assertTrue(self.delivered.wait(1.0))
+        self.assertEqual([seq for seq, _ in self.calls], [1, 3])
+        deadline = self.calls[0][1] + 0.1
+        self.assertGreaterEqual(self.calls[1][1], deadline - 0.01)
+        self.assertLess(self.calls[1][1], deadline + 0.05)
+        self.assertIsNone(subscription.queued_event)
+
+    def test_rate_keeps_firing_at_interval(self):
+        self.event_manager.subscribe("test.throttle", self._handler, throttle=(ThrottleMode.RATE, 0.05))
+        self.event_manager.emit("test.throttle", {"seq": 1})
+        self.event_manager.emit("test.throttle", {"seq": 2})
+        self.assertTrue(self.delivered.wait(1.0))
+
+        # 刚投递过排队事件，新事件仍需等待一个间隔
+        self.event_manager.emit("test.throttle", {"seq": 3})
+        self.assertEqual(len(self.calls), 2)
+        time.sleep(0.2)
+        self.assertEqual([seq for seq, _ in self.calls], [1, 2, 3])
+
+    def test_trailing_event_handed_back_to_dispatcher_thread(self):
+        handed_back = []
+        emitter = threading.get_ident()
+        self.event_manager.set_thread_dispatcher(emitter, handed_back.append)
+        try:
+            threads = []
+            self.event_manager.subscribe(
+                "test.throttle", lambda event_type, data: threads.append(threading.get_ident()),
+                throttle=(ThrottleMode.LAST, 0.05))
+            self.event_manager.emit("test.throttle", {"seq": 1})
+            self.event_manager.emit("test.throttle", {"seq": 2})
+            time.sleep(0.2)
+
+            # 调度线程只交回投递，不直接调用处理器
+            self.assertEqual(len(threads), 1)
+            self.assertEqual(len(handed_back), 1)
+            handed_back[0]()
+            self.assertEqual(threads, [emitter, emitter])
+        finally:
+            self.event_manager.set_thread_dispatcher(emitter, None)
+
+    def test_unsubscribe_cancels_pending_event(self):
+        subscription = self.event_manager.subscribe("test.throttle", self._handler,
+                                                    throttle=(ThrottleMode.LAST, 0.05))
+        self.event_manager.emit("test.throttle", {"seq": 1})
+        self.event_manager.emit("test.throttle", {"seq": 2})
+        self.assertTrue(self.event_manager.throttle_scheduler.is_armed(subscription.id))
+
+        self.event_manager.unsubscribe(subscription)
+        self.assertFalse(self.event_manager.throttle_scheduler.is_armed(subscription.id))
+        time.sleep(0.1)
+        self.assertEqual(len(self.calls), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
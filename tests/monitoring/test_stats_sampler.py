@@ -0,0 +1,94 @@
+"""
+---------------------------------------------------------------
+File name:                  test_stats_sampler.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                系统统计后台采样器的测试
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+"""
+
+import time
+import threading
+import unittest
+
+from status.monitoring.stats_sampler import MetricGroup, StatsSampler, default_metric_groups
+
+
+class CountingCollector:
+    """记录调用次数和调用线程的采样函数"""
+
+    def __init__(self, key: str):
+        self.key = key
+        self.calls = 0
+        self.threads = set()
+
+    def __call__(self):
+        self.calls += 1
+        self.threads.add(threading.current_thread().name)
+        return {self.key: self.calls}
+
+
+class TestStatsSampler(unittest.TestCase):
+
+    def test_sample_now_merges_groups_into_new_snapshot(self):
+        """立即采样合并各组结果，每次发布新的只读快照"""
+        fast, slow = CountingCollector("cpu"), CountingCollector("disk")
+        sampler = StatsSampler([MetricGroup("fast", 1.0, fast), MetricGroup("slow", 10.0, slow)])
+        self.assertEqual(sampler.get_snapshot().version, 0)
+
+        first = sampler.sample_now()
+        second = sampler.sample_now(["fast"])
+
+        self.assertEqual((first.version, second.version), (1, 2))
+        self.assertEqual(dict(first.data), {"cpu": 1, "disk": 1})
+        self.assertEqual(dict(second.data), {"cpu": 2, "disk": 1})
+        self.assertIs(sampler.get_snapshot(), second)
+        with self.assertRaises(TypeError):
+            second.data["cpu"] = 0
+        copied = second.to_dict()
+        copied["cpu"] = 0
+        self.assertEqual(second.data["cpu"], 2)
+
+    def test_failing_group_does_not_block_others(self):
+        """单个指标组失败不影响其他组"""
+        def broken():
+            raise RuntimeError("psutil failed")
+
+        sampler = StatsSampler([MetricGroup("broken", 1.0, broken),
+                                MetricGroup("ok", 1.0, CountingCollector("memory"))])
+        snapshot = sampler.sample_now()
+
+        self.assertEqual(dict(snapshot.data), {"memory": 1})
+        self.assertIn("ok", snapshot.updated_at)
+        self.assertNotIn("broken", snapshot.updated_at)
+
+    def test_worker_thread_respects_group_intervals(self):
+        """采样在工作线程中进行，快速组采样次数多于慢速组"""
+        fast, slow = CountingCollector("cpu"), CountingCollector("calendar")
+        sampler = StatsSampler([MetricGroup("fast", 0.02, fast), MetricGroup("slow", 60.0, slow)])
+
+        sampler.start()
+        deadline = time.monotonic() + 5
+        while fast.calls < 5 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        sampler.stop()
+
+        self.assertGreaterEqual(fast.calls, 5)
+        self.assertEqual(slow.calls, 1)
+        self.assertEqual(fast.threads, {"StatsSampler"})
+        self.assertFalse(sampler.is_running())
+        self.assertEqual(sampler.get_snapshot().data["calendar"], 1)
+
+    def test_default_groups(self):
+        """默认指标组按采样开销从快到慢排列"""
+        groups = {group.name: group.interval for group in default_metric_groups()}
+        self.assertEqual(set(groups), {"cpu_memory", "io", "gpu", "disk", "calendar"})
+        self.assertLess(groups["cpu_memory"], groups["disk"])
+        self.assertEqual(groups["calendar"], 60.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
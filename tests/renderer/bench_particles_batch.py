@@ -0,0 +1,103 @@
+"""
+---------------------------------------------------------------
+File name:                  bench_particles_batch.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                PySideRenderer.draw_particles_batch 微基准测试，与基类逐个 draw_circle 的实现对比
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+----
+
+用法:
+    python tests/renderer/bench_particles_batch.py [--particles N] [--frames N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+# 将项目根目录添加到sys.path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.absolute()
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+from status.renderer.pyside_renderer import PySideRenderer
+from status.renderer.renderer_base import RendererBase
+
+WIDTH, HEIGHT = 800, 600
+
+
+def make_columns(count: int, seed: int = 1) -> List[List[float]]:
+    """生成随机粒子列（位置、半径、少量颜色、连续变化的透明度）"""
+    rng = random.Random(seed)
+    palette = [(255, 200, 0), (255, 120, 0), (255, 255, 255)]
+    colors = [rng.choice(palette) for _ in range(count)]
+    return [
+        [rng.uniform(0, WIDTH) for _ in range(count)],
+        [rng.uniform(0, HEIGHT) for _ in range(count)],
+        [rng.uniform(1, 6) for _ in range(count)],
+        [c[0] for c in colors],
+        [c[1] for c in colors],
+        [c[2] for c in colors],
+        [rng.uniform(0, 255) for _ in range(count)],
+    ]
+
+
+def measure(draw, renderer: PySideRenderer, columns: Sequence[Sequence[float]], frames: int,
+            filled: bool) -> float:
+    """测量每帧绘制全部粒子的平均耗时（毫秒）"""
+    renderer.begin_frame()
+    try:
+        draw(renderer, *columns, filled=filled)  # 预热（粒子精灵缓存）
+        seconds = timeit.timeit(lambda: draw(renderer, *columns, filled=filled), number=frames)
+    finally:
+        renderer.end_frame()
+    return seconds / frames * 1000
+
+
+def run_benchmark(particles: int = 2000, frames: int = 20) -> Dict[str, float]:
+    """对批量实现和基类实现分别运行基准测试
+
+    Returns:
+        Dict[str, float]: 实现名称到每帧平均耗时（毫秒）的映射
+    """
+    app = QApplication.instance() or QApplication([])
+    renderer = PySideRenderer()
+    renderer.initialize(WIDTH, HEIGHT)
+    columns = make_columns(particles)
+    results = {}
+    try:
+        for filled in (True, False):
+            suffix = "填充" if filled else "轮廓"
+            results[f"batch/{suffix}"] = measure(PySideRenderer.draw_particles_batch, renderer,
+                                                 columns, frames, filled)
+            results[f"draw_circle/{suffix}"] = measure(RendererBase.draw_particles_batch, renderer,
+                                                       columns, frames, filled)
+    finally:
+        renderer.shutdown()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="draw_particles_batch 微基准测试")
+    parser.add_argument("--particles", type=int, default=2000, help="粒子数量")
+    parser.add_argument("--frames", type=int, default=20, help="每组绘制的帧数")
+    args = parser.parse_args()
+
+    print(f"{'实现':>18}  {'每帧(ms)':>10}")
+    for name, millis in run_benchmark(args.particles, args.frames).items():
+        print(f"{name:>18}  {millis:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+---------------------------------------------------------------
+File name:                  test_dirty_region.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                测试脏矩形跟踪和PySide渲染器的局部重绘
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+                            2026/10/16: 测试未启用跟踪时不记录变化、内容改变时重绘;
+----
+"""
+
+import unittest
+from unittest.mock import MagicMock
+
+from PySide6.QtGui import QColor, QPixmap
+from PySide6.QtWidgets import QApplication
+
+from status.renderer.dirty_region import DirtyRegion
+from status.renderer.drawable import Drawable
+from status.renderer.primitives import Rectangle
+from status.renderer.pyside_renderer import PySideRenderer
+from status.renderer.renderer_base import Color, Rect
+from status.renderer.sprite import Sprite
+
+app = QApplication.instance() or QApplication([])
+
+
+class _Box(Drawable):
+    """用于测试的可绘制对象"""
+
+    dirty_region = DirtyRegion()
+
+    def draw(self, renderer):
+        renderer.draw_rect(self.world_rect, Color(255, 0, 0), filled=True)
+
+
+class _ImageSprite(Sprite):
+    """绘制当前图像的精灵"""
+
+    def draw(self, renderer):
+        renderer.draw_image(self.image, self.x, self.y, source_rect=self.source_rect)
+
+
+class TestDirtyRegion(unittest.TestCase):
+
+    def setUp(self):
+        self.region = _Box.dirty_region = DirtyRegion()
+        self.region.enable()
+
+    def test_first_collect_is_full_redraw(self):
+        _Box(0, 0, 10, 10)
+        self.assertIsNone(self.region.collect())
+        self.assertEqual(self.region.collect(), [])
+        self.assertFalse(self.region.is_dirty())
+
+    def test_move_marks_old_and_new_bounds(self):
+        box = _Box(0, 0, 10, 10)
+        self.region.collect()
+
+        box.x = 50
+        box.x = 100
+        rects = self.region.collect()
+
+        self.assertEqual(len(rects), 2)
+        self.assertTrue(rects[0].contains_point(5, 5))
+        self.assertTrue(rects[1].contains_point(105, 5))
+        self.assertFalse(any(rect.contains_point(55, 5) for rect in rects))
+
+    def test_unchanged_assignment_is_ignored(self):
+        box = _Box(0, 0, 10, 10)
+        self.region.collect()
+        box.x = 0
+        box.visible = True
+        self.assertFalse(self.region.is_dirty())
+
+    def test_child_follows_parent(self):
+        parent = _Box(0, 0, 10, 10)
+        child = _Box(5, 5, 10, 10)
+        parent.add_child(child)
+        self.region.collect()
+
+        parent.x = 40
+        rects = self.region.collect()
+        self.assertEqual(child.world_position, (45, 5))
+        self.assertTrue(any(rect.contains_point(50, 10) for rect in rects))
+
+    def test_rotation_expands_bounds(self):
+        box = _Box(0, 0, 20, 2)
+        box.rotation = 90
+        bounds = box.dirty_bounds
+        self.assertLessEqual(bounds.top, -19)
+        self.assertGreaterEqual(bounds.bottom, 20)
+
+    def test_disabled_region_records_nothing(self):
+        region = _Box.dirty_region = DirtyRegion()
+        box = _Box(0, 0, 10, 10)
+        box.x = 50
+        self.assertEqual(len(region._pending), 0)
+
+        region.enable()
+        region.collect()
+        box.x = 60
+        self.assertTrue(region.is_dirty())
+
+        region.disable()
+        self.assertFalse(region.enabled)
+        self.assertEqual(len(region._pending), 0)
+
+    def test_content_changes_mark_region(self):
+        rectangle = Rectangle(0, 0, 10, 10, color=Color(255, 0, 0))
+        rectangle.dirty_region = self.region
+        self.region.collect()
+
+        rectangle.color = Color(0, 255, 0)
+        rects = self.region.collect()
+        self.assertTrue(any(rect.contains_point(5, 5) for rect in rects))
+
+    def test_many_rects_are_merged(self):
+        self.region.collect()
+        for i in range(DirtyRegion.MAX_RECTS + 1):
+            self.region.add_rect(Rect(i, 0, 1, 1))
+        self.assertEqual(self.region.collect(), [Rect(0, 0, DirtyRegion.MAX_RECTS + 1, 1)])
+
+
+class TestDirtyRendering(unittest.TestCase):
+
+    def setUp(self):
+        self.region = _Box.dirty_region = DirtyRegion()
+        self.renderer = PySideRenderer()
+        self.renderer.initialize(60, 20, widget=MagicMock())
+        self.renderer.enable_dirty_tracking(self.region)
+
+    def tearDown(self):
+        self.renderer.shutdown()
+
+    def _render(self, *drawables):
+        self.renderer.begin_frame()
+        if not self.renderer.is_frame_skipped():
+            self.renderer.clear(Color(0, 0, 255))
+            for drawable in drawables:
+                drawable.draw(self.renderer)
+        self.renderer.end_frame()
+        return self.renderer.get_pixmap().toImage()
+
+    def test_clean_frame_is_skipped(self):
+        box = _Box(0, 0, 10, 10)
+        self._render(box)
+        self.renderer.widget.update.reset_mock()
+
+        self._render(box)
+        self.assertTrue(self.renderer.is_frame_skipped())
+        self.renderer.widget.update.assert_not_called()
+
+    def test_only_dirty_area_is_repainted(self):
+        box = _Box(0, 0, 10, 10)
+        self._render(box)
+        self.renderer.widget.update.reset_mock()
+
+        box.x = 30
+        image = self._render(box)
+
+        self.assertEqual(image.pixelColor(35, 5), QColor(255, 0, 0))
+        self.assertEqual(image.pixelColor(5, 5), QColor(0, 0, 255))
+        # 脏区域之外保留上一帧的内容（首帧清除时的背景）
+        self.assertEqual(image.pixelColor(55, 15), QColor(0, 0, 255))
+        dirty = self.renderer.widget.update.call_args.args[0]
+        self.assertLess(dirty.right(), 55)
+
+    def test_sprite_image_change_is_repainted(self):
+        red, green = QPixmap(10, 10), QPixmap(10, 10)
+        red.fill(QColor(255, 0, 0))
+        green.fill(QColor(0, 255, 0))
+        sprite = _ImageSprite(0, 0, image=red)
+        sprite.dirty_region = self.region
+        self._render(sprite)
+        self._render(sprite)
+        self.assertTrue(self.renderer.is_frame_skipped())
+
+        sprite.set_image(green)
+        image = self._render(sprite)
+        self.assertFalse(self.renderer.is_frame_skipped())
+        self.assertEqual(image.pixelColor(5, 5), QColor(0, 255, 0))
+
+    def test_clip_rect_stays_inside_dirty_area(self):
+        box = _Box(0, 0, 10, 10)
+        self._render(box)
+        box.x = 1
+
+        self.renderer.begin_frame()
+        self.renderer.set_clip_rect(Rect(0, 0, 60, 20))
+        self.renderer.clear(Color(0, 255, 0))
+        self.renderer.set_clip_rect(None)
+        self.renderer.end_frame()
+
+        image = self.renderer.get_pixmap().toImage()
+        self.assertEqual(image.pixelColor(5, 5), QColor(0, 255, 0))
+        self.assertEqual(image.pixelColor(40, 5), QColor(0, 0, 255))
+
+
+if __name__ == "__main__":
+    unittest.main()
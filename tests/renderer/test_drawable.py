@@ -8,13 +8,16 @@ Description:                测试可绘制对象和变换
 
 Changed history:            
                             2025/04/04: 初始创建;
+                            2026/10/16: 添加世界变换缓存的测试;
+                            2026/10/16: 添加绕中心原点旋转的子对象点包含测试;
 ----
 """
 
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 import math
 
+from status.renderer import drawable as drawable_module
 from status.renderer.drawable import Transform, Drawable
 from status.renderer.renderer_base import RenderLayer, Rect
 
@@ -286,5 +289,81 @@ class TestDrawable(unittest.TestCase):
         # 所以这里只是验证调用不会抛出异常
 
 
+class TestWorldTransformCache(unittest.TestCase):
+    """测试世界变换缓存"""
+    
+    def setUp(self):
+        self.root = Drawable(x=10, y=20)
+        self.child = Drawable(x=5, y=0)
+        self.leaf = Drawable(x=1, y=2, width=4, height=4)
+        self.root.add_child(self.child)
+        self.child.add_child(self.leaf)
+        
+    def test_ancestor_change_propagates(self):
+        """祖先改变后子孙的世界坐标随之更新"""
+        self.assertEqual(self.leaf.world_position, (16, 22))
+        
+        self.root.x = 100
+        self.assertEqual(self.leaf.world_position, (106, 22))
+        
+        self.root.set_scale(2.0, 2.0)
+        self.assertEqual(self.leaf.world_position, (112, 24))
+        self.assertEqual(self.leaf.world_scale, (2.0, 2.0))
+        
+    def test_clean_nodes_are_not_recomputed(self):
+        """缓存有效时不重新计算，只修改子对象时不重新计算父对象"""
+        self.leaf.world_position
+        with patch("status.renderer.drawable._compose_matrix",
+                   wraps=drawable_module._compose_matrix) as compose:
+            self.leaf.world_position
+            self.leaf.world_rect
+            self.assertEqual(compose.call_count, 0)
+            
+            self.leaf.move(1, 1)
+            self.leaf.world_position
+            self.assertEqual(compose.call_count, 1)
+            
+    def test_rotated_parent(self):
+        """父对象旋转后的世界坐标和点包含检测"""
+        self.root.set_rotation(90)
+        x, y = self.leaf.world_position
+        self.assertAlmostEqual(x, 8)
+        self.assertAlmostEqual(y, 26)
+        
+        # 叶子对象旋转90度后覆盖世界坐标 x∈[4, 8]，y∈[26, 30]
+        self.assertTrue(self.leaf.contains_point_world(6, 28))
+        self.assertFalse(self.leaf.contains_point_world(10, 28))
+        local_x, local_y = self.leaf.world_to_local(*self.leaf.local_to_world(3, 1))
+        self.assertAlmostEqual(local_x, 3)
+        self.assertAlmostEqual(local_y, 1)
+        
+    def test_rotated_child_with_center_origin(self):
+        """绕中心原点旋转的子对象，点包含检测与图元的绘制区域一致"""
+        parent = Drawable(x=100, y=100)
+        child = Drawable(x=10, y=10, width=20, height=10)
+        parent.add_child(child)
+        child.set_center_origin()
+        child.set_rotation(90)
+        
+        # 图元绕 (120, 115) 旋转绘制，旋转90度后覆盖 x∈[115, 125]，y∈[105, 125]
+        cx, cy = child.local_to_world(child.origin_x, child.origin_y)
+        self.assertAlmostEqual(cx, 120)
+        self.assertAlmostEqual(cy, 115)
+        self.assertTrue(child.contains_point_world(120, 107))
+        self.assertTrue(child.contains_point_world(117, 123))
+        self.assertFalse(child.contains_point_world(128, 115))
+        self.assertFalse(child.contains_point_world(105, 115))
+        
+        # 直接修改原点同样使缓存的矩阵失效
+        child.origin_x = 0
+        child.origin_y = 0
+        self.assertTrue(child.contains_point_world(105, 115))
+        
+    def test_zero_scale_contains_nothing(self):
+        """缩放为0时不包含任何点"""
+        self.leaf.set_scale(0.0, 1.0)
+        self.assertFalse(self.leaf.contains_point_world(16, 22))
+
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
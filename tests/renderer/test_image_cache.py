@@ -0,0 +1,103 @@
+"""
+---------------------------------------------------------------
+File name:                  test_image_cache.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                测试PySide渲染器 draw_image 的变换结果缓存
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+                            2026/10/16: 测试文件修改后重新加载;
+----
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from PySide6.QtGui import QColor, QImage, QPixmap
+from PySide6.QtWidgets import QApplication
+
+from status.renderer.pyside_renderer import PySideRenderer
+from status.renderer.renderer_base import Rect
+
+app = QApplication.instance() or QApplication([])
+
+
+class TestDrawImageCache(unittest.TestCase):
+
+    def setUp(self):
+        self.renderer = PySideRenderer()
+        self.renderer.initialize(64, 64)
+        self.renderer.begin_frame()
+        self.pixmap = QPixmap(16, 8)
+        self.pixmap.fill(QColor("red"))
+
+    def tearDown(self):
+        self.renderer.shutdown()
+
+    def _stats(self):
+        return self.renderer.get_renderer_info()["image_cache"]
+
+    def test_repeated_transformed_draw_hits_cache(self):
+        for _ in range(3):
+            self.renderer.draw_image(self.pixmap, 0, 0, width=32, height=16, flip_h=True,
+                                     source_rect=Rect(0, 0, 8, 8), rotation=90.2)
+
+        stats = self._stats()
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["size"], 1)
+
+    def test_plain_pixmap_bypasses_cache(self):
+        with patch.object(QPixmap, "transformed") as transformed:
+            self.renderer.draw_image(self.pixmap, 0, 0)
+        transformed.assert_not_called()
+        self.assertEqual(self._stats()["misses"], 0)
+
+    def test_modified_source_misses(self):
+        image = QImage(8, 8, QImage.Format.Format_ARGB32)
+        image.fill(QColor("red"))
+        self.renderer.draw_image(image, 0, 0)
+        self.renderer.draw_image(image, 0, 0)
+        image.fill(QColor("blue"))
+        self.renderer.draw_image(image, 0, 0)
+
+        self.assertEqual(self._stats()["misses"], 2)
+        self.renderer.end_frame()
+        self.assertEqual(self.renderer.get_pixmap().toImage().pixelColor(0, 0), QColor("blue"))
+
+    def test_modified_file_is_reloaded(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "image.png")
+            image = QImage(8, 8, QImage.Format.Format_ARGB32)
+            image.fill(QColor("red"))
+            image.save(path)
+            self.renderer.draw_image(path, 0, 0)
+            self.renderer.draw_image(path, 0, 0)
+            self.assertEqual(self._stats()["misses"], 1)
+
+            image.fill(QColor("blue"))
+            image.save(path)
+            stat = os.stat(path)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            self.renderer.draw_image(path, 0, 0)
+
+        self.assertEqual(self._stats()["misses"], 2)
+        self.renderer.end_frame()
+        self.assertEqual(self.renderer.get_pixmap().toImage().pixelColor(0, 0), QColor("blue"))
+
+    def test_cache_is_bounded(self):
+        self.renderer.IMAGE_CACHE_SIZE = 4
+        for size in range(10, 20):
+            self.renderer.draw_image(self.pixmap, 0, 0, width=size, height=size)
+        self.assertEqual(self._stats()["size"], 4)
+
+        self.renderer.clear_image_cache()
+        self.assertEqual(self._stats()["size"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+---------------------------------------------------------------
+File name:                  test_particle_batch.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                测试PySide渲染器的粒子批量绘制
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+                            2026/10/16: 改为验证每个颜色桶只设置一次画刷，并验证重叠半透明粒子的透明度叠加;
+                            2026/10/16: 改为验证每个桶只渲染一次粒子精灵，添加轮廓粒子测试;
+----
+"""
+
+import unittest
+from unittest.mock import patch
+
+from PySide6.QtGui import QColor, QPainter
+from PySide6.QtWidgets import QApplication
+
+from status.renderer.pyside_renderer import PySideRenderer
+
+app = QApplication.instance() or QApplication([])
+
+
+class TestDrawParticlesBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.renderer = PySideRenderer()
+        self.renderer.initialize(60, 60)
+
+    def tearDown(self):
+        self.renderer.shutdown()
+
+    def _render(self, *columns, filled=True):
+        self.renderer.begin_frame()
+        self.renderer.draw_particles_batch(*columns, filled=filled)
+        self.renderer.end_frame()
+        return self.renderer.get_pixmap().toImage()
+
+    def test_draws_filled_particles(self):
+        image = self._render([15, 45], [15, 45], [5, 5],
+                             [255, 0], [0, 0], [0, 255], [255, 255])
+
+        self.assertEqual(image.pixelColor(15, 15), QColor(255, 0, 0))
+        self.assertEqual(image.pixelColor(45, 45), QColor(0, 0, 255))
+        self.assertEqual(image.pixelColor(30, 30).alpha(), 0)
+
+    def test_sprite_rendered_once_per_bucket(self):
+        """同一（颜色, 半径）桶只渲染一次精灵并在后续帧复用，粒子逐个贴图，透明粒子被跳过"""
+        count = 100
+        reds = [248, 249, 250, 251] * (count // 4)
+        columns = ([30] * count, [30] * count, [2] * count,
+                   reds, [0] * count, [0] * count, [255] * (count - 1) + [0])
+        with patch.object(QPainter, "drawEllipse") as draw_ellipse, \
+                patch.object(QPainter, "drawPixmap") as draw_pixmap:
+            self._render(*columns)
+            self.assertEqual(draw_ellipse.call_count, 1)
+            self.assertEqual(draw_pixmap.call_count, count - 1)
+
+            self._render(*columns)
+            self.assertEqual(draw_ellipse.call_count, 1)
+
+    def test_outline_particles(self):
+        """未填充的粒子只绘制轮廓"""
+        image = self._render([30], [30], [10], [0], [255], [0], [255], filled=False)
+
+        self.assertEqual(image.pixelColor(30, 30).alpha(), 0)
+        self.assertGreater(image.pixelColor(20, 30).alpha(), 0)
+
+    def test_overlapping_translucent_particles_accumulate_alpha(self):
+        """同色半透明粒子重叠处透明度叠加，与逐个绘制一致"""
+        image = self._render([25, 35], [30, 30], [8, 8],
+                             [255, 255], [0, 0], [0, 0], [128, 128])
+
+        single = image.pixelColor(19, 30).alpha()
+        overlap = image.pixelColor(30, 30).alpha()
+        self.assertGreater(single, 0)
+        self.assertGreater(overlap, single)
+
+    def test_inactive_painter_is_noop(self):
+        self.renderer.draw_particles_batch([1], [1], [1], [0], [0], [0], [255])
+
+
+if __name__ == "__main__":
+    unittest.main()
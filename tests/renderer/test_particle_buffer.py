@@ -0,0 +1,189 @@
+"""
+---------------------------------------------------------------
+File name:                  test_particle_buffer.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                测试结构数组粒子存储和批量更新的粒子系统
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+                            2026/10/16: 添加两种后端的 circle_batch 测试;
+                            2026/10/16: 添加 particles 只读快照测试;
+----
+"""
+
+import unittest
+from unittest.mock import MagicMock
+
+from status.renderer.particle import (Particle, ParticleEmitter, EmissionMode, ParticleSystem)
+from status.renderer.particle_buffer import ParticleBuffer, FIELDS, HAS_NUMPY
+from status.renderer.renderer_base import Color, RendererBase
+
+
+def _values(**overrides):
+    values = dict.fromkeys(FIELDS, 0.0)
+    values.update(size=10.0, lifetime=1.0, scale_x=1.0, scale_y=1.0, r=255.0, a=255.0)
+    values.update(overrides)
+    return tuple(values[name] for name in FIELDS)
+
+
+class ParticleBufferTests:
+    """两种后端共用的测试"""
+
+    use_numpy = False
+
+    def setUp(self):
+        self.buffer = ParticleBuffer(capacity=2, use_numpy=self.use_numpy)
+
+    def test_update_matches_particle(self):
+        """批量积分结果与 Particle.update 一致"""
+        values = _values(x=100, y=100, velocity_x=10, velocity_y=20, acceleration_y=4,
+                         rotation_velocity=90, scale_velocity_x=-0.5, scale_velocity_y=-0.5,
+                         alpha_velocity=-100)
+        self.buffer.add(values)
+        particle = Particle.from_values(dict(zip(FIELDS, values)))
+
+        self.buffer.update(0.5)
+        particle.update(0.5)
+
+        row = self.buffer.get(0)
+        for name in ("x", "y", "velocity_y", "rotation", "scale_x", "age"):
+            self.assertAlmostEqual(row[name], getattr(particle, name))
+        self.assertAlmostEqual(row["a"], particle.color.a)
+
+    def test_dead_particles_compacted_in_order(self):
+        for i, lifetime in enumerate([1.0, 5.0, 1.0, 5.0]):
+            self.buffer.add(_values(x=i, lifetime=lifetime))
+
+        removed = self.buffer.update(2.0)
+
+        self.assertEqual(removed, 2)
+        self.assertEqual(len(self.buffer), 2)
+        self.assertEqual(list(self.buffer.column("x")), [1.0, 3.0])
+
+    def test_keep_newest_and_sort(self):
+        for y in [3.0, 1.0, 2.0]:
+            self.buffer.add(_values(y=y))
+
+        self.buffer.sort_by("y")
+        self.assertEqual(list(self.buffer.column("y")), [1.0, 2.0, 3.0])
+
+        self.buffer.keep_newest(2)
+        self.assertEqual(list(self.buffer.column("y")), [2.0, 3.0])
+
+        self.buffer.clear()
+        self.assertEqual(len(self.buffer), 0)
+
+
+    def test_circle_batch_all_uniform(self):
+        """全部等比缩放时所有粒子进入批量列，半径按缩放计算，返回可直接迭代的Python数值"""
+        self.buffer.add(_values(x=1, size=10, scale_x=2, scale_y=2, g=20))
+        self.buffer.add(_values(x=2, size=4, scale_x=-1, scale_y=-1, b=30))
+
+        (xs, ys, radii, rs, gs, bs, alphas), irregular = self.buffer.circle_batch()
+
+        self.assertEqual(irregular, [])
+        self.assertEqual(list(xs), [1.0, 2.0])
+        self.assertEqual(list(radii), [10.0, 2.0])
+        self.assertEqual(list(gs), [20.0, 0.0])
+        self.assertEqual(list(bs), [0.0, 30.0])
+        self.assertIs(type(radii[0]), float)
+
+    def test_circle_batch_separates_non_uniform(self):
+        """非等比缩放的粒子不进入批量列，只返回其下标"""
+        self.buffer.add(_values(x=1, size=10))
+        self.buffer.add(_values(x=2, size=10, scale_x=2, scale_y=1))
+        self.buffer.add(_values(x=3, size=6, scale_x=0.5, scale_y=0.5))
+
+        (xs, ys, radii, rs, gs, bs, alphas), irregular = self.buffer.circle_batch()
+
+        self.assertEqual(irregular, [1])
+        self.assertEqual(list(xs), [1.0, 3.0])
+        self.assertEqual(list(radii), [5.0, 1.5])
+        self.assertEqual(len(alphas), 2)
+
+
+class TestArrayParticleBuffer(ParticleBufferTests, unittest.TestCase):
+    use_numpy = False
+
+
+@unittest.skipUnless(HAS_NUMPY, "需要NumPy")
+class TestNumpyParticleBuffer(ParticleBufferTests, unittest.TestCase):
+    use_numpy = True
+
+
+class TestBatchedParticleSystem(unittest.TestCase):
+
+    def setUp(self):
+        self.system = ParticleSystem(0, 0, auto_start=False)
+        self.emitter = ParticleEmitter(0, 0, emission_mode=EmissionMode.BURST, burst_count=2000)
+        self.emitter.set_particle_lifetime(1.0, 0)
+        self.emitter.set_velocity(0, 0, 0, 0)
+        self.system.add_emitter(self.emitter)
+        self.system.set_max_particles(10000)
+
+    def test_large_burst_lifecycle(self):
+        self.system.start()
+        self.system.update(0.1)
+        self.assertEqual(self.system.get_particle_count(), 2000)
+        self.assertIsInstance(self.system.particles[0], Particle)
+
+        self.system.update(1.0)
+        self.assertEqual(self.system.get_particle_count(), 0)
+
+    def test_particles_are_read_only_snapshots(self):
+        """修改 particles 返回的快照不影响粒子系统，修改列才会生效"""
+        self.emitter.set_burst_count(1)
+        self.system.start()
+        self.system.update(0.1)
+
+        self.system.particles[0].x = 123.0
+        self.assertNotEqual(self.system.particles[0].x, 123.0)
+
+        self.system.buffer.column("x")[0] = 123.0
+        self.assertEqual(self.system.particles[0].x, 123.0)
+
+    def test_max_particles_skips_excess_emission(self):
+        self.system.set_max_particles(50)
+        self.system.start()
+        self.system.update(0.1)
+        self.assertEqual(self.system.get_particle_count(), 50)
+
+    def test_draw_uses_single_batch(self):
+        self.emitter.set_burst_count(5)
+        self.emitter.set_particle_size(10, 0)
+        self.emitter.set_particle_color(Color(10, 20, 30, 255))
+        self.system.start()
+        self.system.update(0.1)
+
+        renderer = MagicMock(spec=RendererBase)
+        self.system.draw(renderer)
+
+        renderer.set_blend_mode.assert_called_once()
+        renderer.draw_particles_batch.assert_called_once()
+        renderer.draw_circle.assert_not_called()
+        renderer.push_transform.assert_not_called()
+        xs, ys, radii, rs, gs, bs, alphas = renderer.draw_particles_batch.call_args[0]
+        self.assertEqual(len(xs), 5)
+        self.assertEqual(list(radii), [5.0] * 5)
+        self.assertEqual((rs[0], gs[0], bs[0], alphas[0]), (10, 20, 30, 255))
+
+    def test_draw_transforms_non_uniform_particles(self):
+        """非等比缩放的粒子逐个应用变换绘制，其余粒子仍批量绘制"""
+        self.emitter.set_burst_count(3)
+        self.system.start()
+        self.system.update(0.1)
+        self.system.buffer.column("scale_x")[1] = 2.0
+
+        renderer = MagicMock(spec=RendererBase)
+        self.system.draw(renderer)
+
+        xs = renderer.draw_particles_batch.call_args[0][0]
+        self.assertEqual(len(xs), 2)
+        renderer.scale.assert_called_once_with(2.0, self.system.buffer.column("scale_y")[1])
+        renderer.draw_circle.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
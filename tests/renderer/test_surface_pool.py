@@ -0,0 +1,149 @@
+"""
+---------------------------------------------------------------
+File name:                  test_surface_pool.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                测试离屏表面池和转场的离开场景快照
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+                            2026/10/16: 测试表面池不阻止渲染器回收;
+----
+"""
+
+import gc
+import unittest
+import weakref
+from unittest.mock import MagicMock
+
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QApplication
+
+from status.renderer.pyside_renderer import PySideRenderer
+from status.renderer.renderer_base import Color, Rect
+from status.renderer.surface_pool import SurfacePool
+from status.scenes.scene_transition import FadeTransition, TransitionEffectBridge
+
+app = QApplication.instance() or QApplication([])
+
+
+class _ColorScene:
+    """用纯色填满视口的场景"""
+
+    def __init__(self, color: Color):
+        self.color = color
+        self.render_count = 0
+
+    def render(self, renderer):
+        self.render_count += 1
+        renderer.draw_rect(Rect(0, 0, 40, 20), self.color, filled=True)
+
+
+class TestSurfacePool(unittest.TestCase):
+
+    def setUp(self):
+        self.factory = MagicMock(side_effect=lambda w, h: object())
+        self.pool = SurfacePool(self.factory, max_idle=2)
+
+    def test_reuses_surfaces_of_same_size(self):
+        first = self.pool.acquire(40, 20)
+        self.pool.release(first)
+
+        self.assertIs(self.pool.acquire(40, 20), first)
+        self.assertIsNot(self.pool.acquire(40, 20), first)
+        self.assertIsNot(self.pool.acquire(20, 40), first)
+        self.assertEqual(self.factory.call_count, 3)
+        self.assertEqual(self.pool.get_stats()["reused"], 1)
+
+    def test_idle_surfaces_are_bounded(self):
+        surfaces = [self.pool.acquire(10 + i, 10) for i in range(3)]
+        for surface in surfaces:
+            self.pool.release(surface)
+        self.pool.release(object())
+
+        stats = self.pool.get_stats()
+        self.assertEqual(stats["idle"], 2)
+        self.assertEqual(stats["in_use"], 0)
+        # 最久未使用的尺寸被丢弃
+        self.assertIsNot(self.pool.acquire(10, 10), surfaces[0])
+
+    def test_pool_per_renderer(self):
+        renderer = MagicMock()
+        self.assertIs(SurfacePool.for_renderer(renderer), SurfacePool.for_renderer(renderer))
+        self.assertIsNot(SurfacePool.for_renderer(renderer), SurfacePool.for_renderer(MagicMock()))
+
+    def test_renderer_pool_does_not_keep_renderer_alive(self):
+        renderer = PySideRenderer()
+        self.assertIsNone(SurfacePool.find_for_renderer(renderer))
+        pool = weakref.ref(SurfacePool.for_renderer(renderer))
+        self.assertIs(SurfacePool.find_for_renderer(renderer), pool())
+
+        renderer_ref = weakref.ref(renderer)
+        del renderer
+        gc.collect()
+        self.assertIsNone(renderer_ref())
+        self.assertIsNone(pool())
+
+    def test_shutdown_does_not_create_pool(self):
+        renderer = PySideRenderer()
+        renderer.shutdown()
+        self.assertIsNone(SurfacePool.find_for_renderer(renderer))
+
+
+class TestTransitionSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.renderer = PySideRenderer()
+        self.renderer.initialize(40, 20)
+        self.pool = SurfacePool.for_renderer(self.renderer)
+        self.current = _ColorScene(Color(255, 0, 0))
+        self.next = _ColorScene(Color(0, 0, 255))
+
+    def tearDown(self):
+        self.renderer.shutdown()
+
+    def _render_frames(self, transition, frames=3):
+        transition.start_transition(True)
+        for _ in range(frames):
+            transition.update(0.1)
+            self.renderer.begin_frame()
+            self.renderer.clear()
+            transition.render(self.renderer, self.current, self.next)
+            self.renderer.end_frame()
+
+    def test_snapshot_renders_outgoing_scene_once(self):
+        transition = FadeTransition(duration=1.0, snapshot=True)
+        self._render_frames(transition)
+
+        self.assertEqual(self.current.render_count, 1)
+        self.assertEqual(self.next.render_count, 3)
+        color = self.renderer.get_pixmap().toImage().pixelColor(10, 10)
+        self.assertGreater(color.red(), 0)
+        self.assertGreater(color.blue(), 0)
+
+        transition.update(1.0)
+        self.assertEqual(self.pool.get_stats()["in_use"], 0)
+        self.assertEqual(self.pool.get_stats()["idle"], 1)
+
+    def test_bridge_reuses_pooled_surfaces(self):
+        transition = TransitionEffectBridge("fade", duration=1.0, snapshot=True)
+        self._render_frames(transition)
+
+        self.assertEqual(self.current.render_count, 1)
+        stats = self.pool.get_stats()
+        self.assertEqual(stats["created"], 2)
+        self.assertEqual(stats["reused"], 2)
+
+    def test_reset_target_restores_frame_buffer(self):
+        screen = self.renderer.get_pixmap()
+        self.renderer.begin_frame()
+        surface = self.pool.acquire(40, 20)
+        self.renderer.set_target(surface)
+        self.renderer.reset_target()
+        self.renderer.end_frame()
+        self.assertIs(self.renderer.get_pixmap(), screen)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+---------------------------------------------------------------
+File name:                  test_texture_atlas.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                测试纹理图集的装箱、构建和绘制
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+----
+"""
+
+import unittest
+from unittest.mock import MagicMock
+
+from PySide6.QtGui import QColor, QImage
+from PySide6.QtWidgets import QApplication
+
+from status.animation.animation import Animation
+from status.renderer.pyside_renderer import PySideRenderer
+from status.renderer.renderer_base import RendererBase
+from status.renderer.texture_atlas import ShelfPacker, TextureAtlasBuilder, build_animation_atlas
+
+app = QApplication.instance() or QApplication([])
+
+
+def _frame(color: str, width: int = 10, height: int = 10) -> QImage:
+    image = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(QColor(color))
+    return image
+
+
+def _overlaps(a, b):
+    return a[0] < b[0] + b[2] and b[0] < a[0] + a[2] and a[1] < b[1] + b[3] and b[1] < a[1] + a[3]
+
+
+class TestShelfPacker(unittest.TestCase):
+
+    def test_no_overlap_within_bounds(self):
+        sizes = [(30, 20), (10, 40), (25, 25), (40, 10), (15, 15)] * 4
+        positions, pages = ShelfPacker(64, 64, padding=1).pack(sizes)
+
+        placed = {}
+        for (page, x, y), (w, h) in zip(positions, sizes):
+            page_w, page_h = pages[page]
+            self.assertLessEqual(x + w, min(64, page_w))
+            self.assertLessEqual(y + h, min(64, page_h))
+            for other in placed.get(page, []):
+                self.assertFalse(_overlaps((x, y, w, h), other))
+            placed.setdefault(page, []).append((x, y, w, h))
+        self.assertGreater(len(pages), 1)
+
+    def test_oversized_rect_gets_own_page(self):
+        positions, pages = ShelfPacker(32, 32).pack([(10, 10), (50, 50)])
+        self.assertEqual(positions[1], (0, 0, 0))
+        self.assertEqual(pages[0], (50, 50))
+        self.assertEqual(positions[0][0], 1)
+
+
+class TestTextureAtlas(unittest.TestCase):
+
+    def setUp(self):
+        self.walk = Animation("walk", [_frame("red"), _frame("green"), _frame("blue")], fps=5)
+        self.idle = Animation("idle", [_frame("yellow", 20, 15)], fps=2)
+        self.idle.set_loop(False)
+
+    def test_frames_round_trip(self):
+        builder = TextureAtlasBuilder(max_size=256)
+        builder.add_animation("walk", self.walk)
+        builder.add_animation("idle", self.idle)
+        atlas = builder.build("pet")
+
+        self.assertEqual(atlas.page_count, 1)
+        self.assertEqual(atlas.get_stats()["frames"], 4)
+        self.assertEqual(atlas.get_frame_image("walk/1").pixelColor(5, 5), QColor("green"))
+        idle_region = atlas.get_region("idle/0")
+        self.assertEqual((idle_region.rect.width, idle_region.rect.height), (20, 15))
+        self.assertIs(atlas.get_page(0), atlas.get_page(0))
+
+    def test_sprite_animations_reference_atlas(self):
+        atlas, animations = build_animation_atlas({"walk": self.walk, "idle": self.idle}, "pet")
+
+        walk = animations["walk"]
+        self.assertEqual(walk.total_frames, 3)
+        self.assertAlmostEqual(walk.frame_duration, 0.2)
+        self.assertFalse(animations["idle"].loop)
+        frame, _ = walk.get_frame(0.25)
+        self.assertIs(frame.get_image(MagicMock()), atlas.get_page(0))
+        self.assertEqual(frame.source_rect, atlas.get_region("walk/1").rect)
+
+    def test_draw_uses_page_and_source_rect(self):
+        builder = TextureAtlasBuilder()
+        builder.add_animation("walk", self.walk)
+        atlas = builder.build()
+
+        renderer = MagicMock(spec=RendererBase)
+        self.assertTrue(atlas.draw(renderer, "walk/2", 3, 4))
+        self.assertFalse(atlas.draw(renderer, "missing", 0, 0))
+        renderer.draw_image.assert_called_once_with(atlas.get_page(0), 3, 4,
+                                                    source_rect=atlas.get_region("walk/2").rect)
+
+    def test_pyside_renderer_draws_sub_rect_without_caching(self):
+        builder = TextureAtlasBuilder()
+        builder.add_animation("walk", self.walk)
+        atlas = builder.build()
+
+        renderer = PySideRenderer()
+        renderer.initialize(20, 20)
+        renderer.begin_frame()
+        atlas.draw(renderer, "walk/2", 0, 0)
+        renderer.end_frame()
+
+        self.assertEqual(renderer.get_pixmap().toImage().pixelColor(5, 5), QColor("blue"))
+        self.assertEqual(renderer.get_renderer_info()["image_cache"]["misses"], 0)
+        renderer.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,286 @@
+"""
+---------------------------------------------------------------
+File name:                  test_cache.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                测试缓存系统的逐出与过期策略
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+                            2026/10/16: 添加大小估算测试;
+                            2026/10/16: 添加标签失效测试;
+                            2026/10/16: 添加LFU最低频率惰性重算测试;
+"""
+
+import time
+
+import pytest
+
+from status.resources.cache import Cache, CacheStrategy, SizeEstimatorRegistry, size_estimator_registry
+
+
+def _make_cache(strategy: CacheStrategy, max_items: int = 3) -> Cache:
+    """创建不启动自动清理任务的缓存实例"""
+    return Cache(strategy=strategy, max_items=max_items, cleanup_interval=0)
+
+
+class TestCacheEviction:
+
+    def test_lru_evicts_least_recently_used(self):
+        """LRU策略应逐出最久未访问的项"""
+        cache = _make_cache(CacheStrategy.LRU)
+        cache.put("a", b"1")
+        cache.put("b", b"2")
+        cache.put("c", b"3")
+        cache.get("a")
+        cache.put("d", b"4")
+
+        assert cache.keys() == ["c", "a", "d"]
+
+    def test_fifo_ignores_access_order(self):
+        """FIFO策略应逐出最早加入的项，与访问无关"""
+        cache = _make_cache(CacheStrategy.FIFO)
+        cache.put("a", b"1")
+        cache.put("b", b"2")
+        cache.put("c", b"3")
+        cache.get("a")
+        cache.put("d", b"4")
+
+        assert not cache.contains("a")
+        assert cache.keys() == ["b", "c", "d"]
+
+    def test_lfu_evicts_least_frequently_used(self):
+        """LFU策略应逐出访问次数最少的项，同频时逐出较早进入的项"""
+        cache = _make_cache(CacheStrategy.LFU)
+        cache.put("a", b"1")
+        cache.put("b", b"2")
+        cache.put("c", b"3")
+        cache.get("a")
+        cache.get("a")
+        cache.get("c")
+        cache.put("d", b"4")
+
+        assert not cache.contains("b")
+        cache.put("e", b"5")
+        # d与e访问次数都为0，d先进入，应先被逐出
+        assert not cache.contains("d")
+        assert sorted(cache.keys()) == ["a", "c", "e"]
+
+    def test_lfu_remove_keeps_buckets_consistent(self):
+        """移除LFU最低频率桶中的项后仍能正确逐出"""
+        cache = _make_cache(CacheStrategy.LFU)
+        cache.put("a", b"1")
+        cache.put("b", b"2")
+        cache.put("c", b"3")
+        cache.get("a")
+        cache.get("b")
+        cache.get("b")
+        assert cache.remove_method("c") is True
+
+        cache.set_max_items(1)
+
+        assert cache.keys() == ["b"]
+
+    def test_lfu_remove_does_not_scan_buckets(self):
+        """移除最低频率桶的唯一项不遍历频率桶，逐出时再惰性定位最低频率"""
+        cache = _make_cache(CacheStrategy.LFU)
+        cache.put("a", b"1")
+        cache.put("b", b"2")
+        cache.put("c", b"3")
+        cache.get("b")
+        cache.get("c")
+        cache.get("c")
+
+        assert cache.remove_method("a") is True
+        assert cache._min_freq == 0
+        assert 0 not in cache._freq_buckets
+
+        cache.set_max_items(1)
+
+        assert cache.keys() == ["c"]
+
+    def test_set_strategy_rebuilds_order(self):
+        """切换策略后应按新策略的顺序逐出"""
+        cache = _make_cache(CacheStrategy.FIFO)
+        cache.put("a", b"1")
+        cache.put("b", b"2")
+        cache.put("c", b"3")
+        time.sleep(0.001)
+        cache.get("a")
+
+        cache.set_strategy(CacheStrategy.LRU)
+        cache.put("d", b"4")
+
+        assert cache.contains("a")
+        assert not cache.contains("b")
+
+    def test_put_existing_key_does_not_leak_size(self):
+        """重复写入同一键不应累积缓存大小"""
+        cache = _make_cache(CacheStrategy.LRU)
+        for _ in range(10):
+            cache.put("a", b"12345")
+
+        stats = cache.get_stats()
+        assert stats["items_count"] == 1
+        assert stats["current_size"] == 5
+
+    @pytest.mark.parametrize("strategy", [CacheStrategy.LRU, CacheStrategy.FIFO, CacheStrategy.LFU])
+    def test_large_cache_stays_within_limits(self, strategy):
+        """大容量缓存持续写入时应保持数量上限"""
+        cache = _make_cache(strategy, max_items=5000)
+        for i in range(20000):
+            cache.put(f"k{i}", b"x")
+            if i % 2:
+                cache.get(f"k{i - 1}")
+
+        stats = cache.get_stats()
+        assert stats["items_count"] == 5000
+        assert stats["current_size"] == 5000
+
+
+class TestCacheExpiry:
+
+    def test_cleanup_removes_only_expired(self):
+        """cleanup应只移除已过期的项"""
+        cache = _make_cache(CacheStrategy.LRU, max_items=10)
+        cache.put("short", b"1", ttl=0.01)
+        cache.put("long", b"2", ttl=60)
+        time.sleep(0.02)
+
+        assert cache.cleanup() == 1
+        assert cache.keys() == ["long"]
+
+    def test_eviction_prefers_expired_items(self):
+        """容量不足时应优先逐出已过期的项"""
+        cache = _make_cache(CacheStrategy.LRU, max_items=2)
+        cache.put("fresh", b"1", ttl=60)
+        cache.put("stale", b"2", ttl=0.01)
+        time.sleep(0.02)
+        cache.put("new", b"3", ttl=60)
+
+        assert sorted(cache.keys()) == ["fresh", "new"]
+
+    def test_get_expired_returns_default(self):
+        """获取已过期的项应返回默认值并移除该项"""
+        cache = _make_cache(CacheStrategy.LRU)
+        cache.put("a", b"1", ttl=0.01)
+        time.sleep(0.02)
+
+        assert cache.get("a", default="missing") == "missing"
+        assert not cache.contains("a")
+        assert cache.get_stats()["current_size"] == 0
+
+    def test_clear_resets_indexes(self):
+        """清空缓存后索引应一并重置"""
+        cache = _make_cache(CacheStrategy.LFU)
+        cache.put("a", b"1")
+        cache.get("a")
+
+        assert cache.clear() == 1
+        cache.put("b", b"2")
+        cache.put("c", b"3")
+        cache.put("d", b"4")
+        cache.put("e", b"5")
+
+        assert cache.keys() == ["c", "d", "e"]
+
+
+class TestSizeEstimation:
+
+    def test_qimage_uses_real_byte_size(self):
+        """QImage应按实际像素格式计算大小"""
+        from PySide6.QtGui import QImage
+
+        argb = QImage(10, 10, QImage.Format.Format_ARGB32)
+        indexed = QImage(10, 10, QImage.Format.Format_Indexed8)
+
+        assert size_estimator_registry.estimate(argb) == argb.sizeInBytes()
+        assert size_estimator_registry.estimate(indexed) == indexed.sizeInBytes()
+        assert size_estimator_registry.estimate(indexed) < size_estimator_registry.estimate(argb)
+
+    def test_qpixmap_uses_depth(self, qapp):
+        """QPixmap应按位深计算后备存储大小"""
+        from PySide6.QtGui import QPixmap
+
+        pixmap = QPixmap(8, 4)
+
+        assert size_estimator_registry.estimate(pixmap) == 8 * 4 * pixmap.depth() // 8
+        assert size_estimator_registry.estimate(QPixmap()) == 0
+
+    def test_animation_sums_frames(self):
+        """Animation的大小应包含所有帧"""
+        from PySide6.QtGui import QImage
+        from status.animation.animation import Animation
+
+        frames = [QImage(16, 16, QImage.Format.Format_ARGB32) for _ in range(3)]
+        animation = Animation("idle", frames)
+
+        assert size_estimator_registry.estimate(animation) >= 3 * frames[0].sizeInBytes()
+
+    def test_containers_are_recursive(self):
+        """容器应递归计算元素大小，共享元素只计算一次"""
+        payload = b"x" * 1000
+        data = {"frames": [payload, payload], "meta": {"name": "idle"}}
+
+        size = size_estimator_registry.estimate(data)
+        assert 1000 < size < 2000
+
+    def test_cyclic_container_terminates(self):
+        """循环引用的容器不应导致无限递归"""
+        data: list = [b"x" * 10]
+        data.append(data)
+
+        assert size_estimator_registry.estimate(data) > 10
+
+    def test_custom_estimator_applies_to_subclasses(self):
+        """注册的估算器应作用于子类，注销后恢复默认估算"""
+        class Base:
+            pass
+
+        class Child(Base):
+            pass
+
+        registry = SizeEstimatorRegistry()
+        registry.register(Base, lambda obj, recurse: 4096)
+        assert registry.estimate(Child()) == 4096
+
+        assert registry.unregister(Base) is True
+        assert registry.estimate(Child()) != 4096
+
+    def test_cache_budget_uses_estimated_size(self):
+        """缓存的大小上限应按估算大小生效"""
+        cache = Cache(max_size=2500, max_items=100, cleanup_interval=0)
+        cache.put("a", [b"x" * 1000])
+        cache.put("b", [b"x" * 1000])
+        cache.put("c", [b"x" * 1000])
+
+        assert not cache.contains("a")
+        assert cache.get_stats()["current_size"] <= 2500
+
+
+class TestCacheTags:
+
+    def test_invalidate_tags_removes_only_tagged_items(self):
+        """按标签失效只移除关联该标签的项"""
+        cache = _make_cache(CacheStrategy.LRU, max_items=10)
+        cache.put("a", b"1", tags={"path:a.png", "pack:p1"})
+        cache.put("b", b"2", tags={"path:b.png", "pack:p1"})
+        cache.put("c", b"3", tags={"path:c.png", "pack:p2"})
+
+        assert cache.invalidate_tags({"path:a.png"}) == ["a"]
+        assert sorted(cache.invalidate_tags({"pack:p1"})) == ["b"]
+        assert cache.keys() == ["c"]
+
+    def test_tags_follow_eviction_and_replacement(self):
+        """逐出或覆盖的项应同时从标签索引中注销"""
+        cache = _make_cache(CacheStrategy.LRU, max_items=2)
+        cache.put("a", b"1", tags={"pack:p1"})
+        cache.put("b", b"2", tags={"pack:p1"})
+        cache.put("c", b"3")
+        cache.put("b", b"4")
+
+        assert cache.get_tagged_keys("pack:p1") == []
+        assert cache.add_tags("missing", {"pack:p1"}) is False
+        assert cache.add_tags("c", {"pack:p1"}) is True
+        assert cache.get_tagged_keys("pack:p1") == ["c"]
@@ -0,0 +1,186 @@
+"""
+---------------------------------------------------------------
+File name:                  test_cache_invalidation.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                测试资源包事件触发的精确缓存失效
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+                            2026/10/16: 改为通过load_resource缓存资源后验证失效;
+"""
+
+import os
+import json
+import shutil
+import tempfile
+from typing import Generator
+from unittest.mock import MagicMock
+
+import pytest
+from PySide6.QtGui import QColor, QImage
+
+from status.resources import ResourceType
+from status.resources.asset_manager import AssetManager
+from status.resources.resource_loader import LRUCache, ResourceLoader
+from status.resources.resource_pack import ResourcePack, ResourcePackManager, ResourcePackType
+
+
+def _make_pack(root: str, pack_id: str, files: dict) -> str:
+    pack_dir = os.path.join(root, pack_id)
+    for rel_path, content in files.items():
+        file_path = os.path.join(pack_dir, *rel_path.split("/"))
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(content)
+    with open(os.path.join(pack_dir, "pack.json"), "w", encoding="utf-8") as f:
+        json.dump({"id": pack_id, "name": pack_id, "version": "1.0.0", "format": 1}, f)
+    return pack_dir
+
+
+def _save_png(path: str, rgb: int) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    image = QImage(2, 2, QImage.Format.Format_RGB32)
+    image.fill(QColor(rgb))
+    assert image.save(path, "PNG")
+
+
+def _rescan(manager: ResourcePackManager, pack_id: str) -> None:
+    manager.resource_packs[pack_id]._scan_files()
+    manager._update_resource_path_map()
+
+
+@pytest.fixture
+def pack_manager() -> Generator[ResourcePackManager, None, None]:
+    """两个目录资源包：base提供文本和一个序列，extra提供另一个文本"""
+    temp_dir = tempfile.mkdtemp()
+    manager = ResourcePackManager()
+    for pack_id, files in {
+        "base": {"texts/a.txt": "a", "texts/b.txt": "b", "anims/idle/f1.txt": "1"},
+        "extra": {"texts/c.txt": "c"},
+    }.items():
+        pack = ResourcePack(_make_pack(temp_dir, pack_id, files), ResourcePackType.DIRECTORY)
+        pack.load()
+        manager.resource_packs[pack_id] = pack
+        manager.active_packs.append(pack_id)
+    manager._update_resource_path_map()
+    manager.initialized = True
+    yield manager
+    shutil.rmtree(temp_dir)
+
+
+@pytest.fixture
+def asset_manager(monkeypatch, pack_manager) -> AssetManager:
+    """使用真实ResourceLoader的全新AssetManager实例"""
+    monkeypatch.setattr(AssetManager, "_instance", None)
+    am = AssetManager()
+    am.loader.set_manager(pack_manager)
+    am.initialize()
+    return am
+
+
+class TestLoaderInvalidation:
+
+    def test_lru_cache_tags(self):
+        """LRUCache按标签失效，逐出时同步注销标签"""
+        cache = LRUCache(2)
+        cache.put("a", 1, tags={"pack:p"})
+        cache.put("b", 2, tags={"pack:p"})
+        cache.put("c", 3, tags={"pack:q"})
+
+        assert "pack:p" in cache.tag_index and cache.tag_index["pack:p"] == {"b"}
+        assert cache.invalidate_tags({"pack:p"}) == 1
+        assert list(cache.cache) == ["c"]
+
+    def test_invalidation_tags_include_parent_directories(self):
+        """路径变化应同时失效其所有上级目录（图像序列）"""
+        tags = ResourceLoader().get_invalidation_tags(["anims/idle/f1.png"])
+
+        assert tags == {"path:anims/idle/f1.png", "dir:anims/idle", "dir:anims"}
+
+    def test_pack_events_evict_only_affected_entries(self, pack_manager):
+        """通过load_resource缓存的资源，重载和移除事件只清除受影响的缓存项"""
+        loader = ResourceLoader()
+        loader.set_manager(pack_manager)
+        for path in ["texts/a.txt", "texts/b.txt", "texts/c.txt"]:
+            loader.load_resource(path, ResourceType.TEXT)
+        assert list(loader._text_cache.cache) == ["texts/a.txt", "texts/b.txt", "texts/c.txt"]
+
+        loader.handle_resource_pack_reloaded({"pack_id": "base", "changed_paths": ["texts/a.txt"]})
+        assert list(loader._text_cache.cache) == ["texts/b.txt", "texts/c.txt"]
+
+        loader.handle_resource_pack_removed({"pack_id": "extra"})
+        assert list(loader._text_cache.cache) == ["texts/b.txt"]
+
+        loader.handle_resource_pack_reloaded({"pack_id": "base"})
+        assert len(loader._text_cache) == 0
+
+    def test_invalidate_resources_removes_loaded_entries(self, qt_app, pack_manager):
+        """load_resource缓存的JSON和图像都能按路径失效"""
+        base_dir = pack_manager.resource_packs["base"].path
+        with open(os.path.join(base_dir, "data.json"), "w", encoding="utf-8") as f:
+            json.dump({"v": 1}, f)
+        _save_png(os.path.join(base_dir, "anims", "idle", "f1.png"), 0xFF0000)
+        _rescan(pack_manager, "base")
+        loader = ResourceLoader()
+        loader.set_manager(pack_manager)
+
+        assert loader.load_resource("data.json", ResourceType.JSON) == {"v": 1}
+        assert loader.load_resource("anims/idle/f1.png", ResourceType.IMAGE) is not None
+
+        assert loader.invalidate_resources(["data.json", "anims/idle/f1.png"]) == 2
+        assert len(loader._json_cache) == 0 and len(loader._image_cache) == 0
+
+
+class TestAssetManagerInvalidation:
+
+    def test_typed_caches_evict_only_changed_paths(self, asset_manager):
+        """AssetManager的类型缓存只失效变化的资源及包含它的序列"""
+        am = asset_manager
+        assert am.load_asset("texts/a.txt", ResourceType.TEXT) == "a"
+        assert am.load_asset("texts/b.txt", ResourceType.TEXT) == "b"
+        am.image_cache.put("anims/idle##sequence=True", ["frame"])
+        am._tag_cache_entry(am.image_cache, "anims/idle##sequence=True", {am.loader.dir_tag("anims/idle")})
+
+        am.loader.handle_resource_pack_reloaded({
+            "pack_id": "base", "changed_paths": ["texts/a.txt", "anims/idle/f2.txt"]
+        })
+
+        assert not am.other_cache.contains("texts/a.txt")
+        assert am.other_cache.contains("texts/b.txt")
+        assert not am.image_cache.contains("anims/idle##sequence=True")
+
+    def test_reloaded_sequence_frame_is_decoded_again(self, qt_app, asset_manager, pack_manager):
+        """图像序列中的帧在磁盘上修改并重载后，重新加载应得到新的像素"""
+        am = asset_manager
+        frame_path = os.path.join(pack_manager.resource_packs["base"].path, "anims", "walk", "f1.png")
+        _save_png(frame_path, 0xFF0000)
+        _rescan(pack_manager, "base")
+
+        frames = am.load_image_sequence("anims/walk")
+        assert frames and QColor(frames[0].pixel(0, 0)) == QColor(0xFF0000)
+
+        _save_png(frame_path, 0x0000FF)
+        am.loader.handle_resource_pack_reloaded({"pack_id": "base", "changed_paths": ["anims/walk/f1.png"]})
+
+        frames = am.load_image_sequence("anims/walk")
+        assert frames and QColor(frames[0].pixel(0, 0)) == QColor(0x0000FF)
+
+    def test_invalidated_entries_are_redecoded_in_background(self, asset_manager, pack_manager):
+        """开启后台重新解码时，失效的资源应被重新加载回缓存"""
+        am = asset_manager
+        am.redecode_invalidated = True
+        am.load_asset("texts/a.txt", ResourceType.TEXT)
+
+        with open(pack_manager.get_resource_path("texts/a.txt"), "w", encoding="utf-8") as f:
+            f.write("a2")
+        futures = []
+        original = am.redecode_async
+        am.redecode_async = lambda keys: futures.append(original(keys)) or futures[-1]
+        am.loader.handle_resource_pack_reloaded({"pack_id": "base", "changed_paths": ["texts/a.txt"]})
+
+        assert len(futures) == 1
+        assert futures[0].result(timeout=5) == (1, 1)
+        assert am.other_cache.contains("texts/a.txt")
+        assert am.load_asset("texts/a.txt", ResourceType.TEXT) == "a2"
@@ -0,0 +1,179 @@
+"""
+---------------------------------------------------------------
+File name:                  test_decode_pool.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                测试带优先级的解码线程池及其在AssetManager中的使用
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+"""
+
+import os
+import json
+import shutil
+import tempfile
+import threading
+from typing import Generator
+
+import pytest
+
+from status.resources.asset_manager import AssetManager
+from status.resources.decode_pool import DecodePool
+from status.resources.resource_pack import ResourcePack, ResourcePackManager, ResourcePackType
+
+
+class TestDecodePool:
+
+    def test_higher_priority_runs_first(self):
+        """排队任务应按优先级出队，同优先级按提交顺序"""
+        pool = DecodePool(max_workers=1)
+        gate = threading.Event()
+        order = []
+        pool.submit(gate.wait)
+
+        futures = [
+            pool.submit(order.append, "low", priority=0),
+            pool.submit(order.append, "high", priority=10),
+            pool.submit(order.append, "low2", priority=0),
+            pool.submit(order.append, "mid", priority=5),
+        ]
+        gate.set()
+        for future in futures:
+            future.result(timeout=5)
+
+        assert order == ["high", "mid", "low", "low2"]
+        pool.shutdown()
+
+    def test_tasks_run_in_parallel(self):
+        """工作线程应并行执行任务"""
+        pool = DecodePool(max_workers=4)
+        barrier = threading.Barrier(4, timeout=5)
+
+        futures = [pool.submit(barrier.wait) for _ in range(4)]
+
+        assert sorted(f.result(timeout=5) for f in futures) == [0, 1, 2, 3]
+        assert pool.get_stats()["workers"] == 4
+        pool.shutdown()
+
+    def test_map_ordered_keeps_order_and_isolates_failures(self):
+        """map_ordered按输入顺序返回结果，失败项为None"""
+        pool = DecodePool(max_workers=3)
+
+        def work(x):
+            if x == 3:
+                raise ValueError("bad frame")
+            return x * 2
+
+        assert pool.map_ordered(work, range(6)) == [0, 2, 4, None, 8, 10]
+        pool.shutdown()
+
+    def test_nested_map_in_worker_does_not_deadlock(self):
+        """工作线程内嵌套调用map_ordered应直接执行而不是等待其他工作线程"""
+        pool = DecodePool(max_workers=1)
+
+        future = pool.submit(pool.map_ordered, lambda x: x + 1, [1, 2, 3])
+
+        assert future.result(timeout=5) == [2, 3, 4]
+        pool.shutdown()
+
+    def test_callback_and_shutdown_cancel_pending(self):
+        """完成回调应被调用，关闭时尚未开始的任务被取消"""
+        pool = DecodePool(max_workers=1)
+        gate = threading.Event()
+        done = []
+        running = pool.submit(gate.wait, callback=lambda f: done.append(f.result()))
+        pending = pool.submit(lambda: "never")
+
+        threading.Timer(0.05, gate.set).start()
+        pool.shutdown()
+
+        assert running.result() is True and done == [True]
+        assert pending.cancelled()
+        with pytest.raises(RuntimeError):
+            pool.submit(lambda: None)
+
+
+def _png_bytes(color: int) -> bytes:
+    from PySide6.QtCore import QBuffer, QByteArray, QIODevice
+    from PySide6.QtGui import QImage
+
+    image = QImage(4, 4, QImage.Format.Format_ARGB32)
+    image.fill(color)
+    byte_array = QByteArray()
+    buffer = QBuffer(byte_array)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, "PNG")
+    buffer.close()
+    return bytes(byte_array.data())
+
+
+@pytest.fixture
+def sequence_manager() -> Generator[ResourcePackManager, None, None]:
+    """包含两个图像序列的目录资源包"""
+    temp_dir = tempfile.mkdtemp()
+    pack_dir = os.path.join(temp_dir, "anim_pack")
+    for state, count in (("idle", 12), ("walk", 5)):
+        os.makedirs(os.path.join(pack_dir, "anims", state))
+        for i in range(count):
+            with open(os.path.join(pack_dir, "anims", state, f"frame{i}.png"), "wb") as f:
+                f.write(_png_bytes(0xff000000 + i))
+    with open(os.path.join(pack_dir, "pack.json"), "w", encoding="utf-8") as f:
+        json.dump({"id": "anim_pack", "name": "Anim", "version": "1.0.0", "format": 1}, f)
+
+    manager = ResourcePackManager()
+    pack = ResourcePack(pack_dir, ResourcePackType.DIRECTORY)
+    pack.load()
+    manager.resource_packs["anim_pack"] = pack
+    manager.active_packs.append("anim_pack")
+    manager._update_resource_path_map()
+    manager.initialized = True
+    yield manager
+    shutil.rmtree(temp_dir)
+
+
+@pytest.fixture
+def asset_manager(monkeypatch, sequence_manager) -> AssetManager:
+    monkeypatch.setattr(AssetManager, "_instance", None)
+    am = AssetManager()
+    am.decode_workers = 4
+    am.loader.set_manager(sequence_manager)
+    am.initialize()
+    return am
+
+
+class TestAssetManagerDecoding:
+
+    def test_sequence_frames_decoded_in_order(self, asset_manager):
+        """并行解码的序列帧应保持自然顺序"""
+        frames = asset_manager.load_image_sequence("anims/idle")
+
+        assert frames is not None and len(frames) == 12
+        assert [frame.pixel(0, 0) & 0xff for frame in frames] == list(range(12))
+        assert asset_manager.get_decode_pool().get_stats()["completed"] >= 12
+
+    def test_preload_sequences_async_reports_completion(self, asset_manager):
+        """批量异步预加载序列应回调每个序列并返回汇总结果"""
+        reported = []
+
+        future = asset_manager.preload_sequences_async(
+            ["anims/idle", "anims/walk", "anims/missing"],
+            priorities={"anims/walk": 10},
+            callback=lambda path, ok: reported.append((path, ok))
+        )
+
+        assert future.result(timeout=10) == (2, 3)
+        assert sorted(reported) == [("anims/idle", True), ("anims/missing", False), ("anims/walk", True)]
+        assert asset_manager.image_cache.contains("anims/walk##sequence=True")
+
+    def test_preload_async_returns_future(self, asset_manager):
+        """preload_async应返回汇总成功数量的Future"""
+        done = []
+        future = asset_manager.preload_async(
+            ["anims/idle/frame0.png", "anims/walk/frame1.png"],
+            on_complete=lambda ok, total: done.append((ok, total))
+        )
+
+        assert future.result(timeout=10) == (2, 2)
+        assert done == [(2, 2)]
@@ -0,0 +1,169 @@
+"""
+---------------------------------------------------------------
+File name:                  test_frame_cache.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                测试动画帧磁盘缓存
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+                            2026/10/16: 添加辅助模块源码变化的缓存键测试;
+"""
+
+import os
+import shutil
+import tempfile
+from typing import Generator
+
+import pytest
+from PySide6.QtGui import QColor, QImage
+
+from status.animation.animation import Animation
+from status.animation.time_animation_manager import TimeAnimationManager
+from status.behavior.pet_state import PetState
+from status.pet_assets.placeholder_factory import PlaceholderFactory
+from status.pet_assets.placeholders import idle_placeholder
+from status.resources.frame_cache import FrameDiskCache
+
+
+@pytest.fixture
+def temp_dir() -> Generator[str, None, None]:
+    """创建临时目录（自动清理）"""
+    temp_dir_path = tempfile.mkdtemp()
+    yield temp_dir_path
+    shutil.rmtree(temp_dir_path)
+
+
+@pytest.fixture
+def frame_cache(temp_dir) -> FrameDiskCache:
+    return FrameDiskCache(os.path.join(temp_dir, "frames"))
+
+
+def _frames(count: int = 3, size: int = 5) -> list:
+    frames = []
+    for i in range(count):
+        image = QImage(size, size + i, QImage.Format.Format_ARGB32)
+        image.fill(QColor(40 * i, 10, 200, 128 + i))
+        frames.append(image)
+    return frames
+
+
+def _same_pixels(a: QImage, b: QImage) -> bool:
+    fmt = QImage.Format.Format_ARGB32_Premultiplied
+    return a.size() == b.size() and a.convertToFormat(fmt) == b.convertToFormat(fmt)
+
+
+class TestFrameDiskCache:
+
+    def test_round_trip_maps_frames(self, frame_cache):
+        """写入后读取的帧应与原帧像素一致，并直接引用映射的文件"""
+        frames = _frames()
+        key = frame_cache.make_key("test", "source", 1)
+
+        assert frame_cache.store_frames(key, frames, {"fps": 6})
+        loaded, meta = frame_cache.load_frames(key)
+
+        assert meta == {"fps": 6}
+        assert len(loaded) == 3
+        assert all(_same_pixels(a, b) for a, b in zip(frames, loaded))
+        assert loaded[0].format() == QImage.Format.Format_ARGB32_Premultiplied
+
+        # 修改映射的帧不影响缓存文件
+        loaded[0].fill(QColor(0, 0, 0))
+        reloaded, _ = frame_cache.load_frames(key)
+        assert _same_pixels(reloaded[0], frames[0])
+        assert frame_cache.get_stats()["hits"] == 2
+
+    def test_missing_and_corrupt_entries(self, frame_cache):
+        """未命中返回None，损坏的文件被删除"""
+        key = frame_cache.make_key("test", "corrupt")
+        assert frame_cache.load_frames(key) is None
+
+        assert frame_cache.store_frames(key, _frames(1))
+        path = os.path.join(frame_cache.cache_dir, key + ".frames")
+        with open(path, "r+b") as f:
+            f.write(b"JUNK")
+
+        assert frame_cache.load_frames(key) is None
+        assert not os.path.exists(path)
+
+    def test_size_limit_evicts_oldest(self, frame_cache):
+        """超出容量时删除最久未使用的缓存项"""
+        first = frame_cache.make_key("test", 1)
+        second = frame_cache.make_key("test", 2)
+        frame_cache.store_frames(first, _frames(1))
+        os.utime(os.path.join(frame_cache.cache_dir, first + ".frames"), (1, 1))
+
+        # 容量只够容纳一个缓存项，写入第二项时淘汰较旧的第一项
+        frame_cache.max_size = os.path.getsize(os.path.join(frame_cache.cache_dir, first + ".frames"))
+        frame_cache.store_frames(second, _frames(1))
+
+        assert frame_cache.load_frames(first) is None
+        assert frame_cache.load_frames(second) is not None
+
+
+class TestPlaceholderFrameCache:
+
+    def test_second_factory_maps_instead_of_painting(self, frame_cache, monkeypatch, qt_app):
+        """占位符帧缓存命中时不再调用create_animation"""
+        original = PlaceholderFactory(frame_cache=frame_cache).get_animation(PetState.IDLE)
+        assert frame_cache.get_stats()["stores"] == 1
+
+        def fail():
+            raise AssertionError("不应重新绘制")
+        monkeypatch.setattr(idle_placeholder, "create_animation", fail)
+        cached = PlaceholderFactory(frame_cache=frame_cache).get_animation(PetState.IDLE)
+
+        assert isinstance(cached, Animation)
+        assert (cached.name, cached.fps, cached.is_looping) == (original.name, original.fps, original.is_looping)
+        assert cached.metadata["placeholder"] is True
+        assert len(cached.frames) == len(original.frames)
+        assert all(_same_pixels(a, b) for a, b in zip(original.frames, cached.frames))
+
+    def test_generator_version_changes_key(self, frame_cache, qt_app):
+        """生成器版本变化后缓存键不同"""
+        factory = PlaceholderFactory(frame_cache=frame_cache)
+        key = factory._frame_cache_key(idle_placeholder)
+
+        factory.GENERATOR_VERSION = PlaceholderFactory.GENERATOR_VERSION + 1
+        assert factory._frame_cache_key(idle_placeholder) != key
+        assert PlaceholderFactory(frame_cache=None)._frame_cache_key(idle_placeholder) is None
+
+    def test_helper_module_change_changes_key(self, frame_cache, monkeypatch, qt_app):
+        """占位符引用的status辅助模块源码变化后缓存键不同"""
+        import status.animation.animation as animation_module
+        factory = PlaceholderFactory(frame_cache=frame_cache)
+        assert animation_module.__file__ in factory._source_files(idle_placeholder)
+        key = factory._frame_cache_key(idle_placeholder)
+
+        original_hash = FrameDiskCache.hash_file
+        monkeypatch.setattr(frame_cache, "hash_file",
+                            lambda path: "changed" if path == animation_module.__file__ else original_hash(path))
+        assert factory._frame_cache_key(idle_placeholder) != key
+
+
+class TestDirectoryFrameCache:
+
+    def test_unchanged_directory_skips_decoding(self, temp_dir, frame_cache, monkeypatch):
+        """目录未变化时直接映射缓存，文件变化后重新解码"""
+        anim_dir = os.path.join(temp_dir, "anim")
+        os.makedirs(anim_dir)
+        for i, frame in enumerate(_frames(2)):
+            frame.save(os.path.join(anim_dir, f"frame_{i}.png"))
+
+        manager = TimeAnimationManager(base_path=temp_dir, frame_cache=frame_cache)
+        first = manager._load_animation_from_path(anim_dir, "time_test")
+        assert frame_cache.get_stats()["stores"] == 1
+
+        decoded = []
+        original_decode = manager._decode_frames
+        monkeypatch.setattr(manager, "_decode_frames", lambda d, f: decoded.append(d) or original_decode(d, f))
+        second = manager._load_animation_from_path(anim_dir, "time_test")
+        assert not decoded
+        assert all(_same_pixels(a, b) for a, b in zip(first.frames, second.frames))
+
+        _frames(3)[2].save(os.path.join(anim_dir, "frame_2.png"))
+        third = manager._load_animation_from_path(anim_dir, "time_test")
+        assert decoded == [anim_dir]
+        assert len(third.frames) == 3
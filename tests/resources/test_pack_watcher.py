@@ -0,0 +1,183 @@
+"""
+---------------------------------------------------------------
+File name:                  test_pack_watcher.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                测试资源包变化检测后端与增量热重载
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+from typing import Generator
+from unittest.mock import MagicMock
+
+import pytest
+
+from status.resources.pack_watcher import ChangeKind, InotifyWatcher, StatCacheWatcher
+from status.resources.resource_pack import ResourcePack, ResourcePackManager, ResourcePackType
+from status.resources.resource_loader import ResourceLoader
+
+
+def _write(path: str, content: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+def _bump_mtime(path: str) -> None:
+    """确保mtime变化（部分文件系统的时间精度较低）"""
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+
+
+@pytest.fixture
+def temp_dir() -> Generator[str, None, None]:
+    """创建临时目录（自动清理）"""
+    temp_dir_path = tempfile.mkdtemp()
+    yield temp_dir_path
+    shutil.rmtree(temp_dir_path, ignore_errors=True)
+
+
+@pytest.fixture
+def pack_dir(temp_dir: str) -> str:
+    """创建目录资源包"""
+    path = os.path.join(temp_dir, "dir_pack")
+    _write(os.path.join(path, "pack.json"), json.dumps({
+        "id": "dir_pack", "name": "Dir Pack", "version": "1.0.0", "format": 1
+    }))
+    _write(os.path.join(path, "images", "a.txt"), "a")
+    _write(os.path.join(path, "images", "b.txt"), "b")
+    return path
+
+
+@pytest.fixture
+def dir_pack_manager(pack_dir: str) -> ResourcePackManager:
+    """创建只激活目录资源包的管理器，事件系统为mock"""
+    manager = ResourcePackManager()
+    pack = ResourcePack(pack_dir, ResourcePackType.DIRECTORY)
+    pack.load()
+    manager.resource_packs["dir_pack"] = pack
+    manager.active_packs.append("dir_pack")
+    manager._update_resource_path_map()
+    manager.initialized = True
+    manager._event_system = MagicMock()
+    return manager
+
+
+def _watcher_types():
+    types = [StatCacheWatcher]
+    if sys.platform.startswith("linux"):
+        types.append(InotifyWatcher)
+    return types
+
+
+@pytest.mark.parametrize("watcher_type", _watcher_types())
+class TestPackWatcher:
+
+    def test_reports_created_modified_deleted(self, watcher_type, pack_dir):
+        """应报告新建、修改和删除的文件，不报告未变化的文件"""
+        watcher = watcher_type()
+        assert watcher.add_path(pack_dir, recursive=True)
+        assert watcher.poll() == {}
+
+        a_path = os.path.join(pack_dir, "images", "a.txt")
+        b_path = os.path.join(pack_dir, "images", "b.txt")
+        c_path = os.path.join(pack_dir, "images", "c.txt")
+        _write(a_path, "a2")
+        _bump_mtime(a_path)
+        os.remove(b_path)
+        _write(c_path, "c")
+
+        changes = watcher.poll()
+        assert changes == {
+            a_path: ChangeKind.MODIFIED,
+            b_path: ChangeKind.DELETED,
+            c_path: ChangeKind.CREATED,
+        }
+        assert watcher.poll() == {}
+        watcher.close()
+
+    def test_new_subdirectory_is_followed(self, watcher_type, pack_dir):
+        """递归监控时新建的子目录及其文件应被发现并继续监控"""
+        watcher = watcher_type()
+        watcher.add_path(pack_dir, recursive=True)
+
+        new_file = os.path.join(pack_dir, "sounds", "click.txt")
+        _write(new_file, "1")
+        assert watcher.poll().get(new_file) == ChangeKind.CREATED
+
+        _write(new_file, "22")
+        _bump_mtime(new_file)
+        assert watcher.poll() == {new_file: ChangeKind.MODIFIED}
+        watcher.close()
+
+    def test_single_file_root(self, watcher_type, temp_dir):
+        """监控单个文件时只报告该文件，忽略同目录的其他文件"""
+        target = os.path.join(temp_dir, "pack.zip")
+        _write(target, "v1")
+        watcher = watcher_type()
+        assert watcher.add_path(target)
+
+        _write(os.path.join(temp_dir, "other.txt"), "x")
+        _write(target, "v2!")
+        _bump_mtime(target)
+
+        assert watcher.poll() == {target: ChangeKind.MODIFIED}
+        watcher.close()
+
+
+class TestIncrementalHotReload:
+
+    def test_only_changed_paths_are_reloaded(self, dir_pack_manager, pack_dir):
+        """目录资源包变化时只更新变化的路径，并在事件中携带这些路径"""
+        pack = dir_pack_manager.resource_packs["dir_pack"]
+        pack.load = MagicMock(side_effect=AssertionError("不应整体重新加载"))
+        dir_pack_manager._check_directory_changes()
+
+        _write(os.path.join(pack_dir, "images", "a.txt"), "a2")
+        _bump_mtime(os.path.join(pack_dir, "images", "a.txt"))
+        os.remove(os.path.join(pack_dir, "images", "b.txt"))
+        _write(os.path.join(pack_dir, "images", "new.txt"), "n")
+        dir_pack_manager._check_directory_changes()
+
+        dir_pack_manager._event_system.publish.assert_called_with("resource_pack.reloaded", {
+            "pack_id": "dir_pack",
+            "changed_paths": ["images/a.txt", "images/b.txt", "images/new.txt"]
+        })
+        assert dir_pack_manager.list_resources("images/") == ["images/a.txt", "images/new.txt"]
+        assert dir_pack_manager.get_resource_content("images/a.txt") == b"a2"
+
+    def test_metadata_change_reloads_whole_pack(self, dir_pack_manager, pack_dir):
+        """pack.json变化时应整体重新加载资源包"""
+        pack = dir_pack_manager.resource_packs["dir_pack"]
+
+        assert dir_pack_manager.hot_reload_pack("dir_pack", changed_paths=["pack.json"])
+
+        assert pack.loaded
+        dir_pack_manager._event_system.publish.assert_called_with("resource_pack.reloaded", {
+            "pack_id": "dir_pack"
+        })
+
+    def test_loader_invalidates_only_changed_paths(self):
+        """ResourceLoader收到携带路径的重载事件时只清除对应缓存"""
+        loader = ResourceLoader()
+        loader._image_cache.put("images/a.png", "A", tags=loader.get_resource_tags("images/a.png"))
+        loader._image_cache.put("images/b.png", "B", tags=loader.get_resource_tags("images/b.png"))
+        loader._font_cache.put("fonts/main.ttf_16", "F", tags=loader.get_resource_tags("fonts/main.ttf"))
+
+        loader.handle_resource_pack_reloaded({
+            "pack_id": "dir_pack",
+            "changed_paths": ["images/a.png", "fonts/main.ttf"]
+        })
+
+        assert loader._image_cache.get("images/a.png") is None
+        assert loader._image_cache.get("images/b.png") == "B"
+        assert loader._font_cache.get("fonts/main.ttf_16") is None
@@ -0,0 +1,288 @@
+"""
+---------------------------------------------------------------
+File name:                  test_resource_pack_io.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                测试资源包文件读取路径（ZIP句柄池等）
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+                            2026/10/16: 添加mmap零复制读取测试;
+                            2026/10/16: 添加资源路径前缀索引测试;
+"""
+
+import os
+import json
+import mmap
+import shutil
+import tempfile
+import threading
+import zipfile
+from typing import Generator
+
+import pytest
+
+from status.resources.resource_pack import (
+    ResourcePack, ResourcePackManager, ResourcePackType, ResourcePathIndex, ZipHandlePool,
+    natural_sort_key
+)
+from status.resources.resource_loader import ResourceLoader
+
+
+PACK_METADATA = {
+    "id": "zip_pack",
+    "name": "Zip Pack",
+    "version": "1.0.0",
+    "format": 1
+}
+
+
+def _write_zip_pack(zip_path: str, frame_count: int = 20, marker: str = "v1") -> None:
+    """写入包含压缩与非压缩成员的ZIP资源包"""
+    with zipfile.ZipFile(zip_path, "w") as zip_file:
+        zip_file.writestr("pack.json", json.dumps(PACK_METADATA))
+        for i in range(frame_count):
+            zip_file.writestr(f"frames/frame_{i}.bin", f"{marker}-frame-{i}" * 50,
+                              compress_type=zipfile.ZIP_DEFLATED)
+        zip_file.writestr("raw/stored.bin", f"{marker}-stored", compress_type=zipfile.ZIP_STORED)
+        zip_file.writestr("images/dot.png", _png_bytes(), compress_type=zipfile.ZIP_STORED)
+
+
+def _png_bytes() -> bytes:
+    """生成一张2x3的PNG图像数据"""
+    from PySide6.QtCore import QBuffer, QByteArray, QIODevice
+    from PySide6.QtGui import QImage
+
+    image = QImage(2, 3, QImage.Format.Format_ARGB32)
+    image.fill(0xff336699)
+    byte_array = QByteArray()
+    buffer = QBuffer(byte_array)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, "PNG")
+    buffer.close()
+    return bytes(byte_array.data())
+
+
+@pytest.fixture
+def temp_dir() -> Generator[str, None, None]:
+    """创建临时目录（自动清理）"""
+    temp_dir_path = tempfile.mkdtemp()
+    yield temp_dir_path
+    shutil.rmtree(temp_dir_path)
+
+
+@pytest.fixture
+def zip_pack_path(temp_dir: str) -> str:
+    """创建ZIP资源包文件"""
+    zip_path = os.path.join(temp_dir, "zip_pack.zip")
+    _write_zip_pack(zip_path)
+    return zip_path
+
+
+@pytest.fixture
+def zip_pack_manager(zip_pack_path: str) -> Generator[ResourcePackManager, None, None]:
+    """创建只激活ZIP资源包的资源包管理器"""
+    manager = ResourcePackManager()
+    pack = ResourcePack(zip_pack_path, ResourcePackType.ZIP)
+    pack.load()
+    manager.resource_packs["zip_pack"] = pack
+    manager.active_packs.append("zip_pack")
+    manager._update_resource_path_map()
+    manager.initialized = True
+    yield manager
+    pack.close()
+
+
+class TestZipHandlePool:
+
+    def test_reads_all_members_with_one_directory_parse(self, zip_pack_path):
+        """加载并读取全部成员只解析一次中央目录"""
+        pack = ResourcePack(zip_pack_path, ResourcePackType.ZIP)
+        pack.load()
+
+        for i in range(20):
+            assert pack.get_file_content(f"frames/frame_{i}.bin") == (f"v1-frame-{i}" * 50).encode()
+        assert pack.get_file_content("raw/stored.bin") == b"v1-stored"
+
+        stats = pack._zip_pool.get_stats()
+        assert stats["directory_parses"] == 1
+        assert stats["open_handles"] == 1
+        assert stats["cached_offsets"] == 22  # 20帧 + stored.bin + pack.json
+        pack.close()
+
+    def test_missing_member_raises_key_error(self, zip_pack_path):
+        """读取不存在的成员应抛出KeyError"""
+        pool = ZipHandlePool(zip_pack_path)
+        with pytest.raises(KeyError):
+            pool.read("missing.bin")
+        pool.close()
+
+    def test_concurrent_reads_are_bounded(self, zip_pack_path):
+        """多线程并发读取结果正确，且打开的句柄数不超过上限"""
+        pool = ZipHandlePool(zip_pack_path, max_handles=2)
+        errors = []
+
+        def worker(offset: int) -> None:
+            for n in range(50):
+                i = (offset + n) % 20
+                if pool.read(f"frames/frame_{i}.bin") != (f"v1-frame-{i}" * 50).encode():
+                    errors.append(i)
+
+        threads = [threading.Thread(target=worker, args=(k,)) for k in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not errors
+        assert pool.get_stats()["open_handles"] <= 2
+        pool.close()
+
+    def test_invalidate_picks_up_rewritten_archive(self, zip_pack_path):
+        """失效后应重新解析被替换的ZIP文件"""
+        pool = ZipHandlePool(zip_pack_path)
+        assert pool.read("raw/stored.bin") == b"v1-stored"
+
+        _write_zip_pack(zip_pack_path, frame_count=3, marker="v2")
+        pool.invalidate()
+
+        assert pool.read("raw/stored.bin") == b"v2-stored"
+        assert pool.get_stats()["directory_parses"] == 2
+        pool.close()
+
+
+class TestResourcePackManagerZipAccess:
+
+    def test_get_resource_content_reads_zip_members(self, zip_pack_manager):
+        """管理器应能经资源包读取ZIP中的资源"""
+        assert zip_pack_manager.resource_pack_map["raw/stored.bin"] == "zip_pack"
+        assert zip_pack_manager.get_resource_content("raw/stored.bin") == b"v1-stored"
+        assert zip_pack_manager.get_resource_content("frames/frame_3.bin") == ("v1-frame-3" * 50).encode()
+
+    def test_hot_reload_invalidates_handles(self, zip_pack_manager, zip_pack_path):
+        """热重载后应读到更新后的ZIP内容"""
+        assert zip_pack_manager.get_resource_content("raw/stored.bin") == b"v1-stored"
+
+        _write_zip_pack(zip_pack_path, frame_count=2, marker="v2")
+        assert zip_pack_manager.hot_reload_pack("zip_pack")
+
+        assert zip_pack_manager.get_resource_content("raw/stored.bin") == b"v2-stored"
+        assert not zip_pack_manager.has_resource("frames/frame_5.bin")
+
+
+class TestResourceBuffers:
+
+    def test_stored_zip_member_is_memory_mapped(self, zip_pack_path):
+        """未压缩ZIP成员应通过mmap映射而非复制"""
+        pool = ZipHandlePool(zip_pack_path)
+
+        view = pool.read_buffer("raw/stored.bin")
+        assert isinstance(view.obj, mmap.mmap)
+        assert view == b"v1-stored"
+
+        deflated = pool.read_buffer("frames/frame_1.bin")
+        assert deflated == ("v1-frame-1" * 50).encode()
+        view.release()
+        pool.close()
+
+    def test_directory_file_is_memory_mapped(self, temp_dir):
+        """目录资源包文件应通过mmap映射，空文件返回空视图"""
+        pack_dir = os.path.join(temp_dir, "dir_pack")
+        os.makedirs(pack_dir)
+        with open(os.path.join(pack_dir, "pack.json"), "w", encoding="utf-8") as f:
+            json.dump(dict(PACK_METADATA, id="dir_pack"), f)
+        with open(os.path.join(pack_dir, "data.bin"), "wb") as f:
+            f.write(b"directory-bytes")
+        open(os.path.join(pack_dir, "empty.bin"), "wb").close()
+
+        pack = ResourcePack(pack_dir, ResourcePackType.DIRECTORY)
+        pack.load()
+
+        view = pack.get_file_buffer("data.bin")
+        assert isinstance(view.obj, mmap.mmap)
+        assert view == b"directory-bytes"
+        assert pack.get_file_buffer("empty.bin") == b""
+        assert pack.get_file_buffer("missing.bin") is None
+
+    def test_loader_decodes_image_from_zip_buffer(self, zip_pack_manager):
+        """ResourceLoader应直接从映射的缓冲区解码图像"""
+        loader = ResourceLoader()
+        loader.set_manager(zip_pack_manager)
+
+        image = loader.load_image("images/dot.png", use_internal_cache=False)
+
+        assert image is not None
+        assert (image.width(), image.height()) == (2, 3)
+
+    def test_loader_maps_filesystem_images(self, temp_dir):
+        """没有资源包时应映射文件系统中的图像"""
+        image_path = os.path.join(temp_dir, "dot.png")
+        with open(image_path, "wb") as f:
+            f.write(_png_bytes())
+        loader = ResourceLoader()
+        loader.set_manager(None)
+
+        assert isinstance(loader.get_resource_buffer(image_path).obj, mmap.mmap)
+        image = loader.load_image(image_path, use_internal_cache=False)
+        assert image is not None and image.width() == 2
+
+
+def _path_sort_key(path: str) -> list:
+    """逐段自然排序的键（目录内的文件排在同名前缀的兄弟目录之前）"""
+    return [natural_sort_key(segment) for segment in path.split("/")]
+
+
+class TestResourcePathIndex:
+
+    PATHS = [
+        "anims/idle/frame10.png", "anims/idle/frame2.png", "anims/idle/frame1.png",
+        "anims/idle2/frame1.png", "anims/walk/frame1.png", "sounds/click.wav", "readme.txt"
+    ]
+
+    def test_prefix_matches_startswith_in_natural_order(self):
+        """前缀查询结果应与startswith筛选一致，并按自然顺序排列"""
+        index = ResourcePathIndex(self.PATHS)
+
+        for prefix in ["", "anims", "anims/", "anims/idle", "anims/idle/", "anims/idle/frame1",
+                       "anims/w", "s", "missing", "anims/idle/frame10.png"]:
+            expected = sorted([p for p in self.PATHS if p.startswith(prefix)], key=_path_sort_key)
+            assert index.list(prefix) == expected, prefix
+
+        assert index.list("anims/idle/") == [
+            "anims/idle/frame1.png", "anims/idle/frame2.png", "anims/idle/frame10.png"
+        ]
+
+    def test_remove_prunes_empty_branches(self):
+        """移除路径后应裁剪空分支，重复增删保持计数一致"""
+        index = ResourcePathIndex(self.PATHS)
+
+        assert index.remove("anims/walk/frame1.png") is True
+        assert index.remove("anims/walk/frame1.png") is False
+        assert index.add("readme.txt") is False
+        assert len(index) == len(self.PATHS) - 1
+        assert index.list("anims/w") == []
+        assert "anims/walk/frame1.png" not in index
+        assert "anims/idle" not in index
+
+        assert index.add("anims/walk/frame3.png") is True
+        assert index.list("anims/walk") == ["anims/walk/frame3.png"]
+
+    def test_manager_updates_index_incrementally(self, zip_pack_manager, zip_pack_path):
+        """管理器热重载后前缀索引应反映新增与删除的资源"""
+        frames = zip_pack_manager.list_resources("frames/")
+        assert frames == [f"frames/frame_{i}.bin" for i in range(20)]
+
+        _write_zip_pack(zip_pack_path, frame_count=3, marker="v2")
+        assert zip_pack_manager.hot_reload_pack("zip_pack")
+
+        assert zip_pack_manager.list_resources("frames") == [f"frames/frame_{i}.bin" for i in range(3)]
+        assert zip_pack_manager.list_resources() == sorted(zip_pack_manager.resource_path_map,
+                                                           key=_path_sort_key)
+
+    def test_loader_keeps_manager_order(self, zip_pack_manager):
+        """ResourceLoader应直接返回管理器的有序列表"""
+        loader = ResourceLoader()
+        loader.set_manager(zip_pack_manager)
+
+        assert loader.list_resources("frames") == [f"frames/frame_{i}.bin" for i in range(20)]
@@ -0,0 +1,140 @@
+"""
+---------------------------------------------------------------
+File name:                  test_single_flight.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                测试并发加载请求合并
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from status.resources import ResourceType
+from status.resources.asset_manager import AssetManager
+from status.resources.resource_loader import ResourceLoader
+from status.resources.single_flight import SingleFlight
+
+
+def _run_concurrently(fn, count: int = 8) -> list:
+    """在count个线程中同时调用fn，返回各线程的结果"""
+    barrier = threading.Barrier(count)
+    results = [None] * count
+
+    def worker(i: int) -> None:
+        barrier.wait()
+        results[i] = fn()
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    return results
+
+
+class TestSingleFlight:
+
+    def test_concurrent_calls_share_one_execution(self):
+        """同一键的并发调用只执行一次并共享结果"""
+        flight = SingleFlight()
+        calls = []
+
+        def load():
+            calls.append(1)
+            time.sleep(0.1)
+            return object()
+
+        results = _run_concurrently(lambda: flight.do("key", load))
+
+        assert len(calls) == 1
+        assert all(r is results[0] for r in results)
+        assert flight.get_stats() == {"in_flight": 0, "coalesced": 7}
+
+    def test_exception_propagates_to_all_waiters(self):
+        """加载异常应传递给所有合并的调用方，之后的调用重新执行"""
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        errors = []
+
+        def failing():
+            started.set()
+            release.wait(5)
+            raise ValueError("boom")
+
+        def call():
+            try:
+                flight.do("key", failing)
+            except ValueError as e:
+                errors.append(e)
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        started.wait(5)
+        follower = threading.Thread(target=call)
+        follower.start()
+        while flight.get_coalesced_count() == 0:
+            time.sleep(0.001)
+        release.set()
+        leader.join(5)
+        follower.join(5)
+
+        assert len(errors) == 2
+        assert flight.do("key", lambda: "ok") == "ok"
+
+    def test_reentrant_call_does_not_deadlock(self):
+        """同一线程重入同一键时直接执行"""
+        flight = SingleFlight()
+
+        assert flight.do("key", lambda: flight.do("key", lambda: 42)) == 42
+        assert flight.get_coalesced_count() == 0
+
+
+def _slow_manager(content: bytes) -> MagicMock:
+    manager = MagicMock()
+
+    def read(path):
+        time.sleep(0.1)
+        return content
+
+    manager.get_resource_content.side_effect = read
+    manager.resource_pack_map = {}
+    return manager
+
+
+class TestLoadCoalescing:
+
+    def test_loader_coalesces_concurrent_loads(self):
+        """ResourceLoader对同一资源的并发加载只读取一次"""
+        loader = ResourceLoader()
+        manager = _slow_manager(b'{"a": 1}')
+        loader._manager = manager
+
+        results = _run_concurrently(lambda: loader.load_resource("data/config.json", use_internal_cache=False))
+
+        assert results == [{"a": 1}] * 8
+        assert manager.get_resource_content.call_count == 1
+        assert loader.get_cache_stats()["coalesced"] == 7
+
+    def test_asset_manager_coalesces_and_reports(self, monkeypatch):
+        """AssetManager对同一缓存键的并发未命中只加载一次，并在统计中报告"""
+        monkeypatch.setattr(AssetManager, "_instance", None)
+        am = AssetManager()
+        am.initialize()
+        manager = _slow_manager(b"hello")
+        am.loader._manager = manager
+
+        results = _run_concurrently(lambda: am.load_asset("notes/readme.txt", ResourceType.TEXT))
+
+        assert results == ["hello"] * 8
+        assert manager.get_resource_content.call_count == 1
+        stats = am.get_cache_stats()["coalesced"]
+        assert stats["total"] == 7
+        assert stats["asset"] + stats["loader"] == 7
@@ -8,6 +8,10 @@ Description:                StatusPet主应用程序的测试，使用TDD方法
 
 Changed history:            
                             2025/05/14: 初始创建;
+                            2026/10/16: 添加帧未变化时不更新主窗口的测试;
+                            2026/10/16: 添加统计快照只在版本变化时发布的测试;
+                            2026/10/16: 添加update出错后仍安排下一次更新的测试;
+                            2026/10/16: 添加重新显示统计面板时不发布旧快照的测试;
 ----
 """
 
@@ -23,12 +27,15 @@ sys.path.insert(0, project_root)
 
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import Qt, QPoint, QSize, QEvent
+from PySide6.QtGui import QImage
 
 # 导入被测试的模块
 from status.main import StatusPet
 from status.core.events import SystemStatsUpdatedEvent
 from status.core.event_system import EventSystem, EventType
 from status.behavior.pet_state import PetState
+from status.animation.animation import Animation
+from status.monitoring.stats_sampler import MetricGroup, StatsSampler
 from status.core.events import EventManager
 
 # 确保有Qt应用程序实例
@@ -142,6 +149,78 @@ class TestStatusPet(unittest.TestCase):
             # 验证动画是否被更新
             self.status_pet.current_animation.update.assert_called_once()
 
+    def test_update_reschedules_after_error(self):
+        """update中途出错时仍安排下一次更新，更新循环不会停止"""
+        self.status_pet.frame_scheduler = MagicMock()
+        self.status_pet.current_animation = MagicMock()
+        self.status_pet.current_animation.update.side_effect = RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            self.status_pet.update()
+        self.status_pet.frame_scheduler.schedule.assert_called_once()
+
+    def test_update_sets_image_only_when_frame_changes(self):
+        """帧未变化时update不触碰主窗口，帧变化时传入缓存的QPixmap"""
+        frames = [QImage(8, 8, QImage.Format.Format_ARGB32) for _ in range(2)]
+        animation = Animation(name="test", frames=frames, fps=10)
+        animation.play()
+        self.status_pet.current_animation = animation
+        self.status_pet._displayed_frame = None
+
+        with patch('status.main.publish_stats'):
+            self.status_pet.update()
+            self.status_pet.update()
+            self.assertEqual(self.mock_window_instance.set_image.call_count, 1)
+            self.assertIs(self.mock_window_instance.set_image.call_args[0][0], animation.get_pixmap_at_index(0))
+
+            animation.last_frame_time -= 1.0  # 模拟到达下一帧的时间
+            self.status_pet.update()
+            self.assertEqual(self.mock_window_instance.set_image.call_count, 2)
+            self.assertIs(self.mock_window_instance.set_image.call_args[0][0], animation.get_pixmap_at_index(1))
+
+    def test_publish_latest_stats_only_on_new_snapshot(self):
+        """只有采样器发布了新快照时才发布统计事件"""
+        sampler = StatsSampler([MetricGroup("cpu", 60.0, lambda: {"cpu": 12.5})])
+        sampler.start = MagicMock()
+        sampler.is_running = MagicMock(return_value=True)
+        self.status_pet.stats_sampler = sampler
+        self.status_pet._published_stats_version = 0
+
+        with patch('status.main.publish_stats_data') as mock_publish, \
+             patch('status.main.publish_stats') as mock_sync_publish:
+            self.status_pet._publish_latest_stats()
+            mock_publish.assert_not_called()
+
+            sampler.sample_now()
+            self.status_pet._publish_latest_stats()
+            self.status_pet._publish_latest_stats()
+            mock_publish.assert_called_once_with({"cpu": 12.5})
+            mock_sync_publish.assert_not_called()
+
+    def test_reshown_stats_panel_skips_stale_snapshot(self):
+        """隐藏后重新显示统计面板时，不重新发布隐藏前的旧快照"""
+        sampler = StatsSampler([MetricGroup("cpu", 60.0, lambda: {"cpu": 12.5})])
+        sampler.start = MagicMock()
+        sampler.stop = MagicMock()
+        sampler.is_running = MagicMock(return_value=True)
+        self.status_pet.stats_sampler = sampler
+        self.status_pet.stats_panel = MagicMock()
+
+        with patch('status.main.publish_stats_data') as mock_publish:
+            sampler.sample_now()
+            self.status_pet._publish_latest_stats()
+            self.assertEqual(mock_publish.call_count, 1)
+
+            self.status_pet._handle_toggle_stats_panel(False)
+            self.status_pet._handle_toggle_stats_panel(True)
+            sampler.start.assert_called_once()
+            self.status_pet._publish_latest_stats()
+            self.assertEqual(mock_publish.call_count, 1)
+
+            sampler.sample_now()
+            self.status_pet._publish_latest_stats()
+            self.assertEqual(mock_publish.call_count, 2)
+
     def test_handle_state_change(self):
         """测试状态变化处理功能"""
         from status.behavior.pet_state import PetState
@@ -0,0 +1,57 @@
+"""
+---------------------------------------------------------------
+File name:                  test_main_pet_window_image.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                主窗口设置图像的测试
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+"""
+
+import unittest
+from unittest.mock import patch
+
+from PySide6.QtCore import Qt, QSize
+from PySide6.QtGui import QPixmap
+from PySide6.QtWidgets import QApplication
+
+from status.ui.main_pet_window import MainPetWindow
+
+app = QApplication.instance() or QApplication([])
+
+
+class TestMainPetWindowSetImage(unittest.TestCase):
+
+    def setUp(self):
+        self.window = MainPetWindow()
+        self.pixmap = QPixmap(100, 100)
+        self.pixmap.fill(Qt.GlobalColor.red)
+        self.window.set_image(self.pixmap)
+
+    def tearDown(self):
+        self.window.close()
+        self.window.deleteLater()
+
+    def test_repeat_image_is_skipped(self):
+        """重复设置同一图像不重新设置标签"""
+        with patch.object(self.window.image_label, 'setPixmap') as mock_set_pixmap:
+            self.window.set_image(self.pixmap)
+            mock_set_pixmap.assert_not_called()
+
+    def test_resize_only_when_size_changes(self):
+        """同尺寸图像不调整窗口大小，尺寸变化时调整"""
+        same_size = QPixmap(100, 100)
+        same_size.fill(Qt.GlobalColor.green)
+        with patch.object(self.window, 'resize_to_image') as mock_resize:
+            self.window.set_image(same_size)
+            self.assertIs(self.window.image, same_size)
+            mock_resize.assert_not_called()
+
+        self.window.set_image(QPixmap(50, 60))
+        self.assertEqual(self.window.size(), QSize(50, 60))
+
+
+if __name__ == "__main__":
+    unittest.main()
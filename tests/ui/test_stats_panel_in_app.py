@@ -8,6 +8,7 @@ Description:                测试StatsPanel在主应用中的集成表现
 
 Changed history:            
                             2025/05/13: 初始创建;
+                            2026/10/16: 窗口位置事件按帧合并，断言前投递一帧;
 ----
 """
 
@@ -122,6 +123,9 @@ class TestStatsPanelInApp(unittest.TestCase):
         timer.start()
         QApplication.processEvents()
         
+        # 窗口位置变化事件按帧合并，测试不运行主更新循环，需手动投递一帧
+        self.pet_app.advanced_event_manager.flush_coalesced()
+        
         # 确保StatsPanel位置已更新
         self.assertNotEqual(initial_pos, self.pet_app.stats_panel.pos(), 
                            "StatsPanel位置应该在主窗口移动后更新")
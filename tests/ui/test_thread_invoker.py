@@ -0,0 +1,40 @@
+"""
+---------------------------------------------------------------
+File name:                  test_thread_invoker.py
+Author:                     Ignorant-lu
+Date created:               2026/10/16
+Description:                测试线程调用器将回调交回所属线程执行
+----------------------------------------------------------------
+
+Changed history:
+                            2026/10/16: 初始创建;
+----
+"""
+
+import threading
+import unittest
+
+from PySide6.QtWidgets import QApplication
+
+from status.ui.thread_invoker import ThreadInvoker
+
+app = QApplication.instance() or QApplication([])
+
+
+class TestThreadInvoker(unittest.TestCase):
+
+    def test_callback_runs_in_owner_thread(self):
+        invoker = ThreadInvoker()
+        ran_in = []
+
+        worker = threading.Thread(target=lambda: invoker.post(lambda: ran_in.append(threading.get_ident())))
+        worker.start()
+        worker.join()
+        self.assertEqual(ran_in, [])
+
+        QApplication.processEvents()
+        self.assertEqual(ran_in, [threading.get_ident()])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,6 +10,7 @@ Changed history:
                             2025/05/15: 初始创建;
                             2025/05/15: 修改测试，使其真正测试实现;
                             2025/05/15: 实现方法后更新测试;
+                            2026/10/16: 热重载只携带变化的路径;
 ----
 """
 import os
@@ -213,8 +214,9 @@ class TestResourceHotLoading:
             # 手动触发检查（不依赖线程调度）
             resource_pack_manager._check_directory_changes()
             
-            # 验证hot_reload_pack是否被调用
-            resource_pack_manager.hot_reload_pack.assert_called_with("sample_pack")
+            # 验证hot_reload_pack是否被调用，且只携带变化的路径
+            resource_pack_manager.hot_reload_pack.assert_called_with(
+                "sample_pack", changed_paths=["textures/example.txt"])
             
         finally:
             # 停止监控